@@ -4,15 +4,26 @@ import typing as t
 
 from api import utils as api_utils
 
-from .routers import api_router
+from .routers import api_router, metrics as metrics_router
 
+from core_utils import metrics_utils
 from fastapi import APIRouter, FastAPI
 from settings.api_settings import FASTAPI_SETTINGS
+from settings.metrics_settings import METRICS_SETTINGS
 
 __all__ = ["fastapi_app"]
 
 INCLUDE_ROUTERS: list[APIRouter] = [api_router.router]
 
+## Serve Prometheus metrics at /metrics, outside the versioned API prefix
+METRICS_ENDPOINT: bool = METRICS_SETTINGS.get("METRICS_API_ENDPOINT", default=False)
+if METRICS_ENDPOINT:
+    INCLUDE_ROUTERS.append(metrics_router.router)
+
+## Time fetch/convert/save stages run by API requests. Upstream API & HTTP cache metrics are recorded with them.
+if METRICS_ENDPOINT or METRICS_SETTINGS.get("METRICS_STAGE_TIMING", default=False):
+    metrics_utils.enable_stage_timing()
+
 fastapi_app: FastAPI = api_utils.get_app(
     debug=FASTAPI_SETTINGS.get("FASTAPI_DEBUG", default=False),
     cors=True,
@@ -24,6 +35,12 @@ fastapi_app: FastAPI = api_utils.get_app(
     routers=INCLUDE_ROUTERS
 )
 
+if METRICS_ENDPOINT:
+    api_utils.add_metrics_middleware(app=fastapi_app)
+
+## Trace requests, upstream HTTP requests & SQL statements, when TRACING_ENABLED is set
+api_utils.add_tracing(app=fastapi_app)
+
 
 @fastapi_app.get("/")
 def read_root():
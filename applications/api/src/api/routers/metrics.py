@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from core_utils import metrics_utils
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+__all__ = ["router"]
+
+router = APIRouter(tags=["util"])
+
+
+@router.get("/metrics", summary="Prometheus metrics", response_class=PlainTextResponse)
+def metrics() -> PlainTextResponse:
+    """Serve request, upstream API, HTTP cache, database pool & ingest stage metrics in the Prometheus text format."""
+    return PlainTextResponse(
+        content=metrics_utils.render_prometheus(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
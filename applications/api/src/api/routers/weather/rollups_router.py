@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import typing as t
+
+from api.responses import API_RESPONSE_DICT
+from domain.weatherapi.weather.rollups import CurrentWeatherRollupOut
+from fastapi import APIRouter, Query, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from loguru import logger as log
+from weather_client.apis import api_weatherapi
+
+__all__ = ["router"]
+
+prefix: str = "/rollups"
+tags: list[str] = ["weather", "weatherapi", "rollups"]
+
+router: APIRouter = APIRouter(prefix=prefix, responses=API_RESPONSE_DICT, tags=tags)
+
+
+def _get_rollups(
+    location: str, granularity: str, start_epoch: int | None, end_epoch: int | None, limit: int | None
+) -> JSONResponse:
+    log.info(f"Reading {granularity} current weather rollups for location: {location}")
+
+    try:
+        rollups: list[CurrentWeatherRollupOut] = api_weatherapi.db_client.get_current_weather_rollups(
+            location_name=location,
+            granularity=granularity,
+            start_epoch=start_epoch,
+            end_epoch=end_epoch,
+            limit=limit,
+        )
+    except Exception as exc:
+        msg = f"({type(exc)}) Error reading {granularity} current weather rollups. Details: {exc}"
+        log.error(msg)
+
+        return JSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content={"text": f"Error reading {granularity} current weather rollups for location: {location}."},
+        )
+
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "location": location,
+            "granularity": granularity,
+            "count": len(rollups),
+            "rollups": jsonable_encoder([r.model_dump() for r in rollups]),
+        },
+    )
+
+
+@router.get("/hourly/{location}")
+def get_hourly_rollups_for_location(
+    location: str,
+    start_epoch: int | None = None,
+    end_epoch: int | None = None,
+    limit: int | None = Query(default=24, ge=1, le=24 * 366),
+) -> JSONResponse:
+    return _get_rollups(location, "hourly", start_epoch, end_epoch, limit)
+
+
+@router.get("/daily/{location}")
+def get_daily_rollups_for_location(
+    location: str,
+    start_epoch: int | None = None,
+    end_epoch: int | None = None,
+    limit: int | None = Query(default=30, ge=1, le=3660),
+) -> JSONResponse:
+    return _get_rollups(location, "daily", start_epoch, end_epoch, limit)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import typing as t
 
-from . import current_weather_router, weather_forecast_router
+from . import current_weather_router, rollups_router, weather_forecast_router
 
 from api import helpers as api_helpers
 from api.responses import API_RESPONSE_DICT, img_response
@@ -21,3 +21,4 @@ tags: list[str] = ["weather", "weatherapi"]
 router: APIRouter = APIRouter(prefix=prefix, responses=API_RESPONSE_DICT, tags=tags)
 router.include_router(current_weather_router.router)
 router.include_router(weather_forecast_router.router)
+router.include_router(rollups_router.router)
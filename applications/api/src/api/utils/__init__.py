@@ -1,3 +1,5 @@
 from __future__ import annotations
 
+from .metrics import *
+from .tracing import *
 from .utils import *
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import time
+import typing as t
+
+from core_utils import metrics_utils
+from depends import db_depends
+from fastapi import FastAPI
+from loguru import logger as log
+
+__all__ = [
+    "API_REQUEST_DURATION",
+    "API_REQUESTS_IN_FLIGHT",
+    "RequestMetricsMiddleware",
+    "add_metrics_middleware",
+]
+
+API_REQUEST_DURATION = metrics_utils.Histogram(
+    "weatherdata_api_request_duration_seconds",
+    "API request latency, by method, route template & response status.",
+    labelnames=["method", "route", "status"],
+)
+API_REQUESTS_IN_FLIGHT = metrics_utils.Gauge(
+    "weatherdata_api_requests_in_flight",
+    "API requests currently being handled.",
+)
+
+
+def _pool_stat(name: str) -> t.Callable[[], dict[tuple, float]]:
+    def collect() -> dict[tuple, float]:
+        return {(stats["database"],): stats[name] for stats in db_depends.get_db_pool_stats() if name in stats}
+
+    return collect
+
+
+## Read from the shared engines (depends.db_depends.get_db_engine()) at scrape time
+for _name, _description in [
+    ("size", "Connections the pool keeps open."),
+    ("checked_out", "Pooled connections currently in use."),
+    ("checked_in", "Idle pooled connections."),
+    ("overflow", "Connections opened beyond the pool size (negative while the pool is filling)."),
+]:
+    metrics_utils.CallbackGauge(
+        f"weatherdata_db_pool_{_name}", _description, callback=_pool_stat(_name), labelnames=["database"]
+    )
+
+
+class RequestMetricsMiddleware:
+    """ASGI middleware that records each request's latency & status by route template, and the in-flight request count.
+
+    Description:
+        Routes are labelled with their template (i.e. `/api/v1/weather/current/{location}`), not the
+        requested path, to keep the number of series bounded. Requests that match no route are
+        labelled "unmatched".
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status: dict[str, int] = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+
+            await send(message)
+
+        API_REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            API_REQUESTS_IN_FLIGHT.dec()
+
+            ## Set on the scope by the router once a route matches
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            API_REQUEST_DURATION.observe(time.perf_counter() - start, scope["method"], route, str(status["code"]))
+
+
+def add_metrics_middleware(app: FastAPI = None) -> FastAPI:
+    try:
+        app.add_middleware(RequestMetricsMiddleware)
+    except Exception as exc:
+        msg = f"({type(exc)}) Error adding metrics middleware to FastAPI app. Details: {exc}"
+        log.error(msg)
+
+        raise exc
+
+    return app
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import typing as t
+
+from fastapi import FastAPI
+from loguru import logger as log
+import setup
+
+try:
+    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+except ImportError:
+    FastAPIInstrumentor = None
+
+__all__ = [
+    "add_tracing",
+]
+
+## Polled by monitoring; tracing them would bury the request traces
+EXCLUDED_URLS: str = "/metrics,/health"
+
+
+def add_tracing(app: FastAPI) -> bool:
+    """Configure tracing for the API process & record a span for each request, per TRACING_SETTINGS.
+
+    Description:
+        Incoming `traceparent` headers are honored, so a caller's trace continues through the API,
+        its upstream HTTP requests & SQL statements.
+
+    Params:
+        app (FastAPI): The app to instrument.
+
+    Returns:
+        (bool): `True` if tracing is enabled.
+
+    """
+    if not setup.setup_tracing(component="api"):
+        return False
+
+    if FastAPIInstrumentor is None:
+        log.warning(
+            "Tracing is enabled, but opentelemetry-instrumentation-fastapi is not installed. Install the 'api[otel]' extra to trace requests."
+        )
+        return True
+
+    FastAPIInstrumentor.instrument_app(app, excluded_urls=EXCLUDED_URLS)
+
+    return True
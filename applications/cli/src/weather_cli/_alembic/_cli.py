@@ -6,9 +6,7 @@ import logging
 from pathlib import Path
 import typing as t
 
-from alembic import command
-from alembic.config import Config
-from alembic.script import ScriptDirectory
+## Alembic (& SQLAlchemy) are imported when a command runs, not when the CLI starts
 
 from cyclopts import App, Group, Parameter
 from loguru import logger as log
@@ -65,6 +63,8 @@ class AlembicController(AbstractContextManager):
         log: logging.Logger | None = None
 
     def __enter__(self) -> t.Self:
+        from alembic.config import Config
+
         ## Initialize Alembic configuration object
         self.config = Config(self.cfg_file)
 
@@ -95,6 +95,8 @@ class AlembicController(AbstractContextManager):
             Exception: If an error occurs during upgrade.
 
         """
+        from alembic import command
+
         log.info(
             f"{'Simulating' if self.dry_run else 'Upgrading'} to revision: {revision}"
         )
@@ -117,6 +119,9 @@ class AlembicController(AbstractContextManager):
             Exception: If an error occurs during downgrade.
 
         """
+        from alembic import command
+        from alembic.script import ScriptDirectory
+
         log.info(
             f"{'Simulating' if self.dry_run else 'Downgrading'} to revision: {revision}"
         )
@@ -173,6 +178,8 @@ class AlembicController(AbstractContextManager):
             )
             return
 
+        from alembic import command
+
         log.info(f"Creating migration: {message}")
         try:
             command.revision(self.config, message=message, autogenerate=True)
@@ -2,20 +2,8 @@ from __future__ import annotations
 
 import typing as t
 
-from celery import Celery
 from cyclopts import App, Group, Parameter
-from domain.weatherapi import (
-    location as location_domain,
-    weather as weather_domain,
-)
 from loguru import logger as log
-from scheduling.celery_scheduler import (
-    CelerySettings,
-    celery_settings,
-    celeryapp,
-    check_task,
-    start_celery,
-)
 
 __all__ = ["celery_app"]
 
@@ -36,6 +24,15 @@ def _start_celery(mode: t.Annotated[str, Parameter(name="mode", show_default=Tru
     if mode not in ["beat", "worker"]:
         raise ValueError(f"Invalid mode: {mode}. Must be one of ['beat', 'worker']")
 
+    if mode == "worker":
+        ## Before the app is imported; gevent/eventlet pools must patch the standard library first
+        from scheduling.celery_patch import patch_celery_worker_pool
+
+        patch_celery_worker_pool()
+
+    ## Imports Celery, the task modules & the database; only needed to start Celery
+    from scheduling.celery_scheduler import celeryapp, start_celery
+
     log.info(f"Starting Celery in '{mode}' mode.")
     
     try:
@@ -3,13 +3,9 @@ from __future__ import annotations
 import typing as t
 
 from cyclopts import App, Group, Parameter
-from depends import db_depends
 from loguru import logger as log
-import settings
-import setup
-import sqlalchemy as sa
-import sqlalchemy.exc as sa_exc
-import sqlalchemy.sql as sa_sql
+
+## SQLAlchemy & the database packages are imported by each command, so they don't slow down CLI startup
 
 __all__ = ["db_app"]
 
@@ -19,6 +15,9 @@ db_app = App(name="db", help="CLI for managing the database.")
 @db_app.command(name="init")
 def _init_db():
     """Initialize the database."""
+    from depends import db_depends
+    import setup
+
     log.info("Initializing database.")
 
     engine = db_depends.get_db_engine()
@@ -49,6 +48,10 @@ def show_db_info(
         option: The option to show information about. Options: ['tables', 'driver']
 
     """
+    from depends import db_depends
+    import sqlalchemy as sa
+    import sqlalchemy.exc as sa_exc
+
     log.info(f"Showing database info: {option}")
 
     engine = db_depends.get_db_engine()
@@ -109,6 +112,11 @@ def count_db_rows(table: t.Annotated[str, Parameter(name="table", show_default=T
         int: The number of rows in the table.
 
     """
+    from depends import db_depends
+    import sqlalchemy as sa
+    import sqlalchemy.exc as sa_exc
+    import sqlalchemy.sql as sa_sql
+
     log.info(f"Counting rows in table: {table}")
 
     engine = db_depends.get_db_engine()
@@ -138,6 +146,10 @@ def count_db_rows(table: t.Annotated[str, Parameter(name="table", show_default=T
 
 @db_app.command(name="test-connection")
 def test_db_connection():
+    from depends import db_depends
+    import settings
+    import sqlalchemy as sa
+
     log.info("Testing database connection")
     log.debug(f"Database settings: {settings.DB_SETTINGS.as_dict()}")
 
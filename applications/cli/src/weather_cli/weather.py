@@ -3,16 +3,11 @@ from __future__ import annotations
 from datetime import timedelta
 import typing as t
 
-from core_utils import time_utils
 from cyclopts import App, Group, Parameter
-from domain.weatherapi import (
-    location as location_domain,
-    weather as weather_domain,
-)
 from loguru import logger as log
-from weather_client.apis import api_weatherapi
 
-from depends import db_depends
+## The weather client, domain models & database are imported by each command, so `cli --help`
+#  & other sub-apps don't load SQLAlchemy, pydantic models & the HTTP client at startup.
 
 __all__ = ["weather_app"]
 
@@ -27,16 +22,20 @@ def get_current_weather(
         help="The location to get the current weather for. Can be a city name or postal code."
     )] = "London",
     save_to_db: t.Annotated[bool, Parameter(name="--save-db", show_default=True)] = False
-) -> weather_domain.current.CurrentWeatherIn:
+):
     """Get the current weather for a given location.
     
     Params:
         location: The location to get the current weather for. Can be a city name or postal code.
     
     Returns:
-        The current weather for the given location.
+        (CurrentWeatherIn): The current weather for the given location.
 
     """
+    from depends import db_depends
+    from domain.weatherapi import location as location_domain, weather as weather_domain
+    from weather_client.apis import api_weatherapi
+
     log.info(f"Getting current weather for location: {location}")
     
     try:
@@ -95,12 +94,16 @@ Wind:
     
 
 @weather_app.command(name="forecast")
-def get_weather_forecast(location: t.Annotated[str, Parameter(name="location", show_default=True)] = "London", save_to_db: t.Annotated[bool, Parameter(name="--save-db", show_default=True)] = False) -> weather_domain.forecast.ForecastJSONIn:
+def get_weather_forecast(location: t.Annotated[str, Parameter(name="location", show_default=True)] = "London", save_to_db: t.Annotated[bool, Parameter(name="--save-db", show_default=True)] = False):
     """Get the weather forecast for a given location.
     
     Params:
         location: The location to get the weather forecast for. Can be a city name or postal code.
     """
+    from depends import db_depends
+    from domain.weatherapi import location as location_domain, weather as weather_domain
+    from weather_client.apis import api_weatherapi
+
     log.info(f"Getting weather forecast for location: {location}")
     
     try:
@@ -139,3 +142,97 @@ def get_weather_forecast(location: t.Annotated[str, Parameter(name="location", s
             log.error(msg)
     
     return weather_forecast_str
+
+
+@weather_app.command(name="register")
+def register_location(
+    location: t.Annotated[str, Parameter(
+        name="location",
+        help="The location to poll on a schedule. Can be a city name, postal code or 'lat,lon'."
+    )],
+    label: t.Annotated[str | None, Parameter(name="--label", show_default=True)] = None,
+    active: t.Annotated[bool, Parameter(name="--active", show_default=True)] = True,
+):
+    """Add a location to the polling registry, or enable/disable a registered location.
+
+    Params:
+        location: The location to poll. Can be a city name, postal code or 'lat,lon'.
+        label: An optional display name for the location.
+        active: Whether the location should be polled.
+    """
+    from depends import db_depends
+    from weather_client.apis import api_weatherapi
+
+    try:
+        registered = api_weatherapi.db_client.register_location(
+            location={"query": location, "label": label, "active": active}, engine=db_depends.get_db_engine()
+        )
+    except Exception as exc:
+        msg = f"({type(exc)}) Error registering location '{location}'. Details: {exc}"
+        log.error(msg)
+
+        exit(1)
+
+    log.info(f"Registered location: {registered}")
+
+
+@weather_app.command(name="locations")
+def list_locations(
+    all_locations: t.Annotated[bool, Parameter(name="--all", show_default=True, help="Include inactive locations.")] = False,
+):
+    """List the locations in the polling registry."""
+    from depends import db_depends
+    from weather_client.apis import api_weatherapi
+
+    try:
+        locations = api_weatherapi.db_client.list_registered_locations(
+            active_only=not all_locations, engine=db_depends.get_db_engine()
+        )
+    except Exception as exc:
+        msg = f"({type(exc)}) Error listing registered locations. Details: {exc}"
+        log.error(msg)
+
+        exit(1)
+
+    for loc in locations:
+        print(
+            f"[{loc.id}] {loc.query}{f' ({loc.label})' if loc.label else ''} | active: {loc.active} | last polled: {loc.last_polled_at}"
+            f"{f' | next update: {loc.next_update_epoch} (every {loc.update_interval_s}s)' if loc.next_update_epoch else ''}"
+            f"{f' | last error: {loc.last_error}' if loc.last_error else ''}"
+        )
+
+    return locations
+
+
+@weather_app.command(name="poll-load")
+def show_poll_load(
+    poll: t.Annotated[t.Literal["current", "forecast"], Parameter(name="--poll", show_default=True)] = "current",
+    spread: t.Annotated[int | None, Parameter(name="--spread", help="Seconds polls are spread over. Defaults to the configured spread.")] = None,
+    slot: t.Annotated[int, Parameter(name="--slot", show_default=True, help="Seconds per histogram row.")] = 60,
+    simulate: t.Annotated[int | None, Parameter(name="--simulate", help="Report for this many made-up locations instead of the registry.")] = None,
+):
+    """Show how registered locations' polls are distributed over each dispatch's spread window."""
+    from depends import db_depends
+    from scheduling import stagger
+    from weather_client.apis import api_weatherapi
+
+    if spread is None:
+        spread = api_weatherapi.poll_spread_current if poll == "current" else api_weatherapi.poll_spread_forecast
+
+    if simulate:
+        queries = [f"simulated-location-{i}" for i in range(simulate)]
+    else:
+        try:
+            queries = [
+                loc.query
+                for loc in api_weatherapi.db_client.list_registered_locations(engine=db_depends.get_db_engine())
+                if (loc.poll_current if poll == "current" else loc.poll_forecast)
+            ]
+        except Exception as exc:
+            msg = f"({type(exc)}) Error listing registered locations. Details: {exc}"
+            log.error(msg)
+
+            exit(1)
+
+    print(f"{poll} polls for [{len(queries)}] location(s) over {spread}s (+/- {api_weatherapi.poll_jitter}s jitter per batch)")
+    print(stagger.format_load_report(stagger.load_distribution(queries, window=spread, slot=slot, salt=poll), slot=slot))
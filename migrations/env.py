@@ -7,7 +7,7 @@ from alembic import context
 
 import db
 from depends import db_depends
-from domain.weatherapi.location import WeatherAPILocationModel
+from domain.weatherapi.location import LocationRegistryModel, WeatherAPILocationModel
 from domain.weatherapi.weather.current import (
     CurrentWeatherModel,
     CurrentWeatherConditionModel,
@@ -15,6 +15,11 @@ from domain.weatherapi.weather.current import (
     CurrentWeatherJSONModel
 )
 from domain.weatherapi.weather.forecast import ForecastJSONModel
+from domain.weatherapi.weather.rollups import (
+    RollupWatermarkModel,
+    CurrentWeatherHourlyRollupModel,
+    CurrentWeatherDailyRollupModel,
+)
 from domain.openmeteo.location.models import MeteoLocationModel
 
 # this is the Alembic Config object, which provides
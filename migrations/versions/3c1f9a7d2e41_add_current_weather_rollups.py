@@ -0,0 +1,93 @@
+"""add current weather rollups
+
+Revision ID: 3c1f9a7d2e41
+Revises: b5e7b5cfaa92
+Create Date: 2026-10-19 09:12:31.418207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1f9a7d2e41'
+down_revision: Union[str, None] = 'b5e7b5cfaa92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _rollup_columns() -> list[sa.Column]:
+    return [
+        sa.Column('id', sa.INTEGER(), autoincrement=True, nullable=False),
+        sa.Column('location_id', sa.INTEGER(), nullable=False),
+        sa.Column('bucket_start_epoch', sa.INTEGER(), nullable=False),
+        sa.Column('reading_count', sa.INTEGER(), nullable=False),
+        sa.Column('first_reading_epoch', sa.INTEGER(), nullable=False),
+        sa.Column('last_reading_epoch', sa.INTEGER(), nullable=False),
+        sa.Column('temp_c_min', sa.FLOAT(), nullable=True),
+        sa.Column('temp_c_max', sa.FLOAT(), nullable=True),
+        sa.Column('temp_c_sum', sa.FLOAT(), nullable=False),
+        sa.Column('temp_c_count', sa.INTEGER(), server_default='0', nullable=False),
+        sa.Column('feelslike_c_sum', sa.FLOAT(), nullable=False),
+        sa.Column('feelslike_c_count', sa.INTEGER(), server_default='0', nullable=False),
+        sa.Column('humidity_sum', sa.FLOAT(), nullable=False),
+        sa.Column('humidity_count', sa.INTEGER(), server_default='0', nullable=False),
+        sa.Column('pressure_mb_sum', sa.FLOAT(), nullable=False),
+        sa.Column('pressure_mb_count', sa.INTEGER(), server_default='0', nullable=False),
+        sa.Column('wind_kph_sum', sa.FLOAT(), nullable=False),
+        sa.Column('wind_kph_count', sa.INTEGER(), server_default='0', nullable=False),
+        sa.Column('wind_kph_max', sa.FLOAT(), nullable=True),
+        sa.Column('gust_kph_max', sa.FLOAT(), nullable=True),
+        sa.Column('precip_mm_sum', sa.FLOAT(), nullable=False),
+        sa.Column('precip_mm_max', sa.FLOAT(), nullable=True),
+        sa.Column('uv_max', sa.FLOAT(), nullable=True),
+        sa.ForeignKeyConstraint(['location_id'], ['weatherapi_location.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('id'),
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('weatherapi_current_weather', sa.Column('created_at', sa.DateTime(timezone=True), nullable=True))
+
+    op.create_table('weatherapi_rollup_watermark',
+    sa.Column('id', sa.INTEGER(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.VARCHAR(length=255), nullable=False),
+    sa.Column('last_id', sa.INTEGER(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('id')
+    )
+    op.create_index(op.f('ix_weatherapi_rollup_watermark_name'), 'weatherapi_rollup_watermark', ['name'], unique=True)
+
+    op.create_table('weatherapi_current_weather_hourly',
+    *_rollup_columns(),
+    sa.UniqueConstraint('location_id', 'bucket_start_epoch', name='_hourly_location_bucket_uc')
+    )
+    op.create_index(op.f('ix_weatherapi_current_weather_hourly_location_id'), 'weatherapi_current_weather_hourly', ['location_id'], unique=False)
+    op.create_index(op.f('ix_weatherapi_current_weather_hourly_bucket_start_epoch'), 'weatherapi_current_weather_hourly', ['bucket_start_epoch'], unique=False)
+
+    op.create_table('weatherapi_current_weather_daily',
+    *_rollup_columns(),
+    sa.UniqueConstraint('location_id', 'bucket_start_epoch', name='_daily_location_bucket_uc')
+    )
+    op.create_index(op.f('ix_weatherapi_current_weather_daily_location_id'), 'weatherapi_current_weather_daily', ['location_id'], unique=False)
+    op.create_index(op.f('ix_weatherapi_current_weather_daily_bucket_start_epoch'), 'weatherapi_current_weather_daily', ['bucket_start_epoch'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_weatherapi_current_weather_daily_bucket_start_epoch'), table_name='weatherapi_current_weather_daily')
+    op.drop_index(op.f('ix_weatherapi_current_weather_daily_location_id'), table_name='weatherapi_current_weather_daily')
+    op.drop_table('weatherapi_current_weather_daily')
+    op.drop_index(op.f('ix_weatherapi_current_weather_hourly_bucket_start_epoch'), table_name='weatherapi_current_weather_hourly')
+    op.drop_index(op.f('ix_weatherapi_current_weather_hourly_location_id'), table_name='weatherapi_current_weather_hourly')
+    op.drop_table('weatherapi_current_weather_hourly')
+    op.drop_index(op.f('ix_weatherapi_rollup_watermark_name'), table_name='weatherapi_rollup_watermark')
+    op.drop_table('weatherapi_rollup_watermark')
+
+    with op.batch_alter_table('weatherapi_current_weather') as batch_op:
+        batch_op.drop_column('created_at')
@@ -0,0 +1,41 @@
+"""add raw json content hash
+
+Revision ID: 5e9c2a7b1f63
+Revises: 8d2b6f0c4a17
+Create Date: 2026-10-19 13:02:47.118530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e9c2a7b1f63'
+down_revision: Union[str, None] = '8d2b6f0c4a17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+## Raw JSON tables deduplicated by content hash. Existing rows keep a NULL hash.
+JSON_TABLES: list[str] = ['weatherapi_current_json', 'weatherapi_forecast_json']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table_name in JSON_TABLES:
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.add_column(sa.Column('content_hash', sa.String(length=64), nullable=True))
+            batch_op.add_column(sa.Column('seen_count', sa.INTEGER(), server_default='1', nullable=False))
+            batch_op.add_column(sa.Column('last_seen_at', sa.DateTime(timezone=True), nullable=True))
+            batch_op.create_index(batch_op.f(f'ix_{table_name}_content_hash'), ['content_hash'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table_name in JSON_TABLES:
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.drop_index(batch_op.f(f'ix_{table_name}_content_hash'))
+            batch_op.drop_column('last_seen_at')
+            batch_op.drop_column('seen_count')
+            batch_op.drop_column('content_hash')
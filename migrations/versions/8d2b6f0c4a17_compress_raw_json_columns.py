@@ -0,0 +1,90 @@
+"""compress raw json columns
+
+Revision ID: 8d2b6f0c4a17
+Revises: 3c1f9a7d2e41
+Create Date: 2026-10-19 11:40:05.903114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from db.types import CompressedJSON
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2b6f0c4a17'
+down_revision: Union[str, None] = '3c1f9a7d2e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+## (table, column) pairs converted between sqlalchemy.JSON & CompressedJSON
+JSON_COLUMNS: list[tuple[str, str]] = [
+    ('weatherapi_current_json', 'current_weather_json'),
+    ('weatherapi_forecast_json', 'forecast_json'),
+]
+
+BATCH_SIZE: int = 500
+
+
+def _copy_column(table_name: str, src: str, src_type: sa.types.TypeEngine, dst: str, dst_type: sa.types.TypeEngine) -> None:
+    """Copy src into dst in batches, converting through Python so each column's type handles (de)serialization."""
+    conn = op.get_bind()
+    table = sa.table(table_name, sa.column('id', sa.INTEGER()), sa.column(src, src_type), sa.column(dst, dst_type))
+
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(table.c.id, table.c[src]).where(table.c.id > last_id).order_by(table.c.id).limit(BATCH_SIZE)
+        ).all()
+
+        if not rows:
+            break
+
+        for row_id, value in rows:
+            ## Leave NULLs as NULL; sa.JSON would write them as the JSON text 'null'
+            if value is None:
+                continue
+
+            conn.execute(sa.update(table).where(table.c.id == row_id).values({dst: value}))
+
+        last_id = rows[-1][0]
+
+
+def _swap_column(
+    table_name: str,
+    column: str,
+    old_type: sa.types.TypeEngine,
+    new_type: sa.types.TypeEngine,
+    stored_type: sa.types.TypeEngine,
+) -> None:
+    """Replace a column with one of `new_type`, keeping its data & nullability.
+
+    Params:
+        stored_type: The type `new_type` is stored as, i.e. `LargeBinary` for `CompressedJSON`. Batch mode
+            reflects & copies the table, which needs a plain column type rather than a `TypeDecorator`.
+
+    """
+    tmp_column = f"{column}_tmp"
+    nullable: bool = next(c["nullable"] for c in sa.inspect(op.get_bind()).get_columns(table_name) if c["name"] == column)
+
+    op.add_column(table_name, sa.Column(tmp_column, new_type, nullable=True))
+    _copy_column(table_name, column, old_type, tmp_column, new_type)
+
+    ## batch_alter_table recreates the table on SQLite, which can't drop/rename columns in place
+    with op.batch_alter_table(table_name) as batch_op:
+        batch_op.drop_column(column)
+        batch_op.alter_column(tmp_column, new_column_name=column, existing_type=stored_type, nullable=nullable)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table_name, column in JSON_COLUMNS:
+        _swap_column(table_name, column, sa.JSON(), CompressedJSON(), sa.LargeBinary())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table_name, column in JSON_COLUMNS:
+        _swap_column(table_name, column, CompressedJSON(), sa.JSON(), sa.JSON())
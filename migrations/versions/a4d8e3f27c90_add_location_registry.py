@@ -0,0 +1,73 @@
+"""add location registry
+
+Revision ID: a4d8e3f27c90
+Revises: 5e9c2a7b1f63
+Create Date: 2026-10-19 14:21:09.550371
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d8e3f27c90'
+down_revision: Union[str, None] = '5e9c2a7b1f63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CURRENT_WEATHER_TABLE: str = 'weatherapi_current_weather'
+## The original UNIQUE(last_updated_epoch) constraint was created without a name. On SQLite it is
+#  only addressable through a naming convention in batch mode.
+NAMING_CONVENTION: dict = {'uq': 'uq_%(table_name)s_%(column_0_name)s'}
+OLD_EPOCH_UC: str = 'uq_weatherapi_current_weather_last_updated_epoch'
+NEW_EPOCH_UC: str = '_location_last_updated_epoch_uc'
+
+
+def _find_unique_constraint(columns: list[str]) -> str | None:
+    """Return the reflected name of the unique constraint on exactly these columns, if it has one."""
+    for uc in sa.inspect(op.get_bind()).get_unique_constraints(CURRENT_WEATHER_TABLE):
+        if uc['column_names'] == columns:
+            return uc['name']
+
+    return None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('weatherapi_location_registry',
+    sa.Column('id', sa.INTEGER(), autoincrement=True, nullable=False),
+    sa.Column('query', sa.VARCHAR(length=255), nullable=False),
+    sa.Column('label', sa.TEXT(), nullable=True),
+    sa.Column('active', sa.Boolean(), server_default=sa.true(), nullable=False),
+    sa.Column('poll_current', sa.Boolean(), server_default=sa.true(), nullable=False),
+    sa.Column('poll_forecast', sa.Boolean(), server_default=sa.true(), nullable=False),
+    sa.Column('location_id', sa.INTEGER(), nullable=True),
+    sa.Column('last_polled_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_error', sa.TEXT(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['location_id'], ['weatherapi_location.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('id')
+    )
+    op.create_index(op.f('ix_weatherapi_location_registry_query'), 'weatherapi_location_registry', ['query'], unique=True)
+    op.create_index(op.f('ix_weatherapi_location_registry_active'), 'weatherapi_location_registry', ['active'], unique=False)
+
+    ## last_updated_epoch is shared between locations, so it can only be unique per location
+    old_uc = _find_unique_constraint(['last_updated_epoch']) or OLD_EPOCH_UC
+
+    with op.batch_alter_table(CURRENT_WEATHER_TABLE, naming_convention=NAMING_CONVENTION) as batch_op:
+        batch_op.drop_constraint(old_uc, type_='unique')
+        batch_op.create_unique_constraint(NEW_EPOCH_UC, ['location_id', 'last_updated_epoch'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table(CURRENT_WEATHER_TABLE, naming_convention=NAMING_CONVENTION) as batch_op:
+        batch_op.drop_constraint(NEW_EPOCH_UC, type_='unique')
+        batch_op.create_unique_constraint(OLD_EPOCH_UC, ['last_updated_epoch'])
+
+    op.drop_index(op.f('ix_weatherapi_location_registry_active'), table_name='weatherapi_location_registry')
+    op.drop_index(op.f('ix_weatherapi_location_registry_query'), table_name='weatherapi_location_registry')
+    op.drop_table('weatherapi_location_registry')
@@ -0,0 +1,38 @@
+"""add location update tracking
+
+Revision ID: c7f1e2b9d804
+Revises: a4d8e3f27c90
+Create Date: 2026-10-19 16:02:44.118203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7f1e2b9d804'
+down_revision: Union[str, None] = 'a4d8e3f27c90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('weatherapi_location_registry', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('last_updated_epoch', sa.BigInteger(), nullable=True))
+        batch_op.add_column(sa.Column('update_interval_s', sa.INTEGER(), nullable=True))
+        batch_op.add_column(sa.Column('next_update_epoch', sa.BigInteger(), nullable=True))
+        batch_op.add_column(sa.Column('unchanged_polls', sa.INTEGER(), server_default='0', nullable=False))
+        batch_op.create_index(batch_op.f('ix_weatherapi_location_registry_next_update_epoch'), ['next_update_epoch'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('weatherapi_location_registry', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_weatherapi_location_registry_next_update_epoch'))
+        batch_op.drop_column('unchanged_polls')
+        batch_op.drop_column('next_update_epoch')
+        batch_op.drop_column('update_interval_s')
+        batch_op.drop_column('last_updated_epoch')
@@ -0,0 +1,126 @@
+"""add raw json location key
+
+Revision ID: d2a6b8c3f915
+Revises: c7f1e2b9d804
+Create Date: 2026-10-19 15:12:09.441207
+
+"""
+import json
+from typing import Sequence, Union
+import zlib
+
+from alembic import op
+import sqlalchemy as sa
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a6b8c3f915'
+down_revision: Union[str, None] = 'c7f1e2b9d804'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+## (table, payload column) pairs; retention downsamples these per location_key
+JSON_COLUMNS: list[tuple[str, str]] = [
+    ('weatherapi_current_json', 'current_weather_json'),
+    ('weatherapi_forecast_json', 'forecast_json'),
+]
+
+BATCH_SIZE: int = 500
+
+## Frozen copies of db.types.CompressedJSON's decoding & domain.weatherapi.location.get_location_key(),
+#  as of this revision, so later changes to the app can't change what this migration does.
+_CODEC_ZLIB = b"\x01"
+_CODEC_ZSTD = b"\x02"
+_CODEC_ZSTD_DICT = b"\x03"
+LOCATION_KEY_MAX_LENGTH: int = 255
+
+
+def _decode_payload(data) -> dict | None:
+    """Decode a stored payload. Returns None for values this migration can't decode (i.e. zstd dictionaries)."""
+    if data is None:
+        return None
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+
+    ## Legacy, uncompressed JSON
+    if isinstance(data, str):
+        return json.loads(data)
+
+    header, body = data[:1], data[1:]
+
+    if header == _CODEC_ZLIB:
+        return json.loads(zlib.decompress(body))
+    if header == _CODEC_ZSTD:
+        return json.loads(zstandard.ZstdDecompressor().decompress(body)) if zstandard is not None else None
+    if header == _CODEC_ZSTD_DICT:
+        ## Compressed with a registered zstd dictionary, which isn't available here
+        return None
+
+    return json.loads(data)
+
+
+def _get_location_key(payload: dict | None) -> str | None:
+    """Return the payload's "name|region|country" location key, lowercased, or None without a location name."""
+    if not payload:
+        return None
+
+    location: dict = payload.get("location") or {}
+    if not location.get("name"):
+        return None
+
+    key = "|".join(str(location.get(part) or "").strip().lower() for part in ("name", "region", "country"))
+
+    return key[:LOCATION_KEY_MAX_LENGTH]
+
+
+def _backfill_location_keys(table_name: str, payload_col: str) -> None:
+    """Decode each existing payload once & store its location key, in batches.
+
+    Rows whose payload can't be decoded here are left NULL, like rows without a location.
+    """
+    conn = op.get_bind()
+    table = sa.table(
+        table_name,
+        sa.column('id', sa.INTEGER()),
+        sa.column(payload_col, sa.LargeBinary()),
+        sa.column('location_key', sa.String(255)),
+    )
+
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(table.c.id, table.c[payload_col]).where(table.c.id > last_id).order_by(table.c.id).limit(BATCH_SIZE)
+        ).all()
+
+        if not rows:
+            break
+
+        for row_id, payload in rows:
+            location_key = _get_location_key(_decode_payload(payload))
+            if location_key is not None:
+                conn.execute(sa.update(table).where(table.c.id == row_id).values(location_key=location_key))
+
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table_name, payload_col in JSON_COLUMNS:
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.add_column(sa.Column('location_key', sa.String(length=255), nullable=True))
+            batch_op.create_index(batch_op.f(f'ix_{table_name}_location_key'), ['location_key'], unique=False)
+
+        _backfill_location_keys(table_name, payload_col)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table_name, _ in JSON_COLUMNS:
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.drop_index(batch_op.f(f'ix_{table_name}_location_key'))
+            batch_op.drop_column('location_key')
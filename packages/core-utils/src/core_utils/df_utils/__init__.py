@@ -2,4 +2,5 @@ from __future__ import annotations
 
 from .constants import *
 from .validators import *
-from .methods import *
\ No newline at end of file
+from .methods import *
+from .optimize import *
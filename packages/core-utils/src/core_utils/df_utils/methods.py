@@ -1,6 +1,13 @@
 from __future__ import annotations
 
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
 import logging
+import os
 from pathlib import Path
 import typing as t
 
@@ -14,6 +21,8 @@ __all__ = [
     "rename_df_cols",
     "count_df_rows",
     "load_pqs_to_df",
+    "find_data_files",
+    "load_files_parallel",
     "convert_csv_to_pq",
     "convert_pq_to_csv",
     "load_pq",
@@ -135,17 +144,15 @@ def count_df_rows(df: pd.DataFrame = None) -> int:
     return len(df.index)
 
 
-def load_pqs_to_df(
-    search_dir: str = None, filetype: str = ".parquet"
-) -> list[pd.DataFrame]:
-    """Load data export files in search_dir into list of DataFrames.
+def find_data_files(search_dir: t.Union[str, Path] = None, filetype: str = ".parquet") -> list[Path]:
+    """Return a sorted list of files in search_dir (recursive) matching filetype.
 
     Params:
-        search_dir (str): The directory to search for files in
+        search_dir (str|Path): The directory to search for files in
         filetype (str): The file extension to filter results by
 
     Returns:
-        (list[pandas.DataFrame]): A list of Pandas `DataFrame`s created from files in `search_dir`
+        (list[Path]): Sorted list of matching file paths
 
     """
     if search_dir is None:
@@ -154,29 +161,186 @@ def load_pqs_to_df(
     if not filetype.startswith("."):
         filetype = f".{filetype}"
 
-    files: list[Path] = []
+    return sorted(f for f in Path(search_dir).glob(f"**/*{filetype}") if f.is_file())
+
+
+def _read_data_file(
+    file: t.Union[str, Path], columns: list[str] | None = None, pq_engine: str = "pyarrow"
+) -> pd.DataFrame:
+    """Read a single .parquet or .csv file into a DataFrame.
+
+    Description:
+        Module-level so it can be pickled & sent to a `ProcessPoolExecutor`.
+
+    Params:
+        file (str|Path): Path to the file to read
+        columns (list[str]|None): Only load these columns. `None` loads all columns
+        pq_engine (str): The Parquet engine to use
+
+    Returns:
+        (pandas.DataFrame): The loaded `DataFrame`
+
+    """
+    file = Path(file)
+
+    if file.suffix == ".parquet":
+        return pd.read_parquet(file, engine=pq_engine, columns=columns)
+
+    elif file.suffix == ".csv":
+        ## Callable usecols tolerates files missing some of the requested columns
+        usecols = (lambda c: c in columns) if columns else None
+
+        return pd.read_csv(file, usecols=usecols)
+
+    raise ValueError(f"Unsupported file type: {file.suffix}. Must be one of ['.parquet', '.csv']")
+
+
+def load_files_parallel(
+    files: list[t.Union[str, Path]] = None,
+    columns: list[str] | None = None,
+    max_workers: int | None = None,
+    use_processes: bool = False,
+    pq_engine: str = "pyarrow",
+    progress_callback: t.Callable[[int, int, Path], None] | None = None,
+    progress_interval: int = 100,
+) -> list[pd.DataFrame]:
+    """Load a list of .parquet/.csv files into DataFrames concurrently.
+
+    Description:
+        Parquet reads with pyarrow release the GIL, so a thread pool scales well. CSV parsing
+        holds the GIL for longer; pass `use_processes=True` to parse CSV files in a process pool.
+        Results are returned in the same order as `files`, regardless of completion order.
+
+    Params:
+        files (list[str|Path]): Paths to the files to load
+        columns (list[str]|None): Only load these columns. `None` loads all columns
+        max_workers (int|None): Max number of workers. Defaults to `min(32, os.cpu_count() + 4)`
+            for threads, `os.cpu_count()` for processes
+        use_processes (bool): If `True`, use a `ProcessPoolExecutor` instead of threads
+        pq_engine (str): The Parquet engine to use
+        progress_callback (Callable[[int, int, Path], None]|None): Called after each file loads
+            with `(completed, total, file)`
+        progress_interval (int): Log progress every `progress_interval` files
+
+    Returns:
+        (list[pandas.DataFrame]): A list of `DataFrame`s, one per input file
+
+    """
+    if not files:
+        return []
+
+    files = [Path(f) for f in files]
+    total = len(files)
+
+    if max_workers is None:
+        max_workers = (os.cpu_count() or 1) if use_processes else min(32, (os.cpu_count() or 1) + 4)
+    max_workers = max(1, min(max_workers, total))
+
+    executor_cls: type[Executor] = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+
+    log.debug(f"Loading [{total}] file(s) with {executor_cls.__name__}(max_workers={max_workers})")
 
-    for f in Path(search_dir).glob(f"**/*{filetype}"):
-        if f.is_file():
-            files.append(f)
+    dataframes: list[pd.DataFrame | None] = [None] * total
+    completed = 0
 
-    dataframes: list[pd.DataFrame] = []
+    with executor_cls(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_read_data_file, f, columns, pq_engine): idx for idx, f in enumerate(files)
+        }
 
-    if filetype == ".parquet":
-        for pq in files:
-            df = load_pq(pq_file=pq)
+        for fut in as_completed(futures):
+            idx = futures[fut]
 
-            dataframes.append(df)
+            try:
+                dataframes[idx] = fut.result()
+            except Exception as exc:
+                msg = f"({type(exc)}) Error loading file '{files[idx]}' to DataFrame. Details: {exc}"
+                log.error(msg)
 
-    elif filetype == ".csv":
-        for f in files:
-            df = pd.read_csv(f)
+                for pending in futures:
+                    pending.cancel()
 
-            dataframes.append(df)
+                raise exc
+
+            completed += 1
+
+            if progress_callback is not None:
+                progress_callback(completed, total, files[idx])
+
+            if progress_interval and (completed % progress_interval == 0 or completed == total):
+                log.info(f"Loaded [{completed}/{total}] file(s)")
 
     return dataframes
 
 
+def load_pqs_to_df(
+    search_dir: str = None,
+    filetype: str = ".parquet",
+    columns: list[str] | None = None,
+    concat: bool = False,
+    max_workers: int | None = None,
+    use_processes: bool = False,
+    progress_callback: t.Callable[[int, int, Path], None] | None = None,
+) -> t.Union[list[pd.DataFrame], pd.DataFrame]:
+    """Load data export files in search_dir into list of DataFrames.
+
+    Description:
+        Files are loaded concurrently with `load_files_parallel()`. Pass `max_workers=1` to load serially.
+
+    Params:
+        search_dir (str): The directory to search for files in
+        filetype (str): The file extension to filter results by
+        columns (list[str]|None): Only load these columns. `None` loads all columns
+        concat (bool): If `True`, concatenate the loaded files into a single `DataFrame`. Columns are
+            unified across files; columns missing from a file are filled with nulls
+        max_workers (int|None): Max number of concurrent workers
+        use_processes (bool): If `True`, load files in a process pool (useful for large CSV directories)
+        progress_callback (Callable[[int, int, Path], None]|None): Called after each file loads
+            with `(completed, total, file)`
+
+    Returns:
+        (list[pandas.DataFrame]): A list of Pandas `DataFrame`s created from files in `search_dir`
+        (pandas.DataFrame): A single concatenated `DataFrame`, when `concat=True`
+
+    """
+    if not filetype.startswith("."):
+        filetype = f".{filetype}"
+
+    if filetype not in [".parquet", ".csv"]:
+        raise ValueError(f"Unsupported file type: {filetype}. Must be one of ['.parquet', '.csv']")
+
+    files: list[Path] = find_data_files(search_dir=search_dir, filetype=filetype)
+    log.debug(f"Found [{len(files)}] '{filetype}' file(s) in path: {search_dir}")
+
+    dataframes: list[pd.DataFrame] = load_files_parallel(
+        files=files,
+        columns=columns,
+        max_workers=max_workers,
+        use_processes=use_processes,
+        progress_callback=progress_callback,
+    )
+
+    if not concat:
+        return dataframes
+
+    if not dataframes:
+        return pd.DataFrame(columns=columns)
+
+    try:
+        ## Outer join unifies the schema, keeping the column order of the first file where possible
+        df = pd.concat(dataframes, ignore_index=True, join="outer", sort=False)
+    except Exception as exc:
+        msg = f"({type(exc)}) Error concatenating [{len(dataframes)}] DataFrame(s). Details: {exc}"
+        log.error(msg)
+
+        raise exc
+
+    if columns:
+        df = df.reindex(columns=columns)
+
+    return df
+
+
 def convert_csv_to_pq(
     csv_file: t.Union[str, Path] = None,
     pq_file: t.Union[str, Path] = None,
@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import logging
+import typing as t
+
+import pandas as pd
+
+if t.TYPE_CHECKING:
+    import sqlalchemy as sa
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    "WEATHER_FLOAT_COLS",
+    "WEATHER_SMALL_INT_COLS",
+    "WEATHER_CATEGORY_COLS",
+    "WEATHER_STRING_COLS",
+    "get_df_memory_usage",
+    "optimize_weather_df_dtypes",
+    "load_sql_to_df",
+]
+
+## Measurement columns. 2 decimal places of precision (the NUMERIC(12, 2) columns) fit in a float32
+WEATHER_FLOAT_COLS: list[str] = [
+    "temp_c",
+    "temp_f",
+    "wind_mph",
+    "wind_kph",
+    "pressure_mb",
+    "pressure_in",
+    "precip_mm",
+    "precip_in",
+    "feelslike_c",
+    "feelslike_f",
+    "windchill_c",
+    "windchill_f",
+    "heatindex_c",
+    "heatindex_f",
+    "dewpoint_c",
+    "dewpoint_f",
+    "vis_km",
+    "vis_miles",
+    "uv",
+    "gust_mph",
+    "gust_kph",
+    "co",
+    "no2",
+    "o3",
+    "so2",
+    "pm2_5",
+    "pm10",
+    "lat",
+    "lon",
+]
+
+## Bounded integer columns & the smallest dtype that holds their range
+WEATHER_SMALL_INT_COLS: dict[str, str] = {
+    "humidity": "uint8",
+    "cloud": "uint8",
+    "is_day": "uint8",
+    "us_epa_index": "uint8",
+    "gb_defra_index": "uint8",
+    "wind_degree": "uint16",
+    "code": "uint16",
+    "condition_code": "uint16",
+}
+
+## Low-cardinality text columns, stored as categoricals
+WEATHER_CATEGORY_COLS: list[str] = [
+    "wind_dir",
+    "text",
+    "condition_text",
+    "icon",
+    "condition_icon",
+    "name",
+    "location_name",
+    "region",
+    "country",
+    "tz_id",
+]
+
+## High-cardinality text columns, stored as Arrow-backed strings
+WEATHER_STRING_COLS: list[str] = [
+    "last_updated",
+    "localtime",
+]
+
+
+def _string_dtype() -> pd.StringDtype:
+    """Return an Arrow-backed string dtype if pyarrow is installed, otherwise the default string dtype."""
+    try:
+        import pyarrow  # noqa: F401
+
+        return pd.StringDtype("pyarrow")
+    except ImportError:
+        log.debug("pyarrow is not installed, falling back to the default pandas string dtype")
+
+        return pd.StringDtype()
+
+
+def get_df_memory_usage(df: pd.DataFrame) -> int:
+    """Return the deep memory usage of a DataFrame, in bytes.
+
+    Params:
+        df (pandas.DataFrame): The `DataFrame` to measure
+
+    Returns:
+        (int): Memory usage in bytes, including the contents of object columns
+
+    """
+    return int(df.memory_usage(deep=True).sum())
+
+
+def optimize_weather_df_dtypes(
+    df: pd.DataFrame,
+    float_dtype: str = "float32",
+    float_cols: list[str] | None = None,
+    small_int_cols: dict[str, str] | None = None,
+    category_cols: list[str] | None = None,
+    string_cols: list[str] | None = None,
+    max_category_ratio: float = 0.5,
+    report: bool = True,
+) -> pd.DataFrame:
+    """Convert a weather DataFrame's columns to memory-lean dtypes.
+
+    Description:
+        Measurement columns (often `Decimal` objects when read from NUMERIC columns) become `float_dtype`.
+        Bounded integers (humidity, cloud, is_day, ...) become small unsigned ints, using the nullable
+        (i.e. `UInt8`) variant when the column contains nulls. Low-cardinality text becomes `category`,
+        other text columns become Arrow-backed strings. Columns not present in the `DataFrame` are skipped.
+
+    Params:
+        df (pandas.DataFrame): The `DataFrame` to optimize
+        float_dtype (str): dtype for measurement columns
+        float_cols (list[str]|None): Measurement columns. Defaults to `WEATHER_FLOAT_COLS`
+        small_int_cols (dict[str, str]|None): Map of column name to integer dtype. Defaults to `WEATHER_SMALL_INT_COLS`
+        category_cols (list[str]|None): Low-cardinality text columns. Defaults to `WEATHER_CATEGORY_COLS`
+        string_cols (list[str]|None): Text columns to store as strings. Defaults to `WEATHER_STRING_COLS`
+        max_category_ratio (float): Only convert a `category_cols` column when `unique / rows` is at or below
+            this ratio; otherwise it is stored as a string
+        report (bool): If `True`, log memory usage before & after
+
+    Returns:
+        (pandas.DataFrame): A new `DataFrame` with optimized dtypes
+
+    """
+    if df is None or df.empty:
+        return df
+
+    float_cols = WEATHER_FLOAT_COLS if float_cols is None else float_cols
+    small_int_cols = WEATHER_SMALL_INT_COLS if small_int_cols is None else small_int_cols
+    category_cols = WEATHER_CATEGORY_COLS if category_cols is None else category_cols
+    string_cols = WEATHER_STRING_COLS if string_cols is None else string_cols
+
+    mem_before: int = get_df_memory_usage(df) if report else 0
+    str_dtype = _string_dtype()
+
+    df = df.copy()
+
+    for col in float_cols:
+        if col in df.columns:
+            ## to_numeric handles Decimal & numeric strings
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype(float_dtype)
+
+    for col, int_dtype in small_int_cols.items():
+        if col not in df.columns:
+            continue
+
+        series = pd.to_numeric(df[col], errors="coerce")
+
+        if series.isna().any():
+            ## Nullable integer dtypes are capitalized, i.e. uint8 -> UInt8
+            int_dtype = int_dtype.replace("uint", "UInt").replace("int", "Int")
+
+        try:
+            df[col] = series.astype(int_dtype)
+        except (TypeError, ValueError) as exc:
+            log.warning(f"Could not convert column '{col}' to {int_dtype}, leaving as {series.dtype}. Details: {exc}")
+            df[col] = series
+
+    for col in category_cols:
+        if col not in df.columns:
+            continue
+
+        n_unique = df[col].nunique(dropna=True)
+
+        if n_unique / len(df.index) <= max_category_ratio:
+            df[col] = df[col].astype("category")
+        else:
+            df[col] = df[col].astype(str_dtype)
+
+    for col in string_cols:
+        if col in df.columns and df[col].dtype == object:
+            df[col] = df[col].astype(str_dtype)
+
+    if report:
+        mem_after: int = get_df_memory_usage(df)
+        saved_pct = (1 - mem_after / mem_before) * 100 if mem_before else 0.0
+
+        log.info(
+            f"DataFrame memory usage: {mem_before / 1024:.1f} KiB -> {mem_after / 1024:.1f} KiB ({saved_pct:.1f}% smaller)"
+        )
+
+    return df
+
+
+def load_sql_to_df(
+    query: t.Union[str, "sa.Select", "sa.TextClause"],
+    engine: "sa.Engine",
+    params: dict | None = None,
+    optimize: bool = True,
+    chunksize: int | None = None,
+    report: bool = True,
+) -> pd.DataFrame:
+    """Load the results of a SQL query into a DataFrame, optionally applying weather dtype optimizations.
+
+    Description:
+        When `chunksize` is set, each chunk is optimized as it is read so the full, un-optimized
+        result set is never held in memory at once. Which text columns become categoricals is decided
+        once, from the first chunk, & every chunk is cast the same way; the chunks' categories are then
+        merged so the combined columns stay categorical.
+
+    Params:
+        query (str|sqlalchemy.Select|sqlalchemy.TextClause): The query to run
+        engine (sqlalchemy.Engine): The database engine to read from
+        params (dict|None): Optional bind parameters for the query
+        optimize (bool): If `True`, run `optimize_weather_df_dtypes()` on the result
+        chunksize (int|None): Read the result in chunks of this many rows
+        report (bool): If `True`, log memory usage before & after optimization
+
+    Returns:
+        (pandas.DataFrame): The query results
+
+    """
+    if engine is None:
+        raise ValueError("Missing a database engine to read from")
+
+    try:
+        if chunksize is None:
+            df = pd.read_sql(query, con=engine, params=params, coerce_float=True)
+
+            return optimize_weather_df_dtypes(df, report=report) if optimize else df
+
+        chunks: list[pd.DataFrame] = []
+        ## Decided from the first chunk: (category columns, text columns stored as strings)
+        text_cols: tuple[list[str], list[str]] | None = None
+
+        for chunk in pd.read_sql(query, con=engine, params=params, coerce_float=True, chunksize=chunksize):
+            if not optimize:
+                chunks.append(chunk)
+                continue
+
+            if text_cols is None:
+                chunk = optimize_weather_df_dtypes(chunk, report=False)
+                category_cols = [col for col in WEATHER_CATEGORY_COLS if col in chunk.columns and chunk[col].dtype == "category"]
+                text_cols = (category_cols, [col for col in WEATHER_CATEGORY_COLS if col not in category_cols])
+            else:
+                chunk = optimize_weather_df_dtypes(
+                    chunk,
+                    category_cols=text_cols[0],
+                    string_cols=WEATHER_STRING_COLS + text_cols[1],
+                    max_category_ratio=1.0,
+                    report=False,
+                )
+
+            chunks.append(chunk)
+
+    except Exception as exc:
+        msg = f"({type(exc)}) Error loading SQL query results to DataFrame. Details: {exc}"
+        log.error(msg)
+
+        raise exc
+
+    if not chunks:
+        return pd.DataFrame()
+
+    if text_cols is not None and len(chunks) > 1:
+        ## Chunks with different categories concat to object; give every chunk the same categories first
+        for col in text_cols[0]:
+            categories = pd.Index(pd.concat([chunk[col].cat.categories.to_series() for chunk in chunks]).unique())
+            for chunk in chunks:
+                chunk[col] = chunk[col].cat.set_categories(categories)
+
+    df = pd.concat(chunks, ignore_index=True)
+
+    if report:
+        log.info(f"Loaded [{len(df.index)}] row(s), {get_df_memory_usage(df) / 1024:.1f} KiB")
+
+    return df
@@ -1,17 +1,43 @@
 from __future__ import annotations
 
 import hashlib
+import json
+import typing as t
 
 from loguru import logger as log
 
-__all__ = ["get_hash_from_str"]
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
 
-def get_hash_from_str(input_str: str = None, encoding: str = "utf-8") -> str:
+__all__ = ["HASH_ALGORITHMS", "get_hash_from_str", "canonicalize_json", "get_content_hash"]
+
+## Named algorithms for get_hash_from_str(); any other hashlib name also works. xxh3 requires the optional 'xxhash' package
+HASH_ALGORITHMS: list[str] = ["md5", "sha1", "sha256", "blake2b", "xxh3_64", "xxh3_128"]
+
+
+def _new_hasher(algorithm: str):
+    if algorithm in ("xxh3_64", "xxh3_128"):
+        if xxhash is None:
+            raise ImportError(f"Hash algorithm '{algorithm}' requires the 'xxhash' package")
+
+        return getattr(xxhash, algorithm)()
+
+    if algorithm == "blake2b":
+        ## 128-bit digest, same width as md5, but faster on 64-bit CPUs
+        return hashlib.blake2b(digest_size=16)
+
+    return hashlib.new(algorithm)
+
+
+def get_hash_from_str(input_str: str = None, encoding: str = "utf-8", algorithm: str = "md5") -> str:
     """Return a hashed version of an input string.
 
     Params:
         input_str (str): The string to hash
         encoding (str): The character encoding to use
+        algorithm (str): The hash algorithm to use. Any `hashlib` algorithm, or one of `HASH_ALGORITHMS`
 
     Returns:
         (str): A hashed representation of `input_str`
@@ -40,7 +66,10 @@ def get_hash_from_str(input_str: str = None, encoding: str = "utf-8") -> str:
             raise exc
 
     try:
-        hash = hashlib.md5(input_str.encode(encoding)).hexdigest()
+        hasher = _new_hasher(algorithm)
+        hasher.update(input_str.encode(encoding))
+
+        hash = hasher.hexdigest()
 
     except Exception as exc:
         msg = Exception(
@@ -53,6 +82,69 @@ def get_hash_from_str(input_str: str = None, encoding: str = "utf-8") -> str:
     return hash
 
 
+def _drop_keys(data: t.Any, exclude_keys: set[str], path: str = "") -> t.Any:
+    """Return a copy of data without keys whose dotted path (i.e. `location.localtime`) is in exclude_keys."""
+    if isinstance(data, dict):
+        return {
+            k: _drop_keys(v, exclude_keys, f"{path}.{k}" if path else k)
+            for k, v in data.items()
+            if (f"{path}.{k}" if path else k) not in exclude_keys
+        }
+
+    if isinstance(data, list):
+        return [_drop_keys(v, exclude_keys, path) for v in data]
+
+    return data
+
+
+def canonicalize_json(data: t.Union[dict, list, str], exclude_keys: t.Iterable[str] | None = None) -> str:
+    """Return a canonical JSON string for data, so equal content always serializes to the same string.
+
+    Description:
+        Keys are sorted & whitespace is removed. Keys in `exclude_keys` are dropped before
+        serializing; nested keys are given as dotted paths, i.e. `location.localtime`.
+
+    Params:
+        data (dict | list | str): The data to canonicalize. Strings are parsed as JSON first.
+        exclude_keys (Iterable[str] | None): Dotted key paths to leave out.
+
+    Returns:
+        (str): The canonical JSON string.
+
+    """
+    if isinstance(data, str):
+        data = json.loads(data)
+
+    if exclude_keys:
+        data = _drop_keys(data, set(exclude_keys))
+
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def get_content_hash(
+    data: t.Union[dict, list, str],
+    exclude_keys: t.Iterable[str] | None = None,
+    algorithm: str = "blake2b",
+) -> str:
+    """Return a hash of data's canonical JSON form, for detecting duplicate API responses.
+
+    Description:
+        Two responses that only differ in key order, whitespace or an excluded (volatile) key
+        hash to the same value. Defaults to stdlib `blake2b`, which is available everywhere, so
+        hashes stored by different workers are always comparable.
+
+    Params:
+        data (dict | list | str): The data to hash. Strings are parsed as JSON first.
+        exclude_keys (Iterable[str] | None): Dotted key paths to leave out, i.e. `location.localtime`.
+        algorithm (str): The hash algorithm to use. See `get_hash_from_str()`.
+
+    Returns:
+        (str): A hex digest of the canonicalized data.
+
+    """
+    return get_hash_from_str(input_str=canonicalize_json(data, exclude_keys=exclude_keys), algorithm=algorithm)
+
+
 if __name__ == "__main__":
     log.info(f"Hashlib demo start")
 
@@ -0,0 +1,13 @@
+"""Lightweight timers & histograms for the ingest pipeline's hot paths.
+
+Stages (i.e. an HTTP request, a schema conversion, a database save) are timed with `time_stage()` or
+`@timed_stage()` into per-stage histograms. Timing is off until `enable_stage_timing()` is called; disabled
+timers cost one flag check. Other code can register its own `Counter`, `Gauge` & `Histogram` metrics;
+`render_prometheus()` exports all of them in Prometheus' text format.
+"""
+
+from __future__ import annotations
+
+from .constants import *
+from .metrics import *
+from .methods import *
@@ -0,0 +1,28 @@
+"""Constant variables for stage timing.
+
+- DEFAULT_BUCKETS (tuple[float, ...]): Histogram bucket upper bounds in seconds, from 0.5ms to 30s.
+- STAGE_METRIC_NAME (str): Name of the exported Prometheus histogram.
+"""
+
+from __future__ import annotations
+
+__all__ = ["DEFAULT_BUCKETS", "STAGE_METRIC_NAME"]
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+STAGE_METRIC_NAME: str = "weatherdata_stage_duration_seconds"
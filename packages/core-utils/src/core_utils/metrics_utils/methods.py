@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+from contextlib import contextmanager, nullcontext
+import contextvars
+import functools
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import time
+import typing as t
+
+from .constants import STAGE_METRIC_NAME
+from .metrics import Histogram, StageHistogram, get_registered_metrics
+
+from loguru import logger as log
+
+__all__ = [
+    "STAGE_HISTOGRAM",
+    "enable_stage_timing",
+    "stage_timing_enabled",
+    "time_stage",
+    "timed_stage",
+    "observe_stage",
+    "collect_stage_timings",
+    "get_stage_histograms",
+    "reset_stage_histograms",
+    "render_prometheus",
+    "start_metrics_server",
+]
+
+## Checked by every timer; when False, timers do nothing
+_ENABLED: bool = False
+
+STAGE_HISTOGRAM: Histogram = Histogram(
+    STAGE_METRIC_NAME, "Time spent in each ingest pipeline stage.", labelnames=["component", "stage"]
+)
+
+_NULL_TIMER = nullcontext()
+
+## Seconds per "component.stage" for the current task, while collect_stage_timings() is open
+_COLLECTED_TIMINGS: contextvars.ContextVar[dict[str, float] | None] = contextvars.ContextVar(
+    "collected_stage_timings", default=None
+)
+
+
+def _record(component: str, stage: str, seconds: float) -> None:
+    _get_histogram(component, stage).observe(seconds)
+
+    collected = _COLLECTED_TIMINGS.get()
+    if collected is not None:
+        key = f"{component}.{stage}"
+        collected[key] = collected.get(key, 0.0) + seconds
+
+
+class _StageTimer:
+    __slots__ = ("component", "stage", "start")
+
+    def __init__(self, component: str, stage: str):
+        self.component: str = component
+        self.stage: str = stage
+        self.start: float = 0.0
+
+    def __enter__(self) -> _StageTimer:
+        self.start = time.perf_counter()
+
+        return self
+
+    def __exit__(self, *exc) -> None:
+        _record(self.component, self.stage, time.perf_counter() - self.start)
+
+
+def _get_histogram(component: str, stage: str) -> StageHistogram:
+    return STAGE_HISTOGRAM.labels(component, stage)
+
+
+def enable_stage_timing(enabled: bool = True) -> None:
+    """Turn stage timing on (or off) for this process."""
+    global _ENABLED
+
+    _ENABLED = enabled
+    log.debug(f"Stage timing {'enabled' if enabled else 'disabled'}")
+
+
+def stage_timing_enabled() -> bool:
+    return _ENABLED
+
+
+def time_stage(component: str, stage: str) -> t.ContextManager:
+    """Time the body of a `with` block into the `(component, stage)` histogram.
+
+    Params:
+        component (str): The subsystem, i.e. "http", "convert" or "db".
+        stage (str): The step within the component, i.e. "send" or "save_forecast".
+
+    Returns:
+        (ContextManager): A timer, or a shared no-op context when stage timing is disabled.
+
+    """
+    if not _ENABLED:
+        return _NULL_TIMER
+
+    return _StageTimer(component, stage)
+
+
+def timed_stage(component: str, stage: str | None = None) -> t.Callable:
+    """Decorator that times each call of a function into the `(component, stage)` histogram.
+
+    Params:
+        component (str): The subsystem, i.e. "http", "convert" or "db".
+        stage (str | None): The step within the component. Defaults to the function's name.
+
+    """
+
+    def decorator(func: t.Callable) -> t.Callable:
+        stage_name: str = stage or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _ENABLED:
+                return func(*args, **kwargs)
+
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(component, stage_name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def observe_stage(component: str, stage: str, seconds: float) -> None:
+    """Record a duration measured elsewhere, i.e. across callbacks, in the `(component, stage)` histogram."""
+    if _ENABLED:
+        _record(component, stage, seconds)
+
+
+@contextmanager
+def collect_stage_timings() -> t.Generator[dict[str, float], None, None]:
+    """Also total the stages timed in the body of a `with` block, i.e. one Celery task, for logging.
+
+    Description:
+        Stages run in threads started with a copy of this context (see `contextvars.copy_context()`)
+        are included. Nothing is collected while stage timing is disabled.
+
+    Returns:
+        (dict[str, float]): Seconds spent in each stage, keyed by "component.stage". Filled in as stages finish.
+
+    """
+    timings: dict[str, float] = {}
+    token = _COLLECTED_TIMINGS.set(timings)
+
+    try:
+        yield timings
+    finally:
+        _COLLECTED_TIMINGS.reset(token)
+
+
+def get_stage_histograms() -> dict[tuple[str, str], dict[str, t.Any]]:
+    """Return a snapshot of every stage histogram recorded in this process, keyed by `(component, stage)`."""
+    return STAGE_HISTOGRAM.snapshots()
+
+
+def reset_stage_histograms() -> None:
+    STAGE_HISTOGRAM.clear()
+
+
+def render_prometheus() -> str:
+    """Render every registered metric, including the stage histograms, in the Prometheus text exposition format.
+
+    Returns:
+        (str): The metrics text, ending with a newline.
+
+    """
+    lines: list[str] = []
+
+    for metric in get_registered_metrics():
+        lines.extend(metric.render())
+
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+
+        body = render_prometheus().encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        ## Scrapes would flood the worker's logs
+        pass
+
+
+def start_metrics_server(port: int, host: str = "0.0.0.0") -> ThreadingHTTPServer:
+    """Serve `render_prometheus()` at `http://<host>:<port>/metrics` from a daemon thread.
+
+    Description:
+        For processes without a web app, i.e. Celery workers. Each process keeps its own
+        histograms, so each needs its own port.
+
+    Returns:
+        (ThreadingHTTPServer): The running server; call `shutdown()` to stop it.
+
+    """
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name=f"metrics-server-{port}", daemon=True).start()
+
+    log.info(f"Serving stage metrics at http://{host}:{port}/metrics")
+
+    return server
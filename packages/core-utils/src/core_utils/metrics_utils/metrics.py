@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import abc
+from bisect import bisect_left
+import threading
+import typing as t
+
+from .constants import DEFAULT_BUCKETS
+
+__all__ = [
+    "StageHistogram",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "CallbackGauge",
+    "get_registered_metrics",
+    "unregister_metric",
+]
+
+## Metrics rendered by render_prometheus(), in registration order
+_REGISTRY: dict[str, _Metric] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def _escape(value: t.Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: t.Sequence[str], values: t.Sequence[t.Any], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+
+class StageHistogram:
+    """A thread-safe, fixed-bucket histogram of durations in seconds.
+
+    Params:
+        buckets (tuple[float, ...]): Sorted bucket upper bounds. Observations above the last bound
+            only count towards `+Inf`.
+
+    """
+
+    __slots__ = ("buckets", "counts", "count", "sum", "_lock")
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets: tuple[float, ...] = buckets
+        ## Per-bucket (non-cumulative) counts, with a final slot for +Inf
+        self.counts: list[int] = [0] * (len(buckets) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        index = bisect_left(self.buckets, seconds)
+
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum += seconds
+
+    def snapshot(self) -> dict[str, t.Any]:
+        """Return the count, sum & cumulative bucket counts (Prometheus `le` semantics)."""
+        with self._lock:
+            counts = list(self.counts)
+            count, total = self.count, self.sum
+
+        cumulative: list[tuple[float, int]] = []
+        running = 0
+        for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+            running += bucket_count
+            cumulative.append((bound, running))
+
+        return {"count": count, "sum": total, "buckets": cumulative}
+
+
+class _Metric(abc.ABC):
+    """Base for registered metrics. Subclasses set `type_name` & render their values in `samples()`."""
+
+    type_name: str = "untyped"
+
+    def __init__(self, name: str, description: str, labelnames: t.Sequence[str] = (), register: bool = True):
+        self.name: str = name
+        self.description: str = description
+        self.labelnames: tuple[str, ...] = tuple(labelnames)
+        self._lock = threading.Lock()
+
+        if register:
+            with _REGISTRY_LOCK:
+                if name in _REGISTRY:
+                    raise ValueError(f"A metric named '{name}' is already registered")
+                _REGISTRY[name] = self
+
+    def _check_labels(self, labelvalues: tuple) -> None:
+        if len(labelvalues) != len(self.labelnames):
+            raise ValueError(f"Metric '{self.name}' expects labels {self.labelnames}, got {labelvalues}")
+
+    @abc.abstractmethod
+    def samples(self) -> list[str]:
+        """Return the metric's sample lines in the Prometheus text format."""
+
+    def render(self) -> list[str]:
+        return [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.type_name}", *self.samples()]
+
+
+class Counter(_Metric):
+    """A monotonically increasing count, i.e. requests served, per label set.
+
+    Usage:
+        REQUESTS = Counter("weatherdata_requests_total", "Requests served.", ["route"])
+        REQUESTS.inc("/health")
+    """
+
+    type_name = "counter"
+
+    def __init__(self, name: str, description: str, labelnames: t.Sequence[str] = (), register: bool = True):
+        super().__init__(name, description, labelnames, register=register)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, *labelvalues: t.Any, amount: float = 1) -> None:
+        self._check_labels(labelvalues)
+
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def get(self, *labelvalues: t.Any) -> float:
+        return self._values.get(labelvalues, 0)
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            values = dict(self._values)
+
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {value!r}" for labels, value in sorted(values.items())]
+
+
+class Gauge(Counter):
+    """A value that goes up & down, i.e. requests in flight, per label set."""
+
+    type_name = "gauge"
+
+    def dec(self, *labelvalues: t.Any, amount: float = 1) -> None:
+        self.inc(*labelvalues, amount=-amount)
+
+    def set(self, value: float, *labelvalues: t.Any) -> None:
+        self._check_labels(labelvalues)
+
+        with self._lock:
+            self._values[labelvalues] = value
+
+
+class CallbackGauge(_Metric):
+    """A gauge read at render time, i.e. database pool usage.
+
+    Params:
+        callback (Callable[[], dict[tuple, float]]): Returns the current value for each label set.
+            Errors are swallowed & render no samples, so one broken callback can't fail a scrape.
+
+    """
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        callback: t.Callable[[], dict[tuple, float]],
+        labelnames: t.Sequence[str] = (),
+        register: bool = True,
+    ):
+        super().__init__(name, description, labelnames, register=register)
+        self.callback = callback
+
+    def samples(self) -> list[str]:
+        try:
+            values = self.callback()
+        except Exception:
+            return []
+
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {value!r}" for labels, value in sorted(values.items())]
+
+
+class Histogram(_Metric):
+    """Durations in seconds, bucketed per label set.
+
+    Usage:
+        LATENCY = Histogram("weatherdata_request_duration_seconds", "Request latency.", ["route"])
+        LATENCY.observe(0.12, "/health")
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labelnames: t.Sequence[str] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        register: bool = True,
+    ):
+        super().__init__(name, description, labelnames, register=register)
+        self.buckets: tuple[float, ...] = buckets
+        self._histograms: dict[tuple, StageHistogram] = {}
+
+    def labels(self, *labelvalues: t.Any) -> StageHistogram:
+        """Return the histogram for one label set, to observe into it without a lookup per call."""
+        self._check_labels(labelvalues)
+
+        histogram = self._histograms.get(labelvalues)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(labelvalues, StageHistogram(self.buckets))
+
+        return histogram
+
+    def observe(self, seconds: float, *labelvalues: t.Any) -> None:
+        self.labels(*labelvalues).observe(seconds)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    def snapshots(self) -> dict[tuple, dict[str, t.Any]]:
+        with self._lock:
+            histograms = dict(self._histograms)
+
+        return {labels: histogram.snapshot() for labels, histogram in sorted(histograms.items())}
+
+    def samples(self) -> list[str]:
+        lines: list[str] = []
+
+        for labels, snapshot in self.snapshots().items():
+            for bound, count in snapshot["buckets"]:
+                le = f'le="{_format_bound(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, extra=le)} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {snapshot['sum']!r}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {snapshot['count']}")
+
+        return lines
+
+
+def get_registered_metrics() -> list[_Metric]:
+    with _REGISTRY_LOCK:
+        return list(_REGISTRY.values())
+
+
+def unregister_metric(name: str) -> None:
+    with _REGISTRY_LOCK:
+        _REGISTRY.pop(name, None)
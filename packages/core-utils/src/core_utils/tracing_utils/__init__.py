@@ -0,0 +1,10 @@
+"""Optional OpenTelemetry tracing.
+
+Requires the `core-utils[otel]` extra. Without it, or until `configure_tracing()` is called, `start_span()`
+returns a no-op context manager, so instrumented code runs unchanged.
+"""
+
+from __future__ import annotations
+
+from .constants import *
+from .methods import *
@@ -0,0 +1,14 @@
+"""Constant variables for tracing.
+
+- TRACING_EXPORTERS (list[str]): Span exporters accepted by `configure_tracing()`.
+- DEFAULT_SERVICE_NAME (str): `service.name` resource attribute when none is given.
+- TRACER_NAME (str): Instrumentation scope of spans started with `start_span()`/`@traced()`.
+"""
+
+from __future__ import annotations
+
+__all__ = ["TRACING_EXPORTERS", "DEFAULT_SERVICE_NAME", "TRACER_NAME"]
+
+TRACING_EXPORTERS: list[str] = ["otlp", "file", "console"]
+DEFAULT_SERVICE_NAME: str = "weatherdata"
+TRACER_NAME: str = "weatherdata"
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+from contextlib import nullcontext
+import functools
+from pathlib import Path
+import typing as t
+
+from .constants import DEFAULT_SERVICE_NAME, TRACER_NAME, TRACING_EXPORTERS
+
+from loguru import logger as log
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    from opentelemetry.trace import Status, StatusCode
+except ImportError:
+    trace = None
+
+__all__ = [
+    "tracing_available",
+    "tracing_enabled",
+    "configure_tracing",
+    "get_tracer",
+    "shutdown_tracing",
+    "start_span",
+    "traced",
+    "set_span_attributes",
+    "record_span_error",
+]
+
+## Set by configure_tracing(); when False, spans are no-ops
+_ENABLED: bool = False
+_PROVIDER = None
+
+_NULL_SPAN = nullcontext()
+
+
+def tracing_available() -> bool:
+    """Return `True` if the OpenTelemetry SDK is installed (the `core-utils[otel]` extra)."""
+    return trace is not None
+
+
+def tracing_enabled() -> bool:
+    return _ENABLED
+
+
+def _get_exporter(exporter: str, otlp_endpoint: str | None = None, file_path: str | None = None):
+    match exporter:
+        case "otlp":
+            try:
+                from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+            except ImportError as exc:
+                raise ImportError("The 'otlp' tracing exporter requires the 'opentelemetry-exporter-otlp' package") from exc
+
+            ## Without an endpoint, the exporter reads OTEL_EXPORTER_OTLP_ENDPOINT (default: localhost:4317)
+            return OTLPSpanExporter(endpoint=otlp_endpoint) if otlp_endpoint else OTLPSpanExporter()
+        case "file":
+            path = Path(file_path or "logs/traces.jsonl")
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            ## One JSON span per line
+            return ConsoleSpanExporter(
+                out=open(path, "a", encoding="utf-8"), formatter=lambda span: span.to_json(indent=None) + "\n"
+            )
+        case "console":
+            return ConsoleSpanExporter()
+
+
+def configure_tracing(
+    service_name: str = DEFAULT_SERVICE_NAME,
+    exporter: str = "otlp",
+    otlp_endpoint: str | None = None,
+    file_path: str | None = None,
+    sample_ratio: float = 1.0,
+) -> bool:
+    """Install an OpenTelemetry tracer provider for this process & enable `start_span()`.
+
+    Description:
+        Spans are batched & exported in a background thread. Sampling follows the parent span's decision
+        when there is one (i.e. a Celery task started from a traced API request), so a trace is either
+        complete or absent. Call once per process, after forking.
+
+    Params:
+        service_name (str): The `service.name` resource attribute, i.e. "weatherdata-api".
+        exporter (str): One of `TRACING_EXPORTERS`. "otlp" sends to an OTLP collector over gRPC, "file"
+            appends JSON lines to `file_path`, "console" prints spans.
+        otlp_endpoint (str | None): Collector address, i.e. "http://localhost:4317".
+        file_path (str | None): Output file for the "file" exporter.
+        sample_ratio (float): Fraction of new traces to record, from 0 to 1.
+
+    Returns:
+        (bool): `True` if tracing was enabled, `False` if OpenTelemetry isn't installed.
+
+    Raises:
+        ValueError: If `exporter` is not one of `TRACING_EXPORTERS`.
+
+    """
+    global _ENABLED, _PROVIDER
+
+    if exporter not in TRACING_EXPORTERS:
+        raise ValueError(f"Invalid tracing exporter: '{exporter}'. Must be one of {TRACING_EXPORTERS}")
+
+    if trace is None:
+        log.warning("Tracing is enabled, but OpenTelemetry is not installed. Install the 'core-utils[otel]' extra.")
+        return False
+
+    if _ENABLED:
+        log.debug("Tracing is already configured for this process")
+        return True
+
+    try:
+        provider = TracerProvider(
+            resource=Resource.create({"service.name": service_name}),
+            sampler=ParentBased(TraceIdRatioBased(sample_ratio)),
+        )
+        provider.add_span_processor(
+            BatchSpanProcessor(_get_exporter(exporter, otlp_endpoint=otlp_endpoint, file_path=file_path))
+        )
+        trace.set_tracer_provider(provider)
+    except Exception as exc:
+        msg = f"({type(exc)}) Error configuring tracing. Details: {exc}"
+        log.error(msg)
+
+        raise exc
+
+    _PROVIDER = provider
+    _ENABLED = True
+    log.info(f"Tracing enabled for service '{service_name}', exporting to: {exporter}")
+
+    return True
+
+
+def shutdown_tracing() -> None:
+    """Flush buffered spans & stop exporting."""
+    global _ENABLED
+
+    if _PROVIDER is not None:
+        _PROVIDER.shutdown()
+
+    _ENABLED = False
+
+
+def get_tracer():
+    """Return the OpenTelemetry tracer for this app, or `None` if tracing is disabled.
+
+    Description:
+        For spans that can't be a `with` block, i.e. ones started & ended in separate callbacks.
+    """
+    if not _ENABLED:
+        return None
+
+    return trace.get_tracer(TRACER_NAME)
+
+
+def start_span(name: str, attributes: dict[str, t.Any] | None = None) -> t.ContextManager:
+    """Start a span as a child of the current span, for the body of a `with` block.
+
+    Description:
+        Exceptions raised in the block are recorded on the span & set its status to error.
+
+    Returns:
+        (ContextManager): The span context, or a shared no-op context when tracing is disabled.
+
+    """
+    if not _ENABLED:
+        return _NULL_SPAN
+
+    return trace.get_tracer(TRACER_NAME).start_as_current_span(name, attributes=attributes)
+
+
+def traced(name: str | None = None, attributes: dict[str, t.Any] | None = None) -> t.Callable:
+    """Decorator that wraps each call of a function in a span. `name` defaults to the function's qualified name."""
+
+    def decorator(func: t.Callable) -> t.Callable:
+        span_name: str = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _ENABLED:
+                return func(*args, **kwargs)
+
+            with trace.get_tracer(TRACER_NAME).start_as_current_span(span_name, attributes=attributes):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def set_span_attributes(attributes: dict[str, t.Any]) -> None:
+    """Set attributes on the current span, if tracing is enabled."""
+    if _ENABLED:
+        trace.get_current_span().set_attributes(attributes)
+
+
+def record_span_error(span, exc: BaseException) -> None:
+    """Record an exception on a span & set its status to error."""
+    span.record_exception(exc)
+    span.set_status(Status(StatusCode.ERROR, str(exc)))
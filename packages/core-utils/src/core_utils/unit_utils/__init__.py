@@ -0,0 +1,10 @@
+"""Vectorized weather unit conversions & derived metrics.
+
+Functions accept scalars, lists, NumPy arrays or Pandas Series and return NumPy arrays (or a Series,
+when given a Series), so readings can be stored in canonical metric units and converted on read.
+"""
+
+from __future__ import annotations
+
+from .constants import *
+from .methods import *
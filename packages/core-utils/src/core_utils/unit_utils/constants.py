@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+__all__ = [
+    "KPH_PER_MPH",
+    "MS_PER_KPH",
+    "INHG_PER_MB",
+    "MM_PER_IN",
+    "KM_PER_MILE",
+    "MAGNUS_A",
+    "MAGNUS_B",
+    "WIND_CHILL_MAX_TEMP_C",
+    "WIND_CHILL_MIN_WIND_KPH",
+    "HEAT_INDEX_MIN_TEMP_C",
+    "METRIC_TO_IMPERIAL_COLS",
+]
+
+KPH_PER_MPH: float = 1.609344
+MS_PER_KPH: float = 1 / 3.6
+INHG_PER_MB: float = 0.029529983071445
+MM_PER_IN: float = 25.4
+KM_PER_MILE: float = 1.609344
+
+## Magnus formula coefficients (Alduchov & Eskridge, 1996), valid -40C to 50C
+MAGNUS_A: float = 17.625
+MAGNUS_B: float = 243.04
+
+## NWS wind chill is only defined at or below 10C (50F) with wind above 4.8 km/h (3 mph)
+WIND_CHILL_MAX_TEMP_C: float = 10.0
+WIND_CHILL_MIN_WIND_KPH: float = 4.8
+## NWS heat index is only meaningful at or above ~26.7C (80F)
+HEAT_INDEX_MIN_TEMP_C: float = 26.7
+
+## Canonical metric column -> (imperial column, conversion function name)
+METRIC_TO_IMPERIAL_COLS: dict[str, tuple[str, str]] = {
+    "temp_c": ("temp_f", "c_to_f"),
+    "feelslike_c": ("feelslike_f", "c_to_f"),
+    "windchill_c": ("windchill_f", "c_to_f"),
+    "heatindex_c": ("heatindex_f", "c_to_f"),
+    "dewpoint_c": ("dewpoint_f", "c_to_f"),
+    "wind_kph": ("wind_mph", "kph_to_mph"),
+    "gust_kph": ("gust_mph", "kph_to_mph"),
+    "pressure_mb": ("pressure_in", "mb_to_inhg"),
+    "precip_mm": ("precip_in", "mm_to_in"),
+    "vis_km": ("vis_miles", "km_to_miles"),
+}
@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import logging
+import typing as t
+
+from .constants import (
+    HEAT_INDEX_MIN_TEMP_C,
+    INHG_PER_MB,
+    KM_PER_MILE,
+    KPH_PER_MPH,
+    MAGNUS_A,
+    MAGNUS_B,
+    METRIC_TO_IMPERIAL_COLS,
+    MM_PER_IN,
+    MS_PER_KPH,
+    WIND_CHILL_MAX_TEMP_C,
+    WIND_CHILL_MIN_WIND_KPH,
+)
+
+import numpy as np
+import pandas as pd
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    "c_to_f",
+    "f_to_c",
+    "kph_to_mph",
+    "mph_to_kph",
+    "kph_to_ms",
+    "mb_to_inhg",
+    "inhg_to_mb",
+    "mm_to_in",
+    "in_to_mm",
+    "km_to_miles",
+    "miles_to_km",
+    "dew_point_c",
+    "heat_index_c",
+    "wind_chill_c",
+    "feels_like_c",
+    "add_imperial_columns",
+    "add_derived_metrics",
+]
+
+ArrayLike = t.Union[float, int, list, np.ndarray, pd.Series]
+
+
+def _as_array(values: ArrayLike) -> np.ndarray:
+    """Return values as a float64 NumPy array. Decimals & None become floats/NaN."""
+    if isinstance(values, pd.Series):
+        return pd.to_numeric(values, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+
+    return np.asarray(values, dtype="float64")
+
+
+def _like(result: np.ndarray, values: ArrayLike) -> t.Union[np.ndarray, pd.Series, float]:
+    """Return result in the same container type as the input values."""
+    if isinstance(values, pd.Series):
+        return pd.Series(result, index=values.index, name=values.name)
+
+    if np.ndim(result) == 0:
+        return float(result)
+
+    return result
+
+
+def c_to_f(temp_c: ArrayLike) -> t.Union[np.ndarray, pd.Series, float]:
+    """Convert degrees Celsius to Fahrenheit."""
+    return _like(_as_array(temp_c) * 9.0 / 5.0 + 32.0, temp_c)
+
+
+def f_to_c(temp_f: ArrayLike) -> t.Union[np.ndarray, pd.Series, float]:
+    """Convert degrees Fahrenheit to Celsius."""
+    return _like((_as_array(temp_f) - 32.0) * 5.0 / 9.0, temp_f)
+
+
+def kph_to_mph(speed_kph: ArrayLike) -> t.Union[np.ndarray, pd.Series, float]:
+    """Convert kilometers per hour to miles per hour."""
+    return _like(_as_array(speed_kph) / KPH_PER_MPH, speed_kph)
+
+
+def mph_to_kph(speed_mph: ArrayLike) -> t.Union[np.ndarray, pd.Series, float]:
+    """Convert miles per hour to kilometers per hour."""
+    return _like(_as_array(speed_mph) * KPH_PER_MPH, speed_mph)
+
+
+def kph_to_ms(speed_kph: ArrayLike) -> t.Union[np.ndarray, pd.Series, float]:
+    """Convert kilometers per hour to meters per second."""
+    return _like(_as_array(speed_kph) * MS_PER_KPH, speed_kph)
+
+
+def mb_to_inhg(pressure_mb: ArrayLike) -> t.Union[np.ndarray, pd.Series, float]:
+    """Convert millibars (hPa) to inches of mercury."""
+    return _like(_as_array(pressure_mb) * INHG_PER_MB, pressure_mb)
+
+
+def inhg_to_mb(pressure_in: ArrayLike) -> t.Union[np.ndarray, pd.Series, float]:
+    """Convert inches of mercury to millibars (hPa)."""
+    return _like(_as_array(pressure_in) / INHG_PER_MB, pressure_in)
+
+
+def mm_to_in(length_mm: ArrayLike) -> t.Union[np.ndarray, pd.Series, float]:
+    """Convert millimeters to inches."""
+    return _like(_as_array(length_mm) / MM_PER_IN, length_mm)
+
+
+def in_to_mm(length_in: ArrayLike) -> t.Union[np.ndarray, pd.Series, float]:
+    """Convert inches to millimeters."""
+    return _like(_as_array(length_in) * MM_PER_IN, length_in)
+
+
+def km_to_miles(distance_km: ArrayLike) -> t.Union[np.ndarray, pd.Series, float]:
+    """Convert kilometers to miles."""
+    return _like(_as_array(distance_km) / KM_PER_MILE, distance_km)
+
+
+def miles_to_km(distance_miles: ArrayLike) -> t.Union[np.ndarray, pd.Series, float]:
+    """Convert miles to kilometers."""
+    return _like(_as_array(distance_miles) * KM_PER_MILE, distance_miles)
+
+
+_CONVERTERS: dict[str, t.Callable[[ArrayLike], t.Union[np.ndarray, pd.Series, float]]] = {
+    "c_to_f": c_to_f,
+    "f_to_c": f_to_c,
+    "kph_to_mph": kph_to_mph,
+    "mph_to_kph": mph_to_kph,
+    "kph_to_ms": kph_to_ms,
+    "mb_to_inhg": mb_to_inhg,
+    "inhg_to_mb": inhg_to_mb,
+    "mm_to_in": mm_to_in,
+    "in_to_mm": in_to_mm,
+    "km_to_miles": km_to_miles,
+    "miles_to_km": miles_to_km,
+}
+
+
+def dew_point_c(temp_c: ArrayLike, humidity: ArrayLike) -> t.Union[np.ndarray, pd.Series, float]:
+    """Calculate dew point with the Magnus formula.
+
+    Params:
+        temp_c (ArrayLike): Air temperature in Celsius
+        humidity (ArrayLike): Relative humidity, in percent (0-100)
+
+    Returns:
+        (numpy.ndarray|pandas.Series|float): Dew point in Celsius. `NaN` where humidity is 0 or missing
+
+    """
+    t_c = _as_array(temp_c)
+    rh = _as_array(humidity)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gamma = np.log(rh / 100.0) + (MAGNUS_A * t_c) / (MAGNUS_B + t_c)
+        dew_point = (MAGNUS_B * gamma) / (MAGNUS_A - gamma)
+
+    dew_point = np.where(rh > 0, dew_point, np.nan)
+
+    return _like(dew_point, temp_c)
+
+
+def heat_index_c(temp_c: ArrayLike, humidity: ArrayLike) -> t.Union[np.ndarray, pd.Series, float]:
+    """Calculate heat index with the NWS Rothfusz regression, including its low/high humidity adjustments.
+
+    Description:
+        Uses Steadman's simple formula when its result is below 80F, as the NWS does.
+
+    Params:
+        temp_c (ArrayLike): Air temperature in Celsius
+        humidity (ArrayLike): Relative humidity, in percent (0-100)
+
+    Returns:
+        (numpy.ndarray|pandas.Series|float): Heat index in Celsius
+
+    """
+    t_f = _as_array(temp_c) * 9.0 / 5.0 + 32.0
+    rh = _as_array(humidity)
+
+    simple = 0.5 * (t_f + 61.0 + (t_f - 68.0) * 1.2 + rh * 0.094)
+
+    full = (
+        -42.379
+        + 2.04901523 * t_f
+        + 10.14333127 * rh
+        - 0.22475541 * t_f * rh
+        - 6.83783e-3 * t_f**2
+        - 5.481717e-2 * rh**2
+        + 1.22874e-3 * t_f**2 * rh
+        + 8.5282e-4 * t_f * rh**2
+        - 1.99e-6 * t_f**2 * rh**2
+    )
+
+    with np.errstate(invalid="ignore"):
+        low_rh_adj = ((13.0 - rh) / 4.0) * np.sqrt(np.clip((17.0 - np.abs(t_f - 95.0)) / 17.0, 0.0, None))
+    high_rh_adj = ((rh - 85.0) / 10.0) * ((87.0 - t_f) / 5.0)
+
+    full = np.where((rh < 13.0) & (t_f >= 80.0) & (t_f <= 112.0), full - low_rh_adj, full)
+    full = np.where((rh > 85.0) & (t_f >= 80.0) & (t_f <= 87.0), full + high_rh_adj, full)
+
+    heat_index_f = np.where((simple + t_f) / 2.0 < 80.0, simple, full)
+
+    return _like((heat_index_f - 32.0) * 5.0 / 9.0, temp_c)
+
+
+def wind_chill_c(temp_c: ArrayLike, wind_kph: ArrayLike) -> t.Union[np.ndarray, pd.Series, float]:
+    """Calculate wind chill with the NWS/Environment Canada formula.
+
+    Description:
+        Where wind chill is undefined (temperature above 10C or wind at/below 4.8 km/h), the air
+        temperature is returned.
+
+    Params:
+        temp_c (ArrayLike): Air temperature in Celsius
+        wind_kph (ArrayLike): Wind speed in kilometers per hour
+
+    Returns:
+        (numpy.ndarray|pandas.Series|float): Wind chill in Celsius
+
+    """
+    t_c = _as_array(temp_c)
+    v = _as_array(wind_kph)
+
+    with np.errstate(invalid="ignore"):
+        v16 = np.power(np.clip(v, 0.0, None), 0.16)
+    chill = 13.12 + 0.6215 * t_c - 11.37 * v16 + 0.3965 * t_c * v16
+
+    applies = (t_c <= WIND_CHILL_MAX_TEMP_C) & (v > WIND_CHILL_MIN_WIND_KPH)
+
+    return _like(np.where(applies, chill, t_c), temp_c)
+
+
+def feels_like_c(
+    temp_c: ArrayLike, humidity: ArrayLike, wind_kph: ArrayLike
+) -> t.Union[np.ndarray, pd.Series, float]:
+    """Calculate a "feels like" temperature.
+
+    Description:
+        Wind chill when it is cold & windy, heat index when it is hot, otherwise the air temperature.
+
+    Params:
+        temp_c (ArrayLike): Air temperature in Celsius
+        humidity (ArrayLike): Relative humidity, in percent (0-100)
+        wind_kph (ArrayLike): Wind speed in kilometers per hour
+
+    Returns:
+        (numpy.ndarray|pandas.Series|float): Feels-like temperature in Celsius
+
+    """
+    t_c = _as_array(temp_c)
+
+    chill = _as_array(wind_chill_c(t_c, wind_kph))
+    heat = _as_array(heat_index_c(t_c, humidity))
+
+    feels = np.where(t_c >= HEAT_INDEX_MIN_TEMP_C, heat, np.where(t_c <= WIND_CHILL_MAX_TEMP_C, chill, t_c))
+
+    return _like(feels, temp_c)
+
+
+def add_imperial_columns(
+    df: pd.DataFrame, col_map: dict[str, tuple[str, str]] | None = None, overwrite: bool = False
+) -> pd.DataFrame:
+    """Compute imperial unit columns from canonical metric columns, i.e. `temp_c` -> `temp_f`.
+
+    Params:
+        df (pandas.DataFrame): A `DataFrame` of readings in metric units
+        col_map (dict[str, tuple[str, str]]|None): Map of metric column -> (imperial column, conversion function name).
+            Defaults to `METRIC_TO_IMPERIAL_COLS`
+        overwrite (bool): If `True`, replace imperial columns that already exist in `df`
+
+    Returns:
+        (pandas.DataFrame): `df` with imperial columns added
+
+    """
+    col_map = METRIC_TO_IMPERIAL_COLS if col_map is None else col_map
+
+    for metric_col, (imperial_col, func_name) in col_map.items():
+        if metric_col not in df.columns:
+            continue
+        if imperial_col in df.columns and not overwrite:
+            continue
+
+        converted: pd.Series = _CONVERTERS[func_name](df[metric_col])
+
+        ## Keep the source column's float width, i.e. float32 after df_utils.optimize_weather_df_dtypes()
+        if df[metric_col].dtype.kind == "f":
+            converted = converted.astype(df[metric_col].dtype)
+
+        df[imperial_col] = converted
+
+    return df
+
+
+def add_derived_metrics(
+    df: pd.DataFrame,
+    temp_col: str = "temp_c",
+    humidity_col: str = "humidity",
+    wind_col: str = "wind_kph",
+    overwrite: bool = False,
+) -> pd.DataFrame:
+    """Compute dew point, heat index, wind chill & feels-like columns (Celsius) from a DataFrame of readings.
+
+    Params:
+        df (pandas.DataFrame): A `DataFrame` of readings in metric units
+        temp_col (str): Air temperature column (Celsius)
+        humidity_col (str): Relative humidity column (percent)
+        wind_col (str): Wind speed column (km/h)
+        overwrite (bool): If `True`, replace derived columns that already exist in `df`
+
+    Returns:
+        (pandas.DataFrame): `df` with `dewpoint_c`, `heatindex_c`, `windchill_c` & `feelslike_c` columns added
+
+    """
+    missing = [c for c in [temp_col, humidity_col, wind_col] if c not in df.columns]
+    if missing:
+        raise ValueError(f"DataFrame is missing required column(s): {missing}")
+
+    derived: dict[str, t.Callable[[], pd.Series]] = {
+        "dewpoint_c": lambda: dew_point_c(df[temp_col], df[humidity_col]),
+        "heatindex_c": lambda: heat_index_c(df[temp_col], df[humidity_col]),
+        "windchill_c": lambda: wind_chill_c(df[temp_col], df[wind_col]),
+        "feelslike_c": lambda: feels_like_c(df[temp_col], df[humidity_col], df[wind_col]),
+    }
+
+    for col, compute in derived.items():
+        if col in df.columns and not overwrite:
+            continue
+
+        df[col] = compute()
+
+    return df
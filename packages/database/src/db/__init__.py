@@ -4,4 +4,5 @@ from . import *
 from .__methods import *
 from .base import *
 from .utils import *
+from .retention import *
 from .types import *
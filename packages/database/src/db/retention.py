@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+import datetime as dt
+import logging
+import time
+import typing as t
+
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    "DOWNSAMPLE_INTERVALS",
+    "RetentionPolicy",
+    "RetentionReport",
+    "apply_retention_policy",
+]
+
+DOWNSAMPLE_INTERVALS: list[str] = ["hourly", "daily"]
+
+
+@dataclass
+class RetentionPolicy:
+    """Retention policy for a table of timestamped rows.
+
+    Description:
+        Rows newer than `raw_days` are kept as-is. Rows between `raw_days` and `delete_days` old are
+        downsampled to the first row per `partition_col` value per hour/day (if `downsample` is set).
+        Rows older than `delete_days` are deleted. Set a value to `None` to disable that phase.
+
+    Attributes:
+        name (str): A name for the policy, used in logs & reports.
+        model (type): The SQLAlchemy model the policy applies to.
+        timestamp_col (str): Name of the column to age rows by.
+        raw_days (int | None): Keep every row for this many days.
+        downsample (str | None): One of `DOWNSAMPLE_INTERVALS`, or `None` to skip downsampling.
+        delete_days (int | None): Delete rows older than this many days.
+        payload_col (str | None): Column whose stored size estimates the bytes reclaimed.
+        partition_col (str | None): Column to downsample per (i.e. a location ID), so readings for different
+            locations in the same hour are all kept. Rows with a NULL value are never downsampled. `None`
+            downsamples the whole table as one partition.
+
+    """
+
+    name: str
+    model: type
+    timestamp_col: str = "created_at"
+    raw_days: int | None = 30
+    downsample: str | None = None
+    delete_days: int | None = None
+    payload_col: str | None = None
+    partition_col: str | None = None
+
+    def __post_init__(self):
+        if self.downsample is not None and self.downsample not in DOWNSAMPLE_INTERVALS:
+            raise ValueError(f"Invalid downsample interval: '{self.downsample}'. Must be one of {DOWNSAMPLE_INTERVALS}")
+
+        if self.downsample is not None and self.raw_days is None:
+            raise ValueError(f"Retention policy '{self.name}' downsamples, but has no raw_days")
+
+        if self.raw_days is not None and self.delete_days is not None and self.delete_days < self.raw_days:
+            raise ValueError(
+                f"Retention policy '{self.name}' deletes after {self.delete_days} day(s), before raw data expires at {self.raw_days} day(s)"
+            )
+
+
+@dataclass
+class RetentionReport:
+    """Result of applying a retention policy.
+
+    Attributes:
+        policy (str): The name of the policy.
+        table (str): The table the policy was applied to.
+        dry_run (bool): If `True`, no rows were deleted.
+        rows_total (int): Rows in the table before the policy ran.
+        downsampled_rows (int): Rows removed (or that would be removed) by downsampling.
+        downsampled_bytes (int): Estimated payload bytes reclaimed by downsampling.
+        deleted_rows (int): Rows removed (or that would be removed) by the delete phase.
+        deleted_bytes (int): Estimated payload bytes reclaimed by the delete phase.
+        duration_s (float): How long the policy took to apply.
+
+    """
+
+    policy: str
+    table: str
+    dry_run: bool
+    rows_total: int = 0
+    downsampled_rows: int = 0
+    downsampled_bytes: int = 0
+    deleted_rows: int = 0
+    deleted_bytes: int = 0
+    duration_s: float = 0.0
+
+    @property
+    def rows_reclaimed(self) -> int:
+        return self.downsampled_rows + self.deleted_rows
+
+    @property
+    def bytes_reclaimed(self) -> int:
+        return self.downsampled_bytes + self.deleted_bytes
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "rows_reclaimed": self.rows_reclaimed, "bytes_reclaimed": self.bytes_reclaimed}
+
+
+def _payload_size_expr(policy: RetentionPolicy) -> sa.ColumnElement:
+    """Return a SQL expression for a row's payload size in bytes, without loading the payload."""
+    if not policy.payload_col:
+        return sa.literal(0)
+
+    payload_col = getattr(policy.model, policy.payload_col)
+    ## Binary (i.e. CompressedJSON) columns report their stored size, JSON/text columns their serialized size
+    stored_type = getattr(payload_col.type, "impl", payload_col.type)
+    length_of = payload_col if isinstance(stored_type, sa.LargeBinary) else sa.cast(payload_col, sa.Text)
+
+    return sa.func.coalesce(sa.func.length(length_of), 0)
+
+
+def _bucket(ts: dt.datetime, interval: str) -> dt.datetime:
+    if interval == "hourly":
+        return ts.replace(minute=0, second=0, microsecond=0)
+
+    return ts.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _delete_ids(session: so.Session, id_col: sa.Column, ids: list[int], batch_size: int) -> None:
+    """Delete rows by primary key in batches, committing after each batch."""
+    for i in range(0, len(ids), batch_size):
+        chunk = ids[i : i + batch_size]
+
+        session.execute(sa.delete(id_col.table).where(id_col.in_(chunk)))
+        session.commit()
+
+
+def _apply_delete_phase(
+    session: so.Session,
+    policy: RetentionPolicy,
+    cutoff: dt.datetime,
+    dry_run: bool,
+    batch_size: int,
+) -> tuple[int, int]:
+    """Delete rows older than cutoff. Returns (rows, estimated bytes)."""
+    model = policy.model
+    id_col = model.__table__.c.id
+    ts_col = getattr(model, policy.timestamp_col)
+
+    size_expr = sa.func.coalesce(sa.func.sum(_payload_size_expr(policy)), 0)
+
+    rows, est_bytes = session.execute(sa.select(sa.func.count(id_col), size_expr).where(ts_col < cutoff)).one()
+
+    if dry_run or not rows:
+        return int(rows or 0), int(est_bytes or 0)
+
+    deleted: int = 0
+
+    while True:
+        ## Select a batch of IDs first; DELETE ... LIMIT is not portable across dialects
+        ids = session.execute(sa.select(id_col).where(ts_col < cutoff).order_by(id_col).limit(batch_size)).scalars().all()
+
+        if not ids:
+            break
+
+        _delete_ids(session, id_col, ids, batch_size)
+        deleted += len(ids)
+
+        log.debug(f"[{policy.name}] Deleted [{deleted}/{rows}] expired row(s)")
+
+    return deleted, int(est_bytes or 0)
+
+
+def _apply_downsample_phase(
+    session: so.Session,
+    policy: RetentionPolicy,
+    window_start: dt.datetime | None,
+    window_end: dt.datetime,
+    dry_run: bool,
+    batch_size: int,
+) -> tuple[int, int]:
+    """Keep the first row per (partition, bucket) between window_start & window_end. Returns (rows, bytes).
+
+    Description:
+        Only the ID, timestamp, partition & payload size of each row are read; payloads are never loaded.
+    """
+    model = policy.model
+    id_col = model.__table__.c.id
+    ts_col = getattr(model, policy.timestamp_col)
+    partition_col = getattr(model, policy.partition_col) if policy.partition_col else sa.null()
+
+    cols = [id_col, ts_col, partition_col, _payload_size_expr(policy)]
+
+    seen: set[tuple] = set()
+    drop_ids: list[int] = []
+    drop_bytes: int = 0
+    removed: int = 0
+    last_id: int = 0
+
+    while True:
+        stmt = sa.select(*cols).where(ts_col < window_end, id_col > last_id).order_by(id_col).limit(batch_size)
+        if window_start is not None:
+            stmt = stmt.where(ts_col >= window_start)
+
+        rows = session.execute(stmt).all()
+
+        if not rows:
+            break
+
+        last_id = rows[-1][0]
+
+        for row_id, ts, partition, size in rows:
+            ## Can't tell which partition the row belongs to, so it's kept
+            if policy.partition_col and partition is None:
+                continue
+
+            key = (partition, _bucket(ts, policy.downsample))
+
+            if key in seen:
+                drop_ids.append(row_id)
+                drop_bytes += int(size or 0)
+            else:
+                seen.add(key)
+
+        if len(drop_ids) >= batch_size:
+            removed += len(drop_ids)
+            if not dry_run:
+                _delete_ids(session, id_col, drop_ids, batch_size)
+            drop_ids = []
+
+    removed += len(drop_ids)
+    if drop_ids and not dry_run:
+        _delete_ids(session, id_col, drop_ids, batch_size)
+
+    return removed, drop_bytes
+
+
+def apply_retention_policy(
+    policy: RetentionPolicy,
+    engine: sa.Engine,
+    dry_run: bool = True,
+    batch_size: int = 500,
+    now: dt.datetime | None = None,
+) -> RetentionReport:
+    """Apply a retention policy to its table.
+
+    Description:
+        Expired rows are deleted first, then rows in the downsampling window are thinned out.
+        Deletes run in batches of `batch_size`, each in its own transaction, so long runs don't
+        hold locks on the whole table. With `dry_run=True`, rows & bytes that would be reclaimed
+        are counted, but nothing is deleted.
+
+    Params:
+        policy (RetentionPolicy): The policy to apply.
+        engine (sqlalchemy.Engine): The database engine to use.
+        dry_run (bool): If `True`, only report what would be deleted.
+        batch_size (int): Number of rows to read/delete per transaction.
+        now (datetime.datetime | None): Reference time for row ages. Defaults to `datetime.now()`, matching
+            the `created_at` column defaults.
+
+    Returns:
+        (RetentionReport): Counts of rows & estimated bytes reclaimed.
+
+    """
+    if engine is None:
+        raise ValueError("Missing a database engine")
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    now = now or dt.datetime.now()
+    start = time.perf_counter()
+
+    report = RetentionReport(policy=policy.name, table=policy.model.__tablename__, dry_run=dry_run)
+
+    delete_cutoff = now - dt.timedelta(days=policy.delete_days) if policy.delete_days is not None else None
+    raw_cutoff = now - dt.timedelta(days=policy.raw_days) if policy.raw_days is not None else None
+
+    session_pool = so.sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    with session_pool() as session:
+        try:
+            report.rows_total = session.execute(sa.select(sa.func.count()).select_from(policy.model.__table__)).scalar_one()
+
+            if delete_cutoff is not None:
+                report.deleted_rows, report.deleted_bytes = _apply_delete_phase(
+                    session, policy, delete_cutoff, dry_run, batch_size
+                )
+
+            if policy.downsample is not None:
+                report.downsampled_rows, report.downsampled_bytes = _apply_downsample_phase(
+                    session, policy, delete_cutoff, raw_cutoff, dry_run, batch_size
+                )
+        except Exception as exc:
+            session.rollback()
+
+            msg = f"({type(exc)}) Error applying retention policy '{policy.name}'. Details: {exc}"
+            log.error(msg)
+
+            raise exc
+
+    report.duration_s = round(time.perf_counter() - start, 3)
+
+    log.info(
+        f"[{policy.name}]{' [DRY RUN]' if dry_run else ''} {report.rows_reclaimed}/{report.rows_total} row(s), ~{report.bytes_reclaimed / 1024:.1f} KiB {'reclaimable' if dry_run else 'reclaimed'} from '{report.table}' "
+        f"(downsampled: {report.downsampled_rows}, deleted: {report.deleted_rows}) in {report.duration_s}s"
+    )
+
+    return report
@@ -1,10 +1,83 @@
-from sqlalchemy.types import TypeDecorator, TEXT
-from sqlalchemy.dialects.postgresql import ARRAY as PG_ARRAY
-from sqlalchemy.dialects.mysql import JSON as MYSQL_JSON
+from sqlalchemy.types import TypeDecorator, TEXT, LargeBinary
+from sqlalchemy.dialects.postgresql import ARRAY as PG_ARRAY, BYTEA as PG_BYTEA
+from sqlalchemy.dialects.mysql import JSON as MYSQL_JSON, LONGBLOB as MYSQL_LONGBLOB
 from sqlalchemy.dialects.sqlite import TEXT as SQLITE_TEXT
 import json
+import logging
+import struct
+import zlib
 
-__all__ = ["StrList"]
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    "StrList",
+    "CompressedJSON",
+    "register_zstd_dictionary",
+    "train_zstd_dictionary",
+]
+
+## 1-byte header identifying how a CompressedJSON value was encoded. Rows are self-describing,
+#  so the algorithm/dictionary can change without rewriting existing rows.
+_CODEC_ZLIB = b"\x01"
+_CODEC_ZSTD = b"\x02"
+## Followed by a 4-byte big-endian dictionary ID
+_CODEC_ZSTD_DICT = b"\x03"
+
+## Registered zstd dictionaries, by name & by dictionary ID
+_ZSTD_DICTS_BY_NAME: dict = {}
+_ZSTD_DICTS_BY_ID: dict = {}
+
+
+def register_zstd_dictionary(name: str, dict_data: bytes) -> int:
+    """Register a trained zstd dictionary for use with `CompressedJSON(zstd_dict=name)`.
+
+    Description:
+        Dictionaries must be registered (i.e. at import time) in every process that reads or
+        writes columns compressed with them. Rows record the ID of the dictionary they were
+        compressed with.
+
+    Params:
+        name (str): A name for the dictionary, i.e. `weatherapi_current`.
+        dict_data (bytes): The dictionary, as returned by `train_zstd_dictionary()`.
+
+    Returns:
+        (int): The dictionary's ID.
+
+    """
+    if zstandard is None:
+        raise ImportError("zstd dictionaries require the 'zstandard' package")
+
+    zdict = zstandard.ZstdCompressionDict(dict_data)
+    dict_id: int = zdict.dict_id()
+
+    _ZSTD_DICTS_BY_NAME[name] = zdict
+    _ZSTD_DICTS_BY_ID[dict_id] = zdict
+
+    return dict_id
+
+
+def train_zstd_dictionary(samples: list, dict_size: int = 32 * 1024) -> bytes:
+    """Train a zstd dictionary from sample JSON payloads.
+
+    Params:
+        samples (list[dict]): Sample payloads, i.e. a few hundred raw API responses from one provider.
+        dict_size (int): Target dictionary size in bytes.
+
+    Returns:
+        (bytes): The trained dictionary. Store it & pass it to `register_zstd_dictionary()`.
+
+    """
+    if zstandard is None:
+        raise ImportError("Training zstd dictionaries requires the 'zstandard' package")
+
+    encoded = [json.dumps(s, separators=(",", ":")).encode("utf-8") for s in samples]
+
+    return zstandard.train_dictionary(dict_size, encoded).as_bytes()
 
 
 class StrList(TypeDecorator):
@@ -42,3 +115,116 @@ class StrList(TypeDecorator):
         elif dialect.name in ("mysql", "sqlite"):
             return json.loads(value)
         return value
+
+
+class CompressedJSON(TypeDecorator):
+    """Custom type that stores JSON-serializable values as compressed bytes.
+
+    Description:
+        Values are serialized as compact JSON, then compressed with zlib, or with zstd when a column
+        opts in with `algorithm="zstd"` (requires the `zstandard` package, the `database[zstd]` extra).
+        Pass `zstd_dict` to compress with a dictionary registered with `register_zstd_dictionary()`,
+        which greatly improves the ratio for small, repetitive payloads.
+        Values are stored as `BYTEA` on PostgreSQL, `LONGBLOB` on MySQL & `BLOB` elsewhere.
+
+        Reads detect the encoding from a 1-byte header, so rows written with a different algorithm
+        or dictionary (or legacy uncompressed JSON text) still decode.
+
+    Params:
+        algorithm (str): "zlib" or "zstd".
+        level (int | None): Compression level. Defaults to 3 for zstd, 6 for zlib.
+        zstd_dict (str | None): Name of a registered zstd dictionary to compress with. Requires `algorithm="zstd"`.
+
+    Raises:
+        ImportError: If `algorithm="zstd"` & the `zstandard` package is not installed.
+
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, algorithm: str = "zlib", level: int | None = None, zstd_dict: str | None = None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        if algorithm not in ("zlib", "zstd"):
+            raise ValueError(f"Invalid compression algorithm: '{algorithm}'. Must be one of ['zlib', 'zstd']")
+
+        if algorithm == "zstd" and zstandard is None:
+            ## An explicit opt-in; silently writing zlib instead would hide a missing 'database[zstd]' extra
+            raise ImportError("CompressedJSON(algorithm='zstd') requires the 'zstandard' package, install 'database[zstd]'")
+
+        if zstd_dict is not None and algorithm != "zstd":
+            raise ValueError("zstd_dict requires algorithm='zstd'")
+
+        self.algorithm = algorithm
+        self.level = level if level is not None else (3 if algorithm == "zstd" else 6)
+        self.zstd_dict = zstd_dict
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(PG_BYTEA())
+        elif dialect.name == "mysql":
+            return dialect.type_descriptor(MYSQL_LONGBLOB())
+        else:  # SQLite and other dialects
+            return dialect.type_descriptor(LargeBinary())
+
+    def compress(self, value) -> bytes:
+        """Serialize & compress a value, prefixed with its codec header."""
+        raw: bytes = json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+        if self.algorithm == "zlib":
+            return _CODEC_ZLIB + zlib.compress(raw, self.level)
+
+        if self.zstd_dict is not None:
+            zdict = _ZSTD_DICTS_BY_NAME.get(self.zstd_dict)
+            if zdict is None:
+                raise ValueError(f"zstd dictionary '{self.zstd_dict}' has not been registered")
+
+            compressor = zstandard.ZstdCompressor(level=self.level, dict_data=zdict)
+
+            return _CODEC_ZSTD_DICT + struct.pack(">I", zdict.dict_id()) + compressor.compress(raw)
+
+        return _CODEC_ZSTD + zstandard.ZstdCompressor(level=self.level).compress(raw)
+
+    @staticmethod
+    def decompress(data):
+        """Decompress & deserialize a value written by `compress()`."""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+
+        ## Legacy, uncompressed JSON (i.e. rows written before migrating from sqlalchemy.JSON)
+        if isinstance(data, str):
+            return json.loads(data)
+
+        header, body = data[:1], data[1:]
+
+        if header == _CODEC_ZLIB:
+            return json.loads(zlib.decompress(body))
+
+        if header in (_CODEC_ZSTD, _CODEC_ZSTD_DICT):
+            if zstandard is None:
+                raise ImportError("Reading zstd-compressed values requires the 'zstandard' package")
+
+            if header == _CODEC_ZSTD_DICT:
+                (dict_id,) = struct.unpack(">I", body[:4])
+                zdict = _ZSTD_DICTS_BY_ID.get(dict_id)
+                if zdict is None:
+                    raise ValueError(f"zstd dictionary with ID [{dict_id}] has not been registered")
+
+                return json.loads(zstandard.ZstdDecompressor(dict_data=zdict).decompress(body[4:]))
+
+            return json.loads(zstandard.ZstdDecompressor().decompress(body))
+
+        return json.loads(data)
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+
+        return self.compress(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+
+        return self.decompress(value)
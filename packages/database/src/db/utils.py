@@ -12,12 +12,39 @@ __all__ = [
     "dump_sqlite_db_schema"
 ]
 
-def backup_sqlite_db(source: str, target: str) -> None:
+## Pages copied per backup step. The source is only locked while a step runs, so writers can
+#  commit between steps.
+DEFAULT_BACKUP_PAGES: int = 1024
+## Seconds to wait between backup steps
+DEFAULT_BACKUP_SLEEP: float = 0.01
+
+
+def _log_backup_progress(status: int, remaining: int, total: int) -> None:
+    if total:
+        log.debug(f"SQLite backup: copied [{total - remaining}/{total}] page(s) ({(total - remaining) / total:.0%})")
+
+
+def backup_sqlite_db(
+    source: str,
+    target: str,
+    pages: int = DEFAULT_BACKUP_PAGES,
+    sleep: float = DEFAULT_BACKUP_SLEEP,
+    progress: t.Callable[[int, int, int], object] | None = _log_backup_progress,
+) -> None:
     """Backup an SQLite database.
-    
+
+    Description:
+        Uses SQLite's online backup API, copying `pages` pages per step instead of the whole database at
+        once, so the source stays writable during the backup. If another connection writes to the source
+        between steps, SQLite restarts the copy to keep the backup consistent.
+
     Params:
         source (str): The path to the source database.
         target (str): The path to the target database.
+        pages (int): Pages to copy per step. 0 or a negative number copies the whole database in one step.
+        sleep (float): Seconds to wait between steps.
+        progress (Callable[[int, int, int], object] | None): Called after each step with
+            `(status, remaining, total)` page counts. Defaults to logging the progress at DEBUG level.
     """
     try:
         connection: sqlite3.Connection = sqlite3.connect(database=source)
@@ -39,9 +66,9 @@ def backup_sqlite_db(source: str, target: str) -> None:
 
     with bck:
         try:
-            connection.backup(target=bck)
+            connection.backup(target=bck, pages=pages, progress=progress, sleep=sleep)
         except Exception as exc:
-            msg = f"({type(exc)})"
+            msg = f"({type(exc)}) Error backing up SQLite database '{source}' to '{target}'. Details: {exc}"
             log.error(msg)
 
             bck.close()
@@ -1,3 +1,4 @@
 from __future__ import annotations
 
 from .db_depends import *
+from .tracing_depends import *
@@ -1,29 +1,37 @@
 from __future__ import annotations
 
 import logging
+import threading
 import typing as t
 
 log = logging.getLogger(__name__)
 
 import db
+from core_utils import tracing_utils
 
-from settings import DB_SETTINGS
 import settings
 import sqlalchemy as sa
 import sqlalchemy.orm as so
 
-__all__ = ["get_db_uri", "get_db_engine", "get_session_pool"]
+from .tracing_depends import instrument_db_engine
+
+__all__ = ["get_db_uri", "get_db_engine", "get_session_pool", "get_db_engines", "dispose_db_engines", "get_db_pool_stats"]
+
+## Engines built by get_db_engine(), keyed by (URL, echo), so callers share one connection pool per database
+_ENGINES: dict[tuple[str, bool], sa.Engine] = {}
+_ENGINES_LOCK = threading.Lock()
 
 # DB_SETTINGS = settings.get_namespace("database")
+_DB_SETTINGS = settings.get_db_settings()
 
 
 def get_db_uri(
-    drivername: str = DB_SETTINGS.get("DB_DRIVERNAME", default="sqlite+pysqlite"),
-    username: str | None = DB_SETTINGS.get("DB_USERNAME", default=None),
-    password: str | None = DB_SETTINGS.get("DB_PASSWORD", default=None),
-    host: str | None = DB_SETTINGS.get("DB_HOST", default=None),
-    port: int | None = DB_SETTINGS.get("DB_PORT", default=None),
-    database: str = DB_SETTINGS.get("DB_DATABASE", default="demo.sqlite"),
+    drivername: str = _DB_SETTINGS.db_drivername,
+    username: str | None = _DB_SETTINGS.db_username,
+    password: str | None = _DB_SETTINGS.db_password,
+    host: str | None = _DB_SETTINGS.db_host,
+    port: int | None = _DB_SETTINGS.db_port,
+    database: str = _DB_SETTINGS.db_database,
     as_str: bool = False,
 ) -> sa.URL:
     """Construct a SQLAlchemy `URL` for a database connection.
@@ -56,34 +64,96 @@ def get_db_uri(
         return db_uri
 
 
-def get_db_engine(db_uri: sa.URL = get_db_uri(), echo: bool = False) -> sa.Engine:
-    """Construct a SQLAlchemy `Engine` for a database connection.
+def get_db_engine(db_uri: sa.URL | None = None, echo: bool = False) -> sa.Engine:
+    """Return the shared SQLAlchemy `Engine` for a database connection.
+
+    Description:
+        The engine (& its connection pool) is built on the first call for each `db_uri` & `echo`,
+        and reused after that, instead of opening a new pool for every save.
 
     Params:
-        db_uri (sa.URL): A SQLAlchemy `URL` for a database connection.
+        db_uri (sa.URL | None): A SQLAlchemy `URL` for a database connection. Defaults to `get_db_uri()`.
         echo (bool): Echo SQL statements to the console.
 
     Returns:
         (sa.Engine): A SQLAlchemy `Engine`
 
     """
-    engine: sa.Engine = db.get_engine(url=db_uri, echo=echo)
+    if db_uri is None:
+        db_uri = get_db_uri()
+
+    key = (db_uri.render_as_string(hide_password=False), bool(echo))
+
+    engine: sa.Engine | None = _ENGINES.get(key)
+    if engine is None:
+        with _ENGINES_LOCK:
+            engine = _ENGINES.get(key)
+            if engine is None:
+                engine = db.get_engine(url=db_uri, echo=echo)
+                if tracing_utils.tracing_enabled():
+                    instrument_db_engine(engine)
+                _ENGINES[key] = engine
 
     return engine
 
 
+def get_db_engines() -> list[sa.Engine]:
+    """Return every shared engine built by `get_db_engine()` in this process."""
+    with _ENGINES_LOCK:
+        return list(_ENGINES.values())
+
+
+def dispose_db_engines(close: bool = False) -> None:
+    """Reset the shared engines' connection pools.
+
+    Params:
+        close (bool): Close the pooled connections. Pass `False` in a forked child process, so the
+            parent's connections are dropped from the child's pool without being closed under the parent.
+
+    """
+    for engine in get_db_engines():
+        engine.dispose(close=close)
+
+
+def get_db_pool_stats() -> list[dict[str, t.Any]]:
+    """Return connection pool usage for each shared engine.
+
+    Returns:
+        (list[dict]): One dict per engine, with the `database` (URL without password), pool `size`,
+            connections `checked_out` & `checked_in`, and `overflow`. Counts a pool type doesn't track are left out.
+
+    """
+    stats: list[dict[str, t.Any]] = []
+
+    for engine in get_db_engines():
+        pool = engine.pool
+        engine_stats: dict[str, t.Any] = {"database": engine.url.render_as_string(hide_password=True)}
+
+        for name in ("size", "checkedout", "checkedin", "overflow"):
+            method = getattr(pool, name, None)
+            if callable(method):
+                engine_stats[name.replace("checked", "checked_")] = method()
+
+        stats.append(engine_stats)
+
+    return stats
+
+
 def get_session_pool(
-    engine: sa.Engine = get_db_engine(),
+    engine: sa.Engine | None = None,
 ) -> so.sessionmaker[so.Session]:
     """Construct a SQLAlchemy `Session` pool for a database connection.
 
     Params:
-        engine (sa.Engine): A SQLAlchemy `Engine` for a database connection.
+        engine (sa.Engine | None): A SQLAlchemy `Engine` for a database connection. Defaults to `get_db_engine()`.
 
     Returns:
         (so.sessionmaker[so.Session]): A SQLAlchemy `Session` pool
 
     """
+    if engine is None:
+        engine = get_db_engine()
+
     session: so.sessionmaker[so.Session] = db.get_session_pool(engine=engine)
 
     return session
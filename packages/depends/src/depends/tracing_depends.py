@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import logging
+import typing as t
+
+log = logging.getLogger(__name__)
+
+from core_utils import tracing_utils
+import sqlalchemy as sa
+
+__all__ = ["instrument_db_engine"]
+
+## Longest SQL statement recorded on a span; bulk inserts can be very long
+MAX_STATEMENT_LENGTH: int = 2048
+
+## Set on engines that already have the span listeners, so they're only added once
+_INSTRUMENTED_FLAG: str = "_weatherdata_traced"
+## Spans in progress on a connection. A stack, because executemany() batches fire one event per batch.
+_SPANS_KEY: str = "_weatherdata_spans"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    tracer = tracing_utils.get_tracer()
+    if tracer is None:
+        return
+
+    operation: str = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL"
+    span = tracer.start_span(
+        f"{operation} {conn.engine.url.database or conn.engine.dialect.name}",
+        attributes={
+            "db.system": conn.engine.dialect.name,
+            "db.name": conn.engine.url.database or "",
+            "db.operation": operation,
+            "db.statement": statement[:MAX_STATEMENT_LENGTH],
+            "db.executemany": bool(executemany),
+        },
+    )
+    conn.info.setdefault(_SPANS_KEY, []).append(span)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    spans: list = conn.info.get(_SPANS_KEY)
+    if not spans:
+        return
+
+    span = spans.pop()
+    if cursor.rowcount is not None and cursor.rowcount >= 0:
+        span.set_attribute("db.rowcount", cursor.rowcount)
+    span.end()
+
+
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    spans: list = conn.info.get(_SPANS_KEY) if conn is not None else None
+    if not spans:
+        return
+
+    span = spans.pop()
+    tracing_utils.record_span_error(span, exception_context.original_exception)
+    span.end()
+
+
+def instrument_db_engine(engine: sa.Engine) -> sa.Engine:
+    """Record a span for every SQL statement an engine executes.
+
+    Description:
+        Spans are children of the current span, i.e. the API request or Celery task that ran the query.
+        The statement is recorded without its bound parameters. Safe to call more than once per engine;
+        statements run while tracing is disabled are not recorded.
+
+    Params:
+        engine (sa.Engine): The SQLAlchemy `Engine` to instrument.
+
+    Returns:
+        (sa.Engine): The same engine.
+
+    """
+    if getattr(engine, _INSTRUMENTED_FLAG, False):
+        return engine
+
+    sa.event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    sa.event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    sa.event.listen(engine, "handle_error", _handle_error)
+    setattr(engine, _INSTRUMENTED_FLAG, True)
+
+    log.debug(f"Tracing SQL statements for database: {engine.url.render_as_string(hide_password=True)}")
+
+    return engine
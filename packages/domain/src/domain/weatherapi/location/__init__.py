@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from . import *
+from .keys import *
 from .models import *
 from .repository import *
 from .schemas import *
\ No newline at end of file
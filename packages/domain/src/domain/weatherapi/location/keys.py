@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import typing as t
+
+__all__ = [
+    "LOCATION_KEY_MAX_LENGTH",
+    "get_location_key",
+]
+
+## Length of the `location_key` columns on the raw JSON tables
+LOCATION_KEY_MAX_LENGTH: int = 255
+
+
+def get_location_key(payload: dict | None) -> str | None:
+    """Return the key identifying which location a raw WeatherAPI response is for.
+
+    Description:
+        Stored in the raw JSON tables' `location_key` column, so jobs like retention can group rows by
+        location without decompressing every payload. Location names aren't unique on their own, so the
+        key is the name, region & country, i.e. "london|city of london, greater london|united kingdom".
+
+    Params:
+        payload (dict | None): A current weather or forecast response.
+
+    Returns:
+        (str | None): The location key, or None if the response has no location.
+
+    """
+    if not payload:
+        return None
+
+    location: dict[str, t.Any] = payload.get("location") or {}
+    if not location.get("name"):
+        return None
+
+    key = "|".join(str(location.get(part) or "").strip().lower() for part in ("name", "region", "country"))
+
+    return key[:LOCATION_KEY_MAX_LENGTH]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import datetime as dt
 from decimal import Decimal
 import typing as t
 
@@ -11,6 +12,7 @@ import sqlalchemy.orm as so
 
 __all__ = [
     "WeatherAPILocationModel",
+    "LocationRegistryModel",
 ]
 
 
@@ -59,3 +61,56 @@ class WeatherAPILocationModel(Base):
     # forecast_weather_entries: so.Mapped[list["ForecastDayModel"]] = so.relationship(
     #     "ForecastDayModel", back_populates="location", cascade="all, delete-orphan"
     # )
+
+
+class LocationRegistryModel(Base):
+    """A location to poll WeatherAPI for on a schedule.
+
+    Description:
+        The scheduled dispatcher task polls every active location in the registry. A location
+        is linked to its `weatherapi_location` row once the first response for it is saved.
+
+    Attributes:
+        id (int): The ID of the registry entry.
+        query (str): The WeatherAPI `q` parameter, i.e. "London" or "51.52,-0.11".
+        label (str | None): An optional display name for the location.
+        active (bool): Whether the location should be polled.
+        poll_current (bool): Whether to poll current weather for the location.
+        poll_forecast (bool): Whether to poll the weather forecast for the location.
+        location_id (int | None): The resolved `weatherapi_location` row, once known.
+        last_polled_at (datetime | None): When the location was last polled successfully.
+        last_error (str | None): The error from the last failed poll, cleared on success.
+        last_updated_epoch (int | None): WeatherAPI's `last_updated_epoch` from the last current weather poll.
+        update_interval_s (int | None): Learned seconds between WeatherAPI updates for the location.
+        next_update_epoch (int | None): When WeatherAPI is next expected to update the location. Current
+            weather polls before this time are skipped.
+        unchanged_polls (int): Polls since the last update that returned the same `last_updated_epoch`.
+        created_at (datetime): When the location was added to the registry.
+
+    """
+
+    __tablename__ = "weatherapi_location_registry"
+
+    id: so.Mapped[annotated.INT_PK]
+
+    query: so.Mapped[str] = so.mapped_column(sa.VARCHAR(255), unique=True, index=True)
+    label: so.Mapped[str | None] = so.mapped_column(sa.TEXT, nullable=True)
+    active: so.Mapped[bool] = so.mapped_column(sa.Boolean, default=True, server_default=sa.true(), index=True)
+    poll_current: so.Mapped[bool] = so.mapped_column(sa.Boolean, default=True, server_default=sa.true())
+    poll_forecast: so.Mapped[bool] = so.mapped_column(sa.Boolean, default=True, server_default=sa.true())
+
+    location_id: so.Mapped[int | None] = so.mapped_column(sa.ForeignKey("weatherapi_location.id"), nullable=True)
+
+    last_polled_at: so.Mapped[dt.datetime | None] = so.mapped_column(sa.DateTime(timezone=True), nullable=True)
+    last_error: so.Mapped[str | None] = so.mapped_column(sa.TEXT, nullable=True)
+
+    last_updated_epoch: so.Mapped[int | None] = so.mapped_column(sa.BigInteger, nullable=True)
+    update_interval_s: so.Mapped[int | None] = so.mapped_column(sa.INTEGER, nullable=True)
+    next_update_epoch: so.Mapped[int | None] = so.mapped_column(sa.BigInteger, nullable=True, index=True)
+    unchanged_polls: so.Mapped[int] = so.mapped_column(sa.INTEGER, default=0, server_default="0")
+
+    created_at: so.Mapped[dt.datetime] = so.mapped_column(
+        sa.DateTime(timezone=True),
+        default=dt.datetime.now,
+        nullable=False,
+    )
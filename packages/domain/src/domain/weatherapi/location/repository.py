@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import datetime as dt
 import typing as t
 
-from .models import WeatherAPILocationModel
+from .models import LocationRegistryModel, WeatherAPILocationModel
 
 from db.base import BaseRepository
 from loguru import logger as log
@@ -12,6 +13,7 @@ import sqlalchemy.orm as so
 
 __all__ = [
     "LocationRepository",
+    "LocationRegistryRepository",
 ]
 
 
@@ -146,3 +148,165 @@ class LocationRepository(BaseRepository[WeatherAPILocationModel]):
             msg = f"({type(exc)}) Error saving location. Details: {exc}"
             log.error(msg)
             raise
+
+
+class LocationRegistryRepository(BaseRepository[LocationRegistryModel]):
+    """Repository for LocationRegistryModel objects.
+
+    Attributes:
+        session (so.Session): The database session.
+
+    """
+
+    def __init__(self, session: so.Session):
+        super().__init__(session, LocationRegistryModel)
+
+    def get_by_query(self, query: str) -> LocationRegistryModel | None:
+        """Get a registry entry by its WeatherAPI query.
+
+        Params:
+            query (str): The WeatherAPI `q` parameter of the location.
+
+        Returns:
+            (LocationRegistryModel): A LocationRegistryModel object.
+            (None): None if the location is not in the registry.
+
+        """
+        return (
+            self.session.query(LocationRegistryModel)
+            .filter(LocationRegistryModel.query == query)
+            .one_or_none()
+        )
+
+    def list_active_queries(self, poll: str = "current", due_before: int | None = None) -> list[str]:
+        """Return the queries of all active locations, ordered by ID so shards are stable between runs.
+
+        Params:
+            poll (str): Which poll the locations must be enabled for, "current" or "forecast".
+            due_before (int | None): Only return locations with no predicted update time, or one at or
+                before this Unix timestamp.
+
+        Returns:
+            (list[str]): WeatherAPI `q` parameters of the active locations.
+
+        """
+        if poll not in ("current", "forecast"):
+            raise ValueError(f"Invalid poll type: '{poll}'. Must be 'current' or 'forecast'")
+
+        poll_col = LocationRegistryModel.poll_current if poll == "current" else LocationRegistryModel.poll_forecast
+
+        stmt = sa.select(LocationRegistryModel.query).where(LocationRegistryModel.active.is_(True), poll_col.is_(True))
+        if due_before is not None:
+            stmt = stmt.where(
+                sa.or_(
+                    LocationRegistryModel.next_update_epoch.is_(None),
+                    LocationRegistryModel.next_update_epoch <= due_before,
+                )
+            )
+
+        return self.session.execute(stmt.order_by(LocationRegistryModel.id)).scalars().all()
+
+    def record_poll_results(
+        self,
+        results: dict[str, str | None],
+        location_ids: dict[str, int] | None = None,
+        polled_at: dt.datetime | None = None,
+    ) -> None:
+        """Record the outcome of polling a batch of locations.
+
+        Description:
+            Successful polls are updated in a single statement; failed polls keep their
+            `last_polled_at` & store the error.
+
+        Params:
+            results (dict[str, str | None]): Maps each polled query to an error message, or None on success.
+            location_ids (dict[str, int] | None): Maps queries to their resolved `weatherapi_location` IDs.
+            polled_at (datetime | None): When the locations were polled. Defaults to `datetime.now()`.
+
+        """
+        polled_at = polled_at or dt.datetime.now()
+
+        succeeded = [q for q, err in results.items() if err is None]
+        failed = {q: err for q, err in results.items() if err is not None}
+
+        if succeeded:
+            self.session.execute(
+                sa.update(LocationRegistryModel)
+                .where(LocationRegistryModel.query.in_(succeeded))
+                .values(last_polled_at=polled_at, last_error=None)
+            )
+
+        for query, location_id in (location_ids or {}).items():
+            self.session.execute(
+                sa.update(LocationRegistryModel)
+                .where(LocationRegistryModel.query == query, LocationRegistryModel.location_id.is_(None))
+                .values(location_id=location_id)
+            )
+
+        for query, err in failed.items():
+            self.session.execute(
+                sa.update(LocationRegistryModel).where(LocationRegistryModel.query == query).values(last_error=err)
+            )
+
+        self.session.commit()
+
+    def record_update_epochs(
+        self,
+        epochs: dict[str, int],
+        default_interval: int = 900,
+        min_interval: int = 300,
+        max_interval: int = 3600,
+    ) -> None:
+        """Record each location's `last_updated_epoch` & predict when WeatherAPI will next update it.
+
+        Description:
+            The update interval is learned per location. A longer gap between updates than the current
+            estimate only raises the estimate if a poll in between saw unchanged data; otherwise the gap
+            may just be polls that were skipped or failed, and raising it would skip even more polls.
+
+        Params:
+            epochs (dict[str, int]): Maps polled queries to the `last_updated_epoch` in their response.
+            default_interval (int): Estimated seconds between updates for locations without a learned interval.
+            min_interval (int): Lower bound for learned intervals.
+            max_interval (int): Upper bound for learned intervals, & the longest a location can be skipped for.
+
+        """
+        if not epochs:
+            return
+
+        rows = self.session.execute(
+            sa.select(
+                LocationRegistryModel.query,
+                LocationRegistryModel.last_updated_epoch,
+                LocationRegistryModel.update_interval_s,
+                LocationRegistryModel.unchanged_polls,
+            ).where(LocationRegistryModel.query.in_(list(epochs.keys())))
+        ).all()
+
+        for query, prev_epoch, interval, unchanged_polls in rows:
+            epoch = int(epochs[query])
+            interval = interval or default_interval
+            values: dict = {}
+
+            if prev_epoch is not None and epoch <= prev_epoch:
+                ## No new data since the last poll; the prediction stays in the past, so the next dispatch polls again
+                values["unchanged_polls"] = (unchanged_polls or 0) + 1
+            else:
+                if prev_epoch is not None:
+                    observed = min(max(epoch - prev_epoch, min_interval), max_interval)
+
+                    if observed < interval or unchanged_polls:
+                        interval = round((interval + observed) / 2)
+
+                values.update(
+                    last_updated_epoch=epoch,
+                    update_interval_s=interval,
+                    next_update_epoch=epoch + interval,
+                    unchanged_polls=0,
+                )
+
+            self.session.execute(
+                sa.update(LocationRegistryModel).where(LocationRegistryModel.query == query).values(**values)
+            )
+
+        self.session.commit()
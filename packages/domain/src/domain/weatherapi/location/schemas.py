@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import datetime as dt
 from decimal import Decimal
 import typing as t
 
@@ -16,6 +17,8 @@ from pydantic import (
 __all__ = [
     "LocationIn",
     "LocationOut",
+    "LocationRegistryIn",
+    "LocationRegistryOut",
 ]
 
 class LocationIn(BaseModel):
@@ -52,3 +55,51 @@ class LocationOut(LocationIn):
     """
 
     id: int
+
+
+class LocationRegistryIn(BaseModel):
+    """A location to add to the polling registry.
+
+    Attributes:
+        query (str): The WeatherAPI `q` parameter, i.e. "London" or "51.52,-0.11".
+        label (str | None): An optional display name for the location.
+        active (bool): Whether the location should be polled.
+        poll_current (bool): Whether to poll current weather for the location.
+        poll_forecast (bool): Whether to poll the weather forecast for the location.
+
+    """
+
+    query: str
+    label: str | None = None
+    active: bool = True
+    poll_current: bool = True
+    poll_forecast: bool = True
+
+
+class LocationRegistryOut(LocationRegistryIn):
+    """A location in the polling registry, retrieved from the database.
+
+    Attributes:
+        id (int): The ID of the registry entry.
+        location_id (int | None): The resolved `weatherapi_location` row, once known.
+        last_polled_at (datetime | None): When the location was last polled successfully.
+        last_error (str | None): The error from the last failed poll.
+        last_updated_epoch (int | None): WeatherAPI's `last_updated_epoch` from the last current weather poll.
+        update_interval_s (int | None): Learned seconds between WeatherAPI updates for the location.
+        next_update_epoch (int | None): When WeatherAPI is next expected to update the location.
+        unchanged_polls (int): Polls since the last update that returned unchanged data.
+        created_at (datetime): When the location was added to the registry.
+
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    location_id: int | None = None
+    last_polled_at: dt.datetime | None = None
+    last_error: str | None = None
+    last_updated_epoch: int | None = None
+    update_interval_s: int | None = None
+    next_update_epoch: int | None = None
+    unchanged_polls: int = 0
+    created_at: dt.datetime
@@ -1,3 +1,3 @@
 from __future__ import annotations
 
-from . import current, forecast, weather_alerts
\ No newline at end of file
+from . import current, forecast, rollups, weather_alerts
@@ -5,6 +5,7 @@ import typing as t
 import datetime as dt
 
 from db import Base, annotated
+from db.types import CompressedJSON
 from domain.weatherapi.location import WeatherAPILocationModel
 from loguru import logger as log
 import sqlalchemy as sa
@@ -32,13 +33,25 @@ class CurrentWeatherJSONModel(Base):
         nullable=False,
     )
 
-    current_weather_json: so.Mapped[dict] = so.mapped_column(JSON)
+    ## Stored zstd/zlib-compressed; raw responses are large & highly repetitive
+    current_weather_json: so.Mapped[dict] = so.mapped_column(CompressedJSON(), nullable=False)
+
+    ## Hash of the canonicalized response, without volatile fields. Repeats of a response bump
+    #  seen_count/last_seen_at instead of adding a row. NULL for rows saved before deduplication.
+    content_hash: so.Mapped[str | None] = so.mapped_column(sa.String(64), unique=True, index=True, nullable=True)
+    seen_count: so.Mapped[int] = so.mapped_column(sa.INTEGER, default=1, server_default="1", nullable=False)
+    last_seen_at: so.Mapped[dt.datetime | None] = so.mapped_column(sa.DateTime(timezone=True), nullable=True)
+
+    ## `get_location_key()` of the payload, so rows can be grouped by location without decompressing them.
+    #  NULL if the payload has no location.
+    location_key: so.Mapped[str | None] = so.mapped_column(sa.String(255), index=True, nullable=True)
 
 class CurrentWeatherModel(Base):
     """Current weather model.
 
     Attributes:
         id (int): The ID of the current weather record.
+        created_at (datetime): When the record was saved. NULL for records saved before it was tracked.
         last_updated_epoch (int): The last updated epoch time.
         last_updated (str): The last updated time.
         temp_c (Decimal): The temperature in Celsius.
@@ -76,11 +89,18 @@ class CurrentWeatherModel(Base):
     """
 
     __tablename__ = "weatherapi_current_weather"
-    __table_args__ = (sa.UniqueConstraint("last_updated_epoch"),)
-    # __table_args__ = (sa.UniqueConstraint("last_updated_epoch", name="_last_updated_epoch_uc"),)
+    ## WeatherAPI aligns last_updated_epoch to 15 minute marks, so it is only unique per location
+    __table_args__ = (sa.UniqueConstraint("location_id", "last_updated_epoch", name="_location_last_updated_epoch_uc"),)
 
     id: so.Mapped[annotated.INT_PK]
 
+    ## Lets the rollup job skip rows from transactions that may not have committed yet
+    created_at: so.Mapped[dt.datetime | None] = so.mapped_column(
+        sa.DateTime(timezone=True),
+        default=dt.datetime.now,
+        nullable=True,
+    )
+
     last_updated_epoch: so.Mapped[int] = so.mapped_column(sa.INTEGER)
     last_updated: so.Mapped[str] = so.mapped_column(sa.TEXT)
     temp_c: so.Mapped[Decimal] = so.mapped_column(sa.NUMERIC(precision=12, scale=2))
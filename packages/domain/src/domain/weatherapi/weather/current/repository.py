@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import datetime as dt
 import typing as t
 
 from .models import (
@@ -27,6 +28,45 @@ class CurrentWeatherJSONRepository(BaseRepository):
     def __init__(self, session: so.Session):
         super().__init__(session, CurrentWeatherJSONModel)
 
+    def get_by_content_hash(self, content_hash: str) -> CurrentWeatherJSONModel | None:
+        """Get a CurrentWeatherJSONModel by the hash of its content.
+
+        Params:
+            content_hash (str): The content hash of the response to retrieve.
+
+        Returns:
+            CurrentWeatherJSONModel | None: The stored response with the specified hash, or None.
+
+        """
+        return (
+            self.session.query(CurrentWeatherJSONModel)
+            .filter(CurrentWeatherJSONModel.content_hash == content_hash)
+            .one_or_none()
+        )
+
+    def mark_seen(self, obj: CurrentWeatherJSONModel, seen_at: dt.datetime | None = None) -> CurrentWeatherJSONModel:
+        """Record that a duplicate of a stored response was received.
+
+        Description:
+            Increments `seen_count` in SQL (`seen_count + 1`), so concurrent workers
+            don't lose updates, and sets `last_seen_at`.
+
+        Params:
+            obj (CurrentWeatherJSONModel): The stored response.
+            seen_at (datetime | None): When the duplicate was received. Defaults to `datetime.now()`.
+
+        Returns:
+            CurrentWeatherJSONModel: The refreshed response.
+
+        """
+        obj.seen_count = CurrentWeatherJSONModel.seen_count + 1
+        obj.last_seen_at = seen_at or dt.datetime.now()
+
+        self.session.commit()
+        self.session.refresh(obj)
+
+        return obj
+
 
 class CurrentWeatherRepository(BaseRepository[CurrentWeatherModel]):
     """Repository for CurrentWeatherModel.
@@ -137,7 +177,7 @@ class CurrentWeatherRepository(BaseRepository[CurrentWeatherModel]):
             .one_or_none()
         )
 
-    def get_by_last_updated_epoch(self, last_updated_epoch: int):
+    def get_by_last_updated_epoch(self, last_updated_epoch: int, location_id: int | None = None):
         """Get a CurrentWeatherModel by its last updated epoch.
         
         Description:
@@ -145,6 +185,7 @@ class CurrentWeatherRepository(BaseRepository[CurrentWeatherModel]):
         
         Params:
             last_updated_epoch (int): The last updated epoch of the CurrentWeatherModel to retrieve.
+            location_id (int | None): Only match readings for this location. Epochs are shared between locations.
         
         Returns:
             CurrentWeatherModel: The CurrentWeatherModel with the specified last updated epoch.
@@ -153,12 +194,15 @@ class CurrentWeatherRepository(BaseRepository[CurrentWeatherModel]):
             Exception: If there is an error retrieving the CurrentWeatherModel.
 
         """
-        return (
-            self.session.query(CurrentWeatherModel)
-            .filter(CurrentWeatherModel.last_updated_epoch == last_updated_epoch)
-            .one_or_none()
+        query = self.session.query(CurrentWeatherModel).filter(
+            CurrentWeatherModel.last_updated_epoch == last_updated_epoch
         )
 
+        if location_id is not None:
+            query = query.filter(CurrentWeatherModel.location_id == location_id)
+
+        return query.one_or_none()
+
     def get_by_last_updated(self, last_updated: str):
         """Get a CurrentWeatherModel by its last updated.
         
@@ -42,6 +42,9 @@ class CurrentWeatherJSONOut(CurrentWeatherJSONIn):
     Attributes:
       id (int): The ID of the current weather response.
       created_at (datetime): The creation date of the current weather response.
+      content_hash (str | None): Hash of the response's content, used to deduplicate responses.
+      seen_count (int): How many times this response has been received.
+      last_seen_at (datetime | None): When a duplicate of this response was last received.
 
     """
     
@@ -49,6 +52,10 @@ class CurrentWeatherJSONOut(CurrentWeatherJSONIn):
     
     created_at: dt.datetime
 
+    content_hash: str | None = None
+    seen_count: int = 1
+    last_seen_at: dt.datetime | None = None
+
 class CurrentWeatherConditionIn(BaseModel):
     """Current weather condition schema.
     
@@ -4,6 +4,7 @@ import datetime as dt
 import typing as t
 
 from db import Base, annotated
+from db.types import CompressedJSON
 from loguru import logger as log
 import sqlalchemy as sa
 import sqlalchemy.exc as sa_exc
@@ -25,4 +26,15 @@ class ForecastJSONModel(Base):
         nullable=False,
     )
 
-    forecast_json: so.Mapped[dict] = so.mapped_column(JSON)
\ No newline at end of file
+    ## Stored zstd/zlib-compressed; raw responses are large & highly repetitive
+    forecast_json: so.Mapped[dict | None] = so.mapped_column(CompressedJSON(), nullable=True)
+
+    ## Hash of the canonicalized response, without volatile fields. Repeats of a response bump
+    #  seen_count/last_seen_at instead of adding a row. NULL for rows saved before deduplication.
+    content_hash: so.Mapped[str | None] = so.mapped_column(sa.String(64), unique=True, index=True, nullable=True)
+    seen_count: so.Mapped[int] = so.mapped_column(sa.INTEGER, default=1, server_default="1", nullable=False)
+    last_seen_at: so.Mapped[dt.datetime | None] = so.mapped_column(sa.DateTime(timezone=True), nullable=True)
+
+    ## `get_location_key()` of the payload, so rows can be grouped by location without decompressing them.
+    #  NULL if the payload has no location.
+    location_key: so.Mapped[str | None] = so.mapped_column(sa.String(255), index=True, nullable=True)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import datetime as dt
 import typing as t
 
 from .models import ForecastJSONModel
@@ -14,4 +15,43 @@ __all__ = ["ForecastJSONRepository"]
 
 class ForecastJSONRepository(BaseRepository):
     def __init__(self, session: so.Session):
-        super().__init__(session, ForecastJSONModel)
\ No newline at end of file
+        super().__init__(session, ForecastJSONModel)
+
+    def get_by_content_hash(self, content_hash: str) -> ForecastJSONModel | None:
+        """Get a ForecastJSONModel by the hash of its content.
+
+        Params:
+            content_hash (str): The content hash of the forecast to retrieve.
+
+        Returns:
+            ForecastJSONModel | None: The stored forecast with the specified hash, or None.
+
+        """
+        return (
+            self.session.query(ForecastJSONModel)
+            .filter(ForecastJSONModel.content_hash == content_hash)
+            .one_or_none()
+        )
+
+    def mark_seen(self, obj: ForecastJSONModel, seen_at: dt.datetime | None = None) -> ForecastJSONModel:
+        """Record that a duplicate of a stored forecast was received.
+
+        Description:
+            Increments `seen_count` in SQL (`seen_count + 1`), so concurrent workers
+            don't lose updates, and sets `last_seen_at`.
+
+        Params:
+            obj (ForecastJSONModel): The stored forecast.
+            seen_at (datetime | None): When the duplicate was received. Defaults to `datetime.now()`.
+
+        Returns:
+            ForecastJSONModel: The refreshed forecast.
+
+        """
+        obj.seen_count = ForecastJSONModel.seen_count + 1
+        obj.last_seen_at = seen_at or dt.datetime.now()
+
+        self.session.commit()
+        self.session.refresh(obj)
+
+        return obj
@@ -28,9 +28,16 @@ class ForecastJSONOut(ForecastJSONIn):
     Attributes:
         id (int): The ID of the forecast.
         created_at (datetime): The creation date of the forecast.
+        content_hash (str | None): Hash of the forecast's content, used to deduplicate responses.
+        seen_count (int): How many times this forecast has been received.
+        last_seen_at (datetime | None): When a duplicate of this forecast was last received.
         
     """
     
     id: int
 
-    created_at: dt.datetime
\ No newline at end of file
+    created_at: dt.datetime
+
+    content_hash: str | None = None
+    seen_count: int = 1
+    last_seen_at: dt.datetime | None = None
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import datetime as dt
+import typing as t
+
+from db import Base, annotated
+from loguru import logger as log
+import sqlalchemy as sa
+import sqlalchemy.exc as sa_exc
+import sqlalchemy.orm as so
+
+__all__ = [
+    "RollupWatermarkModel",
+    "CurrentWeatherHourlyRollupModel",
+    "CurrentWeatherDailyRollupModel",
+]
+
+
+class RollupWatermarkModel(Base):
+    """Tracks how far a rollup job has processed its source table.
+
+    Attributes:
+        id (int): The ID of the watermark record.
+        name (str): The name of the rollup job, i.e. `weatherapi_current_weather`.
+        last_id (int): The highest source row ID included in the rollups.
+        updated_at (datetime): When the watermark was last advanced.
+
+    """
+
+    __tablename__ = "weatherapi_rollup_watermark"
+
+    id: so.Mapped[annotated.INT_PK]
+
+    name: so.Mapped[str] = so.mapped_column(sa.VARCHAR(255), unique=True, index=True)
+    last_id: so.Mapped[int] = so.mapped_column(sa.INTEGER, default=0, nullable=False)
+    updated_at: so.Mapped[dt.datetime] = so.mapped_column(
+        sa.DateTime(timezone=True),
+        default=dt.datetime.now,
+        onupdate=dt.datetime.now,
+        nullable=False,
+    )
+
+
+class _CurrentWeatherRollupMixin:
+    """Shared columns for current weather rollup buckets.
+
+    Description:
+        Averages are stored as running sums + a count of the readings that had a value, so a bucket
+        can be updated incrementally as new readings arrive, without re-scanning the source table.
+        Readings missing a metric don't change its average.
+
+    Attributes:
+        id (int): The ID of the rollup record.
+        location_id (int): The location the bucket belongs to.
+        bucket_start_epoch (int): Unix timestamp of the start of the bucket.
+        reading_count (int): Number of readings in the bucket.
+        first_reading_epoch (int): `last_updated_epoch` of the oldest reading in the bucket.
+        last_reading_epoch (int): `last_updated_epoch` of the newest reading in the bucket.
+        temp_c_min (float): Minimum temperature in Celsius.
+        temp_c_max (float): Maximum temperature in Celsius.
+        temp_c_sum (float): Sum of temperatures in Celsius.
+        temp_c_count (int): Number of readings with a temperature.
+        feelslike_c_sum (float): Sum of feels-like temperatures in Celsius.
+        feelslike_c_count (int): Number of readings with a feels-like temperature.
+        humidity_sum (float): Sum of humidity percentages.
+        humidity_count (int): Number of readings with a humidity percentage.
+        pressure_mb_sum (float): Sum of pressure readings in millibars.
+        pressure_mb_count (int): Number of readings with a pressure reading.
+        wind_kph_sum (float): Sum of wind speeds in km/h.
+        wind_kph_count (int): Number of readings with a wind speed.
+        wind_kph_max (float): Maximum wind speed in km/h.
+        gust_kph_max (float): Maximum gust speed in km/h.
+        precip_mm_sum (float): Sum of precipitation readings in mm.
+        precip_mm_max (float): Maximum precipitation reading in mm.
+        uv_max (float): Maximum UV index.
+
+    """
+
+    id: so.Mapped[annotated.INT_PK]
+
+    location_id: so.Mapped[int] = so.mapped_column(sa.ForeignKey("weatherapi_location.id"), index=True)
+    bucket_start_epoch: so.Mapped[int] = so.mapped_column(sa.INTEGER, index=True)
+
+    reading_count: so.Mapped[int] = so.mapped_column(sa.INTEGER, default=0, nullable=False)
+    first_reading_epoch: so.Mapped[int] = so.mapped_column(sa.INTEGER)
+    last_reading_epoch: so.Mapped[int] = so.mapped_column(sa.INTEGER)
+
+    temp_c_min: so.Mapped[float | None] = so.mapped_column(sa.FLOAT)
+    temp_c_max: so.Mapped[float | None] = so.mapped_column(sa.FLOAT)
+    temp_c_sum: so.Mapped[float] = so.mapped_column(sa.FLOAT, default=0.0)
+    temp_c_count: so.Mapped[int] = so.mapped_column(sa.INTEGER, default=0, nullable=False)
+    feelslike_c_sum: so.Mapped[float] = so.mapped_column(sa.FLOAT, default=0.0)
+    feelslike_c_count: so.Mapped[int] = so.mapped_column(sa.INTEGER, default=0, nullable=False)
+    humidity_sum: so.Mapped[float] = so.mapped_column(sa.FLOAT, default=0.0)
+    humidity_count: so.Mapped[int] = so.mapped_column(sa.INTEGER, default=0, nullable=False)
+    pressure_mb_sum: so.Mapped[float] = so.mapped_column(sa.FLOAT, default=0.0)
+    pressure_mb_count: so.Mapped[int] = so.mapped_column(sa.INTEGER, default=0, nullable=False)
+    wind_kph_sum: so.Mapped[float] = so.mapped_column(sa.FLOAT, default=0.0)
+    wind_kph_count: so.Mapped[int] = so.mapped_column(sa.INTEGER, default=0, nullable=False)
+    wind_kph_max: so.Mapped[float | None] = so.mapped_column(sa.FLOAT)
+    gust_kph_max: so.Mapped[float | None] = so.mapped_column(sa.FLOAT)
+    precip_mm_sum: so.Mapped[float] = so.mapped_column(sa.FLOAT, default=0.0)
+    precip_mm_max: so.Mapped[float | None] = so.mapped_column(sa.FLOAT)
+    uv_max: so.Mapped[float | None] = so.mapped_column(sa.FLOAT)
+
+
+class CurrentWeatherHourlyRollupModel(_CurrentWeatherRollupMixin, Base):
+    """Hourly (UTC) rollup of current weather readings per location."""
+
+    __tablename__ = "weatherapi_current_weather_hourly"
+    __table_args__ = (
+        sa.UniqueConstraint("location_id", "bucket_start_epoch", name="_hourly_location_bucket_uc"),
+    )
+
+
+class CurrentWeatherDailyRollupModel(_CurrentWeatherRollupMixin, Base):
+    """Daily rollup of current weather readings per location.
+
+    Description:
+        Days start at local midnight in the location's `tz_id`, falling back to UTC.
+
+    """
+
+    __tablename__ = "weatherapi_current_weather_daily"
+    __table_args__ = (
+        sa.UniqueConstraint("location_id", "bucket_start_epoch", name="_daily_location_bucket_uc"),
+    )
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import typing as t
+
+from .models import (
+    CurrentWeatherDailyRollupModel,
+    CurrentWeatherHourlyRollupModel,
+    RollupWatermarkModel,
+)
+
+from db.base import BaseRepository
+from loguru import logger as log
+import sqlalchemy as sa
+import sqlalchemy.exc as sa_exc
+import sqlalchemy.orm as so
+
+__all__ = [
+    "RollupWatermarkRepository",
+    "CurrentWeatherHourlyRollupRepository",
+    "CurrentWeatherDailyRollupRepository",
+]
+
+RollupModel = t.Union[CurrentWeatherHourlyRollupModel, CurrentWeatherDailyRollupModel]
+
+
+class RollupWatermarkRepository(BaseRepository[RollupWatermarkModel]):
+    """Repository for RollupWatermarkModel.
+
+    Attributes:
+        session (so.Session): The database session.
+
+    """
+
+    def __init__(self, session: so.Session):
+        super().__init__(session, RollupWatermarkModel)
+
+    def get_by_name(self, name: str, for_update: bool = False) -> RollupWatermarkModel | None:
+        """Get a watermark by its rollup job name.
+
+        Params:
+            name (str): The name of the rollup job.
+            for_update (bool): Lock the watermark row (`SELECT ... FOR UPDATE`) until the session's
+                transaction ends. Ignored by SQLite, which only allows one writer at a time.
+
+        Returns:
+            (RollupWatermarkModel): The watermark, if it exists.
+            (None): None if the rollup job has never run.
+
+        """
+        query = self.session.query(RollupWatermarkModel).filter(RollupWatermarkModel.name == name)
+
+        if for_update:
+            ## Reload the row even if it's in the session already; another run may have advanced it
+            query = query.with_for_update().populate_existing()
+
+        return query.one_or_none()
+
+    def get_or_create(self, name: str, for_update: bool = False) -> RollupWatermarkModel:
+        """Get a watermark by name, creating it at 0 if it does not exist.
+
+        Params:
+            name (str): The name of the rollup job.
+            for_update (bool): Lock the watermark row until the session's transaction ends.
+
+        Returns:
+            RollupWatermarkModel: The existing or newly created watermark.
+
+        """
+        watermark = self.get_by_name(name=name, for_update=for_update)
+
+        if watermark is None:
+            try:
+                self.create(RollupWatermarkModel(name=name, last_id=0))
+            except sa_exc.IntegrityError:
+                ## Another run created it first
+                self.session.rollback()
+
+            watermark = self.get_by_name(name=name, for_update=for_update)
+
+        return watermark
+
+
+class _CurrentWeatherRollupRepository(BaseRepository[RollupModel]):
+    """Shared query methods for hourly & daily rollup repositories."""
+
+    def get_bucket(self, location_id: int, bucket_start_epoch: int) -> RollupModel | None:
+        """Get a single rollup bucket.
+
+        Params:
+            location_id (int): The ID of the location.
+            bucket_start_epoch (int): Unix timestamp of the start of the bucket.
+
+        Returns:
+            (RollupModel): The bucket, if it exists.
+            (None): None if no readings have been rolled up into the bucket yet.
+
+        """
+        return (
+            self.session.query(self.model)
+            .filter(
+                self.model.location_id == location_id,
+                self.model.bucket_start_epoch == bucket_start_epoch,
+            )
+            .one_or_none()
+        )
+
+    def get_buckets(self, location_id: int, bucket_start_epochs: list[int]) -> dict[int, RollupModel]:
+        """Get multiple rollup buckets for a location, keyed by bucket start epoch.
+
+        Params:
+            location_id (int): The ID of the location.
+            bucket_start_epochs (list[int]): Bucket start timestamps to load.
+
+        Returns:
+            dict[int, RollupModel]: Existing buckets, keyed by `bucket_start_epoch`.
+
+        """
+        if not bucket_start_epochs:
+            return {}
+
+        rows = (
+            self.session.query(self.model)
+            .filter(
+                self.model.location_id == location_id,
+                self.model.bucket_start_epoch.in_(bucket_start_epochs),
+            )
+            .all()
+        )
+
+        return {row.bucket_start_epoch: row for row in rows}
+
+    def list_for_location(
+        self,
+        location_id: int,
+        start_epoch: int | None = None,
+        end_epoch: int | None = None,
+        limit: int | None = None,
+    ) -> list[RollupModel]:
+        """List rollup buckets for a location, oldest first.
+
+        Params:
+            location_id (int): The ID of the location.
+            start_epoch (int | None): Only return buckets starting at or after this timestamp.
+            end_epoch (int | None): Only return buckets starting before this timestamp.
+            limit (int | None): Return at most this many (most recent) buckets.
+
+        Returns:
+            list[RollupModel]: Rollup buckets ordered by `bucket_start_epoch`.
+
+        """
+        stmt = sa.select(self.model).where(self.model.location_id == location_id)
+
+        if start_epoch is not None:
+            stmt = stmt.where(self.model.bucket_start_epoch >= start_epoch)
+        if end_epoch is not None:
+            stmt = stmt.where(self.model.bucket_start_epoch < end_epoch)
+
+        if limit is not None:
+            ## Take the most recent N buckets, then return them oldest first
+            stmt = stmt.order_by(self.model.bucket_start_epoch.desc()).limit(limit)
+            return list(reversed(self.session.execute(stmt).scalars().all()))
+
+        stmt = stmt.order_by(self.model.bucket_start_epoch)
+
+        return self.session.execute(stmt).scalars().all()
+
+
+class CurrentWeatherHourlyRollupRepository(_CurrentWeatherRollupRepository):
+    """Repository for CurrentWeatherHourlyRollupModel.
+
+    Attributes:
+        session (so.Session): The database session.
+
+    """
+
+    def __init__(self, session: so.Session):
+        super().__init__(session, CurrentWeatherHourlyRollupModel)
+
+
+class CurrentWeatherDailyRollupRepository(_CurrentWeatherRollupRepository):
+    """Repository for CurrentWeatherDailyRollupModel.
+
+    Attributes:
+        session (so.Session): The database session.
+
+    """
+
+    def __init__(self, session: so.Session):
+        super().__init__(session, CurrentWeatherDailyRollupModel)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import datetime as dt
+import typing as t
+
+from loguru import logger as log
+from pydantic import BaseModel, ConfigDict, computed_field
+
+__all__ = [
+    "RollupWatermarkOut",
+    "CurrentWeatherRollupOut",
+]
+
+
+class RollupWatermarkOut(BaseModel):
+    """Rollup watermark, retrieved from database.
+
+    Attributes:
+        id (int): The ID of the watermark record.
+        name (str): The name of the rollup job.
+        last_id (int): The highest source row ID included in the rollups.
+        updated_at (datetime): When the watermark was last advanced.
+
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    last_id: int
+    updated_at: dt.datetime
+
+
+class CurrentWeatherRollupOut(BaseModel):
+    """An hourly or daily current weather rollup bucket, retrieved from database.
+
+    Attributes:
+        location_id (int): The location the bucket belongs to.
+        bucket_start_epoch (int): Unix timestamp of the start of the bucket.
+        reading_count (int): Number of readings in the bucket.
+        temp_c_min (float): Minimum temperature in Celsius.
+        temp_c_max (float): Maximum temperature in Celsius.
+        temp_c_avg (float): Average temperature in Celsius.
+        feelslike_c_avg (float): Average feels-like temperature in Celsius.
+        humidity_avg (float): Average humidity percentage.
+        pressure_mb_avg (float): Average pressure in millibars.
+        wind_kph_avg (float): Average wind speed in km/h.
+        wind_kph_max (float): Maximum wind speed in km/h.
+        gust_kph_max (float): Maximum gust speed in km/h.
+        precip_mm_sum (float): Sum of precipitation readings in mm.
+        precip_mm_max (float): Maximum precipitation reading in mm.
+        uv_max (float): Maximum UV index.
+
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    location_id: int
+    bucket_start_epoch: int
+    reading_count: int
+    first_reading_epoch: int | None = None
+    last_reading_epoch: int | None = None
+
+    temp_c_min: float | None = None
+    temp_c_max: float | None = None
+    temp_c_sum: float = 0.0
+    temp_c_count: int = 0
+    feelslike_c_sum: float = 0.0
+    feelslike_c_count: int = 0
+    humidity_sum: float = 0.0
+    humidity_count: int = 0
+    pressure_mb_sum: float = 0.0
+    pressure_mb_count: int = 0
+    wind_kph_sum: float = 0.0
+    wind_kph_count: int = 0
+    wind_kph_max: float | None = None
+    gust_kph_max: float | None = None
+    precip_mm_sum: float = 0.0
+    precip_mm_max: float | None = None
+    uv_max: float | None = None
+
+    def _avg(self, total: float, count: int) -> float | None:
+        ## Averaged over the readings that had a value, not every reading in the bucket
+        if not count:
+            return None
+
+        return round(total / count, 2)
+
+    @computed_field
+    @property
+    def bucket_start(self) -> dt.datetime:
+        return dt.datetime.fromtimestamp(self.bucket_start_epoch, tz=dt.timezone.utc)
+
+    @computed_field
+    @property
+    def temp_c_avg(self) -> float | None:
+        return self._avg(self.temp_c_sum, self.temp_c_count)
+
+    @computed_field
+    @property
+    def feelslike_c_avg(self) -> float | None:
+        return self._avg(self.feelslike_c_sum, self.feelslike_c_count)
+
+    @computed_field
+    @property
+    def humidity_avg(self) -> float | None:
+        return self._avg(self.humidity_sum, self.humidity_count)
+
+    @computed_field
+    @property
+    def pressure_mb_avg(self) -> float | None:
+        return self._avg(self.pressure_mb_sum, self.pressure_mb_count)
+
+    @computed_field
+    @property
+    def wind_kph_avg(self) -> float | None:
+        return self._avg(self.wind_kph_sum, self.wind_kph_count)
@@ -3,4 +3,5 @@ from __future__ import annotations
 from .client import *
 from .controllers import *
 from .cache import *
-from .constants import *
\ No newline at end of file
+from .constants import *
+from .metrics import *
\ No newline at end of file
@@ -13,6 +13,7 @@ import typing as t
 
 log = logging.getLogger(__name__)
 
+from core_utils import metrics_utils
 import httpx
 
 __all__ = [
@@ -69,6 +70,7 @@ def build_request(
     return request
 
 
+@metrics_utils.timed_stage("http", "decode")
 def decode_response(response: httpx.Response = None, encoding: str = "utf-8") -> dict:
     """Decode an httpx.Response object to a Python dict.
 
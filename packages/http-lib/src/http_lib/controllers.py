@@ -4,15 +4,18 @@ from contextlib import AbstractContextManager, contextmanager
 import json
 import logging
 from pathlib import Path
+import time
 import typing as t
 
 log = logging.getLogger(__name__)
 
 from . import cache
+from .metrics import HTTP_CACHE_REQUESTS, UPSTREAM_REQUEST_DURATION, get_provider_name
 
-from dynaconf import Dynaconf
+from core_utils import metrics_utils, tracing_utils
 import hishel
 import httpx
+from settings import HTTP_SETTINGS
 
 __all__ = [
     "get_http_controller",
@@ -21,15 +24,6 @@ __all__ = [
 ]
 
 
-## Load HTTP settings from environment
-HTTP_SETTINGS = Dynaconf(
-    environments=True,
-    env="http",
-    envvar_prefix="HTTP_CACHE",
-    settings_files=[".settings.toml", ".secrets.toml"],
-)
-
-
 def ensure_dir_exists(path: str) -> None:
     """Create directory if it does not exist.
 
@@ -69,6 +63,7 @@ def get_http_controller(
     cacheable_status_codes: list[int] | None = None,
     cache_allow_heuristics: bool = True,
     cache_allow_stale: bool = False,
+    transport: httpx.BaseTransport | None = None,
 ) -> HttpxController:
     """Return an initialized HttpxController class object.
 
@@ -99,6 +94,8 @@ def get_http_controller(
         cache_allow_heuristics (bool): (default: True) Use heuristics to match objects in cache, improves performance &
             reliability of caching new objects.
         cache_allow_stale (bool): (default: False) When `True`, allow stale/expired responses from cache.
+        transport (httpx.BaseTransport | None): (default: None) Send requests through this transport instead of
+            the network, i.e. an `httpx.MockTransport` replaying recorded responses. Wrapped by the cache when enabled.
 
     Returns:
         (HttpxController): Initialized HttpxController object to use for requests.
@@ -119,6 +116,7 @@ def get_http_controller(
             cacheable_status_codes=cacheable_status_codes,
             cache_allow_heuristics=cache_allow_heuristics,
             cache_allow_stale=cache_allow_stale,
+            transport=transport,
         )
 
         return http_ctl
@@ -191,6 +189,8 @@ class HttpxController(AbstractContextManager):
         cache_allow_heuristics (bool): (default: True) Use heuristics to match objects in cache, improves performance &
             reliability of caching new objects.
         cache_allow_stale (bool): (default: False) When `True`, allow stale/expired responses from cache.
+        transport (httpx.BaseTransport | None): (default: None) Send requests through this transport instead of
+            the network. Wrapped by the cache when enabled.
     """
 
     def __init__(
@@ -216,6 +216,7 @@ class HttpxController(AbstractContextManager):
         cacheable_status_codes: list[int] | None = [200, 201, 202, 301, 308],
         cache_allow_heuristics: bool = True,
         cache_allow_stale: bool = False,
+        transport: httpx.BaseTransport | None = None,
     ) -> None:
         self.use_cache: bool = use_cache
         self.force_cache: bool = force_cache
@@ -229,6 +230,7 @@ class HttpxController(AbstractContextManager):
         self.cacheable_status_codes: list[int] | None = cacheable_status_codes
         self.cache_allow_heuristics: bool = cache_allow_heuristics
         self.cache_allow_stale: bool = cache_allow_stale
+        self.transport: httpx.BaseTransport | None = transport
 
         ## Placeholder for initialized httpx.Client
         self.client: httpx.Client | None = None
@@ -328,7 +330,9 @@ class HttpxController(AbstractContextManager):
             self.cache_controller = cache_controller
 
         _transport: hishel.CacheTransport = cache.get_cache_transport(
-            cache_storage=self.cache, cache_controller=self.cache_controller
+            transport_base=self.transport or httpx.HTTPTransport(),
+            cache_storage=self.cache,
+            cache_controller=self.cache_controller,
         )
 
         self.cache_transport = _transport
@@ -337,9 +341,101 @@ class HttpxController(AbstractContextManager):
 
     def _get_client(self) -> httpx.Client:
         """Return an httpx.Client object initialized from class parameters."""
-        transport: hishel.CacheTransport | None = self.cache_transport
+        transport: httpx.BaseTransport | None = self.cache_transport or self.transport
+        instrument: bool = metrics_utils.stage_timing_enabled() or tracing_utils.tracing_enabled()
+
+        if instrument and transport is not None:
+            transport = _InstrumentedTransport(transport, cached=self.cache_transport is not None)
+
         client = httpx.Client(
             transport=transport, follow_redirects=self.follow_redirects
         )
 
+        if instrument and transport is None:
+            ## Passing a transport turns off httpx's proxies from the environment (HTTP(S)_PROXY, NO_PROXY),
+            #  so wrap the default & proxy transports the client built instead
+            client._transport = _InstrumentedTransport(client._transport)
+            client._mounts = {
+                pattern: _InstrumentedTransport(mounted) if mounted is not None else None
+                for pattern, mounted in client._mounts.items()
+            }
+
         return client
+
+
+class _TimedByteStream(httpx.SyncByteStream):
+    """Response body stream that records the request's duration once the body has been read & closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, start: float, provider: str, status: str, upstream: bool):
+        self.stream = stream
+        self.start = start
+        self.provider = provider
+        self.status = status
+        self.upstream = upstream
+
+    def __iter__(self) -> t.Iterator[bytes]:
+        yield from self.stream
+
+    def close(self) -> None:
+        try:
+            self.stream.close()
+        finally:
+            elapsed = time.perf_counter() - self.start
+
+            metrics_utils.observe_stage("http", "send", elapsed)
+            if self.upstream:
+                UPSTREAM_REQUEST_DURATION.observe(elapsed, self.provider, self.status)
+
+
+class _InstrumentedTransport(httpx.BaseTransport):
+    """Wrap a transport to time & trace each request.
+
+    Description:
+        Every request is timed as the "http"/"send" stage, including reading the response body. Requests
+        answered by the API (not the cache) are also recorded in `UPSTREAM_REQUEST_DURATION` by provider
+        & status, and when `cached`, each request counts as a hit or miss in `HTTP_CACHE_REQUESTS`.
+
+        With tracing enabled, each request gets a span (until the response headers arrive) recording
+        whether the cache answered it. The query string is left out; it can contain API keys.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, cached: bool = False):
+        self.transport = transport
+        self.cached = cached
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        provider = get_provider_name(request.url.host)
+        start = time.perf_counter()
+
+        with tracing_utils.start_span(
+            f"HTTP {request.method}",
+            attributes={
+                "http.request.method": request.method,
+                "server.address": request.url.host,
+                "url.path": request.url.path,
+                "weatherdata.provider": provider,
+            },
+        ):
+            try:
+                response = self.transport.handle_request(request)
+            except Exception:
+                UPSTREAM_REQUEST_DURATION.observe(time.perf_counter() - start, provider, "error")
+                raise
+
+            ## hishel marks responses it served from storage
+            from_cache: bool = bool(response.extensions.get("from_cache", False))
+            tracing_utils.set_span_attributes(
+                {"http.response.status_code": response.status_code, "http.cache_hit": from_cache}
+            )
+
+        if self.cached:
+            HTTP_CACHE_REQUESTS.inc(provider, "hit" if from_cache else "miss")
+
+        response.stream = _TimedByteStream(
+            response.stream, start=start, provider=provider, status=str(response.status_code), upstream=not from_cache
+        )
+
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
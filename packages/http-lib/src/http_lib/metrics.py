@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from core_utils import metrics_utils
+
+__all__ = [
+    "UPSTREAM_REQUEST_DURATION",
+    "HTTP_CACHE_REQUESTS",
+    "get_provider_name",
+]
+
+## Recorded by HttpxController clients while stage timing is enabled (core_utils.metrics_utils.enable_stage_timing())
+UPSTREAM_REQUEST_DURATION = metrics_utils.Histogram(
+    "weatherdata_upstream_request_duration_seconds",
+    "Latency of requests sent to upstream APIs, by provider & response status ('error' if no response).",
+    labelnames=["provider", "status"],
+)
+HTTP_CACHE_REQUESTS = metrics_utils.Counter(
+    "weatherdata_http_cache_requests_total",
+    "Requests sent through the HTTP cache, by provider & result (hit or miss).",
+    labelnames=["provider", "result"],
+)
+
+
+def get_provider_name(host: str) -> str:
+    """Return the provider label for a request host, i.e. "weatherapi" for "api.weatherapi.com"."""
+    parts = host.split(".")
+
+    return parts[-2] if len(parts) >= 2 else host
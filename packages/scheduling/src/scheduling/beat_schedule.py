@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import typing as t
+
+__all__ = [
+    "SCHEDULED_TASKS",
+]
+
+## Backend-independent copy of the Celery beat schedule (celeryapp.BEAT_SCHEDULED_TASKS), for the
+#  Dramatiq & local queue backends, which enqueue these from a lib_scheduler.Scheduler. Intervals &
+#  offsets are in seconds, aligned to UTC.
+SCHEDULED_TASKS: list[dict[str, t.Any]] = [
+    {"name": "dispatch_current_weather", "task": "dispatch_location_polls", "interval": 15 * 60, "offset": 0, "kwargs": {"poll": "current"}},
+    {"name": "dispatch_weather_forecast", "task": "dispatch_location_polls", "interval": 60 * 60, "offset": 30 * 60, "kwargs": {"poll": "forecast"}},
+    ## After each current weather dispatch's spread window
+    {"name": "update_weather_rollups", "task": "update_weather_rollups", "interval": 15 * 60, "offset": 12 * 60, "kwargs": {}},
+    {"name": "apply_retention_policies", "task": "apply_retention_policies", "interval": 24 * 60 * 60, "offset": (3 * 60 + 17) * 60, "kwargs": {}},
+]
@@ -0,0 +1,87 @@
+"""Monkey-patch the standard library for a gevent/eventlet Celery worker pool.
+
+Description:
+    gevent & eventlet replace `socket`, `ssl`, `threading` & friends with cooperative versions, & only
+    work reliably when that happens before anything else imports them. The `celery` CLI does this before
+    loading the app; the worker entry points in this repo call `patch_celery_worker_pool()` first thing
+    instead.
+
+    This module is deliberately outside `scheduling.celery_scheduler` (whose `__init__` imports the app,
+    the settings & the task modules) & doesn't import the settings package; the pool is read straight
+    from the settings files.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import tomllib
+
+__all__ = ["PATCHED_POOLS", "get_celery_worker_pool", "patch_celery_worker_pool"]
+
+## Pools that need the standard library patched
+PATCHED_POOLS: list[str] = ["gevent", "eventlet"]
+
+## The files settings.base.SETTINGS_FILES merges, in order, relative to the working directory
+_SETTINGS_FILES: list[str] = [
+    "settings.toml",
+    ".secrets.toml",
+    "config/settings.toml",
+    "config/.secrets.toml",
+]
+
+## Set once a pool has been patched, so a second call is a no-op
+_PATCHED: str | None = None
+
+
+def get_celery_worker_pool(default: str = "prefork") -> str:
+    """Return the configured `celery_worker_pool` without loading the settings package.
+
+    Description:
+        `DYNACONF_CELERY_WORKER_POOL` wins, then the last of the settings files with a `[celery]`
+        `celery_worker_pool`, like Dynaconf's merge order.
+    """
+    pool: str | None = os.environ.get("DYNACONF_CELERY_WORKER_POOL")
+
+    if not pool:
+        for path in _SETTINGS_FILES:
+            try:
+                with open(Path(path), "rb") as f:
+                    celery: dict = tomllib.load(f).get("celery") or {}
+            except (OSError, tomllib.TOMLDecodeError):
+                continue
+
+            for key, value in celery.items():
+                if key.lower() == "celery_worker_pool" and value:
+                    pool = str(value)
+
+    return (pool or default).strip().strip("'\"").lower()
+
+
+def patch_celery_worker_pool(pool: str | None = None) -> bool:
+    """Monkey-patch the standard library if the worker pool is gevent or eventlet.
+
+    Description:
+        Call at the very top of a worker entry point, before importing the Celery app, the settings or
+        anything that uses sockets or threads.
+
+    Params:
+        pool (str | None): The worker pool. Defaults to the configured `celery_worker_pool`.
+
+    Returns:
+        (bool): `True` if the standard library was patched by this call.
+
+    """
+    global _PATCHED
+
+    pool = pool or get_celery_worker_pool()
+    if pool not in PATCHED_POOLS or _PATCHED is not None:
+        return False
+
+    ## Only the celery package's lazy __init__ is imported here, not the app
+    from celery import maybe_patch_concurrency
+
+    maybe_patch_concurrency(argv=["worker", f"--pool={pool}"])
+    _PATCHED = pool
+
+    return True
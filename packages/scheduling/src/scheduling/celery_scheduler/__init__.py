@@ -4,4 +4,9 @@ from ._beat import *
 from ._worker import *
 from .celeryapp import *
 from .celeryconfig import *
+from .claim_check import *
+from .metrics import *
 from .start_celery import *
+from .task_logging import *
+from .tracing import *
+from .tuning import *
@@ -3,10 +3,11 @@ from __future__ import annotations
 import subprocess
 
 from . import celeryapp
+from .tuning import get_worker_argv
 
 from celery import Celery
 from loguru import logger as log
-from settings.celery_settings import CELERY_SETTINGS
+from scheduling.celery_patch import patch_celery_worker_pool
 from settings.logging_settings import LOGGING_SETTINGS
 import setup
 
@@ -16,7 +17,12 @@ __all__ = [
 
 def start_celery_worker(app: Celery = celeryapp.app):
     """Starts the Celery worker.
-    
+
+    Description:
+        With a gevent or eventlet pool, the worker's entry point must call
+        `scheduling.celery_patch.patch_celery_worker_pool()` before importing anything else, like
+        `scripts/celery/start_celery.py` does.
+
     Params:
         app (Celery): An initialized Celery app
 
@@ -29,11 +35,17 @@ def start_celery_worker(app: Celery = celeryapp.app):
         ]
     )
 
-    log.info("Starting Celery worker")
-    try:
-        app.worker_main(
-            argv=["worker", "--loglevel=DEBUG", "--uid=0", "--gid=0"]
+    argv: list[str] = get_worker_argv()
+
+    ## A no-op when the entry point already patched; patching this late may miss modules imported earlier
+    if patch_celery_worker_pool():
+        log.warning(
+            "Patched the standard library for the gevent/eventlet pool after the Celery app was imported. Call scheduling.celery_patch.patch_celery_worker_pool() at the top of the worker's entry point."
         )
+
+    log.info(f"Starting Celery worker: {' '.join(argv)}")
+    try:
+        app.worker_main(argv=argv)
     except Exception as exc:
         msg = Exception(f"Unhandled exception getting Celery worker. Details: {exc}")
         log.error(msg)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import time
+
 from celery import current_app, shared_task
 import db
 from depends import db_depends
@@ -26,6 +28,7 @@ from domain.weatherapi.weather.forecast import (
     ForecastJSONRepository,
 )
 from loguru import logger as log
+from scheduling.celery_scheduler import claim_check
 from weather_client.apis import api_weatherapi
 
 __all__ = [
@@ -40,6 +43,7 @@ def task_adhoc_current_weather(
     location: str = api_weatherapi.settings.location_name,
     api_key: str = api_weatherapi.settings.api_key,
     use_cache: bool = False,
+    claim_check_mode: str | None = None,
 ):
     """Get the current weather for a location using a Celery task.
 
@@ -47,7 +51,14 @@ def task_adhoc_current_weather(
         location (str): The location to get the current weather for.
         api_key (str): The API key to use for the request.
         use_cache (bool): Whether to use the cache for the request.
+        claim_check_mode (str | None): One of `claim_check.CLAIM_CHECK_MODES`. Use "db" or "minio" to get a
+            `payload_ref` to the full response (see `claim_check.load_payload()`).
+
+    Returns:
+        (dict): A compact summary of the request.
     """
+    start = time.perf_counter()
+
     try:
         current_weather_res = api_weatherapi.client.get_current_weather(
             location=location, api_key=api_key, use_cache=use_cache, save_to_db=True
@@ -58,7 +69,13 @@ def task_adhoc_current_weather(
 
         raise exc
 
-    return current_weather_res
+    summary = claim_check.summarize_payload(
+        current_weather_res, kind="current", location=location, duration_s=round(time.perf_counter() - start, 3)
+    )
+    if current_weather_res is not None:
+        summary["payload_ref"] = claim_check.store_payload(current_weather_res, kind="current", mode=claim_check_mode)
+
+    return summary
 
 
 @log.catch
@@ -67,6 +84,7 @@ def task_adhoc_weather_forecast(
     location: str = api_weatherapi.settings.location_name,
     api_key: str = api_weatherapi.settings.api_key,
     use_cache: bool = False,
+    claim_check_mode: str | None = None,
 ):
     """Get the forecast weather for a location using a Celery task.
 
@@ -74,7 +92,14 @@ def task_adhoc_weather_forecast(
         location (str): The location to get the forecast weather for.
         api_key (str): The API key to use for the request.
         use_cache (bool): Whether to use the cache for the request.
+        claim_check_mode (str | None): One of `claim_check.CLAIM_CHECK_MODES`. Use "db" or "minio" to get a
+            `payload_ref` to the full forecast (see `claim_check.load_payload()`).
+
+    Returns:
+        (dict): A compact summary of the request.
     """
+    start = time.perf_counter()
+
     try:
         forecast_weather_res = api_weatherapi.client.get_weather_forecast(
             location=location, api_key=api_key, use_cache=use_cache, save_to_db=True
@@ -85,4 +110,10 @@ def task_adhoc_weather_forecast(
 
         raise exc
 
-    return forecast_weather_res
+    summary = claim_check.summarize_payload(
+        forecast_weather_res, kind="forecast", location=location, duration_s=round(time.perf_counter() - start, 3)
+    )
+    if forecast_weather_res is not None:
+        summary["payload_ref"] = claim_check.store_payload(forecast_weather_res, kind="forecast", mode=claim_check_mode)
+
+    return summary
@@ -4,12 +4,35 @@ from celery.schedules import crontab
 from weather_client.apis import api_weatherapi
 
 __all__ = [
+    "SCHEDULED_TASK_15m_weatherapi_dispatch_current_weather",
+    "SCHEDULED_TASK_30m_weatherapi_dispatch_weather_forecast",
     "SCHEDULED_TASK_15m_weatherapi_current_weather",
     "SCHEDULED_TASK_30m_weatherapi_weather_forecast",
+    "SCHEDULED_TASK_15m_weatherapi_update_rollups",
+    "SCHEDULED_TASK_daily_retention_policies",
     "SCHEDULED_TASK_test_minutely_weatherapi_current_weather",
     "SCHEDULED_TASK_test_minutely_weatherapi_weather_forecast",
 ]
 
+## Poll every active location in the registry, sharded across workers. Polls are spread over
+#  WEATHERAPI_POLL_SPREAD_CURRENT/WEATHERAPI_POLL_SPREAD_FORECAST seconds after each dispatch.
+SCHEDULED_TASK_15m_weatherapi_dispatch_current_weather = {
+    "15m_weatherapi_dispatch_current_weather": {
+        "task": "dispatch_location_polls",
+        "schedule": crontab(minute="*/15"),
+        "kwargs": {"poll": "current"},
+    }
+}
+
+SCHEDULED_TASK_30m_weatherapi_dispatch_weather_forecast = {
+    "30m_weatherapi_dispatch_weather_forecast": {
+        "task": "dispatch_location_polls",
+        "schedule": crontab(minute=30, hour="*"),
+        "kwargs": {"poll": "forecast"},
+    }
+}
+
+## Single location (WEATHERAPI_LOCATION_NAME) polls
 SCHEDULED_TASK_15m_weatherapi_current_weather = {
     "15m_weaterapi_current_weather": {
         "task": "request_current_weather",
@@ -30,6 +53,22 @@ SCHEDULED_TASK_30m_weatherapi_weather_forecast = {
     }
 }
 
+## Runs after each current weather dispatch's polls (spread over 10 minutes by default) finish
+SCHEDULED_TASK_15m_weatherapi_update_rollups = {
+    "15m_weatherapi_update_rollups": {
+        "task": "update_weather_rollups",
+        "schedule": crontab(minute="12,27,42,57"),
+    }
+}
+
+## Runs off-peak, away from the current weather/forecast polls
+SCHEDULED_TASK_daily_retention_policies = {
+    "daily_retention_policies": {
+        "task": "apply_retention_policies",
+        "schedule": crontab(minute=17, hour=3),
+    }
+}
+
 SCHEDULED_TASK_test_minutely_weatherapi_current_weather = {
     "test_minutely_weatherapi_current_weather": {
         "task": "request_current_weather",
@@ -4,7 +4,7 @@ from pathlib import Path
 import time
 import typing as t
 
-from celery import current_app
+from celery import chord, current_app, group
 from celery.result import AsyncResult
 import db
 import depends
@@ -21,27 +21,41 @@ from domain.weatherapi.weather import (
 )
 import httpx
 from loguru import logger as log
+from scheduling import polling
+from scheduling.celery_scheduler import claim_check
 from weather_client.apis import api_weatherapi
 
 __all__ = [
     "task_current_weather",
     "task_weather_forecast",
+    "task_update_weather_rollups",
+    "task_apply_retention_policies",
+    "task_poll_current_weather_shard",
+    "task_poll_weather_forecast_shard",
+    "task_summarize_location_polls",
+    "task_dispatch_location_polls",
 ]
 
 
 @current_app.task(name="request_current_weather")
-def task_current_weather(location: str) -> dict:
+def task_current_weather(location: str, claim_check_mode: str | None = None) -> dict:
     """Request the current weather for a location using a Celery task.
 
+    Description:
+        The response is saved to the database; the task only returns a compact summary so
+        the (unread) result backend doesn't store a full payload every run.
+
     Params:
         location (str): The location to get the current weather for.
+        claim_check_mode (str | None): One of `claim_check.CLAIM_CHECK_MODES`. When not "none", the summary's
+            `payload_ref` points to the full response. Defaults to the `CELERY_CLAIM_CHECK_MODE` setting.
 
     Returns:
-        (dict): The current weather for the location.
-        (None): None if the request failed.
+        (dict): A summary of the request. `ok` is False if the request failed.
 
     """
     log.info("Requesting current weather from WeatherAPI")
+    start = time.perf_counter()
 
     try:
         current_weather_dict = api_weatherapi.client.get_current_weather(
@@ -49,7 +63,7 @@ def task_current_weather(location: str) -> dict:
         )
         if current_weather_dict is None:
             log.error("Failed to retrieve current weather from weatherapi.")
-            return None
+            return claim_check.summarize_payload(None, kind="current", location=location)
 
         log.success(f"Retrieved current weather for location '{location}'.")
     except Exception as exc:
@@ -58,22 +72,33 @@ def task_current_weather(location: str) -> dict:
 
         raise exc
 
-    return current_weather_dict
+    summary = claim_check.summarize_payload(
+        current_weather_dict, kind="current", location=location, duration_s=round(time.perf_counter() - start, 3)
+    )
+    summary["payload_ref"] = claim_check.store_payload(current_weather_dict, kind="current", mode=claim_check_mode)
+
+    return summary
 
 
 @current_app.task(name="request_weather_forecast")
-def task_weather_forecast(location: str) -> dict:
+def task_weather_forecast(location: str, claim_check_mode: str | None = None) -> dict:
     """Request the weather forecast for a location using a Celery task.
 
+    Description:
+        The forecast is saved to the database; the task only returns a compact summary so
+        the (unread) result backend doesn't store a full payload every run.
+
     Params:
         location (str): The location to get the weather forecast for.
+        claim_check_mode (str | None): One of `claim_check.CLAIM_CHECK_MODES`. When not "none", the summary's
+            `payload_ref` points to the full forecast. Defaults to the `CELERY_CLAIM_CHECK_MODE` setting.
 
     Returns:
-        (dict): The weather forecast for the location.
-        (None): None if the request failed.
+        (dict): A summary of the request. `ok` is False if the request failed.
 
     """
     log.info("Requesting weather forecast from WeatherAPI")
+    start = time.perf_counter()
 
     try:
         weather_forecast_dict = api_weatherapi.client.get_weather_forecast(
@@ -81,7 +106,7 @@ def task_weather_forecast(location: str) -> dict:
         )
         if weather_forecast_dict is None:
             log.error("Failed to retrieve weather forecast from weatherapi.")
-            return None
+            return claim_check.summarize_payload(None, kind="forecast", location=location)
 
         log.success(f"Retrieved weather forecast for location '{location}'.")
     except Exception as exc:
@@ -90,4 +115,162 @@ def task_weather_forecast(location: str) -> dict:
 
         raise exc
 
-    return weather_forecast_dict
+    summary = claim_check.summarize_payload(
+        weather_forecast_dict, kind="forecast", location=location, duration_s=round(time.perf_counter() - start, 3)
+    )
+    summary["payload_ref"] = claim_check.store_payload(weather_forecast_dict, kind="forecast", mode=claim_check_mode)
+
+    return summary
+
+
+@current_app.task(name="update_weather_rollups")
+def task_update_weather_rollups(batch_size: int = 1000) -> dict:
+    """Fold new current weather readings into the hourly & daily rollup tables.
+
+    Params:
+        batch_size (int): Number of readings to process per database transaction.
+
+    Returns:
+        (dict): A summary of the rollup run.
+
+    """
+    log.info("Updating current weather rollups")
+
+    try:
+        summary = api_weatherapi.db_client.update_current_weather_rollups(batch_size=batch_size)
+    except Exception as exc:
+        msg = f"({type(exc)}) Error updating current weather rollups. Details: {exc}"
+        log.error(msg)
+
+        raise exc
+
+    return summary
+
+
+@current_app.task(name="apply_retention_policies")
+def task_apply_retention_policies(dry_run: bool | None = None) -> list[dict]:
+    """Apply retention policies to the raw WeatherAPI JSON tables.
+
+    Params:
+        dry_run (bool | None): Only report rows/bytes that would be reclaimed. Defaults to the `RETENTION_DRY_RUN` setting.
+
+    Returns:
+        (list[dict]): A report of rows & bytes reclaimed per table.
+
+    """
+    log.info("Applying retention policies")
+
+    try:
+        reports = api_weatherapi.db_client.apply_retention_policies(dry_run=dry_run)
+    except Exception as exc:
+        msg = f"({type(exc)}) Error applying retention policies. Details: {exc}"
+        log.error(msg)
+
+        raise exc
+
+    return [report.as_dict() for report in reports]
+
+
+@current_app.task(name="poll_current_weather_shard")
+def task_poll_current_weather_shard(locations: list[str], max_concurrency: int | None = None) -> dict:
+    """Request & bulk save the current weather for a shard of registered locations.
+
+    Params:
+        locations (list[str]): The locations (WeatherAPI queries) in the shard.
+        max_concurrency (int | None): Concurrent requests within the shard. Defaults to the `WEATHERAPI_POLL_CONCURRENCY` setting.
+
+    Returns:
+        (dict): Counts of locations polled, succeeded & failed, with errors by location.
+
+    """
+    return polling.poll_location_shard("current", locations, max_concurrency=max_concurrency)
+
+
+@current_app.task(name="poll_weather_forecast_shard")
+def task_poll_weather_forecast_shard(locations: list[str], max_concurrency: int | None = None) -> dict:
+    """Request & bulk save the weather forecast for a shard of registered locations.
+
+    Params:
+        locations (list[str]): The locations (WeatherAPI queries) in the shard.
+        max_concurrency (int | None): Concurrent requests within the shard. Defaults to the `WEATHERAPI_POLL_CONCURRENCY` setting.
+
+    Returns:
+        (dict): Counts of locations polled, succeeded & failed, with errors by location.
+
+    """
+    return polling.poll_location_shard("forecast", locations, max_concurrency=max_concurrency)
+
+
+@current_app.task(name="summarize_location_polls")
+def task_summarize_location_polls(shard_results: list[dict], poll: str = "current") -> dict:
+    """Combine the results of every shard in a dispatch (the chord callback).
+
+    Params:
+        shard_results (list[dict]): The summaries returned by each shard task.
+        poll (str): The poll type that was dispatched.
+
+    Returns:
+        (dict): Total locations polled, succeeded & failed across all shards.
+
+    """
+    return polling.combine_shard_summaries(shard_results, poll=poll)
+
+
+@current_app.task(name="dispatch_location_polls")
+def task_dispatch_location_polls(
+    poll: str = "current",
+    shard_size: int | None = None,
+    max_concurrency: int | None = None,
+    spread: int | None = None,
+    jitter: int | None = None,
+) -> dict:
+    """Fan out polling of every active registered location to shard subtasks.
+
+    Description:
+        Locations are split into shards delayed across the `spread` window (see
+        `polling.plan_location_polls()`), instead of every location polling in the same second.
+        Each shard's subtask gets its delay as a `countdown`. Shards run in a Celery `chord`, so
+        they are spread across every available worker; `summarize_location_polls` runs once all finish.
+
+        With `WEATHERAPI_CONDITIONAL_POLLING`, current weather polls skip locations WeatherAPI isn't
+        expected to update before the end of the spread window.
+
+    Params:
+        poll (str): "current" or "forecast".
+        shard_size (int | None): Maximum locations per shard. Defaults to the `WEATHERAPI_POLL_SHARD_SIZE` setting.
+        max_concurrency (int | None): Concurrent requests within a shard. Defaults to the `WEATHERAPI_POLL_CONCURRENCY` setting.
+        spread (int | None): Seconds to spread the polls over, 0 to poll all at once. Defaults to the
+            `WEATHERAPI_POLL_SPREAD_CURRENT`/`WEATHERAPI_POLL_SPREAD_FORECAST` setting.
+        jitter (int | None): Maximum random seconds added to or subtracted from each shard's delay.
+            Defaults to the `WEATHERAPI_POLL_JITTER` setting.
+
+    Returns:
+        (dict): The number of locations & shards dispatched, the last shard's delay, and the chord's ID.
+
+    """
+    shard_tasks = {"current": task_poll_current_weather_shard, "forecast": task_poll_weather_forecast_shard}
+
+    if poll not in shard_tasks:
+        raise ValueError(f"Invalid poll type: '{poll}'. Must be one of {list(shard_tasks.keys())}")
+
+    batches = polling.plan_location_polls(poll=poll, shard_size=shard_size, spread=spread, jitter=jitter)
+
+    if not batches:
+        log.warning(f"No active locations registered or due for {poll} weather polling.")
+        return {"poll": poll, "locations": 0, "shards": 0, "max_countdown": 0, "chord_id": None}
+
+    shard_task = shard_tasks[poll]
+    result = chord(
+        group(shard_task.s(batch, max_concurrency).set(countdown=round(offset)) for offset, batch in batches)
+    )(task_summarize_location_polls.s(poll=poll))
+
+    dispatched: dict = {
+        "poll": poll,
+        "locations": sum(len(batch) for _, batch in batches),
+        "shards": len(batches),
+        "max_countdown": round(batches[-1][0]),
+        "chord_id": result.id,
+    }
+    log.info(f"Dispatched {poll} weather polls for [{dispatched['locations']}] location(s) in [{dispatched['shards']}] shard(s)")
+
+    return dispatched
@@ -12,13 +12,16 @@ from scheduling.celery_scheduler.celeryconfig import (
     return_rabbitmq_url,
     return_redis_url,
 )
+from scheduling.celery_scheduler.tuning import get_performance_config
 
 ## Import celery tasks
 # from .celery_tasks import ...
 import celery
 from celery import Celery
 from celery.result import AsyncResult
+from celery import signals
 from celery.schedules import crontab
+from depends import db_depends
 from loguru import logger as log
 from settings.app_settings import APP_SETTINGS
 from settings.celery_settings import CELERY_SETTINGS
@@ -37,8 +40,14 @@ INCLUDE_TASK_PATHS: list[str] = [
 
 ## List of scheduled task dicts to add to Celery beat's schedule
 BEAT_SCHEDULED_TASKS: list = [
-    celery_scheduled_tasks.SCHEDULED_TASK_15m_weatherapi_current_weather,
-    celery_scheduled_tasks.SCHEDULED_TASK_30m_weatherapi_weather_forecast,
+    ## Polls every location in the registry. The registry is seeded with WEATHERAPI_LOCATION_NAME when empty.
+    celery_scheduled_tasks.SCHEDULED_TASK_15m_weatherapi_dispatch_current_weather,
+    celery_scheduled_tasks.SCHEDULED_TASK_30m_weatherapi_dispatch_weather_forecast,
+    ## Poll only WEATHERAPI_LOCATION_NAME, without the registry
+    # celery_scheduled_tasks.SCHEDULED_TASK_15m_weatherapi_current_weather,
+    # celery_scheduled_tasks.SCHEDULED_TASK_30m_weatherapi_weather_forecast,
+    celery_scheduled_tasks.SCHEDULED_TASK_15m_weatherapi_update_rollups,
+    celery_scheduled_tasks.SCHEDULED_TASK_daily_retention_policies,
     ## Uncomment to test every minute
     # celery_scheduled_tasks.SCHEDULED_TASK_test_minutely_weatherapi_current_weather,
     # celery_scheduled_tasks.SCHEDULED_TASK_test_minutely_weatherapi_weather_forecast,
@@ -55,6 +64,8 @@ app: Celery = Celery(
 
 ## Set app config
 app.conf.update(timezone=APP_SETTINGS.get("TZ", default="Etc/UTC"), enable_utc=True)
+## Prefetch, acks, result TTL, time limits & queue routing, from CELERY_SETTINGS
+app.conf.update(**get_performance_config())
 
 ## Autodiscover
 app.autodiscover_tasks(INCLUDE_TASK_PATHS)
@@ -98,6 +109,12 @@ def scheduled_tasks(sender, **kwargs):
 # print_discovered_tasks()
 
 
+@signals.worker_process_init.connect
+def reset_db_pools(**kwargs):
+    """Drop database connections inherited from the parent process in each prefork child."""
+    db_depends.dispose_db_engines(close=False)
+
+
 def check_task(task_id: str = None, app: Celery = app) -> AsyncResult | None:
     """Check a Celery task by its ID.
 
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import datetime as dt
+import gzip
+import io
+import json
+import typing as t
+
+from core_utils import hash_utils
+from depends import db_depends
+from domain.weatherapi.weather import (
+    current as domain_current_weather,
+    forecast as domain_forecast,
+)
+from loguru import logger as log
+from settings.celery_settings import CELERY_SETTINGS
+from weather_client.apis import api_weatherapi
+
+__all__ = [
+    "CLAIM_CHECK_MODES",
+    "PAYLOAD_KINDS",
+    "summarize_payload",
+    "store_payload",
+    "load_payload",
+]
+
+## "none": tasks return a compact summary only. "db": the summary references the raw JSON row the
+#  payload was saved to. "minio": the payload is uploaded (gzipped) to object storage & referenced.
+CLAIM_CHECK_MODES: list[str] = ["none", "db", "minio"]
+
+## kind -> (raw JSON model, JSON column, volatile keys left out of the content hash)
+PAYLOAD_KINDS: dict[str, tuple[type, str, list[str]]] = {
+    "current": (
+        domain_current_weather.CurrentWeatherJSONModel,
+        "current_weather_json",
+        api_weatherapi.db_client.CURRENT_WEATHER_VOLATILE_KEYS,
+    ),
+    "forecast": (
+        domain_forecast.ForecastJSONModel,
+        "forecast_json",
+        api_weatherapi.db_client.FORECAST_VOLATILE_KEYS,
+    ),
+}
+
+
+def summarize_payload(payload: dict | None, kind: str, location: str, duration_s: float | None = None) -> dict:
+    """Return a compact, JSON-serializable summary of a WeatherAPI response for a task result.
+
+    Params:
+        payload (dict | None): The decoded response, or None if the request failed.
+        kind (str): One of `PAYLOAD_KINDS`.
+        location (str): The location that was requested.
+        duration_s (float | None): How long the task took.
+
+    Returns:
+        (dict): The requested location, resolved location name/country, update time & payload size.
+
+    """
+    summary: dict = {"kind": kind, "location": location, "ok": payload is not None, "duration_s": duration_s}
+
+    if payload is None:
+        return summary
+
+    resolved = payload.get("location") or {}
+    summary.update(
+        {
+            "name": resolved.get("name"),
+            "country": resolved.get("country"),
+            "last_updated_epoch": (payload.get("current") or {}).get("last_updated_epoch"),
+            "forecast_days": len((payload.get("forecast") or {}).get("forecastday") or []) if kind == "forecast" else None,
+            "payload_bytes": len(json.dumps(payload, separators=(",", ":"))),
+        }
+    )
+
+    return summary
+
+
+def _get_minio_client():
+    ## Optional dependency, only needed for claim_check="minio"
+    from minio import Minio
+
+    return Minio(
+        CELERY_SETTINGS.get("CELERY_CLAIM_CHECK_MINIO_ENDPOINT", default="localhost:9000"),
+        access_key=CELERY_SETTINGS.get("CELERY_CLAIM_CHECK_MINIO_ACCESS_KEY", default=None),
+        secret_key=CELERY_SETTINGS.get("CELERY_CLAIM_CHECK_MINIO_SECRET_KEY", default=None),
+        secure=CELERY_SETTINGS.get("CELERY_CLAIM_CHECK_MINIO_SECURE", default=True),
+    )
+
+
+def _store_db(payload: dict, kind: str) -> dict | None:
+    model, _, volatile_keys = PAYLOAD_KINDS[kind]
+    content_hash = hash_utils.get_content_hash(payload, exclude_keys=volatile_keys)
+
+    session_pool = db_depends.get_session_pool(engine=db_depends.get_db_engine())
+
+    ## Tasks save responses before returning, so this only looks up the (deduplicated) row
+    with session_pool() as session:
+        row_id = session.query(model.id).filter(model.content_hash == content_hash).scalar()
+
+    if row_id is None:
+        ## The client logs & swallows save errors, so the response may never have been saved
+        log.warning(
+            f"No saved '{model.__tablename__}' row with content hash [{content_hash}], returning no payload reference"
+        )
+        return None
+
+    return {"backend": "db", "table": model.__tablename__, "id": row_id}
+
+
+def _store_minio(payload: dict, kind: str) -> dict:
+    _, _, volatile_keys = PAYLOAD_KINDS[kind]
+    bucket: str = CELERY_SETTINGS.get("CELERY_CLAIM_CHECK_BUCKET", default="weatherdata-task-payloads")
+
+    content_hash = hash_utils.get_content_hash(payload, exclude_keys=volatile_keys)
+    key: str = f"{kind}/{dt.datetime.now(tz=dt.timezone.utc):%Y/%m/%d}/{content_hash}.json.gz"
+    body: bytes = gzip.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+
+    client = _get_minio_client()
+    if not client.bucket_exists(bucket):
+        client.make_bucket(bucket)
+
+    client.put_object(
+        bucket,
+        key,
+        io.BytesIO(body),
+        length=len(body),
+        content_type="application/json",
+        metadata={"Content-Encoding": "gzip"},
+    )
+
+    return {"backend": "minio", "bucket": bucket, "key": key}
+
+
+def store_payload(payload: dict, kind: str, mode: str | None = None) -> dict | None:
+    """Store a full response out of band & return a small reference to it (a "claim check").
+
+    Params:
+        payload (dict): The decoded response.
+        kind (str): One of `PAYLOAD_KINDS`.
+        mode (str | None): One of `CLAIM_CHECK_MODES`. Defaults to the `CELERY_CLAIM_CHECK_MODE` setting.
+
+    Returns:
+        (dict): A reference to pass to `load_payload()`.
+        (None): If mode is "none", or mode is "db" & the response wasn't saved to the database.
+
+    """
+    mode = mode or CELERY_SETTINGS.get("CELERY_CLAIM_CHECK_MODE", default="none")
+
+    if mode not in CLAIM_CHECK_MODES:
+        raise ValueError(f"Invalid claim check mode: '{mode}'. Must be one of {CLAIM_CHECK_MODES}")
+    if kind not in PAYLOAD_KINDS:
+        raise ValueError(f"Invalid payload kind: '{kind}'. Must be one of {list(PAYLOAD_KINDS.keys())}")
+
+    if mode == "none":
+        return None
+
+    try:
+        return _store_db(payload, kind) if mode == "db" else _store_minio(payload, kind)
+    except Exception as exc:
+        msg = f"({type(exc)}) Error storing '{kind}' payload for claim check mode '{mode}'. Details: {exc}"
+        log.error(msg)
+
+        raise exc
+
+
+def load_payload(ref: dict) -> dict:
+    """Load the full response a claim check reference points to.
+
+    Params:
+        ref (dict): A reference returned by `store_payload()`, i.e. a task result's `payload_ref`.
+
+    Returns:
+        (dict): The decoded response.
+
+    """
+    backend = ref.get("backend")
+
+    if backend == "db":
+        model, json_col, _ = next(v for v in PAYLOAD_KINDS.values() if v[0].__tablename__ == ref["table"])
+        session_pool = db_depends.get_session_pool(engine=db_depends.get_db_engine())
+
+        with session_pool() as session:
+            row = session.get(model, ref["id"])
+            if row is None:
+                raise LookupError(f"No '{ref['table']}' row with ID [{ref['id']}]")
+
+            return getattr(row, json_col)
+
+    if backend == "minio":
+        res = _get_minio_client().get_object(ref["bucket"], ref["key"])
+        try:
+            return json.loads(gzip.decompress(res.read()))
+        finally:
+            res.close()
+            res.release_conn()
+
+    raise ValueError(f"Unknown claim check backend: '{backend}'")
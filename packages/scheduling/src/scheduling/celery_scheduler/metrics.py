@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import typing as t
+
+from billiard import current_process
+from celery import signals
+from core_utils import metrics_utils
+from loguru import logger as log
+from settings.celery_settings import CELERY_SETTINGS
+from settings.metrics_settings import METRICS_SETTINGS
+
+__all__ = [
+    "start_worker_metrics",
+]
+
+
+def start_worker_metrics(port_offset: int = 0) -> None:
+    """Enable stage timing & serve this process' metrics for Prometheus, per METRICS_SETTINGS.
+
+    Params:
+        port_offset (int): Added to `METRICS_WORKER_PORT`, so each prefork child gets its own port.
+
+    """
+    if not METRICS_SETTINGS.get("METRICS_STAGE_TIMING", default=False):
+        return
+
+    metrics_utils.enable_stage_timing()
+
+    port: int = int(METRICS_SETTINGS.get("METRICS_WORKER_PORT", default=0) or 0)
+    if port <= 0:
+        return
+
+    try:
+        metrics_utils.start_metrics_server(port=port + port_offset)
+    except OSError as exc:
+        msg = f"({type(exc)}) Error starting stage metrics server on port {port + port_offset}. Details: {exc}"
+        log.error(msg)
+
+
+@signals.worker_init.connect
+def _start_metrics_on_worker_init(sender=None, **kwargs):
+    ## Prefork children run the tasks & serve their own metrics, see below
+    if CELERY_SETTINGS.get("CELERY_WORKER_POOL", default="prefork") == "prefork":
+        if METRICS_SETTINGS.get("METRICS_STAGE_TIMING", default=False):
+            ## Inherited by the forked children
+            metrics_utils.enable_stage_timing()
+
+        return
+
+    start_worker_metrics()
+
+
+@signals.worker_process_init.connect
+def _start_metrics_on_process_init(sender=None, **kwargs):
+    start_worker_metrics(port_offset=getattr(current_process(), "index", 0) + 1)
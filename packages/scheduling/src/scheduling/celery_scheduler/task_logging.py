@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import inspect
+import time
+import typing as t
+
+from celery import signals
+from core_utils import metrics_utils
+from loguru import logger as log
+
+__all__ = [
+    "get_task_location",
+]
+
+## Open log contexts for running tasks, by task ID; entered in task_prerun & exited in task_postrun
+_TASK_CONTEXTS: dict[str, tuple[t.ContextManager, t.ContextManager, dict[str, float], float]] = {}
+
+
+def get_task_location(task, args: t.Sequence | None, kwargs: dict | None) -> str | None:
+    """Return the `location` argument a task was called with, if it takes one."""
+    if kwargs and "location" in kwargs:
+        return kwargs["location"]
+
+    try:
+        bound = inspect.signature(task.run).bind_partial(*(args or ()), **(kwargs or {}))
+    except (TypeError, ValueError):
+        return None
+
+    return bound.arguments.get("location")
+
+
+@signals.task_prerun.connect
+def _enter_task_log_context(task_id=None, task=None, args=None, kwargs=None, **extra):
+    ## Every message the task logs carries its ID, name & location, i.e. in the JSON log
+    log_context = log.contextualize(
+        task_id=task_id, task_name=task.name, location=get_task_location(task, args, kwargs)
+    )
+    timings_context = metrics_utils.collect_stage_timings()
+
+    log_context.__enter__()
+    timings: dict[str, float] = timings_context.__enter__()
+
+    _TASK_CONTEXTS[task_id] = (log_context, timings_context, timings, time.perf_counter())
+
+
+@signals.task_postrun.connect
+def _exit_task_log_context(task_id=None, task=None, state=None, **extra):
+    entry = _TASK_CONTEXTS.pop(task_id, None)
+    if entry is None:
+        return
+
+    log_context, timings_context, timings, start = entry
+
+    try:
+        log.bind(
+            duration_s=round(time.perf_counter() - start, 4),
+            state=state,
+            stage_timings={stage: round(seconds, 4) for stage, seconds in timings.items()},
+        ).info("Task {} finished: {}", task.name, state)
+    finally:
+        timings_context.__exit__(None, None, None)
+        log_context.__exit__(None, None, None)
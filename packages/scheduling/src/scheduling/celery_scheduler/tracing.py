@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import typing as t
+
+from celery import signals
+from loguru import logger as log
+import setup
+from settings.celery_settings import CELERY_SETTINGS
+
+try:
+    from opentelemetry.instrumentation.celery import CeleryInstrumentor
+except ImportError:
+    CeleryInstrumentor = None
+
+__all__ = [
+    "start_celery_tracing",
+]
+
+
+def start_celery_tracing(component: str = "worker") -> bool:
+    """Configure tracing for this Celery process & trace the tasks it sends & runs, per TRACING_SETTINGS.
+
+    Description:
+        The Celery instrumentation injects the current trace context into each task message's headers
+        when it's published, and continues that trace when a worker runs the task, so a beat dispatch,
+        the fan-out tasks & their HTTP/SQL spans end up in one trace.
+
+    Params:
+        component (str): Appended to the service name, i.e. "worker" or "beat".
+
+    Returns:
+        (bool): `True` if tracing is enabled in this process.
+
+    """
+    if not setup.setup_tracing(component=component):
+        return False
+
+    if CeleryInstrumentor is None:
+        log.warning(
+            "Tracing is enabled, but opentelemetry-instrumentation-celery is not installed. Install the 'scheduling[otel]' extra to trace tasks."
+        )
+        return True
+
+    instrumentor = CeleryInstrumentor()
+    if not instrumentor.is_instrumented_by_opentelemetry:
+        instrumentor.instrument()
+
+    return True
+
+
+@signals.worker_init.connect
+def _start_tracing_on_worker_init(sender=None, **kwargs):
+    ## The OTLP exporter's background thread doesn't survive a fork; prefork children set up their own, see below
+    if CELERY_SETTINGS.get("CELERY_WORKER_POOL", default="prefork") == "prefork":
+        return
+
+    start_celery_tracing(component="worker")
+
+
+@signals.worker_process_init.connect
+def _start_tracing_on_process_init(sender=None, **kwargs):
+    start_celery_tracing(component="worker")
+
+
+@signals.beat_init.connect
+def _start_tracing_on_beat_init(sender=None, **kwargs):
+    start_celery_tracing(component="beat")
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import typing as t
+
+from kombu import Exchange, Queue
+from loguru import logger as log
+from settings.celery_settings import CelerySettings, get_celery_settings
+
+__all__ = [
+    "WORKER_POOLS",
+    "QUEUE_DEFAULT",
+    "QUEUE_CURRENT_WEATHER",
+    "QUEUE_FORECAST",
+    "QUEUE_MAINTENANCE",
+    "TASK_ROUTES",
+    "get_task_queues",
+    "get_performance_config",
+    "get_worker_argv",
+]
+
+## Pools accepted by `celery worker --pool`. gevent/eventlet need the matching package installed.
+WORKER_POOLS: list[str] = ["prefork", "threads", "gevent", "eventlet", "solo"]
+
+QUEUE_DEFAULT: str = "celery"
+QUEUE_CURRENT_WEATHER: str = "weather_current"
+QUEUE_FORECAST: str = "weather_forecast"
+QUEUE_MAINTENANCE: str = "maintenance"
+
+## Current weather & forecast polls go to separate queues, so a slow forecast backlog can't delay
+#  15 minute current weather polls. Workers started without -Q consume from every queue.
+#  The scheduled dispatch task & its chord callback go to the maintenance queue, so a worker set
+#  that splits out the poll queues only has to also consume 'maintenance' to keep polls running.
+TASK_ROUTES: dict[str, dict] = {
+    "request_current_weather": {"queue": QUEUE_CURRENT_WEATHER},
+    "poll_current_weather_shard": {"queue": QUEUE_CURRENT_WEATHER},
+    "request_weather_forecast": {"queue": QUEUE_FORECAST},
+    "poll_weather_forecast_shard": {"queue": QUEUE_FORECAST},
+    "update_weather_rollups": {"queue": QUEUE_MAINTENANCE},
+    "apply_retention_policies": {"queue": QUEUE_MAINTENANCE},
+    "dispatch_location_polls": {"queue": QUEUE_MAINTENANCE},
+    "summarize_location_polls": {"queue": QUEUE_MAINTENANCE},
+}
+
+## Per-task overrides. Maintenance tasks scan whole tables & need longer limits than API polls.
+TASK_ANNOTATIONS: dict[str, dict] = {
+    "update_weather_rollups": {"soft_time_limit": 900, "time_limit": 960},
+    "apply_retention_policies": {"soft_time_limit": 3600, "time_limit": 3660},
+}
+
+
+def get_task_queues() -> list[Queue]:
+    """Return the queues declared on the broker, one per routed queue plus the default queue."""
+    queue_names: list[str] = [QUEUE_DEFAULT] + sorted({route["queue"] for route in TASK_ROUTES.values()})
+
+    return [Queue(name, Exchange(name), routing_key=name) for name in queue_names]
+
+
+def get_performance_config(settings: CelerySettings | None = None) -> dict:
+    """Return Celery app config tuned for short, I/O-bound API polling tasks.
+
+    Description:
+        - `worker_prefetch_multiplier=1` with `task_acks_late` stops one worker from reserving
+          a backlog of polls while others sit idle, and re-queues tasks from crashed workers.
+        - Results expire after `CELERY_RESULT_EXPIRES` seconds instead of the 1 day default.
+        - Tasks listed in `CELERY_IGNORE_RESULT_TASKS` never write to the result backend.
+          Shard tasks must keep their results; the dispatch chord's callback reads them.
+        - Soft/hard time limits stop a hung request from holding a worker slot forever. Only the
+          prefork pool enforces them by killing the child process. The threads & solo pools don't
+          enforce them at all, & the gevent/eventlet pools only raise them when the task yields to
+          the event loop, so a task stuck in CPU-bound or blocking C code keeps running. On those
+          pools, API polls are only bounded by httpx's request timeouts.
+
+    Params:
+        settings (CelerySettings | None): The Celery settings. Defaults to `get_celery_settings()`.
+
+    Returns:
+        (dict): Config to pass to `app.conf.update()`.
+
+    """
+    settings = settings or get_celery_settings()
+    annotations: dict[str, dict] = {name: dict(opts) for name, opts in TASK_ANNOTATIONS.items()}
+
+    for task_name in settings.celery_ignore_result_tasks:
+        annotations.setdefault(task_name, {})["ignore_result"] = True
+
+    config: dict = {
+        "worker_prefetch_multiplier": settings.celery_worker_prefetch_multiplier,
+        "task_acks_late": settings.celery_task_acks_late,
+        ## Only matters with acks_late: re-deliver tasks whose worker process was killed
+        "task_reject_on_worker_lost": settings.celery_task_acks_late,
+        "result_expires": settings.celery_result_expires,
+        "task_soft_time_limit": settings.celery_task_soft_time_limit,
+        "task_time_limit": settings.celery_task_time_limit,
+        "task_default_queue": QUEUE_DEFAULT,
+        "task_queues": get_task_queues(),
+        "task_routes": TASK_ROUTES,
+        "task_annotations": annotations,
+    }
+
+    if settings.celery_worker_max_tasks_per_child:
+        config["worker_max_tasks_per_child"] = settings.celery_worker_max_tasks_per_child
+
+    if config["task_time_limit"] <= config["task_soft_time_limit"]:
+        log.warning(
+            f"CELERY_TASK_TIME_LIMIT ({config['task_time_limit']}s) should be greater than CELERY_TASK_SOFT_TIME_LIMIT ({config['task_soft_time_limit']}s)"
+        )
+
+    return config
+
+
+def get_worker_argv(settings: CelerySettings | None = None, loglevel: str = "DEBUG") -> list[str]:
+    """Build `celery worker` arguments from the pool, concurrency & queue settings.
+
+    Description:
+        API polls spend nearly all their time waiting on the network, so a `threads` or
+        `gevent` pool with high concurrency (i.e. 50-100) handles far more of them per worker
+        than the default prefork pool sized to the CPU count.
+
+    Params:
+        settings (CelerySettings | None): The Celery settings. Defaults to `get_celery_settings()`.
+        loglevel (str): The worker's log level.
+
+    Returns:
+        (list[str]): Arguments for `app.worker_main(argv=...)`.
+
+    """
+    settings = settings or get_celery_settings()
+
+    pool: str = settings.celery_worker_pool
+    if pool not in WORKER_POOLS:
+        raise ValueError(f"Invalid CELERY_WORKER_POOL: '{pool}'. Must be one of {WORKER_POOLS}")
+
+    argv: list[str] = ["worker", f"--loglevel={loglevel}", "--uid=0", "--gid=0", f"--pool={pool}"]
+
+    if settings.celery_worker_concurrency:
+        argv.append(f"--concurrency={settings.celery_worker_concurrency}")
+
+    if pool in ("threads", "solo"):
+        log.warning(f"The '{pool}' worker pool doesn't enforce CELERY_TASK_TIME_LIMIT or CELERY_TASK_SOFT_TIME_LIMIT")
+
+    queues = settings.celery_worker_queues
+    if queues:
+        argv.append(f"--queues={','.join(queues) if isinstance(queues, (list, tuple)) else queues}")
+
+    return argv
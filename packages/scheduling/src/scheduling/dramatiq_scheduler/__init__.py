@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+## .actors is not imported here; declaring the actors needs a broker, which is set up by the entry points
+from .broker import *
+from ._scheduler import *
+from ._worker import *
+from .start_dramatiq import *
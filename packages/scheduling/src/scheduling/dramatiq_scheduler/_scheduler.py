@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from .broker import setup_broker
+
+from loguru import logger as log
+from scheduling.beat_schedule import SCHEDULED_TASKS
+from scheduling.lib_scheduler import IntervalJob, Scheduler
+from settings.dramatiq_settings import DRAMATIQ_SETTINGS
+
+__all__ = [
+    "get_scheduled_jobs",
+    "start_dramatiq_scheduler",
+]
+
+
+def get_scheduled_jobs() -> list[IntervalJob]:
+    """Return a job per scheduled task, each enqueueing its actor's message.
+
+    Description:
+        Dramatiq has no beat; jobs enqueue the same schedule as Celery beat. They only enqueue
+        messages, so one scheduler process is enough. Importing the actors sets up the broker, if
+        it isn't already.
+    """
+    from . import actors
+
+    return [
+        IntervalJob(
+            name=task["name"],
+            func=getattr(actors, task["task"]).send,
+            interval=task["interval"],
+            offset=task["offset"],
+            kwargs=task["kwargs"],
+        )
+        for task in SCHEDULED_TASKS
+    ]
+
+
+def start_dramatiq_scheduler(jobs: list[IntervalJob] | None = None):
+    """Enqueue the scheduled Dramatiq messages until interrupted.
+
+    Params:
+        jobs (list[IntervalJob] | None): Jobs to run. Defaults to `get_scheduled_jobs()`.
+
+    """
+    setup_broker()
+
+    jobs = jobs or get_scheduled_jobs()
+    log.info(f"Starting Dramatiq scheduler with [{len(jobs)}] job(s): {[job.name for job in jobs]}")
+
+    Scheduler(jobs=jobs, max_workers=int(DRAMATIQ_SETTINGS.get("DRAMATIQ_SCHEDULER_MAX_WORKERS", default=2))).run()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from .broker import BROKER_SETUP
+
+from loguru import logger as log
+from settings.dramatiq_settings import DRAMATIQ_SETTINGS
+
+__all__ = [
+    "ACTORS_MODULE",
+    "get_worker_argv",
+    "start_dramatiq_worker",
+]
+
+## Imported by each worker process, after BROKER_SETUP sets the broker; declares the actors
+ACTORS_MODULE: str = "scheduling.dramatiq_scheduler.actors"
+
+
+def get_worker_argv() -> list[str]:
+    """Build `dramatiq` CLI arguments from the process, thread & queue settings.
+
+    Description:
+        Polls are I/O-bound, so a few processes with many threads each (i.e. 2 x 32) handle
+        more of them than one process per CPU with Dramatiq's default of 8 threads.
+
+    Returns:
+        (list[str]): Arguments for the `dramatiq` CLI.
+
+    """
+    argv: list[str] = [
+        BROKER_SETUP,
+        ACTORS_MODULE,
+        f"--processes={int(DRAMATIQ_SETTINGS.get('DRAMATIQ_WORKER_PROCESSES', default=2))}",
+        f"--threads={int(DRAMATIQ_SETTINGS.get('DRAMATIQ_WORKER_THREADS', default=16))}",
+    ]
+
+    queues = DRAMATIQ_SETTINGS.get("DRAMATIQ_WORKER_QUEUES", default=None)
+    if queues:
+        argv += ["--queues", *(queues if isinstance(queues, (list, tuple)) else queues.split(","))]
+
+    return argv
+
+
+def start_dramatiq_worker() -> int:
+    """Start Dramatiq worker processes & block until they exit.
+
+    Returns:
+        (int): The worker's exit code.
+
+    """
+    from dramatiq.cli import main as dramatiq_main, make_argument_parser
+
+    argv: list[str] = get_worker_argv()
+
+    log.info(f"Starting Dramatiq worker: dramatiq {' '.join(argv)}")
+    try:
+        return dramatiq_main(make_argument_parser().parse_args(argv))
+    except Exception as exc:
+        msg = f"({type(exc)}) Unhandled exception running Dramatiq worker. Details: {exc}"
+        log.error(msg)
+
+        raise exc
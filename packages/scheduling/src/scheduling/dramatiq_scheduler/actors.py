@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from .broker import setup_broker
+
+import dramatiq
+from loguru import logger as log
+from scheduling import polling
+from settings.dramatiq_settings import DRAMATIQ_SETTINGS
+from weather_client.apis import api_weatherapi
+
+__all__ = [
+    "QUEUE_CURRENT_WEATHER",
+    "QUEUE_FORECAST",
+    "QUEUE_MAINTENANCE",
+    "request_current_weather",
+    "request_weather_forecast",
+    "poll_current_weather_shard",
+    "poll_weather_forecast_shard",
+    "dispatch_location_polls",
+    "update_weather_rollups",
+    "apply_retention_policies",
+]
+
+## Actors bind to the global broker when they're declared; a no-op if an entry point already set it up
+setup_broker()
+
+## Same queue names as the Celery backend, so both can run against one RabbitMQ
+QUEUE_CURRENT_WEATHER: str = "weather_current"
+QUEUE_FORECAST: str = "weather_forecast"
+QUEUE_MAINTENANCE: str = "maintenance"
+
+## Dramatiq time limits are in milliseconds
+POLL_TIME_LIMIT_MS: int = int(DRAMATIQ_SETTINGS.get("DRAMATIQ_TASK_TIME_LIMIT", default=180)) * 1000
+MAINTENANCE_TIME_LIMIT_MS: int = int(DRAMATIQ_SETTINGS.get("DRAMATIQ_MAINTENANCE_TIME_LIMIT", default=3600)) * 1000
+MAX_RETRIES: int = int(DRAMATIQ_SETTINGS.get("DRAMATIQ_MAX_RETRIES", default=3))
+
+
+@dramatiq.actor(
+    actor_name="request_current_weather",
+    queue_name=QUEUE_CURRENT_WEATHER,
+    max_retries=MAX_RETRIES,
+    time_limit=POLL_TIME_LIMIT_MS,
+)
+def request_current_weather(location: str) -> None:
+    """Request & save the current weather for a single location."""
+    log.info(f"Requesting current weather for location '{location}'")
+
+    if api_weatherapi.client.get_current_weather(location=location, save_to_db=True, use_cache=True) is None:
+        log.error(f"Failed to retrieve current weather for location '{location}'")
+
+
+@dramatiq.actor(
+    actor_name="request_weather_forecast",
+    queue_name=QUEUE_FORECAST,
+    max_retries=MAX_RETRIES,
+    time_limit=POLL_TIME_LIMIT_MS,
+)
+def request_weather_forecast(location: str) -> None:
+    """Request & save the weather forecast for a single location."""
+    log.info(f"Requesting weather forecast for location '{location}'")
+
+    if api_weatherapi.client.get_weather_forecast(location=location, save_to_db=True, use_cache=True) is None:
+        log.error(f"Failed to retrieve weather forecast for location '{location}'")
+
+
+@dramatiq.actor(
+    actor_name="poll_current_weather_shard",
+    queue_name=QUEUE_CURRENT_WEATHER,
+    max_retries=MAX_RETRIES,
+    time_limit=POLL_TIME_LIMIT_MS,
+)
+def poll_current_weather_shard(locations: list[str], max_concurrency: int | None = None) -> None:
+    """Request & bulk save the current weather for a shard of registered locations."""
+    polling.poll_location_shard("current", locations, max_concurrency=max_concurrency)
+
+
+@dramatiq.actor(
+    actor_name="poll_weather_forecast_shard",
+    queue_name=QUEUE_FORECAST,
+    max_retries=MAX_RETRIES,
+    time_limit=POLL_TIME_LIMIT_MS,
+)
+def poll_weather_forecast_shard(locations: list[str], max_concurrency: int | None = None) -> None:
+    """Request & bulk save the weather forecast for a shard of registered locations."""
+    polling.poll_location_shard("forecast", locations, max_concurrency=max_concurrency)
+
+
+## Not retried: a retry would dispatch every shard a second time
+@dramatiq.actor(actor_name="dispatch_location_polls", queue_name=QUEUE_MAINTENANCE, max_retries=0)
+def dispatch_location_polls(
+    poll: str = "current",
+    shard_size: int | None = None,
+    max_concurrency: int | None = None,
+    spread: int | None = None,
+    jitter: int | None = None,
+) -> None:
+    """Fan out polling of every active registered location to shard messages.
+
+    Description:
+        Shards are planned the same way as the Celery backend's `dispatch_location_polls`
+        (see `polling.plan_location_polls()`); each shard's message is delayed by its offset.
+        Dramatiq has no chords, so there is no summary task; each shard records its own results.
+
+    """
+    shard_actors = {"current": poll_current_weather_shard, "forecast": poll_weather_forecast_shard}
+
+    if poll not in shard_actors:
+        raise ValueError(f"Invalid poll type: '{poll}'. Must be one of {list(shard_actors.keys())}")
+
+    batches = polling.plan_location_polls(poll=poll, shard_size=shard_size, spread=spread, jitter=jitter)
+
+    if not batches:
+        log.warning(f"No active locations registered or due for {poll} weather polling.")
+        return
+
+    for offset, batch in batches:
+        shard_actors[poll].send_with_options(args=(batch, max_concurrency), delay=int(offset * 1000))
+
+    log.info(
+        f"Dispatched {poll} weather polls for [{sum(len(batch) for _, batch in batches)}] location(s) in [{len(batches)}] shard(s)"
+    )
+
+
+@dramatiq.actor(
+    actor_name="update_weather_rollups",
+    queue_name=QUEUE_MAINTENANCE,
+    max_retries=MAX_RETRIES,
+    time_limit=MAINTENANCE_TIME_LIMIT_MS,
+)
+def update_weather_rollups(batch_size: int = 1000) -> None:
+    """Fold new current weather readings into the hourly & daily rollup tables."""
+    summary = api_weatherapi.db_client.update_current_weather_rollups(batch_size=batch_size)
+    log.info(f"Updated current weather rollups: {summary}")
+
+
+@dramatiq.actor(
+    actor_name="apply_retention_policies",
+    queue_name=QUEUE_MAINTENANCE,
+    max_retries=0,
+    time_limit=MAINTENANCE_TIME_LIMIT_MS,
+)
+def apply_retention_policies(dry_run: bool | None = None) -> None:
+    """Apply retention policies to the raw WeatherAPI JSON tables."""
+    reports = api_weatherapi.db_client.apply_retention_policies(dry_run=dry_run)
+    log.info(f"Applied retention policies: {[report.as_dict() for report in reports]}")
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import threading
+
+import dramatiq
+from dramatiq.brokers.stub import StubBroker
+from loguru import logger as log
+from settings.dramatiq_settings import DRAMATIQ_SETTINGS, return_dramatiq_rabbitmq_url
+
+__all__ = [
+    "DRAMATIQ_BROKERS",
+    "BROKER_SETUP",
+    "get_broker",
+    "setup_broker",
+]
+
+## "stub" keeps messages in memory, for local runs & benchmarks without RabbitMQ/Redis
+DRAMATIQ_BROKERS: list[str] = ["rabbitmq", "redis", "stub"]
+## For the `dramatiq` CLI, which calls it in each worker process before importing the actors
+BROKER_SETUP: str = "scheduling.dramatiq_scheduler.broker:setup_broker"
+
+_LOCK = threading.Lock()
+## Set by setup_broker()
+_BROKER: dramatiq.Broker | None = None
+
+
+def get_broker(kind: str | None = None) -> dramatiq.Broker:
+    """Return a Dramatiq broker.
+
+    Params:
+        kind (str | None): One of `DRAMATIQ_BROKERS`. Defaults to the `DRAMATIQ_BROKER` setting.
+
+    Returns:
+        (dramatiq.Broker): An initialized broker. It is not set as the global broker.
+
+    """
+    kind = (kind or DRAMATIQ_SETTINGS.get("DRAMATIQ_BROKER", default="rabbitmq")).lower()
+
+    match kind:
+        case "rabbitmq":
+            from dramatiq.brokers.rabbitmq import RabbitmqBroker
+
+            return RabbitmqBroker(url=return_dramatiq_rabbitmq_url())
+        case "redis":
+            from dramatiq.brokers.redis import RedisBroker
+
+            return RedisBroker(url=DRAMATIQ_SETTINGS.get("DRAMATIQ_REDIS_URL", default="redis://localhost:6379/0"))
+        case "stub":
+            return StubBroker()
+        case _:
+            raise ValueError(f"Invalid DRAMATIQ_BROKER: '{kind}'. Must be one of {DRAMATIQ_BROKERS}")
+
+
+def setup_broker(kind: str | None = None) -> dramatiq.Broker:
+    """Create the broker & set it as Dramatiq's global broker, once per process.
+
+    Description:
+        Actors bind to the global broker when they're declared, so this must be called before
+        `scheduling.dramatiq_scheduler.actors` is imported. Nothing connects to a broker on import;
+        the worker & scheduler entry points call this when they start.
+
+    Params:
+        kind (str | None): One of `DRAMATIQ_BROKERS`. Defaults to the `DRAMATIQ_BROKER` setting.
+            Ignored if the broker is already set up.
+
+    Returns:
+        (dramatiq.Broker): The global broker.
+
+    """
+    global _BROKER
+
+    with _LOCK:
+        if _BROKER is None:
+            _BROKER = get_broker(kind=kind)
+            dramatiq.set_broker(_BROKER)
+            log.debug(f"Dramatiq broker: {type(_BROKER).__name__}")
+
+        return _BROKER
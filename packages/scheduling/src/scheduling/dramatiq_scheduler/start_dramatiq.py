@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from ._scheduler import start_dramatiq_scheduler
+from ._worker import start_dramatiq_worker
+
+from loguru import logger as log
+
+__all__ = [
+    "DRAMATIQ_MODES",
+    "start",
+]
+
+DRAMATIQ_MODES: list[str] = ["worker", "scheduler"]
+
+
+def start(mode: str):
+    """Start Dramatiq workers, or the scheduler that enqueues scheduled messages.
+
+    Params:
+        mode (str): One of `DRAMATIQ_MODES`.
+
+    """
+    log.info(f"Starting Dramatiq in mode '{mode}'.")
+
+    match mode.lower():
+        case "worker":
+            return start_dramatiq_worker()
+        case "scheduler":
+            return start_dramatiq_scheduler()
+        case _:
+            raise ValueError(f"Invalid mode: {mode}. Must be one of {DRAMATIQ_MODES}")
@@ -1 +1,5 @@
+from __future__ import annotations
+
+from .jobs import *
+from .scheduler import *
 from .schedules import *
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import typing as t
+
+from .scheduler import IntervalJob
+
+from loguru import logger as log
+from scheduling import polling, stagger
+from settings.scheduler_settings import SCHEDULER_SETTINGS
+from weather_client.apis import api_weatherapi
+
+__all__ = [
+    "JOB_TYPES",
+    "poll_locations",
+    "jobs_from_config",
+]
+
+JOB_TYPES: list[str] = polling.POLL_TYPES
+
+
+def poll_locations(
+    job_type: str, locations: list[str] | None = None, days: int = 1, max_concurrency: int = 8
+) -> dict:
+    """Request & save current weather or forecasts for a list of locations.
+
+    Params:
+        job_type (str): One of `JOB_TYPES`.
+        locations (list[str] | None): WeatherAPI queries to poll. If empty, the active locations in the
+            location registry are polled, re-read on every run so newly registered locations are picked up.
+            Registry polls are recorded, & with `WEATHERAPI_CONDITIONAL_POLLING` current weather polls skip
+            locations WeatherAPI isn't expected to have updated yet.
+        days (int): Forecast days, only used for "forecast" jobs.
+        max_concurrency (int): Maximum number of requests in flight at once.
+
+    Returns:
+        (dict): Counts of locations polled, succeeded & failed, with errors by location.
+
+    """
+    if job_type not in JOB_TYPES:
+        raise ValueError(f"Invalid job type: '{job_type}'. Must be one of {JOB_TYPES}")
+
+    from_registry: bool = not locations
+
+    if from_registry:
+        locations = polling.list_due_locations(poll=job_type)
+
+        if not locations:
+            log.info(f"No registered locations due for {job_type} polling")
+            return {"locations": 0, "succeeded": 0, "failed": 0, "errors": {}}
+
+    summary = polling.poll_location_shard(
+        job_type, locations, max_concurrency=max_concurrency, days=days, record=from_registry
+    )
+    if summary["errors"]:
+        log.warning(f"[{summary['failed']}/{summary['locations']}] {job_type} poll(s) failed: {summary['errors']}")
+
+    return summary
+
+
+def jobs_from_config(job_configs: list[dict] | None = None) -> list[IntervalJob]:
+    """Build scheduler jobs from config.
+
+    Description:
+        Each entry in `SCHEDULER_JOBS` is a table like:
+
+        ```toml
+        { name = "current_weather", type = "current", interval_minutes = 15, offset_minutes = 0, locations = [] }
+        ```
+
+        `locations` is optional; an empty list polls the location registry. `days` sets forecast days,
+        `max_concurrency` caps concurrent requests & `run_on_start` runs the job once at startup.
+
+        With `stagger_minutes` set, each listed location becomes its own job, offset by a fixed
+        hash of the location within that many minutes, so locations don't all poll at once.
+        `jitter_seconds` adds up to that many random seconds to every run.
+
+    Params:
+        job_configs (list[dict] | None): Job tables. Defaults to the `SCHEDULER_JOBS` setting.
+
+    Returns:
+        (list[IntervalJob]): Jobs to pass to a `Scheduler`.
+
+    """
+    if job_configs is None:
+        job_configs = SCHEDULER_SETTINGS.get("SCHEDULER_JOBS", default=[])
+
+    jobs: list[IntervalJob] = []
+
+    for job_config in job_configs:
+        job_config: dict = {str(k).lower(): v for k, v in dict(job_config).items()}
+        job_type: str = job_config.get("type", "current")
+
+        if job_type not in JOB_TYPES:
+            raise ValueError(f"Invalid job type: '{job_type}'. Must be one of {JOB_TYPES}")
+
+        interval: float = float(job_config.get("interval_minutes", 15)) * 60
+        offset: float = float(job_config.get("offset_minutes", 0)) * 60
+        stagger_window: float = float(job_config.get("stagger_minutes", 0)) * 60
+        locations: list[str] = list(job_config.get("locations") or [])
+        name: str = job_config.get("name", job_type)
+
+        ## One job for all locations, unless staggering listed locations
+        groups: list[tuple[str, float, list[str]]] = [(name, offset, locations)]
+        if stagger_window > 0 and locations:
+            groups = [
+                (f"{name}_{location}", offset + stagger.stagger_offset(location, stagger_window, salt=job_type), [location])
+                for location in locations
+            ]
+        elif stagger_window > 0:
+            log.warning(f"Job '{name}' polls the location registry; stagger_minutes only applies to listed locations")
+
+        for job_name, job_offset, job_locations in groups:
+            jobs.append(
+                IntervalJob(
+                    name=job_name,
+                    func=poll_locations,
+                    interval=interval,
+                    offset=job_offset,
+                    kwargs={
+                        "job_type": job_type,
+                        "locations": job_locations,
+                        "days": int(job_config.get("days", 1)),
+                        "max_concurrency": int(job_config.get("max_concurrency", api_weatherapi.poll_concurrency)),
+                    },
+                    run_on_start=bool(job_config.get("run_on_start", False)),
+                    jitter=float(job_config.get("jitter_seconds", 0)),
+                )
+            )
+
+    return jobs
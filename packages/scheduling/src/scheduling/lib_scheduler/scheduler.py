@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+import datetime as dt
+import random
+import signal
+import threading
+import time
+import typing as t
+
+from loguru import logger as log
+
+__all__ = [
+    "IntervalJob",
+    "Scheduler",
+]
+
+
+@dataclass
+class IntervalJob:
+    """A job that runs every `interval` seconds, aligned to the wall clock.
+
+    Description:
+        Run times are computed from the epoch, not from the previous run, so they never drift:
+        `interval=900, offset=300` runs at :05, :20, :35 & :50 past every hour, no matter how long
+        each run takes or how late the scheduler woke up.
+
+    Attributes:
+        name (str): A unique name for the job, used in logs.
+        func (Callable): The function to run.
+        interval (float): Seconds between runs.
+        offset (float): Seconds past each interval boundary to run at.
+        kwargs (dict): Keyword arguments passed to `func`.
+        run_on_start (bool): Also run the job once as soon as the scheduler starts.
+        jitter (float): Up to this many random seconds are added to each run time.
+
+    """
+
+    name: str
+    func: t.Callable[..., t.Any] = field(repr=False)
+    interval: float
+    offset: float = 0
+    kwargs: dict = field(default_factory=dict, repr=False)
+    run_on_start: bool = False
+    jitter: float = 0
+
+    next_run: float = field(default=0.0, init=False)
+
+    def __post_init__(self):
+        if self.interval <= 0:
+            raise ValueError(f"Job '{self.name}' interval must be greater than 0")
+
+        ## Normalize so offset is always within one interval
+        self.offset = self.offset % self.interval
+
+    def next_run_after(self, now: float) -> float:
+        """Return the first aligned run time strictly after `now` (a Unix timestamp)."""
+        slots_passed = (now - self.offset) // self.interval
+
+        return (slots_passed + 1) * self.interval + self.offset
+
+    def schedule_next(self, now: float) -> float:
+        """Set & return `next_run`: the next aligned run time after `now`, plus jitter."""
+        self.next_run = self.next_run_after(now)
+        if self.jitter > 0:
+            self.next_run += random.uniform(0, min(self.jitter, self.interval))
+
+        return self.next_run
+
+
+class Scheduler:
+    """Lightweight in-process scheduler for deployments without Celery.
+
+    Description:
+        The scheduler thread sleeps (on a `threading.Event`, so `stop()` wakes it immediately)
+        until the next job is due, then hands the job to a thread pool & goes back to sleep.
+        A slow job never delays other jobs. If a job is still running when it is next due,
+        that run is skipped & logged instead of piling up a second copy.
+
+    Params:
+        jobs (list[IntervalJob] | None): Jobs to schedule. More can be added with `add_job()`.
+        max_workers (int): Maximum number of jobs running at the same time.
+
+    Usage:
+        ```python
+        scheduler = Scheduler(max_workers=4)
+        scheduler.add_job(IntervalJob(name="current_london", func=get_current_weather, interval=900, kwargs={"location": "London"}))
+        scheduler.run()  ## Blocks until stop() or SIGINT/SIGTERM
+        ```
+
+    """
+
+    def __init__(self, jobs: list[IntervalJob] | None = None, max_workers: int = 4):
+        self.jobs: dict[str, IntervalJob] = {}
+        self.max_workers: int = max_workers
+
+        self._running: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+        for job in jobs or []:
+            self.add_job(job)
+
+    def add_job(self, job: IntervalJob) -> None:
+        if job.name in self.jobs:
+            raise ValueError(f"A job named '{job.name}' is already scheduled")
+
+        self.jobs[job.name] = job
+
+    def stop(self, *_) -> None:
+        """Stop the scheduler after the current sleep. Running jobs are allowed to finish."""
+        log.info("Stopping scheduler")
+        self._stop.set()
+
+    def _on_done(self, job: IntervalJob, started: float, future: Future) -> None:
+        with self._lock:
+            self._running.pop(job.name, None)
+
+        exc = future.exception()
+        if exc is not None:
+            log.error(f"({type(exc)}) Scheduled job '{job.name}' failed. Details: {exc}")
+        else:
+            log.debug(f"Scheduled job '{job.name}' finished in {time.monotonic() - started:.2f}s")
+
+    def _dispatch(self, job: IntervalJob, pool: ThreadPoolExecutor) -> None:
+        with self._lock:
+            if job.name in self._running:
+                log.warning(f"Scheduled job '{job.name}' is still running from its last run, skipping this run")
+                return
+
+            started = time.monotonic()
+            future = pool.submit(job.func, **job.kwargs)
+            self._running[job.name] = future
+
+        future.add_done_callback(lambda f: self._on_done(job, started, f))
+
+    def run(self, install_signal_handlers: bool = True) -> None:
+        """Run jobs until `stop()` is called, or the process receives SIGINT/SIGTERM.
+
+        Params:
+            install_signal_handlers (bool): Stop cleanly on SIGINT/SIGTERM. Only possible from the main thread.
+
+        """
+        if not self.jobs:
+            raise ValueError("No jobs to schedule")
+
+        if install_signal_handlers and threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, self.stop)
+            signal.signal(signal.SIGTERM, self.stop)
+
+        now = time.time()
+        for job in self.jobs.values():
+            if job.run_on_start:
+                job.next_run = now
+            else:
+                job.schedule_next(now)
+            log.info(f"Scheduled job '{job.name}', next run at {dt.datetime.fromtimestamp(job.next_run):%Y-%m-%d %H:%M:%S}")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="lib_scheduler") as pool:
+            while not self._stop.is_set():
+                next_due = min(job.next_run for job in self.jobs.values())
+
+                ## Sleep until the next job is due; stop() interrupts the wait
+                if self._stop.wait(timeout=max(0.0, next_due - time.time())):
+                    break
+
+                now = time.time()
+                for job in self.jobs.values():
+                    if job.next_run <= now:
+                        self._dispatch(job, pool)
+                        ## Skip slots missed while asleep (i.e. after system suspend) instead of running them all at once
+                        job.schedule_next(now)
+
+            log.info(f"Waiting for [{len(self._running)}] running job(s) to finish")
+
+        log.info("Scheduler stopped")
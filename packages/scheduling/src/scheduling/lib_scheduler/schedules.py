@@ -1,28 +1,53 @@
-from weather_client.apis import api_weatherapi
-import schedule
+from __future__ import annotations
+
+from .jobs import jobs_from_config
+from .scheduler import IntervalJob, Scheduler
+
 from loguru import logger as log
+from settings.scheduler_settings import SCHEDULER_SETTINGS
+from weather_client.apis import api_weatherapi
 
-__all__ = ["sched_every_15m_weatherapi_current_weather"]
+__all__ = ["sched_every_15m_weatherapi_current_weather", "run_configured_schedules"]
 
 
 def sched_every_15m_weatherapi_current_weather(location: str, save_to_db: bool):
-    log.info(
-        f"Starting schedule, requesting current weather for location '{location}' every 15th minute"
-    )
-
-    job_details = {
-        "func": api_weatherapi.client.get_current_weather,
-        "kwargs": {"location": location, "save_to_db": save_to_db},
-    }
+    """Request the current weather for a location every 15 minutes (:00, :15, :30 & :45), until interrupted."""
+    log.info(f"Starting schedule, requesting current weather for location '{location}' every 15 minutes")
 
-    schedule.every().hour.at(":15").do(job_details["func"], **job_details["kwargs"])
+    scheduler = Scheduler(
+        jobs=[
+            IntervalJob(
+                name=f"current_weather_{location}",
+                func=api_weatherapi.client.get_current_weather,
+                interval=15 * 60,
+                kwargs={"location": location, "save_to_db": save_to_db},
+            )
+        ],
+        max_workers=1,
+    )
 
     try:
-        while True:
-            schedule.run_pending()
-    except KeyboardInterrupt:
-        log.error("Interrupted by user")
-        return
+        scheduler.run()
     except Exception as exc:
         log.error(f"Error requesting weather in location '{location}'. Details: {exc}")
         raise
+
+
+def run_configured_schedules(job_configs: list[dict] | None = None, max_workers: int | None = None):
+    """Run the jobs configured in `SCHEDULER_JOBS` until interrupted.
+
+    Params:
+        job_configs (list[dict] | None): Job tables, see `jobs_from_config()`. Defaults to the `SCHEDULER_JOBS` setting.
+        max_workers (int | None): Maximum number of jobs running at once. Defaults to the `SCHEDULER_MAX_WORKERS` setting.
+
+    """
+    jobs = jobs_from_config(job_configs)
+    if not jobs:
+        raise ValueError("No scheduler jobs configured. Add jobs to the 'scheduler_jobs' setting.")
+
+    if max_workers is None:
+        max_workers = int(SCHEDULER_SETTINGS.get("SCHEDULER_MAX_WORKERS", default=4))
+
+    log.info(f"Starting scheduler with [{len(jobs)}] job(s): {[job.name for job in jobs]}")
+
+    Scheduler(jobs=jobs, max_workers=max_workers).run()
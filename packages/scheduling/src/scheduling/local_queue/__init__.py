@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from .queue import *
+from .tasks import *
+from .worker import *
+from .beat import *
+from .start_local_queue import *
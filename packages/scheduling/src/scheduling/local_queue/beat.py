@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from .queue import SQLiteTaskQueue
+
+from loguru import logger as log
+from scheduling.beat_schedule import SCHEDULED_TASKS
+from scheduling.lib_scheduler import IntervalJob, Scheduler
+
+__all__ = [
+    "NO_RETRY_TASKS",
+    "get_scheduled_jobs",
+    "get_local_queue_beat",
+]
+
+## A retry could enqueue every shard (or delete every batch) a second time
+NO_RETRY_TASKS: list[str] = ["dispatch_location_polls", "apply_retention_policies"]
+
+
+def get_scheduled_jobs(queue: SQLiteTaskQueue, max_retries: int = 3) -> list[IntervalJob]:
+    """Return jobs that enqueue the beat schedule (`beat_schedule.SCHEDULED_TASKS`) on `queue`."""
+    return [
+        IntervalJob(
+            name=task["name"],
+            func=queue.enqueue,
+            interval=task["interval"],
+            offset=task["offset"],
+            kwargs={
+                "name": task["task"],
+                "kwargs": task["kwargs"],
+                "max_retries": 0 if task["task"] in NO_RETRY_TASKS else max_retries,
+            },
+        )
+        for task in SCHEDULED_TASKS
+    ]
+
+
+def get_local_queue_beat(queue: SQLiteTaskQueue, max_retries: int = 3) -> Scheduler:
+    """Return a scheduler that enqueues the beat schedule. Call `.run()` to start it."""
+    jobs = get_scheduled_jobs(queue, max_retries=max_retries)
+    log.info(f"Local queue beat scheduling [{len(jobs)}] task(s): {[job.name for job in jobs]}")
+
+    return Scheduler(jobs=jobs, max_workers=1)
@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+import json
+from pathlib import Path
+import sqlite3
+import threading
+import time
+import typing as t
+
+from loguru import logger as log
+
+__all__ = [
+    "TASK_STATUSES",
+    "QueuedTask",
+    "SQLiteTaskQueue",
+]
+
+TASK_STATUSES: list[str] = ["queued", "running", "done", "failed"]
+
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    args TEXT NOT NULL DEFAULT '[]',
+    kwargs TEXT NOT NULL DEFAULT '{}',
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_retries INTEGER NOT NULL DEFAULT 3,
+    eta REAL NOT NULL,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    worker TEXT,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_tasks_status_eta ON tasks (status, eta);
+"""
+
+
+@dataclass
+class QueuedTask:
+    """A task claimed from the queue.
+
+    Attributes:
+        id (int): The task's row ID.
+        name (str): The registered task name, i.e. "dispatch_location_polls".
+        args (list): Positional arguments.
+        kwargs (dict): Keyword arguments.
+        attempts (int): Times the task has been claimed, including this one.
+        max_retries (int): Retries allowed after the first attempt.
+        worker (str): The worker that claimed the task.
+
+    """
+
+    id: int
+    name: str
+    args: list
+    kwargs: dict
+    attempts: int
+    max_retries: int
+    worker: str
+
+
+class SQLiteTaskQueue:
+    """A durable task queue in a SQLite database file.
+
+    Description:
+        Tasks are rows that move from "queued" to "running" to "done" (or "failed" once retries are
+        used up). A task is only marked done after it succeeds, so tasks claimed by a worker that
+        crashes are re-queued by `requeue_stale()`. The database uses WAL mode, so workers & the
+        beat can share it across threads & processes on one machine; it is not meant for network
+        filesystems.
+
+    Params:
+        path (str | Path): The SQLite database file. Parent directories are created.
+        busy_timeout (float): Seconds to wait for another writer's lock before failing.
+
+    """
+
+    def __init__(self, path: t.Union[str, Path], busy_timeout: float = 30.0):
+        self.path: Path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.busy_timeout: float = busy_timeout
+        ## One connection per thread; sqlite3 connections can't be shared between threads
+        self._local = threading.local()
+
+        ## executescript() manages its own transaction
+        self._connect().executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+
+        if conn is None:
+            ## Autocommit mode; transactions are opened explicitly with BEGIN IMMEDIATE
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> t.Generator[sqlite3.Connection, None, None]:
+        conn = self._connect()
+        ## Take the write lock up front, so two workers can't claim the same task
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+
+    def enqueue(
+        self,
+        name: str,
+        args: t.Sequence | None = None,
+        kwargs: dict | None = None,
+        countdown: float = 0,
+        max_retries: int = 3,
+    ) -> int:
+        """Add a task to the queue.
+
+        Params:
+            name (str): The registered task name.
+            args (Sequence | None): JSON-serializable positional arguments.
+            kwargs (dict | None): JSON-serializable keyword arguments.
+            countdown (float): Seconds to wait before the task can run.
+            max_retries (int): Retries allowed if the task raises.
+
+        Returns:
+            (int): The task's ID.
+
+        """
+        now = time.time()
+
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "INSERT INTO tasks (name, args, kwargs, max_retries, eta, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (name, json.dumps(list(args or [])), json.dumps(kwargs or {}), max_retries, now + countdown, now),
+            )
+
+            return cursor.lastrowid
+
+    def claim(self, worker: str, names: t.Collection[str] | None = None) -> QueuedTask | None:
+        """Mark the next due task as running & return it.
+
+        Params:
+            worker (str): Identifies the claiming worker, for `requeue_stale()` & debugging.
+            names (Collection[str] | None): Only claim tasks with these names.
+
+        Returns:
+            (QueuedTask): The claimed task.
+            (None): If no task is due.
+
+        """
+        now = time.time()
+        query = "SELECT id FROM tasks WHERE status = 'queued' AND eta <= ?"
+        params: list = [now]
+
+        if names:
+            query += f" AND name IN ({', '.join('?' for _ in names)})"
+            params += list(names)
+
+        with self._transaction() as conn:
+            row = conn.execute(query + " ORDER BY eta, id LIMIT 1", params).fetchone()
+            if row is None:
+                return None
+
+            conn.execute(
+                "UPDATE tasks SET status = 'running', attempts = attempts + 1, started_at = ?, worker = ? WHERE id = ?",
+                (now, worker, row["id"]),
+            )
+            task = conn.execute("SELECT * FROM tasks WHERE id = ?", (row["id"],)).fetchone()
+
+        return QueuedTask(
+            id=task["id"],
+            name=task["name"],
+            args=json.loads(task["args"]),
+            kwargs=json.loads(task["kwargs"]),
+            attempts=task["attempts"],
+            max_retries=task["max_retries"],
+            worker=task["worker"],
+        )
+
+    ## Only the claim that's still running may finish a task. If it ran past the stale timeout,
+    #  requeue_stale() may have handed it to another worker, whose claim must not be overwritten.
+    _CLAIM_FILTER: str = "id = ? AND status = 'running' AND worker = ? AND attempts = ?"
+
+    def complete(self, task: QueuedTask) -> bool:
+        """Mark a claimed task as done.
+
+        Returns:
+            (bool): False if the claim was lost, i.e. the task was re-queued as stale.
+
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                f"UPDATE tasks SET status = 'done', finished_at = ? WHERE {self._CLAIM_FILTER}",
+                (time.time(), task.id, task.worker, task.attempts),
+            )
+
+        if not cursor.rowcount:
+            log.warning(f"Task '{task.name}' [{task.id}] attempt {task.attempts} is no longer claimed by '{task.worker}', not marking it done")
+
+        return bool(cursor.rowcount)
+
+    def fail(self, task: QueuedTask, error: str, retry_backoff: float = 30.0) -> bool:
+        """Record a failed attempt, re-queueing the task with exponential backoff if it has retries left.
+
+        Returns:
+            (bool): True if the task was re-queued. False if it used up its retries, or the claim was lost.
+
+        """
+        retry: bool = task.attempts <= task.max_retries
+        now = time.time()
+
+        with self._transaction() as conn:
+            if retry:
+                cursor = conn.execute(
+                    f"UPDATE tasks SET status = 'queued', eta = ?, last_error = ? WHERE {self._CLAIM_FILTER}",
+                    (now + retry_backoff * 2 ** (task.attempts - 1), error, task.id, task.worker, task.attempts),
+                )
+            else:
+                cursor = conn.execute(
+                    f"UPDATE tasks SET status = 'failed', finished_at = ?, last_error = ? WHERE {self._CLAIM_FILTER}",
+                    (now, error, task.id, task.worker, task.attempts),
+                )
+
+        if not cursor.rowcount:
+            log.warning(f"Task '{task.name}' [{task.id}] attempt {task.attempts} is no longer claimed by '{task.worker}', not recording its failure")
+
+            return False
+
+        return retry
+
+    def requeue_stale(self, timeout: float) -> int:
+        """Re-queue tasks that have been running for longer than `timeout` seconds, i.e. after a worker crashed.
+
+        Returns:
+            (int): Number of tasks re-queued.
+
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET status = 'queued', eta = ?, last_error = 'Worker stopped before the task finished' "
+                "WHERE status = 'running' AND started_at < ?",
+                (time.time(), time.time() - timeout),
+            )
+
+        if cursor.rowcount:
+            log.warning(f"Re-queued [{cursor.rowcount}] stale task(s)")
+
+        return cursor.rowcount
+
+    def purge(self, older_than: float) -> int:
+        """Delete done & failed tasks that finished more than `older_than` seconds ago.
+
+        Returns:
+            (int): Number of tasks deleted.
+
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "DELETE FROM tasks WHERE status IN ('done', 'failed') AND finished_at < ?", (time.time() - older_than,)
+            )
+
+        return cursor.rowcount
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of tasks in each status."""
+        rows = self._connect().execute("SELECT status, COUNT(*) AS n FROM tasks GROUP BY status").fetchall()
+        counts: dict[str, int] = {status: 0 for status in TASK_STATUSES}
+        counts.update({row["status"]: row["n"] for row in rows})
+
+        return counts
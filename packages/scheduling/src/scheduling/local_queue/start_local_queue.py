@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import threading
+
+from .beat import get_local_queue_beat
+from .queue import SQLiteTaskQueue
+from .worker import LocalQueueWorker
+
+from loguru import logger as log
+from settings.local_queue_settings import LOCAL_QUEUE_SETTINGS
+
+__all__ = [
+    "LOCAL_QUEUE_MODES",
+    "get_queue",
+    "start",
+]
+
+## "all" runs the beat & a worker in one process, for single-node deployments
+LOCAL_QUEUE_MODES: list[str] = ["worker", "beat", "all"]
+
+
+def get_queue() -> SQLiteTaskQueue:
+    """Return the queue at the configured `LOCAL_QUEUE_PATH`."""
+    return SQLiteTaskQueue(path=LOCAL_QUEUE_SETTINGS.get("LOCAL_QUEUE_PATH", default=".db/local_queue.sqlite3"))
+
+
+def get_worker(queue: SQLiteTaskQueue) -> LocalQueueWorker:
+    return LocalQueueWorker(
+        queue=queue,
+        concurrency=int(LOCAL_QUEUE_SETTINGS.get("LOCAL_QUEUE_CONCURRENCY", default=4)),
+        poll_interval=float(LOCAL_QUEUE_SETTINGS.get("LOCAL_QUEUE_POLL_INTERVAL", default=1.0)),
+        retry_backoff=float(LOCAL_QUEUE_SETTINGS.get("LOCAL_QUEUE_RETRY_BACKOFF", default=30)),
+        stale_timeout=float(LOCAL_QUEUE_SETTINGS.get("LOCAL_QUEUE_STALE_TIMEOUT", default=3900)),
+        keep_finished=float(LOCAL_QUEUE_SETTINGS.get("LOCAL_QUEUE_KEEP_FINISHED_HOURS", default=24)) * 3600,
+    )
+
+
+def start(mode: str):
+    """Start the local queue worker, the beat, or both in one process.
+
+    Params:
+        mode (str): One of `LOCAL_QUEUE_MODES`.
+
+    """
+    if mode not in LOCAL_QUEUE_MODES:
+        raise ValueError(f"Invalid mode: {mode}. Must be one of {LOCAL_QUEUE_MODES}")
+
+    queue = get_queue()
+    max_retries = int(LOCAL_QUEUE_SETTINGS.get("LOCAL_QUEUE_MAX_RETRIES", default=3))
+
+    log.info(f"Starting local queue in mode '{mode}' ({queue.path}): {queue.counts()}")
+
+    match mode:
+        case "worker":
+            get_worker(queue).run()
+        case "beat":
+            get_local_queue_beat(queue, max_retries=max_retries).run()
+        case "all":
+            beat = get_local_queue_beat(queue, max_retries=max_retries)
+            beat_thread = threading.Thread(
+                target=beat.run, kwargs={"install_signal_handlers": False}, name="local_queue_beat", daemon=True
+            )
+            beat_thread.start()
+
+            try:
+                ## The worker handles SIGINT/SIGTERM; stop the beat once it returns
+                get_worker(queue).run()
+            finally:
+                beat.stop()
+                beat_thread.join()
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import typing as t
+
+from .queue import SQLiteTaskQueue
+
+from loguru import logger as log
+from scheduling import polling
+from weather_client.apis import api_weatherapi
+
+__all__ = [
+    "TASKS",
+    "register_task",
+]
+
+## Task name -> function. Names match the Celery tasks, so schedules & ad-hoc calls work on either backend.
+TASKS: dict[str, t.Callable[..., t.Any]] = {}
+
+
+def register_task(name: str) -> t.Callable:
+    """Decorator that registers a function as a local queue task under `name`."""
+
+    def decorator(func: t.Callable) -> t.Callable:
+        if name in TASKS:
+            raise ValueError(f"A local queue task named '{name}' is already registered")
+
+        TASKS[name] = func
+
+        return func
+
+    return decorator
+
+
+@register_task("request_current_weather")
+def request_current_weather(location: str) -> None:
+    if api_weatherapi.client.get_current_weather(location=location, save_to_db=True, use_cache=True) is None:
+        log.error(f"Failed to retrieve current weather for location '{location}'")
+
+
+@register_task("request_weather_forecast")
+def request_weather_forecast(location: str) -> None:
+    if api_weatherapi.client.get_weather_forecast(location=location, save_to_db=True, use_cache=True) is None:
+        log.error(f"Failed to retrieve weather forecast for location '{location}'")
+
+
+@register_task("poll_current_weather_shard")
+def poll_current_weather_shard(locations: list[str], max_concurrency: int | None = None) -> dict:
+    return polling.poll_location_shard("current", locations, max_concurrency=max_concurrency)
+
+
+@register_task("poll_weather_forecast_shard")
+def poll_weather_forecast_shard(locations: list[str], max_concurrency: int | None = None) -> dict:
+    return polling.poll_location_shard("forecast", locations, max_concurrency=max_concurrency)
+
+
+@register_task("dispatch_location_polls")
+def dispatch_location_polls(
+    poll: str = "current",
+    shard_size: int | None = None,
+    max_concurrency: int | None = None,
+    spread: int | None = None,
+    jitter: int | None = None,
+    queue: SQLiteTaskQueue | None = None,
+) -> dict:
+    """Enqueue a delayed shard task per batch of due registered locations (see `polling.plan_location_polls()`).
+
+    Params:
+        queue (SQLiteTaskQueue | None): The queue to enqueue shards on. The worker passes its own queue.
+
+    """
+    if queue is None:
+        raise ValueError("dispatch_location_polls needs the queue to enqueue shards on")
+
+    shard_task: str = {"current": "poll_current_weather_shard", "forecast": "poll_weather_forecast_shard"}[poll]
+    batches = polling.plan_location_polls(poll=poll, shard_size=shard_size, spread=spread, jitter=jitter)
+
+    for offset, batch in batches:
+        queue.enqueue(shard_task, args=[batch, max_concurrency], countdown=offset)
+
+    log.info(f"Dispatched {poll} weather polls for [{sum(len(b) for _, b in batches)}] location(s) in [{len(batches)}] shard(s)")
+
+    return {"poll": poll, "locations": sum(len(b) for _, b in batches), "shards": len(batches)}
+
+
+@register_task("update_weather_rollups")
+def update_weather_rollups(batch_size: int = 1000) -> dict:
+    return api_weatherapi.db_client.update_current_weather_rollups(batch_size=batch_size)
+
+
+@register_task("apply_retention_policies")
+def apply_retention_policies(dry_run: bool | None = None) -> list[dict]:
+    return [report.as_dict() for report in api_weatherapi.db_client.apply_retention_policies(dry_run=dry_run)]
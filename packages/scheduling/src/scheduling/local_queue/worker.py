@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import inspect
+import os
+import signal
+import socket
+import threading
+import time
+import typing as t
+
+from .queue import QueuedTask, SQLiteTaskQueue
+from .tasks import TASKS
+
+from loguru import logger as log
+
+__all__ = [
+    "LocalQueueWorker",
+]
+
+
+class LocalQueueWorker:
+    """Run tasks from a `SQLiteTaskQueue` on a thread pool.
+
+    Description:
+        The worker claims due tasks until `concurrency` are in flight, then waits for a slot.
+        When the queue is empty it sleeps `poll_interval` seconds between checks. Failed tasks
+        are retried with exponential backoff (`retry_backoff`, doubled per attempt). Every minute
+        it re-queues tasks left "running" by a crashed worker & purges old finished tasks.
+
+    Params:
+        queue (SQLiteTaskQueue): The queue to consume.
+        concurrency (int): Maximum tasks running at once.
+        poll_interval (float): Seconds between checks while the queue is empty.
+        retry_backoff (float): Seconds before the first retry.
+        stale_timeout (float): Seconds after which a running task is assumed lost. Must exceed the longest task.
+        keep_finished (float): Seconds to keep done/failed tasks before purging them.
+
+    """
+
+    def __init__(
+        self,
+        queue: SQLiteTaskQueue,
+        concurrency: int = 4,
+        poll_interval: float = 1.0,
+        retry_backoff: float = 30.0,
+        stale_timeout: float = 3900.0,
+        keep_finished: float = 86400.0,
+    ):
+        self.queue = queue
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.retry_backoff = retry_backoff
+        self.stale_timeout = stale_timeout
+        self.keep_finished = keep_finished
+
+        self.name: str = f"{socket.gethostname()}:{os.getpid()}"
+
+        self._slots = threading.BoundedSemaphore(concurrency)
+        self._stop = threading.Event()
+
+    def stop(self, *_) -> None:
+        log.info("Stopping local queue worker")
+        self._stop.set()
+
+    def _run_task(self, task: QueuedTask) -> None:
+        func = TASKS.get(task.name)
+        start = time.perf_counter()
+
+        try:
+            if func is None:
+                raise LookupError(f"No local queue task registered as '{task.name}'")
+
+            kwargs = dict(task.kwargs)
+            ## Tasks that enqueue follow-up tasks (i.e. dispatch_location_polls) get the worker's queue
+            if "queue" in inspect.signature(func).parameters:
+                kwargs["queue"] = self.queue
+
+            func(*task.args, **kwargs)
+        except Exception as exc:
+            try:
+                retried = self.queue.fail(task, error=f"({type(exc).__name__}) {exc}", retry_backoff=self.retry_backoff)
+            except Exception as fail_exc:
+                ## requeue_stale() picks the task up again if it's left "running"
+                log.error(f"({type(fail_exc)}) Error recording failure of task '{task.name}' [{task.id}]. Details: {fail_exc}")
+                retried = False
+
+            log.error(
+                f"({type(exc)}) Task '{task.name}' [{task.id}] failed on attempt {task.attempts}"
+                f"{', retrying' if retried else ', giving up'}. Details: {exc}"
+            )
+
+            return
+
+        try:
+            self.queue.complete(task)
+        except Exception as exc:
+            ## The task ran, but requeue_stale() will re-run it since it's left "running"
+            log.error(f"({type(exc)}) Error marking task '{task.name}' [{task.id}] done. Details: {exc}")
+
+            return
+
+        log.debug(f"Task '{task.name}' [{task.id}] finished in {time.perf_counter() - start:.2f}s")
+
+    def _maintain(self) -> None:
+        try:
+            self.queue.requeue_stale(timeout=self.stale_timeout)
+            purged = self.queue.purge(older_than=self.keep_finished)
+            if purged:
+                log.debug(f"Purged [{purged}] finished task(s)")
+        except Exception as exc:
+            log.error(f"({type(exc)}) Error maintaining local queue. Details: {exc}")
+
+    def run(self, install_signal_handlers: bool = True) -> None:
+        """Consume tasks until `stop()` is called, or the process receives SIGINT/SIGTERM."""
+        if install_signal_handlers and threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, self.stop)
+            signal.signal(signal.SIGTERM, self.stop)
+
+        log.info(f"Local queue worker '{self.name}' consuming {self.queue.path} with concurrency {self.concurrency}")
+
+        next_maintenance: float = 0.0
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="local_queue") as pool:
+            while not self._stop.is_set():
+                if time.monotonic() >= next_maintenance:
+                    self._maintain()
+                    next_maintenance = time.monotonic() + 60
+
+                ## Wait for a free slot, waking regularly to check for stop()
+                if not self._slots.acquire(timeout=self.poll_interval):
+                    continue
+
+                try:
+                    task = self.queue.claim(worker=self.name)
+                except Exception as exc:
+                    self._slots.release()
+                    log.error(f"({type(exc)}) Error claiming task. Details: {exc}")
+                    self._stop.wait(self.poll_interval)
+
+                    continue
+
+                if task is None:
+                    self._slots.release()
+                    self._stop.wait(self.poll_interval)
+
+                    continue
+
+                future: Future = pool.submit(self._run_task, task)
+                future.add_done_callback(lambda _: self._slots.release())
+
+            log.info("Waiting for running task(s) to finish")
+
+        log.info("Local queue worker stopped")
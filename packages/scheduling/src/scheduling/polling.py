@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import time
+import typing as t
+
+from scheduling import stagger
+
+from loguru import logger as log
+from weather_client.apis import api_weatherapi
+
+__all__ = [
+    "POLL_TYPES",
+    "list_due_locations",
+    "plan_location_polls",
+    "poll_location_shard",
+    "combine_shard_summaries",
+]
+
+POLL_TYPES: list[str] = api_weatherapi.db_client.POLL_TYPES
+
+
+def _validate_poll(poll: str) -> None:
+    if poll not in POLL_TYPES:
+        raise ValueError(f"Invalid poll type: '{poll}'. Must be one of {POLL_TYPES}")
+
+
+def list_due_locations(poll: str = "current", due_within: int = 0) -> list[str]:
+    """Return the active registered locations to poll now.
+
+    Description:
+        With `WEATHERAPI_CONDITIONAL_POLLING`, current weather polls leave out locations WeatherAPI
+        isn't expected to update within `due_within` seconds. Forecasts are always polled; they
+        change independently of the current conditions' update cadence.
+
+    Params:
+        poll (str): One of `POLL_TYPES`.
+        due_within (int): Seconds from now a location's predicted update may be & still be polled.
+
+    Returns:
+        (list[str]): WeatherAPI queries, ordered by registry ID.
+
+    """
+    _validate_poll(poll)
+
+    due_before: int | None = None
+    if poll == "current" and api_weatherapi.conditional_polling:
+        due_before = int(time.time()) + int(due_within)
+
+    try:
+        return [
+            query
+            for shard in api_weatherapi.db_client.get_location_shards(
+                shard_size=api_weatherapi.poll_shard_size, poll=poll, due_before=due_before
+            )
+            for query in shard
+        ]
+    except Exception as exc:
+        msg = f"({type(exc)}) Error loading registered locations. Details: {exc}"
+        log.error(msg)
+
+        raise exc
+
+
+def plan_location_polls(
+    poll: str = "current",
+    shard_size: int | None = None,
+    spread: int | None = None,
+    jitter: int | None = None,
+) -> list[tuple[float, list[str]]]:
+    """Split the registered locations due for polling into delayed shards.
+
+    Description:
+        Each location gets a fixed, hash-based offset within the `spread` window. Locations whose
+        offsets fall in the same minute are polled together, in shards of at most `shard_size`,
+        starting at their offset plus up to `jitter` seconds. The poll type salts the hash, so a
+        location's current & forecast polls land at different times.
+
+    Params:
+        poll (str): One of `POLL_TYPES`.
+        shard_size (int | None): Maximum locations per shard. Defaults to the `WEATHERAPI_POLL_SHARD_SIZE` setting.
+        spread (int | None): Seconds to spread the polls over, 0 to poll all at once. Defaults to the
+            `WEATHERAPI_POLL_SPREAD_CURRENT`/`WEATHERAPI_POLL_SPREAD_FORECAST` setting.
+        jitter (int | None): Maximum random seconds added to or subtracted from each shard's delay.
+            Defaults to the `WEATHERAPI_POLL_JITTER` setting.
+
+    Returns:
+        (list[tuple[float, list[str]]]): `(delay_seconds, locations)` pairs, ordered by delay.
+
+    """
+    _validate_poll(poll)
+
+    shard_size = shard_size or api_weatherapi.poll_shard_size
+    if spread is None:
+        spread = api_weatherapi.poll_spread_current if poll == "current" else api_weatherapi.poll_spread_forecast
+    if jitter is None:
+        jitter = api_weatherapi.poll_jitter
+
+    queries: list[str] = list_due_locations(poll=poll, due_within=spread)
+
+    return stagger.stagger_batches(queries, window=spread, jitter=jitter, max_batch_size=shard_size, salt=poll)
+
+
+def poll_location_shard(
+    poll: str,
+    locations: list[str],
+    max_concurrency: int | None = None,
+    days: int = 1,
+    record: bool = True,
+) -> dict:
+    """Request & bulk save the current weather or forecast for a shard of locations.
+
+    Params:
+        poll (str): One of `POLL_TYPES`.
+        locations (list[str]): The locations (WeatherAPI queries) in the shard.
+        max_concurrency (int | None): Concurrent requests within the shard. Defaults to the `WEATHERAPI_POLL_CONCURRENCY` setting.
+        days (int): Forecast days, only used for "forecast" polls.
+        record (bool): Record the outcome on the locations' registry entries. Current weather polls also
+            record each location's `last_updated_epoch`, used to skip polls until WeatherAPI is due to update it.
+
+    Returns:
+        (dict): Counts of locations polled, succeeded & failed, with errors by location.
+
+    """
+    _validate_poll(poll)
+
+    log.info(f"Polling {poll} weather for shard of [{len(locations)}] location(s)")
+
+    max_concurrency = max_concurrency or api_weatherapi.poll_concurrency
+
+    try:
+        if poll == "current":
+            responses, errors = api_weatherapi.client.get_current_weather_batch(
+                locations=locations, max_concurrency=max_concurrency, save_to_db=True
+            )
+        else:
+            responses, errors = api_weatherapi.client.get_weather_forecast_batch(
+                locations=locations, days=days, max_concurrency=max_concurrency, save_to_db=True
+            )
+
+        if record:
+            ## Record every location in the shard; successes map to None
+            api_weatherapi.db_client.record_location_polls(
+                errors={location: errors.get(location) for location in locations},
+                responses=responses,
+                record_updates=poll == "current",
+            )
+    except Exception as exc:
+        msg = f"({type(exc)}) Error polling {poll} weather for shard. Details: {exc}"
+        log.error(msg)
+
+        raise exc
+
+    return {"locations": len(locations), "succeeded": len(locations) - len(errors), "failed": len(errors), "errors": errors}
+
+
+def combine_shard_summaries(shard_results: list[dict], poll: str = "current") -> dict:
+    """Add up the summaries returned by `poll_location_shard()` for every shard in a dispatch."""
+    summary: dict = {"poll": poll, "shards": len(shard_results), "locations": 0, "succeeded": 0, "failed": 0}
+
+    for result in shard_results:
+        for key in ("locations", "succeeded", "failed"):
+            summary[key] += result.get(key, 0)
+
+    log.info(
+        f"Polled {poll} weather for [{summary['succeeded']}/{summary['locations']}] location(s) across [{summary['shards']}] shard(s)"
+    )
+
+    return summary
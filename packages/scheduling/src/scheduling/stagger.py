@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import hashlib
+import random
+import typing as t
+
+__all__ = [
+    "stagger_offset",
+    "apply_jitter",
+    "stagger_batches",
+    "load_distribution",
+    "format_load_report",
+]
+
+
+def stagger_offset(key: str, window: float, salt: str = "") -> float:
+    """Return a stable offset in `[0, window)` seconds for a key, i.e. a location query.
+
+    Description:
+        The offset comes from a hash of the key, so a location always polls at the same point
+        in the window (across restarts & workers), and many locations spread evenly over it.
+        Use `salt` to give the same key different offsets for different polls (i.e. "forecast").
+
+    Params:
+        key (str): The value to hash.
+        window (float): Length of the window in seconds.
+        salt (str): Optional value mixed into the hash.
+
+    Returns:
+        (float): Seconds into the window.
+
+    """
+    if window <= 0:
+        return 0.0
+
+    digest = hashlib.blake2b(f"{salt}:{key}".encode("utf-8"), digest_size=8).digest()
+
+    return int.from_bytes(digest, "big") / 2**64 * window
+
+
+def apply_jitter(offset: float, jitter: float, window: float | None = None, rng: random.Random | None = None) -> float:
+    """Add up to `jitter` random seconds (either direction) to an offset, clamped to `[0, window)`."""
+    if jitter <= 0:
+        return offset
+
+    offset += (rng or random).uniform(-jitter, jitter)
+
+    if window is not None and window > 0:
+        return min(max(offset, 0.0), window - 1e-6)
+
+    return max(offset, 0.0)
+
+
+def stagger_batches(
+    keys: t.Iterable[str],
+    window: float,
+    slot: float = 60,
+    jitter: float = 0,
+    max_batch_size: int | None = None,
+    salt: str = "",
+) -> list[tuple[float, list[str]]]:
+    """Group keys by their stagger offset into batches that start at the same time.
+
+    Description:
+        Each key's offset is rounded down to a `slot`, so keys landing in the same slot are sent
+        together as one batch (i.e. one Celery subtask). Batches larger than `max_batch_size` are
+        split. Jitter is applied per batch, not per key, so a batch still starts at one time.
+
+    Params:
+        keys (Iterable[str]): The keys to spread, i.e. location queries.
+        window (float): Seconds to spread the keys over. 0 puts every key in one batch at offset 0.
+        slot (float): Granularity of batch start times in seconds.
+        jitter (float): Maximum random seconds added to (or subtracted from) each batch's start.
+        max_batch_size (int | None): Maximum keys per batch.
+        salt (str): Mixed into each key's hash, see `stagger_offset()`.
+
+    Returns:
+        (list[tuple[float, list[str]]]): `(offset_seconds, keys)` pairs, ordered by offset.
+
+    """
+    slots: dict[int, list[str]] = {}
+
+    for key in keys:
+        slot_index = int(stagger_offset(key, window, salt=salt) // slot) if window > 0 and slot > 0 else 0
+        slots.setdefault(slot_index, []).append(key)
+
+    batches: list[tuple[float, list[str]]] = []
+
+    for slot_index in sorted(slots):
+        slot_keys = slots[slot_index]
+        size = max_batch_size if max_batch_size and max_batch_size > 0 else len(slot_keys)
+
+        for i in range(0, len(slot_keys), size):
+            batches.append((apply_jitter(slot_index * slot, jitter, window=window), slot_keys[i : i + size]))
+
+    return batches
+
+
+def load_distribution(keys: t.Iterable[str], window: float, slot: float = 60, salt: str = "") -> list[int]:
+    """Count how many keys start in each `slot` of the window.
+
+    Returns:
+        (list[int]): Number of keys per slot, one entry for every slot in the window (including empty slots).
+
+    """
+    slot_count = max(1, int(-(-window // slot))) if window > 0 and slot > 0 else 1
+    counts: list[int] = [0] * slot_count
+
+    for key in keys:
+        slot_index = int(stagger_offset(key, window, salt=salt) // slot) if window > 0 and slot > 0 else 0
+        counts[min(slot_index, slot_count - 1)] += 1
+
+    return counts
+
+
+def format_load_report(counts: list[int], slot: float = 60, width: int = 40) -> str:
+    """Render a per-slot load distribution (from `load_distribution()`) as a text histogram."""
+    total = sum(counts)
+    peak = max(counts) if counts else 0
+
+    lines: list[str] = []
+    for slot_index, count in enumerate(counts):
+        start = slot_index * slot
+        bar = "#" * (round(count / peak * width) if peak else 0)
+        lines.append(f"+{int(start // 60):02d}:{int(start % 60):02d} | {count:>5} {bar}")
+
+    mean = total / len(counts) if counts else 0
+    lines.append(f"total: {total} | slots: {len(counts)} | mean/slot: {mean:.1f} | peak/slot: {peak}")
+
+    return "\n".join(lines)
@@ -1,11 +1,26 @@
 from __future__ import annotations
 
 from .base import *
+from .namespace import *
 from .api_settings import *
 from .app_settings import *
 from .celery_settings import *
 from .db_settings import *
 from .dramatiq_settings import *
+from .http_settings import *
+from .local_queue_settings import *
 from .logging_settings import *
+from .metrics_settings import *
+from .retention_settings import *
+from .scheduler_settings import *
+from .tracing_settings import *
 from .weatherapi_settings import *
-from .openmeteo_settings import *
\ No newline at end of file
+from .openmeteo_settings import *
+
+
+def __getattr__(name: str):
+    ## The global Dynaconf object is only built when something asks for it
+    if name == "SETTINGS":
+        return get_dynaconf()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
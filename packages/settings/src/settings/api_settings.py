@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from dynaconf import Dynaconf
 from settings.base import get_namespace
 
 __all__ = ["FASTAPI_SETTINGS", "UVICORN_SETTINGS"]
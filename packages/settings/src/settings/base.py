@@ -1,24 +1,156 @@
-from dynaconf import Dynaconf
+from __future__ import annotations
 
-__all__ = ["SETTINGS", "get_namespace"]
+from pathlib import Path
+import threading
+import tomllib
+import typing as t
 
-## Initialize Dynaconf object with all configurations
-SETTINGS = Dynaconf(
-    environments=True,
-    settings_files=[
-        "settings.toml",
-        ".secrets.toml",
-        "config/settings.toml",
-        "config/.secrets.toml",
-    ],
-)
+from . import cache
+from .namespace import SettingsNamespace
 
+from loguru import logger as log
 
-def get_namespace(namespace: str) -> Dynaconf:
-    """Return a Dyanconf object scoped to a namespace.
+if t.TYPE_CHECKING:
+    from dynaconf import Dynaconf
+
+__all__ = ["SETTINGS_FILES", "get_dynaconf", "get_namespace", "load_settings", "reload_settings"]
+
+## Settings files Dynaconf merges, in order
+SETTINGS_FILES: list[str] = [
+    "settings.toml",
+    ".secrets.toml",
+    "config/settings.toml",
+    "config/.secrets.toml",
+]
+
+## Top-level tables in the settings files that are Dynaconf environments, not namespaces
+_RESERVED_TABLES: set[str] = {"default", "global", "dynaconf_merge"}
+
+_LOCK = threading.RLock()
+## Built on a cache miss, or when something asks for `SETTINGS`
+_SETTINGS: Dynaconf | None = None
+## Every namespace, resolved once per process
+_NAMESPACES: dict[str, SettingsNamespace] | None = None
+
+
+def __getattr__(name: str) -> t.Any:
+    ## `SETTINGS` used to be built on import; keep it available without paying for Dynaconf up front
+    if name == "SETTINGS":
+        return get_dynaconf()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_dynaconf() -> Dynaconf:
+    """Return the global Dynaconf object with all configurations, creating it on first use.
+
+    Description:
+        Most code should use `get_namespace()` instead, which doesn't load Dynaconf when the settings
+        are cached.
+    """
+    global _SETTINGS
+
+    with _LOCK:
+        if _SETTINGS is None:
+            from dynaconf import Dynaconf
+
+            _SETTINGS = Dynaconf(environments=True, settings_files=SETTINGS_FILES)
+
+        return _SETTINGS
+
+
+def _find_namespaces(files: list[str]) -> list[str]:
+    namespaces: list[str] = []
+
+    for path in files:
+        try:
+            with open(path, "rb") as f:
+                tables = tomllib.load(f)
+        except (OSError, tomllib.TOMLDecodeError) as exc:
+            ## Dynaconf reports invalid files itself when it loads them
+            log.debug("Unable to read namespaces from settings file '{}': {}", path, exc)
+            continue
+
+        for name, value in tables.items():
+            if isinstance(value, dict) and name.lower() not in _RESERVED_TABLES and name.lower() not in namespaces:
+                namespaces.append(name.lower())
+
+    return namespaces
+
+
+def _resolve_namespaces() -> dict[str, dict[str, t.Any]]:
+    ## Stat the files before loading them, so a change made while they're read invalidates the cache
+    candidates: list[Path] = [Path(f) for f in SETTINGS_FILES]
+    files = cache.stat_settings_files(candidates)
+
+    settings = get_dynaconf()
+    found: list[str] = [path for path in (settings.find_file(f) for f in SETTINGS_FILES) if path]
+    files.update(cache.stat_settings_files(found))
+
+    namespaces: dict[str, dict[str, t.Any]] = {
+        namespace: settings.from_env(namespace).to_dict() for namespace in _find_namespaces(found)
+    }
+
+    cache.write_settings_cache(SETTINGS_FILES, files=files, namespaces=namespaces)
+
+    return namespaces
+
+
+def load_settings() -> dict[str, SettingsNamespace]:
+    """Resolve every namespace in the settings files, once per process.
+
+    Description:
+        Namespaces are read from the on-disk cache (see `settings.cache`) when none of the settings files
+        changed since it was written, & the environment's `DYNACONF_` variables are the same. Otherwise
+        Dynaconf loads the files & the cache is rewritten.
+
+        Set `WEATHERDATA_SETTINGS_CACHE=false` to always load the settings files.
+
+    Returns:
+        (dict[str, SettingsNamespace]): Each namespace's settings, keyed by namespace name.
+
+    """
+    global _NAMESPACES
+
+    if _NAMESPACES is not None:
+        return _NAMESPACES
+
+    with _LOCK:
+        if _NAMESPACES is None:
+            namespaces = cache.read_settings_cache(SETTINGS_FILES)
+            if namespaces is None:
+                namespaces = _resolve_namespaces()
+            else:
+                log.debug("Loaded settings from cache")
+
+            _NAMESPACES = {
+                name: SettingsNamespace(namespace=name, values=values) for name, values in namespaces.items()
+            }
+
+    return _NAMESPACES
+
+
+def reload_settings() -> dict[str, SettingsNamespace]:
+    """Discard the settings resolved by this process & the on-disk cache, & load the settings files again.
+
+    Description:
+        Module-level settings objects, i.e. `LOGGING_SETTINGS`, are bound on import & keep their values;
+        call `get_namespace()` again for the new ones.
+    """
+    global _SETTINGS, _NAMESPACES
+
+    with _LOCK:
+        _SETTINGS = None
+        _NAMESPACES = None
+        cache.clear_settings_cache()
+
+    return load_settings()
+
+
+def get_namespace(namespace: str) -> SettingsNamespace:
+    """Return the settings scoped to a namespace.
 
     Description:
-        Uses the global SETTINGS Dynaconf object to return only the environment/namespace.
         In your settings.toml/.secrets.toml, separate your configurations by domain, i.e.:
 
         ```toml
@@ -30,19 +162,26 @@ def get_namespace(namespace: str) -> Dynaconf:
         port = 8000
         ```
 
-        Now you can use .get_namespace() to return a Dynaconf object, instead of declaring a new object
-        for every configuration domain.
+        Now you can use .get_namespace() to return a namespace's settings, instead of declaring a new
+        Dynaconf object for every configuration domain. Every namespace is resolved once per process by
+        `load_settings()`, so calling this repeatedly is cheap.
 
     Params:
         namespace (str): The name of a `[namespace]` in your settings.toml/.secrets.toml, i.e. 'logging' or 'api'.
 
     Returns:
-        (Dynaconf): A scoped Dynaconf settings object.
+        (SettingsNamespace): The namespace's immutable settings.
     """
     try:
-        scoped_settings = SETTINGS.from_env(namespace)
+        namespaces = load_settings()
+
+        if namespace.lower() not in namespaces:
+            with _LOCK:
+                ## Not a table in the settings files; it can still have DYNACONF_ environment overrides
+                values = get_dynaconf().from_env(namespace).to_dict()
+                namespaces[namespace.lower()] = SettingsNamespace(namespace=namespace.lower(), values=values)
 
-        return scoped_settings
+        return namespaces[namespace.lower()]
     except Exception as exc:
         raise Exception(
             f"Error scoping Dynaconf settings to namespace '{namespace}'. Details: {exc}"
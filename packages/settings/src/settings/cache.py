@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import sys
+import tempfile
+import typing as t
+
+from loguru import logger as log
+
+__all__ = [
+    "SETTINGS_CACHE_VERSION",
+    "settings_cache_enabled",
+    "get_settings_cache_dir",
+    "get_settings_cache_file",
+    "stat_settings_files",
+    "read_settings_cache",
+    "write_settings_cache",
+    "clear_settings_cache",
+]
+
+## Bump when the cache file's layout changes, so old caches are ignored
+SETTINGS_CACHE_VERSION: int = 1
+
+## Read from the environment, because the cache is checked before any settings are loaded
+SETTINGS_CACHE_ENV: str = "WEATHERDATA_SETTINGS_CACHE"
+SETTINGS_CACHE_DIR_ENV: str = "WEATHERDATA_SETTINGS_CACHE_DIR"
+DEFAULT_SETTINGS_CACHE_DIR: str = ".cache/settings"
+
+
+def settings_cache_enabled() -> bool:
+    """Return `False` if the on-disk settings cache is disabled with `WEATHERDATA_SETTINGS_CACHE=false`."""
+    return os.environ.get(SETTINGS_CACHE_ENV, "true").strip().lower() not in ("0", "false", "no", "off")
+
+
+def get_settings_cache_dir() -> Path:
+    return Path(os.environ.get(SETTINGS_CACHE_DIR_ENV, DEFAULT_SETTINGS_CACHE_DIR))
+
+
+def _cache_key(settings_files: list[str]) -> str:
+    ## Dynaconf reads DYNACONF_ overrides & its own *_FOR_DYNACONF options from the environment, &
+    #  finds the settings files relative to the working directory & the running script
+    script_dir: str = str(Path(sys.argv[0]).resolve().parent) if sys.argv and sys.argv[0] else ""
+    key: dict[str, t.Any] = {
+        "version": SETTINGS_CACHE_VERSION,
+        "cwd": os.getcwd(),
+        "script_dir": script_dir,
+        "settings_files": settings_files,
+        "env": sorted((k, v) for k, v in os.environ.items() if "DYNACONF" in k.upper()),
+    }
+
+    return hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()[:32]
+
+
+def get_settings_cache_file(settings_files: list[str]) -> Path:
+    """Return the cache file for the current working directory, script & environment."""
+    return get_settings_cache_dir() / f"{_cache_key(settings_files)}.json"
+
+
+def stat_settings_files(paths: t.Iterable[str | Path]) -> dict[str, list[int] | None]:
+    """Return `[mtime_ns, size]` for each path, or `None` for paths that don't exist.
+
+    Description:
+        Missing files are recorded too, so creating a settings file invalidates the cache.
+    """
+    stats: dict[str, list[int] | None] = {}
+
+    for path in paths:
+        path = str(Path(path).absolute())
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stats[path] = None
+        else:
+            stats[path] = [stat.st_mtime_ns, stat.st_size]
+
+    return stats
+
+
+def read_settings_cache(settings_files: list[str]) -> dict[str, dict[str, t.Any]] | None:
+    """Return the cached namespaces, or `None` if there's no cache or any settings file changed since it was written.
+
+    Params:
+        settings_files (list[str]): The settings files Dynaconf loads.
+
+    Returns:
+        (dict[str, dict[str, Any]] | None): The values of each namespace, keyed by namespace name.
+
+    """
+    if not settings_cache_enabled():
+        return None
+
+    cache_file: Path = get_settings_cache_file(settings_files)
+
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            cached: dict = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        log.debug("Ignoring unreadable settings cache '{}': {}", cache_file, exc)
+        return None
+
+    if cached.get("version") != SETTINGS_CACHE_VERSION:
+        return None
+
+    files: dict[str, list[int] | None] = cached.get("files") or {}
+    if stat_settings_files(files.keys()) != files:
+        log.debug("Settings files changed since the settings cache was written: {}", cache_file)
+        return None
+
+    return cached.get("namespaces")
+
+
+def write_settings_cache(
+    settings_files: list[str], files: dict[str, list[int] | None], namespaces: dict[str, dict[str, t.Any]]
+) -> bool:
+    """Write resolved namespaces to the on-disk cache.
+
+    Description:
+        The cache holds secrets (i.e. database passwords) from `.secrets.toml`, so the file is only
+        readable by the current user. It's written to a temporary file & renamed, so other processes
+        never read a partial cache.
+
+        Nothing is cached if a value can't be stored as JSON without changing its type, i.e. a TOML date.
+
+    Params:
+        settings_files (list[str]): The settings files Dynaconf loads.
+        files (dict[str, list[int] | None]): `stat_settings_files()` of every file the values depend on,
+            taken before they were loaded.
+        namespaces (dict[str, dict[str, Any]]): The values of each namespace.
+
+    Returns:
+        (bool): `True` if the cache was written.
+
+    """
+    if not settings_cache_enabled():
+        return False
+
+    try:
+        content: str = json.dumps({"version": SETTINGS_CACHE_VERSION, "files": files, "namespaces": namespaces})
+    except (TypeError, ValueError) as exc:
+        log.debug("Not caching settings, a value can't be stored as JSON: {}", exc)
+        return False
+
+    cache_file: Path = get_settings_cache_file(settings_files)
+
+    try:
+        cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+        ## mkstemp() creates the file with 0600 permissions
+        fd, tmp_path = tempfile.mkstemp(prefix=".settings-", suffix=".tmp", dir=cache_file.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_path, cache_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as exc:
+        ## A read-only checkout or container still works, it just loads the settings files every time
+        log.debug("Unable to write settings cache '{}': {}", cache_file, exc)
+        return False
+
+    return True
+
+
+def clear_settings_cache() -> int:
+    """Delete every cached settings file.
+
+    Returns:
+        (int): The number of cache files deleted.
+
+    """
+    deleted: int = 0
+
+    for cache_file in get_settings_cache_dir().glob("*.json"):
+        try:
+            cache_file.unlink()
+            deleted += 1
+        except FileNotFoundError:
+            pass
+
+    return deleted
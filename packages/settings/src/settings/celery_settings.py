@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from dynaconf import Dynaconf
 from settings.base import get_namespace
+from settings.namespace import NamespaceModel
 
-__all__ = ["CELERY_SETTINGS"]
+from pydantic import Field
+
+__all__ = ["CELERY_SETTINGS", "CelerySettings", "get_celery_settings"]
 
 ## Celery settings loaded with dynaconf
 # CELERY_SETTINGS: Dynaconf = Dynaconf(
@@ -18,3 +20,40 @@ __all__ = ["CELERY_SETTINGS"]
 # )
 
 CELERY_SETTINGS = get_namespace("celery")
+
+
+class CelerySettings(NamespaceModel):
+    """Typed `[celery]` settings."""
+
+    celery_broker_host: str = "localhost"
+    celery_broker_port: int = 5672
+    celery_broker_username: str = "guest"
+    celery_broker_password: str = Field(default="", repr=False)
+    celery_broker_vhost: str = "/"
+    celery_backend_host: str = "localhost"
+    celery_backend_port: int = 6379
+    celery_backend_password: str = Field(default="", repr=False)
+    celery_log_level: str = "INFO"
+
+    celery_worker_pool: str = "prefork"
+    celery_worker_concurrency: int | None = None
+    celery_worker_queues: str | list[str] | None = None
+    celery_worker_prefetch_multiplier: int = 1
+    celery_worker_max_tasks_per_child: int | None = None
+    celery_task_acks_late: bool = True
+    celery_result_expires: int = 3600
+    celery_task_soft_time_limit: int = 120
+    celery_task_time_limit: int = 180
+    celery_ignore_result_tasks: list[str] = ["request_current_weather", "request_weather_forecast"]
+
+    celery_claim_check_mode: str = "none"
+    celery_claim_check_bucket: str = "weatherdata-task-payloads"
+    celery_claim_check_minio_endpoint: str = "localhost:9000"
+    celery_claim_check_minio_secure: bool = True
+    celery_claim_check_minio_access_key: str | None = Field(default=None, repr=False)
+    celery_claim_check_minio_secret_key: str | None = Field(default=None, repr=False)
+
+
+def get_celery_settings() -> CelerySettings:
+    """Return the validated `[celery]` settings."""
+    return get_namespace("celery").to_model(CelerySettings)
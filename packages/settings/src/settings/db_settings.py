@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from dynaconf import Dynaconf
 from settings.base import get_namespace
+from settings.namespace import NamespaceModel
 
-__all__ = ["DB_SETTINGS"]
+from pydantic import Field
+
+__all__ = ["DB_SETTINGS", "DatabaseSettings", "get_db_settings"]
 
 ## Database settings loaded with dynaconf
 # DB_SETTINGS: Dynaconf = Dynaconf(
@@ -18,3 +20,21 @@ __all__ = ["DB_SETTINGS"]
 # )
 
 DB_SETTINGS = get_namespace("database")
+
+
+class DatabaseSettings(NamespaceModel):
+    """Typed `[database]` settings. Empty connection values in the settings files (i.e. SQLite's `db_port = ""`) are `None`."""
+
+    db_type: str = "sqlite"
+    db_drivername: str = "sqlite+pysqlite"
+    db_username: str | None = None
+    db_password: str | None = Field(default=None, repr=False)
+    db_host: str | None = None
+    db_port: int | None = None
+    db_database: str = ".db/db.sqlite3"
+    db_echo: bool = False
+
+
+def get_db_settings() -> DatabaseSettings:
+    """Return the validated `[database]` settings."""
+    return get_namespace("database").to_model(DatabaseSettings)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dynaconf import Dynaconf
+from urllib.parse import quote
+
 from loguru import logger as log
 from settings.base import get_namespace
 import pika
@@ -55,10 +56,11 @@ def return_dramatiq_rabbitmq_url(
     if password:
         dramatiq_broker_url: str = f"amqp://{username}:{password}@{host}:{port}"
     else:
-        dramatiq_broker_url: str = f"amqp://{username}:''@{host}:{port}"
+        dramatiq_broker_url: str = f"amqp://{username}@{host}:{port}"
 
-    if vhost:
-        dramatiq_broker_url += f"/{vhost}"
+    ## The default "/" vhost is an empty path; other vhosts must be URL-encoded
+    if vhost and vhost != "/":
+        dramatiq_broker_url += f"/{quote(vhost, safe='')}"
     else:
         dramatiq_broker_url += "/"
 
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from settings.base import get_namespace
+
+__all__ = ["HTTP_SETTINGS"]
+
+HTTP_SETTINGS = get_namespace("http")
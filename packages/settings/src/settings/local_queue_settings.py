@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from settings.base import get_namespace
+
+__all__ = ["LOCAL_QUEUE_SETTINGS"]
+
+## SQLite task queue (scheduling.local_queue) settings loaded with dynaconf
+LOCAL_QUEUE_SETTINGS = get_namespace("local_queue")
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from dynaconf import Dynaconf
+import typing as t
+
 from settings.base import get_namespace
+from settings.namespace import NamespaceModel
 
-__all__ = ["LOGGING_SETTINGS"]
+__all__ = ["LOGGING_SETTINGS", "LoggingSettings", "get_logging_settings"]
 
 # LOGGING_SETTINGS = Dynaconf(
 #     environments=True,
@@ -17,3 +19,27 @@ __all__ = ["LOGGING_SETTINGS"]
 # )
 
 LOGGING_SETTINGS = get_namespace("logging")
+
+
+class LoggingSettings(NamespaceModel):
+    """Typed `[logging]` settings."""
+
+    log_level: str = "INFO"
+    log_enqueue: bool = False
+    log_sample_rate: int = 0
+    log_sample_interval: float = 60.0
+
+    log_json_file: str | None = None
+    log_json_level: str = "INFO"
+    log_json_rotation: t.Literal["size", "time"] = "size"
+    log_json_max_bytes: int = 50 * 1024 * 1024
+    log_json_when: str = "midnight"
+    log_json_backup_count: int = 7
+    log_json_compress: bool = True
+    log_json_buffer_size: int = 10_000
+    log_json_per_process: bool = False
+
+
+def get_logging_settings() -> LoggingSettings:
+    """Return the validated `[logging]` settings."""
+    return get_namespace("logging").to_model(LoggingSettings)
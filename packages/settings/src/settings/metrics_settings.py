@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from settings.base import get_namespace
+
+__all__ = ["METRICS_SETTINGS"]
+
+## Stage timing & Prometheus export (core_utils.metrics_utils) settings loaded with dynaconf
+METRICS_SETTINGS = get_namespace("metrics")
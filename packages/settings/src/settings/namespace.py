@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import copy
+from types import MappingProxyType
+import typing as t
+
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+
+__all__ = ["NamespaceModel", "SettingsNamespace"]
+
+M = t.TypeVar("M", bound="NamespaceModel")
+
+
+class NamespaceModel(BaseModel):
+    """Base for typed views of a settings namespace, see `SettingsNamespace.to_model()`.
+
+    Description:
+        Fields are the namespace's lower-case setting names, i.e. `celery_worker_pool`. Settings the
+        model doesn't declare are ignored, & an empty string (an unset value in the settings files)
+        is treated as unset for optional fields.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    @classmethod
+    def from_values(cls: type[M], values: t.Mapping[str, t.Any]) -> M:
+        fields = cls.model_fields
+        data: dict[str, t.Any] = {}
+
+        for key, value in values.items():
+            name = key.lower()
+            if name not in fields:
+                continue
+            if value == "" and not fields[name].is_required() and fields[name].default is None:
+                continue
+            data[name] = value
+
+        return cls.model_validate(data)
+
+
+class SettingsNamespace(BaseModel):
+    """Immutable settings for one `[namespace]` of the settings files, resolved once per process.
+
+    Description:
+        Replaces the scoped Dynaconf objects `get_namespace()` used to return. Values are already merged
+        from the settings files & `DYNACONF_` environment variables, & keep the types they were loaded with.
+        Keys are case-insensitive, like Dynaconf's; nested values can be read with a dotted key, i.e.
+        `CELERY_SETTINGS.get("CELERY_QUEUES.default")`.
+
+        Values are stored in a read-only mapping, & mutable values (lists & dicts) are returned as copies,
+        so callers can't change the settings other modules see. Use `to_model()` for a validated, typed
+        view of the namespace.
+
+    Params:
+        namespace (str): The name of the `[namespace]`, i.e. 'logging'.
+        values (dict[str, Any]): The namespace's values, with upper-case top-level keys.
+
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    namespace: str
+
+    _values: t.Mapping[str, t.Any] = PrivateAttr(default_factory=lambda: MappingProxyType({}))
+    ## Validated models from to_model(), built once per namespace object
+    _models: dict[type, NamespaceModel] = PrivateAttr(default_factory=dict)
+
+    def __init__(self, namespace: str, values: t.Mapping[str, t.Any] | None = None):
+        super().__init__(namespace=namespace)
+        self._values = MappingProxyType(copy.deepcopy(dict(values or {})))
+
+    def _lookup(self, key: str) -> tuple[bool, t.Any]:
+        first, *rest = key.split(".")
+        if first.upper() not in self._values:
+            return False, None
+
+        value: t.Any = self._values[first.upper()]
+        for part in rest:
+            if not isinstance(value, dict) or part not in value:
+                return False, None
+            value = value[part]
+
+        return True, value
+
+    def get(self, key: str, default: t.Any = None) -> t.Any:
+        """Return a setting's value, or `default` if it isn't set."""
+        found, value = self._lookup(key)
+        if not found:
+            return default
+
+        return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+    def as_dict(self) -> dict[str, t.Any]:
+        """Return a copy of every value in the namespace."""
+        return copy.deepcopy(dict(self._values))
+
+    def keys(self) -> list[str]:
+        return list(self._values.keys())
+
+    def to_model(self, model: type[M]) -> M:
+        """Validate the namespace's values into a typed model, i.e. `CelerySettings`.
+
+        Raises:
+            pydantic.ValidationError: If a value can't be converted to its field's type.
+
+        """
+        if model not in self._models:
+            self._models[model] = model.from_values(self._values)
+
+        return self._models[model]
+
+    def __getitem__(self, key: str) -> t.Any:
+        found, value = self._lookup(key)
+        if not found:
+            raise KeyError(key)
+
+        return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+    def __contains__(self, key: str) -> bool:
+        return self._lookup(key)[0]
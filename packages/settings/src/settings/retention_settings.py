@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from settings.base import get_namespace
+
+__all__ = ["RETENTION_SETTINGS"]
+
+## Data retention settings loaded with dynaconf
+RETENTION_SETTINGS = get_namespace("retention")
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from settings.base import get_namespace
+
+__all__ = ["SCHEDULER_SETTINGS"]
+
+## In-process scheduler (scheduling.lib_scheduler) settings loaded with dynaconf
+SCHEDULER_SETTINGS = get_namespace("scheduler")
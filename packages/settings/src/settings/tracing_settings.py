@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from settings.base import get_namespace
+
+__all__ = ["TRACING_SETTINGS"]
+
+## OpenTelemetry tracing (core_utils.tracing_utils) settings loaded with dynaconf
+TRACING_SETTINGS = get_namespace("tracing")
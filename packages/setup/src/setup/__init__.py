@@ -1,4 +1,5 @@
 from __future__ import annotations
 
 from .__setup_db import setup_database
+from .__setup_tracing import setup_tracing
 from .logging import *
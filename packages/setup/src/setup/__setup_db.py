@@ -12,14 +12,14 @@ __all__ = [
     "setup_database"
 ]
 
-def setup_database(sqla_base: so.DeclarativeBase = db.Base, engine: sa.Engine = db_depends.get_db_engine()) -> None:
+def setup_database(sqla_base: so.DeclarativeBase = db.Base, engine: sa.Engine | None = None) -> None:
     """Setup the database tables and metadata.
     
     Params:
         sqla_base (sqlalchemy.orm.DeclarativeBase): A SQLAlchemy `DeclarativeBase` object to use for creating metadata.
-        engine (sqlalchemy.Engine): A SQLAlchemy `Engine` to use for database connections.
+        engine (sqlalchemy.Engine | None): A SQLAlchemy `Engine` to use for database connections. Defaults to `db_depends.get_db_engine()`.
     """
-    engine: sa.Engine = engine
+    engine: sa.Engine = engine if engine is not None else db_depends.get_db_engine()
     
     ## Check if the driver is SQLite
     if engine.dialect.name == 'sqlite':
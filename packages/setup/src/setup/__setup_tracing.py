@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from core_utils import tracing_utils
+from depends import db_depends, tracing_depends
+from loguru import logger as log
+from settings.tracing_settings import TRACING_SETTINGS
+
+__all__ = [
+    "setup_tracing"
+]
+
+def setup_tracing(component: str) -> bool:
+    """Configure OpenTelemetry tracing for this process from TRACING_SETTINGS, if it's enabled.
+
+    Description:
+        Also instruments the shared database engines built before tracing was configured. Call once
+        per process, i.e. in each forked Celery worker child.
+
+    Params:
+        component (str): Appended to `TRACING_SERVICE_NAME` for the `service.name`, i.e. "api" or "worker".
+
+    Returns:
+        (bool): `True` if tracing is enabled in this process.
+    """
+    if not TRACING_SETTINGS.get("TRACING_ENABLED", default=False):
+        return False
+
+    service_name: str = f"{TRACING_SETTINGS.get('TRACING_SERVICE_NAME', default=tracing_utils.DEFAULT_SERVICE_NAME)}-{component}"
+
+    try:
+        enabled: bool = tracing_utils.configure_tracing(
+            service_name=service_name,
+            exporter=TRACING_SETTINGS.get("TRACING_EXPORTER", default="otlp"),
+            otlp_endpoint=TRACING_SETTINGS.get("TRACING_OTLP_ENDPOINT", default=None),
+            file_path=TRACING_SETTINGS.get("TRACING_FILE_PATH", default="logs/traces.jsonl"),
+            sample_ratio=float(TRACING_SETTINGS.get("TRACING_SAMPLE_RATIO", default=1.0)),
+        )
+    except Exception as exc:
+        msg = f"({type(exc)}) Error setting up tracing, continuing without it. Details: {exc}"
+        log.error(msg)
+
+        return False
+
+    if enabled:
+        for engine in db_depends.get_db_engines():
+            tracing_depends.instrument_db_engine(engine)
+
+    return enabled
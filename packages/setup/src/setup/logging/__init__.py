@@ -1,2 +1,3 @@
+from .__json import *
 from .__loguru import *
 from .__stdlib import *
\ No newline at end of file
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import atexit
+import copy
+from datetime import datetime
+import gzip
+import json
+import logging
+from logging.handlers import QueueHandler, QueueListener
+import os
+from pathlib import Path
+import queue
+import shutil
+import typing as t
+
+from loguru import logger
+
+from .__stdlib import get_rotating_file_handler, get_timed_rotating_file_handler
+
+__all__ = ["JSON_LOG_ROTATIONS", "get_process_log_filename", "serialize_log_record", "json_log_format", "add_json_log_sink", "stop_json_log_sinks"]
+
+JSON_LOG_ROTATIONS: list[str] = ["size", "time"]
+
+## Running JSON sinks, stopped (and flushed) at exit & restarted in forked children
+_JSON_SINKS: list[_JsonLogSink] = []
+
+
+def serialize_log_record(record: dict) -> str:
+    """Serialize a loguru record to a single-line JSON object.
+
+    Description:
+        Values bound with `logger.bind()` or `logger.contextualize()`, i.e. `task_id`, `location` or
+        `stage_timings`, are included as top-level keys. Values that aren't JSON types are converted with `str()`.
+
+    Params:
+        record (dict): The loguru record.
+
+    Returns:
+        (str): The JSON object, without a trailing newline.
+
+    """
+    data: dict[str, t.Any] = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "message": record["message"],
+        "logger": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+        "process": record["process"].id,
+        "thread": record["thread"].name,
+    }
+    data.update({k: v for k, v in record["extra"].items() if k != "serialized"})
+
+    if record["exception"] is not None:
+        exc = record["exception"]
+        data["exception"] = {
+            "type": exc.type.__name__ if exc.type else None,
+            "value": str(exc.value),
+            "traceback": "".join(logging.Formatter().formatException((exc.type, exc.value, exc.traceback))),
+        }
+
+    return json.dumps(data, default=str, ensure_ascii=False)
+
+
+def json_log_format(record: dict) -> str:
+    """Loguru `format` function that writes each record as one JSON object per line."""
+    record["extra"]["serialized"] = serialize_log_record(record)
+
+    return "{extra[serialized]}"
+
+
+def get_process_log_filename(filename: str, pid: int | None = None) -> str:
+    """Add a process ID to a log filename, i.e. `logs/app.json.log` -> `logs/app.json.1234.log`."""
+    path = Path(filename)
+
+    return str(path.with_name(f"{path.stem}.{pid or os.getpid()}{path.suffix}"))
+
+
+def _gzip_namer(name: str) -> str:
+    return name + ".gz"
+
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    ## Runs on the queue listener's thread, so callers keep logging into the buffer while the file compresses
+    try:
+        with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+            shutil.copyfileobj(f_in, f_out)
+
+        os.remove(source)
+    except Exception as exc:
+        msg = f"({type(exc)}) Error compressing rotated log file '{source}'. Details: {exc}"
+        logging.getLogger(__name__).error(msg)
+
+
+class _BoundedQueueHandler(QueueHandler):
+    """A `QueueHandler` that drops INFO & lower records when its queue is full, instead of growing without limit.
+
+    Description:
+        Records at `block_level` or above wait for space, so warnings & errors are never lost. The number
+        of dropped records is written to the log once there's room again.
+    """
+
+    def __init__(self, log_queue: queue.Queue, block_level: int = logging.WARNING):
+        super().__init__(log_queue)
+        self.block_level: int = block_level
+        self.dropped: int = 0
+        self._unreported: int = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        ## The message is already the serialized JSON, including any exception
+        record = copy.copy(record)
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        record.stack_info = None
+
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if record.levelno >= self.block_level:
+            self.queue.put(record)
+            return
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            self._unreported += 1
+            return
+
+        if self._unreported:
+            self._report_dropped()
+
+    def _report_dropped(self) -> None:
+        message = json.dumps(
+            {
+                "time": datetime.now().astimezone().isoformat(),
+                "level": "WARNING",
+                "message": f"Dropped [{self._unreported}] log message(s), the JSON log buffer was full",
+                "logger": __name__,
+                "process": os.getpid(),
+                "dropped": self._unreported,
+            }
+        )
+        record = logging.LogRecord(__name__, logging.WARNING, __file__, 0, message, None, None)
+
+        try:
+            self.queue.put_nowait(record)
+            self._unreported = 0
+        except queue.Full:
+            pass
+
+
+class _QueueListener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        ## Wait for room; the default put_nowait() raises when the buffer is full
+        self.queue.put(self._sentinel)
+
+
+class _JsonLogSink:
+    def __init__(self, filename: str, make_handler: t.Callable[[str], logging.Handler], buffer_size: int):
+        self.filename: str = filename
+        self.make_handler: t.Callable[[str], logging.Handler] = make_handler
+        self.output_handler: logging.Handler = make_handler(filename)
+        self.buffer_size: int = buffer_size
+        self.queue_handler = _BoundedQueueHandler(queue.Queue(maxsize=buffer_size))
+        self.listener: QueueListener | None = None
+        self.handler_id: int | None = None
+
+    def start(self) -> None:
+        self.listener = _QueueListener(self.queue_handler.queue, self.output_handler)
+        self.listener.start()
+
+    def stop(self) -> None:
+        ## Stop accepting records first; nothing would drain the queue after the listener stops
+        if self.handler_id is not None:
+            try:
+                logger.remove(self.handler_id)
+            except ValueError:
+                ## Already removed, i.e. by logger.remove()
+                pass
+            self.handler_id = None
+
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+
+        self.output_handler.close()
+
+    def restart_in_child(self) -> None:
+        ## The parent's listener thread doesn't exist after a fork, & its queue's lock may be held
+        self.queue_handler.queue = queue.Queue(maxsize=self.buffer_size)
+
+        ## Parent & child rotating the same file would each rename & gzip it, losing records;
+        #  the child writes its own file instead
+        self.output_handler.close()
+        self.filename = get_process_log_filename(self.filename)
+        self.output_handler = self.make_handler(self.filename)
+
+        self.start()
+
+
+def add_json_log_sink(
+    filename: str = "logs/app.json.log",
+    level: str = "INFO",
+    rotation: str = "size",
+    max_bytes: int = 50 * 1024 * 1024,
+    when: str = "midnight",
+    backup_count: int = 7,
+    compress: bool = True,
+    buffer_size: int = 10_000,
+    per_process: bool = False,
+) -> int:
+    """Add a loguru sink that writes one JSON object per line to a rotating file.
+
+    Description:
+        Log calls only serialize the record & put it on a bounded queue; a background thread writes
+        it to the file. When the queue is full, INFO & lower records are dropped (and counted) instead
+        of blocking ingest. Rotated files are gzipped by the same thread.
+
+        A file must only be written by one process: rotation isn't coordinated between processes, so
+        each would rotate & gzip the file on its own & records would be lost. Processes forked after
+        the sink is added (i.e. Celery's prefork workers) write to their own file, with their process
+        ID added to `filename` (see `get_process_log_filename()`). Set `per_process` when separately
+        started processes, i.e. several workers, are configured with the same `filename`.
+
+    Params:
+        filename (str): The log file. Parent directories are created.
+        level (str): The minimum level written to the file.
+        rotation (str): "size" rotates at `max_bytes`, "time" rotates `when` (see `logging.handlers.TimedRotatingFileHandler`).
+        max_bytes (int): File size to rotate at, for size-based rotation.
+        when (str): When to rotate, for time-based rotation, i.e. "midnight" or "H".
+        backup_count (int): Rotated files to keep.
+        compress (bool): Gzip rotated files.
+        buffer_size (int): Records that can wait to be written before INFO & lower records are dropped.
+        per_process (bool): Add this process's ID to `filename`.
+
+    Returns:
+        (int): The loguru handler ID, for `logger.remove()`.
+
+    Raises:
+        ValueError: If `rotation` is not one of `JSON_LOG_ROTATIONS`.
+
+    """
+    if rotation not in JSON_LOG_ROTATIONS:
+        raise ValueError(f"Invalid JSON log rotation: '{rotation}'. Must be one of {JSON_LOG_ROTATIONS}")
+
+    def make_handler(path: str) -> logging.Handler:
+        match rotation:
+            case "size":
+                file_handler = get_rotating_file_handler(path, max_bytes=max_bytes, backup_count=backup_count)
+            case "time":
+                file_handler = get_timed_rotating_file_handler(path, when=when, backup_count=backup_count)
+
+        if compress:
+            file_handler.namer = _gzip_namer
+            file_handler.rotator = _gzip_rotator
+
+        return file_handler
+
+    if per_process:
+        filename = get_process_log_filename(filename)
+
+    sink = _JsonLogSink(filename=filename, make_handler=make_handler, buffer_size=buffer_size)
+    sink.start()
+    sink.handler_id = logger.add(sink.queue_handler, format=json_log_format, level=level)
+    _JSON_SINKS.append(sink)
+
+    return sink.handler_id
+
+
+def stop_json_log_sinks() -> None:
+    """Write out queued records & close every JSON log sink."""
+    while _JSON_SINKS:
+        _JSON_SINKS.pop().stop()
+
+
+def _restart_json_log_sinks_in_child() -> None:
+    for sink in _JSON_SINKS:
+        sink.restart_in_child()
+
+
+atexit.register(stop_json_log_sinks)
+os.register_at_fork(after_in_child=_restart_json_log_sinks_in_child)
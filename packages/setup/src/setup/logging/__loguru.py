@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import sys
+import threading
+import time
 
 from loguru import logger
 import logging
 import settings
 
-__all__ = ["setup_loguru_logging", "setup_fastapi_logging", "setup_uvicorn_logging"]
+from .__json import add_json_log_sink, stop_json_log_sinks
+
+__all__ = ["LogSampler", "setup_loguru_logging", "setup_fastapi_logging", "setup_uvicorn_logging"]
 
 LOGGING_SETTINGS = settings.get_namespace("logging")
 
@@ -88,6 +92,57 @@ def filter_all_errors(record):
     return record["level"].name in ["ERROR", "TRACE"]
 
 
+class LogSampler:
+    """Loguru filter that caps how many messages each line of code logs per interval.
+
+    Description:
+        Ingest logs the same INFO/DEBUG lines for every reading; at high volume, the first
+        `rate` messages from a call site in each `interval` are kept and the rest are dropped.
+        Messages above `max_level` (warnings & errors) are always kept. Loguru builds the record &
+        formats the message with its arguments before any filter runs, so a dropped message still pays
+        for that; the filter only saves the sink's formatting, queueing & writing. Use
+        `logger.opt(lazy=True)` for arguments that are expensive to compute.
+
+    Params:
+        rate (int): Messages kept per call site per interval.
+        interval (float): Length of the sampling window, in seconds.
+        max_level (str): The highest level that is sampled.
+
+    """
+
+    def __init__(self, rate: int, interval: float = 60.0, max_level: str = "INFO"):
+        self.rate: int = rate
+        self.interval: float = interval
+        self.max_level_no: int = logger.level(max_level).no
+        ## Messages dropped since the filter was created
+        self.suppressed: int = 0
+
+        ## (module, line) -> [window start, messages in window]
+        self._windows: dict[tuple[str, int], list] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, record) -> bool:
+        if record["level"].no > self.max_level_no:
+            return True
+
+        site = (record["name"], record["line"])
+        now = time.monotonic()
+
+        with self._lock:
+            window = self._windows.get(site)
+
+            if window is None or now - window[0] >= self.interval:
+                self._windows[site] = [now, 1]
+                return True
+
+            window[1] += 1
+            if window[1] <= self.rate:
+                return True
+
+            self.suppressed += 1
+            return False
+
+
 def setup_loguru_logging(
     log_level: str = "INFO",
     enable_loggers: list[str] = [],
@@ -99,6 +154,11 @@ def setup_loguru_logging(
     retention: int = 3,
     rotation: str = "15 MB",
     log_fmt: str = "detailed",
+    enqueue: bool = LOGGING_SETTINGS.get("LOG_ENQUEUE", default=False),
+    sample_rate: int = LOGGING_SETTINGS.get("LOG_SAMPLE_RATE", default=0),
+    sample_interval: float = LOGGING_SETTINGS.get("LOG_SAMPLE_INTERVAL", default=60.0),
+    json_log_file: str | None = LOGGING_SETTINGS.get("LOG_JSON_FILE", default=None),
+    json_log_level: str = LOGGING_SETTINGS.get("LOG_JSON_LEVEL", default="INFO"),
 ):
     """Setup loguru logging.
 
@@ -108,6 +168,15 @@ def setup_loguru_logging(
         add_file_logger (bool): If `True`, add a file logger to the log.
         add_error_file_logger (bool): If `True`, add a file logger to the log for errors.
         colorize (bool): If `True`, colorize the log output.
+        enqueue (bool): If `True`, messages are formatted & written by a background thread, so logging
+            calls don't block on the console or log files.
+        sample_rate (int): Keep at most this many INFO & lower messages per line of code per
+            `sample_interval` seconds. `0` keeps every message. See `LogSampler`.
+        sample_interval (float): The sampling window, in seconds.
+        json_log_file (str | None): If set, also write one JSON object per line to this file, for log
+            aggregators. Rotation, compression & buffering are configured with the `LOG_JSON_*` settings.
+            See `add_json_log_sink()`.
+        json_log_level (str): The minimum level written to the JSON log.
     """
     valid_log_fmts: list[str] = ["basic", "detailed"]
 
@@ -139,8 +208,13 @@ def setup_loguru_logging(
                 f"Unknown log_fmt: '{log_fmt}'. Must be one of {valid_log_fmts}"
             )
 
-    logger.remove(0)
-    logger.add(sys.stderr, format=fmt, level=log_level, colorize=colorize)
+    def _sampler() -> LogSampler | None:
+        ## One sampler per sink; loguru calls each sink's filter separately
+        return LogSampler(rate=sample_rate, interval=sample_interval) if sample_rate > 0 else None
+
+    logger.remove()
+    stop_json_log_sinks()
+    logger.add(sys.stderr, format=fmt, level=log_level, colorize=colorize, enqueue=enqueue, filter=_sampler())
 
     if enable_loggers:
         for _logger in enable_loggers:
@@ -153,6 +227,8 @@ def setup_loguru_logging(
             retention=retention,
             rotation=rotation,
             level="DEBUG",
+            enqueue=enqueue,
+            filter=_sampler(),
         )
 
     if add_error_file_logger:
@@ -162,6 +238,23 @@ def setup_loguru_logging(
             retention=retention,
             rotation=rotation,
             level="ERROR",
+            enqueue=enqueue,
+        )
+
+    if json_log_file:
+        json_settings = settings.get_logging_settings()
+
+        ## Queued & written by its own thread, so it doesn't need enqueue
+        add_json_log_sink(
+            filename=json_log_file,
+            level=json_log_level,
+            rotation=json_settings.log_json_rotation,
+            max_bytes=json_settings.log_json_max_bytes,
+            when=json_settings.log_json_when,
+            backup_count=json_settings.log_json_backup_count,
+            compress=json_settings.log_json_compress,
+            buffer_size=json_settings.log_json_buffer_size,
+            per_process=json_settings.log_json_per_process,
         )
 
 
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
 from pathlib import Path
+import queue
 import typing as t
 
 __all__ = [
@@ -20,6 +22,17 @@ valid_log_levels: t.List[str] = [
     "CRITICAL",
 ]
 
+## Writes queued records to the real handlers when setup_logging(use_queue_handler=True)
+_QUEUE_LISTENER: QueueListener | None = None
+
+
+def _stop_queue_listener() -> None:
+    global _QUEUE_LISTENER
+
+    if _QUEUE_LISTENER is not None:
+        _QUEUE_LISTENER.stop()
+        _QUEUE_LISTENER = None
+
 
 def get_rotating_file_handler(
     filename: str,
@@ -94,6 +107,7 @@ def setup_logging(
     silence_loggers: t.Optional[t.List[str]] = None,
     add_stream_handler: bool = True,
     use_rotating_handler: bool = True,
+    use_queue_handler: bool = False,
 ) -> None:
     """Set up logging configuration with enhanced features.
 
@@ -108,8 +122,12 @@ def setup_logging(
         handlers: Additional handlers to add.
         silence_loggers: Loggers to silence by setting their level to NOTSET.
         add_stream_handler: Whether to add a StreamHandler to output logs to console.
+        use_queue_handler: Put records on a queue & write them from a background thread, so
+            logging calls don't block on the console or log files. The queue is flushed at exit.
 
     """
+    global _QUEUE_LISTENER
+
     if isinstance(level, str):
         level = level.upper()
         if level not in valid_log_levels:
@@ -135,6 +153,10 @@ def setup_logging(
 
     ## Clear any existing handlers
     root_logger.handlers.clear()
+    _stop_queue_listener()
+
+    ## Handlers that write the records, either directly from the root logger or from the queue listener
+    output_handlers: list[logging.Handler] = []
 
     if filename:
         try:
@@ -143,7 +165,7 @@ def setup_logging(
             else:
                 file_handler = logging.FileHandler(filename)
             file_handler.setFormatter(formatter)
-            root_logger.addHandler(file_handler)
+            output_handlers.append(file_handler)
         except Exception as exc:
             root_logger.error(f"Failed adding file logging handler. Details: {exc}")
 
@@ -155,7 +177,7 @@ def setup_logging(
                 error_file_handler = logging.FileHandler(error_filename)
             error_file_handler.setLevel(logging.ERROR)
             error_file_handler.setFormatter(formatter)
-            root_logger.addHandler(error_file_handler)
+            output_handlers.append(error_file_handler)
         except Exception as exc:
             root_logger.error(
                 f"Failed adding error file logging handler. Details: {exc}"
@@ -164,11 +186,21 @@ def setup_logging(
     if add_stream_handler:
         stream_handler = logging.StreamHandler()
         stream_handler.setFormatter(formatter)
-        root_logger.addHandler(stream_handler)
+        output_handlers.append(stream_handler)
 
     if handlers:
         for handler in handlers:
             handler.setFormatter(formatter)
+            output_handlers.append(handler)
+
+    if use_queue_handler:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _QUEUE_LISTENER = QueueListener(log_queue, *output_handlers, respect_handler_level=True)
+        _QUEUE_LISTENER.start()
+
+        root_logger.addHandler(QueueHandler(log_queue))
+    else:
+        for handler in output_handlers:
             root_logger.addHandler(handler)
 
     if silence_loggers:
@@ -182,4 +214,7 @@ def setup_logging(
     if filename:
         root_logger.debug(f"Logging to file: {filename}")
     if error_filename:
-        root_logger.debug(f"Logging errors to file: {error_filename}")
\ No newline at end of file
+        root_logger.debug(f"Logging errors to file: {error_filename}")
+
+
+atexit.register(_stop_queue_listener)
\ No newline at end of file
@@ -19,9 +19,14 @@ def request_current_weather(
     headers: dict | None = None,
     use_cache: bool = False,
     save_to_db: bool = False,
+    temperature_unit: str = "fahrenheit",
 ):
     url: str = OPENMETEO_FORECAST_URL
 
+    ## Request "celsius" to store canonical units only; convert on read with core_utils.unit_utils
+    if temperature_unit not in ["celsius", "fahrenheit"]:
+        raise ValueError(f"Invalid temperature_unit: '{temperature_unit}'. Must be one of ['celsius', 'fahrenheit']")
+
     if location_name is None or location_name == "":
         if lat is None or lon is None:
             raise ValueError(
@@ -93,7 +98,7 @@ def request_current_weather(
             "wind_direction_10m",
         ],
         "forecast_days": forecast_days,
-        "temperature_unit": "fahrenheit",
+        "temperature_unit": temperature_unit,
     }
 
     ## Build request object
@@ -106,10 +111,11 @@ def request_current_weather(
         res.raise_for_status()
 
     if res.status_code == 200:
-        log.debug(f"Current weather response: [{res.status_code}: {res.reason_phrase}]")
+        log.debug("Current weather response: [{}: {}]", res.status_code, res.reason_phrase)
 
         decoded: dict = http_lib.decode_response(response=res)
-        log.debug(f"Decoded current weather response: {decoded}")
+        ## Lazy: the payload is only formatted if a sink accepts DEBUG
+        log.debug("Decoded current weather response: {}", decoded)
 
         return decoded
     else:
@@ -1,5 +1,6 @@
 import typing as t
 
+from core_utils import metrics_utils
 from domain.openmeteo import location as openmeteo_location_domain
 
 from loguru import logger as log
@@ -7,6 +8,7 @@ from loguru import logger as log
 __all__ = ["location_search_result_dicts_to_schema", "location_schema_to_model"]
 
 
+@metrics_utils.timed_stage("convert")
 def location_search_result_dicts_to_schema(
     search_results: list[dict],
 ) -> openmeteo_location_domain.LocationIn | list[openmeteo_location_domain.LocationIn]:
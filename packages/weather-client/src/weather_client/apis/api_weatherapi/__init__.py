@@ -2,4 +2,13 @@ from __future__ import annotations
 
 from . import client, db_client, convert
 from .constants import WEATHERAPI_BASE_URL
-from .settings import api_key, location_name
+from .settings import (
+    api_key,
+    conditional_polling,
+    location_name,
+    poll_concurrency,
+    poll_jitter,
+    poll_shard_size,
+    poll_spread_current,
+    poll_spread_forecast,
+)
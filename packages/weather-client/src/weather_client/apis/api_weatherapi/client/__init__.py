@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from .batch import *
 from .current import *
 from .forecast import *
 from .requests import *
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import contextvars
+
+from weather_client.apis.api_weatherapi.convert.methods import (
+    current_weather_dict_to_schema,
+    location_dict_to_schema,
+)
+from weather_client.apis.api_weatherapi.db_client.current_weather import (
+    save_current_weather,
+    save_current_weather_responses,
+)
+from weather_client.apis.api_weatherapi.db_client.forecast import save_forecasts
+from weather_client.apis.api_weatherapi.settings import api_key
+
+from . import requests
+
+from core_utils import tracing_utils
+from depends import db_depends
+import http_lib
+import httpx
+from loguru import logger as log
+import sqlalchemy as sa
+
+__all__ = [
+    "get_current_weather_batch",
+    "get_weather_forecast_batch",
+]
+
+
+def _send_batch(
+    requests_by_location: dict[str, httpx.Request],
+    use_cache: bool = False,
+    max_concurrency: int = 8,
+) -> tuple[dict[str, dict], dict[str, str]]:
+    """Send a batch of requests over one shared client, up to `max_concurrency` at a time.
+
+    Description:
+        A request that fails, returns an error status or can't be decoded is recorded in the errors
+        instead of raising, so the other locations' responses are still returned.
+
+    Returns:
+        (tuple[dict[str, dict], dict[str, str]]): Decoded responses & error messages, keyed by location.
+
+    """
+    responses: dict[str, dict] = {}
+    errors: dict[str, str] = {}
+
+    if not requests_by_location:
+        return responses, errors
+
+    max_workers: int = max(1, min(max_concurrency, len(requests_by_location)))
+
+    ## One client (& connection pool) for the whole batch; httpx.Client is safe to share between threads
+    with http_lib.get_http_controller(use_cache=use_cache) as http:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            ## Run each request in a copy of this thread's context, so its trace span joins the batch's trace
+            futures = {
+                pool.submit(contextvars.copy_context().run, http.client.send, req): location
+                for location, req in requests_by_location.items()
+            }
+
+            for future in as_completed(futures):
+                location = futures[future]
+
+                try:
+                    res: httpx.Response = future.result()
+                except Exception as exc:
+                    errors[location] = f"({type(exc).__name__}) {exc}"
+                    log.warning(f"Request for location '{location}' failed. Details: {exc}")
+
+                    continue
+
+                if res.status_code not in http_lib.constants.SUCCESS_CODES:
+                    errors[location] = f"[{res.status_code}: {res.reason_phrase}]: {res.text[:500]}"
+                    log.warning(f"Request for location '{location}' returned [{res.status_code}: {res.reason_phrase}]")
+
+                    continue
+
+                try:
+                    responses[location] = http_lib.decode_response(response=res)
+                except Exception as exc:
+                    errors[location] = f"({type(exc).__name__}) Error decoding response: {exc}"
+                    log.warning(f"Unable to decode response for location '{location}'. Details: {exc}")
+
+    return responses, errors
+
+
+@tracing_utils.traced()
+def get_current_weather_batch(
+    locations: list[str],
+    api_key: str = api_key,
+    include_aqi: bool = True,
+    headers: dict | None = None,
+    use_cache: bool = False,
+    max_concurrency: int = 8,
+    save_to_db: bool = False,
+    db_engine: sa.Engine | None = None,
+    db_echo: bool = False,
+) -> tuple[dict[str, dict], dict[str, str]]:
+    """Get the current weather for a batch of locations.
+
+    Description:
+        Requests share one HTTP client & run concurrently. When `save_to_db` is True, the raw
+        responses are bulk inserted in a single transaction, then each response's location &
+        current weather are saved to the normalized tables.
+
+    Params:
+        locations (list[str]): The locations (WeatherAPI `q` parameters) to get the current weather for.
+        api_key (str, optional): The API key to use. Defaults to api_key.
+        include_aqi (bool, optional): Whether to include the air quality index. Defaults to True.
+        headers (dict | None, optional): The headers to use. Defaults to None.
+        use_cache (bool, optional): Whether to use the cache. Defaults to False.
+        max_concurrency (int, optional): Maximum number of requests in flight at once. Defaults to 8.
+        save_to_db (bool, optional): Whether to save the current weather to the database. Defaults to False.
+        db_engine (Engine | None, optional): The database engine to use. If None, the default engine is used. Defaults to None.
+        db_echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+
+    Returns:
+        tuple[dict[str, dict], dict[str, str]]: Decoded responses & error messages, keyed by location.
+
+    """
+    if api_key is None or api_key == "":
+        raise ValueError("WeatherAPI key is None or empty.")
+
+    log.info(f"Requesting current weather for [{len(locations)}] location(s)")
+
+    responses, errors = _send_batch(
+        {
+            location: requests.return_current_weather_request(
+                api_key=api_key, location=location, include_aqi=include_aqi, headers=headers
+            )
+            for location in locations
+        },
+        use_cache=use_cache,
+        max_concurrency=max_concurrency,
+    )
+
+    if save_to_db and responses:
+        if not db_engine:
+            db_engine = db_depends.get_db_engine()
+
+        try:
+            summary = save_current_weather_responses(responses=list(responses.values()), engine=db_engine, echo=db_echo)
+            log.debug("Saved current weather responses: {}", summary)
+        except Exception as exc:
+            msg = f"({type(exc)}) Error bulk saving current weather responses. Details: {exc}"
+            log.error(msg)
+
+            raise exc
+
+        for location, decoded in responses.items():
+            try:
+                save_current_weather(
+                    location=location_dict_to_schema(location_dict=decoded["location"]),
+                    current_weather=current_weather_dict_to_schema(current_weather_dict=decoded["current"]),
+                    engine=db_engine,
+                    echo=db_echo,
+                )
+            except Exception as exc:
+                msg = f"({type(exc)}) Error saving current weather for location '{location}' to database. Details: {exc}"
+                log.error(msg)
+
+                errors[location] = msg
+
+    log.info(f"Retrieved current weather for [{len(responses)}/{len(locations)}] location(s)")
+
+    return responses, errors
+
+
+@tracing_utils.traced()
+def get_weather_forecast_batch(
+    locations: list[str],
+    days: int = 1,
+    api_key: str = api_key,
+    include_aqi: bool = True,
+    include_alerts: bool = True,
+    headers: dict | None = None,
+    use_cache: bool = False,
+    max_concurrency: int = 8,
+    save_to_db: bool = False,
+    db_engine: sa.Engine | None = None,
+    db_echo: bool = False,
+) -> tuple[dict[str, dict], dict[str, str]]:
+    """Get the weather forecast for a batch of locations.
+
+    Description:
+        Requests share one HTTP client & run concurrently. When `save_to_db` is True, the
+        forecasts are bulk inserted in a single transaction.
+
+    Params:
+        locations (list[str]): The locations (WeatherAPI `q` parameters) to get the weather forecast for.
+        days (int, optional): The number of days to get the weather forecast for. Defaults to 1.
+        api_key (str, optional): The API key to use. Defaults to api_key.
+        include_aqi (bool, optional): Whether to include the air quality index. Defaults to True.
+        include_alerts (bool, optional): Whether to include weather alerts. Defaults to True.
+        headers (dict | None, optional): The headers to use. Defaults to None.
+        use_cache (bool, optional): Whether to use the cache. Defaults to False.
+        max_concurrency (int, optional): Maximum number of requests in flight at once. Defaults to 8.
+        save_to_db (bool, optional): Whether to save the weather forecasts to the database. Defaults to False.
+        db_engine (Engine | None, optional): The database engine to use. If None, the default engine is used. Defaults to None.
+        db_echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+
+    Returns:
+        tuple[dict[str, dict], dict[str, str]]: Decoded responses & error messages, keyed by location.
+
+    """
+    if api_key is None or api_key == "":
+        raise ValueError("WeatherAPI key is None or empty.")
+
+    log.info(f"Requesting weather forecast for [{len(locations)}] location(s)")
+
+    responses, errors = _send_batch(
+        {
+            location: requests.return_weather_forecast_request(
+                api_key=api_key,
+                location=location,
+                days=days,
+                include_aqi=include_aqi,
+                include_alerts=include_alerts,
+                headers=headers,
+            )
+            for location in locations
+        },
+        use_cache=use_cache,
+        max_concurrency=max_concurrency,
+    )
+
+    if save_to_db and responses:
+        if not db_engine:
+            db_engine = db_depends.get_db_engine()
+
+        try:
+            summary = save_forecasts(forecasts=list(responses.values()), engine=db_engine, echo=db_echo)
+            log.debug("Saved weather forecasts: {}", summary)
+        except Exception as exc:
+            msg = f"({type(exc)}) Error bulk saving weather forecasts. Details: {exc}"
+            log.error(msg)
+
+            raise exc
+
+    log.info(f"Retrieved weather forecast for [{len(responses)}/{len(locations)}] location(s)")
+
+    return responses, errors
@@ -16,6 +16,7 @@ from weather_client.apis.api_weatherapi.settings import api_key, location_name
 
 from . import requests
 
+from core_utils import tracing_utils
 from depends import db_depends
 import hishel
 import http_lib
@@ -28,6 +29,7 @@ import sqlalchemy.orm as so
 __all__ = ["get_current_weather"]
 
 
+@tracing_utils.traced()
 def get_current_weather(
     location: str = location_name,
     api_key: str = api_key,
@@ -110,7 +112,7 @@ def get_current_weather(
 
                         continue
 
-    log.debug(f"Response: [{res.status_code}: {res.reason_phrase}]")
+    log.debug("Response: [{}: {}]", res.status_code, res.reason_phrase)
 
     if res.status_code in http_lib.constants.SUCCESS_CODES:
         log.info("Success requesting current weather")
@@ -187,7 +189,7 @@ def get_current_weather(
                     echo=db_echo,
                 )
                 log.success("Saved current weather to database")
-                log.debug(f"Current weather from database: {db_current_weather_out}")
+                log.debug("Current weather from database: {}", db_current_weather_out)
             except Exception as exc:
                 msg = f"({type(exc)}) Error saving current weather to database: {exc}"
                 log.error(msg)
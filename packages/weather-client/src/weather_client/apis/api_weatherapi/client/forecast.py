@@ -8,6 +8,7 @@ from weather_client.apis.api_weatherapi.settings import api_key, location_name
 
 from . import requests
 
+from core_utils import tracing_utils
 from depends import db_depends
 import http_lib
 import httpx
@@ -18,6 +19,7 @@ __all__ = [
     "get_weather_forecast"
 ]
 
+@tracing_utils.traced()
 def get_weather_forecast(
     location: str = location_name,
     days: int = 1,
@@ -110,7 +112,7 @@ def get_weather_forecast(
 
                         continue
 
-    log.debug(f"Response: [{res.status_code}: {res.reason_phrase}]")
+    log.debug("Response: [{}: {}]", res.status_code, res.reason_phrase)
 
     if res.status_code in http_lib.constants.SUCCESS_CODES:
         log.info("Success requesting weather forecast")
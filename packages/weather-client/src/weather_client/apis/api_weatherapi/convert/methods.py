@@ -3,6 +3,7 @@ from __future__ import annotations
 import typing as t
 import json
 
+from core_utils import metrics_utils
 from domain.weatherapi.location import LocationIn, WeatherAPILocationModel, LocationOut
 from domain.weatherapi.weather.current import (
     CurrentWeatherIn,
@@ -33,6 +34,7 @@ __all__ = [
 
 
 @log.catch
+@metrics_utils.timed_stage("convert")
 def current_weather_dict_to_schema(current_weather_dict: dict):
     """Convert a current weather dictionary to a CurrentWeatherIn schema.
 
@@ -51,6 +53,7 @@ def current_weather_dict_to_schema(current_weather_dict: dict):
 
 
 @log.catch
+@metrics_utils.timed_stage("convert")
 def location_dict_to_schema(location_dict: dict):
     """Convert a location dictionary to a LocationIn schema.
 
@@ -152,6 +155,7 @@ def current_weather_schema_to_model(
 
 
 @log.catch
+@metrics_utils.timed_stage("convert")
 def weather_forecast_dict_to_schema(weather_forecast_dict: dict) -> ForecastJSONIn:
     """Convert a weather forecast dictionary to a ForecastJSONIn schema.
 
@@ -170,6 +174,7 @@ def weather_forecast_dict_to_schema(weather_forecast_dict: dict) -> ForecastJSON
 
 
 @log.catch
+@metrics_utils.timed_stage("convert")
 def current_weather_response_dict_to_schema(current_weather_response_dict: dict) -> CurrentWeatherJSONIn:
     """Convert a current weatheer response dictionary to a CurrentWeatherJSONIn schema.
     
@@ -186,6 +191,7 @@ def current_weather_response_dict_to_schema(current_weather_response_dict: dict)
 
 
 @log.catch
+@metrics_utils.timed_stage("convert")
 def current_weather_api_response_to_dict(content: t.Union[dict, str, bytes]):
     """Convert a current weather API response to a dictionary.
 
@@ -212,6 +218,7 @@ def current_weather_api_response_to_dict(content: t.Union[dict, str, bytes]):
 
 
 @log.catch
+@metrics_utils.timed_stage("convert")
 def current_weather_api_response_dict_to_schemas(
     content_dict: dict,
 ) -> list[dict[str, t.Union[LocationIn, CurrentWeatherIn]]]:
@@ -3,3 +3,7 @@ from __future__ import annotations
 from .current_weather import *
 from .forecast import *
 from .location import *
+from .raw_json import *
+from .registry import *
+from .rollups import *
+from .retention import *
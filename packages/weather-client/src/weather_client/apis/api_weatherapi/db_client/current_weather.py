@@ -4,7 +4,9 @@ import json
 import typing as t
 
 from weather_client.apis.api_weatherapi.db_client.location import save_location
+from weather_client.apis.api_weatherapi.db_client.raw_json import bulk_save_raw_json
 
+from core_utils import hash_utils, metrics_utils
 import db
 from depends import db_depends
 from domain.weatherapi import location as domain_location
@@ -15,20 +17,32 @@ import sqlalchemy.exc as sa_exc
 import sqlalchemy.orm as so
 
 __all__ = [
-    "save_current_weather_response", "save_current_weather", "count_current_weather",
+    "CURRENT_WEATHER_VOLATILE_KEYS", "save_current_weather_response", "save_current_weather_responses", "save_current_weather", "count_current_weather", "load_current_weather_df",
 ]
 
+## Keys that change on every request, even when the weather data itself has not. Left out of content hashes.
+CURRENT_WEATHER_VOLATILE_KEYS: list[str] = ["location.localtime", "location.localtime_epoch"]
 
+
+@metrics_utils.timed_stage("db")
 def save_current_weather_response(
-    current_weather_schema: t.Union[domain_current_weather.CurrentWeatherJSONIn, dict, str], engine: sa.Engine | None = None, echo: bool = False
+    current_weather_schema: t.Union[domain_current_weather.CurrentWeatherJSONIn, dict, str], engine: sa.Engine | None = None, echo: bool = False, dedupe: bool = True
 ) -> domain_current_weather.CurrentWeatherJSONOut:
     """Save a current weather response (in JSON form) to the database.
 
+    Description:
+        When `dedupe` is True, a hash of the response (minus `CURRENT_WEATHER_VOLATILE_KEYS`) is stored
+        in a unique column. If the same response was already saved, its `seen_count` is incremented
+        & the existing row is returned instead of adding a new one.
+
     Params:
         current_weather_schema (CurrentWeatherJSONIn | dict | str): The current weather response to save. Can be a CurrentWeatherJSONIn domain object, dict, or JSON string.
+        engine (Engine | None, optional): The database engine to use. If None, the default engine is used. Defaults to None.
+        echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+        dedupe (bool, optional): Skip saving responses identical to one already in the database. Defaults to True.
 
     Returns:
-        CurrentWeatherJSONOut: The saved current weather response.
+        CurrentWeatherJSONOut: The saved (or existing, duplicate) current weather response.
 
     Raises:
         Exception: If current weather response cannot be saved, an `Exception` is raised.
@@ -60,32 +74,91 @@ def save_current_weather_response(
 
     session_pool = db_depends.get_session_pool(engine=engine)
 
+    content_hash: str | None = None
+
+    if dedupe:
+        content_hash = hash_utils.get_content_hash(
+            current_weather_schema.current_weather_json, exclude_keys=CURRENT_WEATHER_VOLATILE_KEYS
+        )
+
     with session_pool() as session:
         repo = domain_current_weather.CurrentWeatherJSONRepository(session=session)
 
-        current_weather_model = domain_current_weather.CurrentWeatherJSONModel(**current_weather_schema.model_dump())
+        db_current_weather = repo.get_by_content_hash(content_hash) if content_hash else None
+
+        if db_current_weather is not None:
+            log.debug(f"Current weather response [{content_hash}] already saved, incrementing seen count.")
+            db_current_weather = repo.mark_seen(db_current_weather)
+        else:
+            current_weather_model = domain_current_weather.CurrentWeatherJSONModel(
+                **current_weather_schema.model_dump(),
+                location_key=domain_location.get_location_key(current_weather_schema.current_weather_json),
+                content_hash=content_hash,
+            )
+
+            try:
+                db_current_weather = repo.create(current_weather_model)
+            except sa_exc.IntegrityError as exc:
+                session.rollback()
+
+                ## Another worker saved the same response between the lookup & the insert
+                db_current_weather = repo.get_by_content_hash(content_hash) if content_hash else None
+                if db_current_weather is None:
+                    msg = f"({type(exc)}) Error saving current weather response JSON. Details: {exc}"
+                    log.error(msg)
+
+                    raise exc
+
+                db_current_weather = repo.mark_seen(db_current_weather)
+            except Exception as exc:
+                msg = f"({type(exc)}) Error saving current weather response JSON. Details: {exc}"
+                log.error(msg)
+
+                raise exc
 
         try:
-            db_current_weather = repo.create(current_weather_model)
+            current_weather_out: domain_current_weather.CurrentWeatherJSONOut = domain_current_weather.CurrentWeatherJSONOut.model_validate(
+                db_current_weather.__dict__
+            )
+
+            return current_weather_out
         except Exception as exc:
-            msg = f"({type(exc)}) Error saving current weather response JSON. Details: {exc}"
+            msg = f"({type(exc)}) Error converting JSON from database to CurrentWeatherJSONOut schema. Details: {exc}"
             log.error(msg)
 
             raise exc
 
-    try:
-        current_weather_out: domain_current_weather.CurrentWeatherJSONOut = domain_current_weather.CurrentWeatherJSONOut.model_validate(
-            current_weather_model.__dict__
-        )
 
-        return current_weather_out
-    except Exception as exc:
-        msg = f"({type(exc)}) Error converting JSON from database to CurrentWeatherJSONOut schema. Details: {exc}"
-        log.error(msg)
+@metrics_utils.timed_stage("db")
+def save_current_weather_responses(
+    responses: list[dict], engine: sa.Engine | None = None, echo: bool = False
+) -> dict:
+    """Bulk save a batch of current weather responses (in JSON form) to the database.
 
-        raise exc
+    Description:
+        Deduplicated by content hash like `save_current_weather_response()`, but saves the
+        whole batch in one transaction.
+
+    Params:
+        responses (list[dict]): Decoded current weather responses.
+        engine (Engine | None, optional): The database engine to use. If None, the default engine is used. Defaults to None.
+        echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+
+    Returns:
+        dict: A summary with `received`, `inserted` & `duplicates` keys.
+
+    """
+    return bulk_save_raw_json(
+        model=domain_current_weather.CurrentWeatherJSONModel,
+        json_col="current_weather_json",
+        payloads=responses,
+        volatile_keys=CURRENT_WEATHER_VOLATILE_KEYS,
+        engine=engine,
+        echo=echo,
+    )
 
 
+@metrics_utils.timed_stage("db")
 def save_current_weather(
     location: t.Union[domain_location.LocationIn, dict, str],
     current_weather: t.Union[domain_current_weather.CurrentWeatherIn, dict, str],
@@ -182,7 +255,7 @@ def save_current_weather(
             log.warning("Location database transaction returned None.")
             return None
         else:
-            log.info("Converting location database model to API schema")
+            log.debug("Converting location database model to API schema")
             location_schema: domain_location.LocationOut = (
                 domain_location.LocationOut.model_validate(db_location)
             )
@@ -190,7 +263,8 @@ def save_current_weather(
         existing_current_weather_model: (
             domain_current_weather.CurrentWeatherModel | None
         ) = repo.get_by_last_updated_epoch(
-            last_updated_epoch=current_weather.last_updated_epoch
+            last_updated_epoch=current_weather.last_updated_epoch,
+            location_id=location_schema.id,
         )
 
         if existing_current_weather_model:
@@ -227,7 +301,7 @@ def save_current_weather(
             log.warning("Current weather database transaction returned None.")
             return None
         else:
-            log.info("Converting database model to API schema")
+            log.debug("Converting database model to API schema")
 
             # Eager load related models
             weather_model = repo.get_with_related(id=db_model.id)
@@ -278,3 +352,63 @@ def count_current_weather(engine: sa.Engine | None = None, echo: bool = False):
         repo = domain_current_weather.CurrentWeatherRepository(session=session)
 
         return repo.count()
+
+
+def load_current_weather_df(
+    location_name: str | None = None,
+    engine: sa.Engine | None = None,
+    echo: bool = False,
+    optimize: bool = True,
+    chunksize: int | None = None,
+):
+    """Load current weather readings, with their condition & location, into a Pandas DataFrame.
+
+    Params:
+        location_name (str | None, optional): Only load readings for this location. Defaults to None (all locations).
+        engine (Engine | None, optional): The database engine to use. If None, the default engine is used. Defaults to None.
+        echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+        optimize (bool, optional): Apply `df_utils.optimize_weather_df_dtypes()` to the result. Defaults to True.
+        chunksize (int | None, optional): Read the result in chunks of this many rows. Defaults to None.
+
+    Returns:
+        pandas.DataFrame: One row per current weather reading.
+
+    Raises:
+        Exception: If there is an error reading current weather from the database, an `Exception` is raised.
+
+    """
+    ## Pandas is only needed here; importing it with the module slows down every ingest process & the CLI
+    from core_utils import df_utils
+
+    if engine is None:
+        engine = db_depends.get_db_engine(echo=echo)
+
+    weather = domain_current_weather.CurrentWeatherModel
+    condition = domain_current_weather.CurrentWeatherConditionModel
+    location = domain_location.WeatherAPILocationModel
+
+    stmt = (
+        sa.select(
+            *[c for c in weather.__table__.columns],
+            condition.text.label("condition_text"),
+            condition.code.label("condition_code"),
+            location.name.label("location_name"),
+            location.region,
+            location.country,
+            location.tz_id,
+        )
+        .outerjoin(condition, condition.weather_id == weather.id)
+        .outerjoin(location, location.id == weather.location_id)
+        .order_by(weather.last_updated_epoch)
+    )
+
+    if location_name:
+        stmt = stmt.where(location.name == location_name)
+
+    try:
+        return df_utils.load_sql_to_df(query=stmt, engine=engine, optimize=optimize, chunksize=chunksize)
+    except Exception as exc:
+        msg = f"({type(exc)}) Error loading current weather into DataFrame. Details: {exc}"
+        log.error(msg)
+
+        raise exc
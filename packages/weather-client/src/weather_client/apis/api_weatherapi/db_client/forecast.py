@@ -3,10 +3,13 @@ from __future__ import annotations
 import json
 import typing as t
 
+from core_utils import hash_utils, metrics_utils
 import db
 from depends import db_depends
+from domain.weatherapi.location import get_location_key
 from domain.weatherapi.weather import forecast as domain_forecast
 from loguru import logger as log
+from weather_client.apis.api_weatherapi.db_client.raw_json import bulk_save_raw_json
 
 # from domain.weatherapi import location as domain_location
 # from weather_client.apis.api_weatherapi.db_client.location import save_location
@@ -15,19 +18,31 @@ import sqlalchemy.exc as sa_exc
 import sqlalchemy.orm as so
 
 __all__ = [
-    "save_forecast", "count_weather_forecast",
+    "FORECAST_VOLATILE_KEYS", "save_forecast", "save_forecasts", "count_weather_forecast",
 ]
 
+## Keys that change on every request, even when the forecast itself has not. Left out of content hashes.
+FORECAST_VOLATILE_KEYS: list[str] = ["location.localtime", "location.localtime_epoch"]
+
+@metrics_utils.timed_stage("db")
 def save_forecast(
-    forecast_schema: t.Union[domain_forecast.ForecastJSONIn, dict, str], engine: sa.Engine | None = None, echo: bool = False
+    forecast_schema: t.Union[domain_forecast.ForecastJSONIn, dict, str], engine: sa.Engine | None = None, echo: bool = False, dedupe: bool = True
 ) -> domain_forecast.ForecastJSONOut:
     """Save a Forecast (in JSON form) to the database.
 
+    Description:
+        When `dedupe` is True, a hash of the forecast (minus `FORECAST_VOLATILE_KEYS`) is stored in a
+        unique column. If the same forecast was already saved, its `seen_count` is incremented & the
+        existing row is returned instead of adding a new one.
+
     Params:
         forecast (ForecastJSONIn | dict | str): The Forecast to save. Can be a ForecastJSONIn domain object, dict, or JSON string.
+        engine (Engine | None, optional): The database engine to use. If None, the default engine is used. Defaults to None.
+        echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+        dedupe (bool, optional): Skip saving forecasts identical to one already in the database. Defaults to True.
 
     Returns:
-        ForecastJSONOut: The saved Forecast.
+        ForecastJSONOut: The saved (or existing, duplicate) Forecast.
 
     Raises:
         Exception: If Forecast cannot be saved, an `Exception` is raised.
@@ -59,30 +74,83 @@ def save_forecast(
 
     session_pool = db_depends.get_session_pool(engine=engine)
 
+    content_hash: str | None = None
+
+    if dedupe:
+        content_hash = hash_utils.get_content_hash(forecast_schema.forecast_json, exclude_keys=FORECAST_VOLATILE_KEYS)
+
     with session_pool() as session:
         repo = domain_forecast.ForecastJSONRepository(session=session)
 
-        forecast_model = domain_forecast.ForecastJSONModel(**forecast_schema.model_dump())
+        db_forecast = repo.get_by_content_hash(content_hash) if content_hash else None
+
+        if db_forecast is not None:
+            log.debug(f"Weather forecast [{content_hash}] already saved, incrementing seen count.")
+            db_forecast = repo.mark_seen(db_forecast)
+        else:
+            forecast_model = domain_forecast.ForecastJSONModel(
+                **forecast_schema.model_dump(),
+                location_key=get_location_key(forecast_schema.forecast_json),
+                content_hash=content_hash,
+            )
+
+            try:
+                db_forecast = repo.create(forecast_model)
+            except sa_exc.IntegrityError as exc:
+                session.rollback()
+
+                ## Another worker saved the same forecast between the lookup & the insert
+                db_forecast = repo.get_by_content_hash(content_hash) if content_hash else None
+                if db_forecast is None:
+                    msg = f"({type(exc)}) Error saving weather forecast JSON. Details: {exc}"
+                    log.error(msg)
+
+                    raise exc
+
+                db_forecast = repo.mark_seen(db_forecast)
+            except Exception as exc:
+                msg = f"({type(exc)}) Error saving weather forecast JSON. Details: {exc}"
+                log.error(msg)
+
+                raise exc
 
         try:
-            db_forecast = repo.create(forecast_model)
+            forecast_out: domain_forecast.ForecastJSONOut = domain_forecast.ForecastJSONOut.model_validate(
+                db_forecast.__dict__
+            )
+
+            return forecast_out
         except Exception as exc:
-            msg = f"({type(exc)}) Error saving weather forecast JSON. Details: {exc}"
+            msg = f"({type(exc)}) Error converting JSON from database to ForecastJSONOut schema. Details: {exc}"
             log.error(msg)
 
             raise exc
 
-    try:
-        forecast_out: domain_forecast.ForecastJSONOut = domain_forecast.ForecastJSONOut.model_validate(
-            forecast_model.__dict__
-        )
 
-        return forecast_out
-    except Exception as exc:
-        msg = f"({type(exc)}) Error converting JSON from database to ForecastJSONOut schema. Details: {exc}"
-        log.error(msg)
+@metrics_utils.timed_stage("db")
+def save_forecasts(forecasts: list[dict], engine: sa.Engine | None = None, echo: bool = False) -> dict:
+    """Bulk save a batch of Forecasts (in JSON form) to the database.
+
+    Description:
+        Deduplicated by content hash like `save_forecast()`, but saves the whole batch in one transaction.
+
+    Params:
+        forecasts (list[dict]): Decoded weather forecast responses.
+        engine (Engine | None, optional): The database engine to use. If None, the default engine is used. Defaults to None.
+        echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+
+    Returns:
+        dict: A summary with `received`, `inserted` & `duplicates` keys.
 
-        raise exc
+    """
+    return bulk_save_raw_json(
+        model=domain_forecast.ForecastJSONModel,
+        json_col="forecast_json",
+        payloads=forecasts,
+        volatile_keys=FORECAST_VOLATILE_KEYS,
+        engine=engine,
+        echo=echo,
+    )
 
 
 def count_weather_forecast(engine: sa.Engine | None = None, echo: bool = False):
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import typing as t
 
+from core_utils import metrics_utils
 import db
 from depends import db_depends
 from domain.weatherapi import location as domain_location
@@ -17,6 +18,7 @@ __all__ = [
 ]
 
 
+@metrics_utils.timed_stage("db")
 def save_location(
     location: t.Union[domain_location.LocationIn, dict, str],
     engine: sa.Engine | None = None,
@@ -55,7 +57,7 @@ def save_location(
 
             raise exc
 
-    log.debug(f"Saving location to DB: {location}")
+    log.debug("Saving location to DB: {}", location)
 
     if engine is None:
         engine = db_depends.get_db_engine(echo=echo)
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from collections import Counter
+import datetime as dt
+import typing as t
+
+from core_utils import hash_utils, metrics_utils
+from depends import db_depends
+from domain.weatherapi.location import get_location_key
+from loguru import logger as log
+import sqlalchemy as sa
+import sqlalchemy.exc as sa_exc
+import sqlalchemy.orm as so
+
+__all__ = [
+    "bulk_save_raw_json",
+]
+
+
+def _insert_batch(
+    session: so.Session,
+    model: type,
+    json_col: str,
+    payloads_by_hash: dict[str, dict],
+    counts: Counter,
+) -> int:
+    """Insert new payloads & bump seen_count for ones already stored, in one transaction. Returns rows inserted."""
+    hash_col = model.content_hash
+
+    existing: set[str] = set(
+        session.execute(sa.select(hash_col).where(hash_col.in_(list(payloads_by_hash.keys())))).scalars().all()
+    )
+
+    new_rows = [
+        model(
+            **{json_col: payload},
+            location_key=get_location_key(payload),
+            content_hash=content_hash,
+            seen_count=counts[content_hash],
+        )
+        for content_hash, payload in payloads_by_hash.items()
+        if content_hash not in existing
+    ]
+    session.add_all(new_rows)
+
+    ## Group existing hashes by how many times they were seen in this batch, one UPDATE per group
+    seen_groups: dict[int, list[str]] = {}
+    for content_hash in existing:
+        seen_groups.setdefault(counts[content_hash], []).append(content_hash)
+
+    now = dt.datetime.now()
+    for seen, hashes in seen_groups.items():
+        session.execute(
+            sa.update(model)
+            .where(hash_col.in_(hashes))
+            .values(seen_count=model.seen_count + seen, last_seen_at=now)
+        )
+
+    session.commit()
+
+    return len(new_rows)
+
+
+@metrics_utils.timed_stage("db")
+def bulk_save_raw_json(
+    model: type,
+    json_col: str,
+    payloads: list[dict],
+    volatile_keys: t.Iterable[str] | None = None,
+    engine: sa.Engine | None = None,
+    echo: bool = False,
+) -> dict:
+    """Save a batch of raw JSON API responses in one transaction, deduplicated by content hash.
+
+    Description:
+        Responses are hashed the same way as the single-row save functions, so rows written
+        by either path deduplicate against each other. Responses already stored (or repeated
+        within the batch) increment the stored row's `seen_count` instead of adding a row.
+
+    Params:
+        model (type): The raw JSON model, i.e. `CurrentWeatherJSONModel`. Must have `location_key`, `content_hash`, `seen_count` & `last_seen_at` columns.
+        json_col (str): The name of the model's JSON column, i.e. `current_weather_json`.
+        payloads (list[dict]): The decoded API responses to save.
+        volatile_keys (Iterable[str] | None, optional): Dotted key paths to leave out of content hashes. Defaults to None.
+        engine (Engine | None, optional): The database engine to use. If None, the default engine is used. Defaults to None.
+        echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+
+    Returns:
+        dict: A summary with `received`, `inserted` & `duplicates` keys.
+
+    Raises:
+        Exception: If the batch cannot be saved, an `Exception` is raised.
+
+    """
+    summary: dict = {"received": len(payloads), "inserted": 0, "duplicates": 0}
+
+    if not payloads:
+        return summary
+
+    counts: Counter = Counter()
+    payloads_by_hash: dict[str, dict] = {}
+
+    for payload in payloads:
+        content_hash = hash_utils.get_content_hash(payload, exclude_keys=volatile_keys)
+
+        counts[content_hash] += 1
+        payloads_by_hash.setdefault(content_hash, payload)
+
+    if engine is None:
+        engine = db_depends.get_db_engine(echo=echo)
+
+    session_pool = db_depends.get_session_pool(engine=engine)
+
+    with session_pool() as session:
+        try:
+            summary["inserted"] = _insert_batch(session, model, json_col, payloads_by_hash, counts)
+        except sa_exc.IntegrityError:
+            session.rollback()
+
+            ## Another worker inserted one of the hashes between the lookup & the insert; the retry sees it as existing
+            log.debug(f"Content hash conflict saving [{len(payloads)}] '{model.__tablename__}' row(s), retrying")
+
+            try:
+                summary["inserted"] = _insert_batch(session, model, json_col, payloads_by_hash, counts)
+            except Exception as exc:
+                session.rollback()
+
+                msg = f"({type(exc)}) Error bulk saving '{model.__tablename__}' rows. Details: {exc}"
+                log.error(msg)
+
+                raise exc
+        except Exception as exc:
+            session.rollback()
+
+            msg = f"({type(exc)}) Error bulk saving '{model.__tablename__}' rows. Details: {exc}"
+            log.error(msg)
+
+            raise exc
+
+    summary["duplicates"] = summary["received"] - summary["inserted"]
+
+    return summary
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import typing as t
+
+from weather_client.apis.api_weatherapi.settings import (
+    location_name,
+    update_interval_default,
+    update_interval_max,
+    update_interval_min,
+)
+
+from core_utils import metrics_utils
+from depends import db_depends
+from domain.weatherapi import location as domain_location
+from loguru import logger as log
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+__all__ = [
+    "POLL_TYPES",
+    "register_location",
+    "set_location_active",
+    "list_registered_locations",
+    "get_location_shards",
+    "record_location_polls",
+]
+
+POLL_TYPES: list[str] = ["current", "forecast"]
+
+
+def register_location(
+    location: t.Union[domain_location.LocationRegistryIn, dict, str],
+    engine: sa.Engine | None = None,
+    echo: bool = False,
+) -> domain_location.LocationRegistryOut:
+    """Add a location to the polling registry, or update it if it is already registered.
+
+    Params:
+        location (LocationRegistryIn | dict | str): The location to register. A string is used as the WeatherAPI query.
+        engine (Engine | None, optional): The database engine to use. If None, the default engine is used. Defaults to None.
+        echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+
+    Returns:
+        LocationRegistryOut: The registered location.
+
+    Raises:
+        Exception: If the location cannot be registered, an `Exception` is raised.
+
+    """
+    if not location:
+        raise ValueError("Missing location to register")
+
+    if isinstance(location, str):
+        location = {"query": location}
+
+    if isinstance(location, dict):
+        try:
+            location: domain_location.LocationRegistryIn = domain_location.LocationRegistryIn.model_validate(location)
+        except Exception as exc:
+            msg = f"({type(exc)}) Error parsing location dict as LocationRegistryIn domain object. Details: {exc}"
+            log.error(msg)
+
+            raise exc
+
+    if engine is None:
+        engine = db_depends.get_db_engine(echo=echo)
+
+    session_pool = db_depends.get_session_pool(engine=engine)
+
+    with session_pool() as session:
+        repo = domain_location.LocationRegistryRepository(session=session)
+
+        try:
+            existing = repo.get_by_query(location.query)
+
+            if existing is not None:
+                db_location = repo.update(existing, location.model_dump())
+            else:
+                db_location = repo.create(domain_location.LocationRegistryModel(**location.model_dump()))
+        except Exception as exc:
+            session.rollback()
+
+            msg = f"({type(exc)}) Error registering location '{location.query}'. Details: {exc}"
+            log.error(msg)
+
+            raise exc
+
+        return domain_location.LocationRegistryOut.model_validate(db_location)
+
+
+def set_location_active(query: str, active: bool, engine: sa.Engine | None = None, echo: bool = False) -> bool:
+    """Enable or disable polling for a registered location.
+
+    Params:
+        query (str): The WeatherAPI query of the registered location.
+        active (bool): Whether the location should be polled.
+        engine (Engine | None, optional): The database engine to use. If None, the default engine is used. Defaults to None.
+        echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+
+    Returns:
+        bool: `True` if the location was found & updated, `False` if it is not registered.
+
+    """
+    if engine is None:
+        engine = db_depends.get_db_engine(echo=echo)
+
+    session_pool = db_depends.get_session_pool(engine=engine)
+
+    with session_pool() as session:
+        repo = domain_location.LocationRegistryRepository(session=session)
+
+        db_location = repo.get_by_query(query)
+        if db_location is None:
+            log.warning(f"Location '{query}' is not in the registry.")
+            return False
+
+        repo.update(db_location, {"active": active})
+
+        return True
+
+
+def list_registered_locations(
+    active_only: bool = True, engine: sa.Engine | None = None, echo: bool = False
+) -> list[domain_location.LocationRegistryOut]:
+    """Return the locations in the polling registry.
+
+    Params:
+        active_only (bool, optional): Only return locations that are being polled. Defaults to True.
+        engine (Engine | None, optional): The database engine to use. If None, the default engine is used. Defaults to None.
+        echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+
+    Returns:
+        list[LocationRegistryOut]: The registered locations, ordered by ID.
+
+    """
+    if engine is None:
+        engine = db_depends.get_db_engine(echo=echo)
+
+    session_pool = db_depends.get_session_pool(engine=engine)
+
+    with session_pool() as session:
+        stmt = sa.select(domain_location.LocationRegistryModel).order_by(domain_location.LocationRegistryModel.id)
+        if active_only:
+            stmt = stmt.where(domain_location.LocationRegistryModel.active.is_(True))
+
+        return [
+            domain_location.LocationRegistryOut.model_validate(loc) for loc in session.execute(stmt).scalars().all()
+        ]
+
+
+def get_location_shards(
+    shard_size: int,
+    poll: str = "current",
+    seed_default: bool = True,
+    due_before: int | None = None,
+    engine: sa.Engine | None = None,
+    echo: bool = False,
+) -> list[list[str]]:
+    """Split the active locations in the registry into shards of at most `shard_size` queries.
+
+    Description:
+        Locations are ordered by registry ID, so a location stays in the same shard between runs
+        unless locations before it are added or removed. If the registry is empty & `seed_default`
+        is True, the configured `WEATHERAPI_LOCATION_NAME` is registered first, so existing
+        single-location deployments keep polling without any setup.
+
+    Params:
+        shard_size (int): Maximum number of locations per shard.
+        poll (str, optional): One of `POLL_TYPES`. Defaults to "current".
+        seed_default (bool, optional): Register the configured location if the registry is empty. Defaults to True.
+        due_before (int | None, optional): Leave out locations WeatherAPI is not expected to update by this Unix
+            timestamp (see `record_location_polls()`). Defaults to None, which includes every active location.
+        engine (Engine | None, optional): The database engine to use. If None, the default engine is used. Defaults to None.
+        echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+
+    Returns:
+        list[list[str]]: Shards of WeatherAPI queries.
+
+    """
+    if shard_size < 1:
+        raise ValueError("shard_size must be at least 1")
+
+    if poll not in POLL_TYPES:
+        raise ValueError(f"Invalid poll type: '{poll}'. Must be one of {POLL_TYPES}")
+
+    if engine is None:
+        engine = db_depends.get_db_engine(echo=echo)
+
+    session_pool = db_depends.get_session_pool(engine=engine)
+
+    with session_pool() as session:
+        repo = domain_location.LocationRegistryRepository(session=session)
+
+        if seed_default and location_name and repo.count() == 0:
+            log.info(f"Location registry is empty, registering configured location '{location_name}'")
+            repo.create(domain_location.LocationRegistryModel(query=location_name))
+
+        queries: list[str] = repo.list_active_queries(poll=poll, due_before=due_before)
+
+        if due_before is not None:
+            deferred: int = len(repo.list_active_queries(poll=poll)) - len(queries)
+            if deferred:
+                log.info(f"Skipping [{deferred}] location(s) with no {poll} update expected yet")
+
+    return [queries[i : i + shard_size] for i in range(0, len(queries), shard_size)]
+
+
+@metrics_utils.timed_stage("db")
+def record_location_polls(
+    errors: dict[str, str | None],
+    responses: dict[str, dict] | None = None,
+    record_updates: bool = False,
+    engine: sa.Engine | None = None,
+    echo: bool = False,
+) -> None:
+    """Record the outcome of polling a shard of registered locations.
+
+    Description:
+        With `record_updates`, each response's `current.last_updated_epoch` is stored & used to
+        predict when WeatherAPI will next update the location, so `get_location_shards(due_before=...)`
+        can skip polls that would only return unchanged data.
+
+    Params:
+        errors (dict[str, str | None]): Maps each polled query to an error message, or None on success.
+        responses (dict[str, dict] | None, optional): Decoded responses by query. Used to link registry entries to
+            their `weatherapi_location` rows. Defaults to None.
+        record_updates (bool, optional): Record `last_updated_epoch` & predict the next update. Defaults to False.
+        engine (Engine | None, optional): The database engine to use. If None, the default engine is used. Defaults to None.
+        echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+
+    """
+    if not errors:
+        return
+
+    if engine is None:
+        engine = db_depends.get_db_engine(echo=echo)
+
+    session_pool = db_depends.get_session_pool(engine=engine)
+
+    with session_pool() as session:
+        location_ids: dict[str, int] = {}
+
+        for query, response in (responses or {}).items():
+            loc = response.get("location") or {}
+            if not loc.get("name"):
+                continue
+
+            location_id = session.execute(
+                sa.select(domain_location.WeatherAPILocationModel.id).where(
+                    domain_location.WeatherAPILocationModel.name == loc["name"],
+                    domain_location.WeatherAPILocationModel.country == loc.get("country"),
+                )
+            ).scalar_one_or_none()
+
+            if location_id is not None:
+                location_ids[query] = location_id
+
+        repo = domain_location.LocationRegistryRepository(session=session)
+
+        try:
+            repo.record_poll_results(results=errors, location_ids=location_ids)
+
+            if record_updates:
+                repo.record_update_epochs(
+                    epochs={
+                        query: response["current"]["last_updated_epoch"]
+                        for query, response in (responses or {}).items()
+                        if (response.get("current") or {}).get("last_updated_epoch") is not None
+                    },
+                    default_interval=update_interval_default,
+                    min_interval=update_interval_min,
+                    max_interval=update_interval_max,
+                )
+        except Exception as exc:
+            session.rollback()
+
+            msg = f"({type(exc)}) Error recording location poll results. Details: {exc}"
+            log.error(msg)
+
+            raise exc
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import typing as t
+
+import db
+from depends import db_depends
+from domain.weatherapi.weather import (
+    current as domain_current_weather,
+    forecast as domain_forecast,
+)
+from loguru import logger as log
+from settings.retention_settings import RETENTION_SETTINGS
+import sqlalchemy as sa
+
+__all__ = [
+    "get_retention_policies",
+    "apply_retention_policies",
+]
+
+
+def get_retention_policies(retention_settings=RETENTION_SETTINGS) -> list[db.RetentionPolicy]:
+    """Build retention policies for the raw WeatherAPI JSON tables from settings.
+
+    Params:
+        retention_settings (SettingsNamespace): The `[retention]` settings namespace.
+
+    Returns:
+        list[db.RetentionPolicy]: Policies for `weatherapi_current_json` & `weatherapi_forecast_json`.
+
+    """
+    return [
+        db.RetentionPolicy(
+            name="weatherapi_current_json",
+            model=domain_current_weather.CurrentWeatherJSONModel,
+            timestamp_col="created_at",
+            raw_days=retention_settings.get("RETENTION_CURRENT_JSON_RAW_DAYS", default=30),
+            downsample=retention_settings.get("RETENTION_CURRENT_JSON_DOWNSAMPLE", default="hourly") or None,
+            delete_days=retention_settings.get("RETENTION_CURRENT_JSON_DELETE_DAYS", default=365),
+            payload_col="current_weather_json",
+            partition_col="location_key",
+        ),
+        db.RetentionPolicy(
+            name="weatherapi_forecast_json",
+            model=domain_forecast.ForecastJSONModel,
+            timestamp_col="created_at",
+            raw_days=retention_settings.get("RETENTION_FORECAST_JSON_RAW_DAYS", default=7),
+            downsample=retention_settings.get("RETENTION_FORECAST_JSON_DOWNSAMPLE", default="daily") or None,
+            delete_days=retention_settings.get("RETENTION_FORECAST_JSON_DELETE_DAYS", default=180),
+            payload_col="forecast_json",
+            partition_col="location_key",
+        ),
+    ]
+
+
+def apply_retention_policies(
+    dry_run: bool | None = None,
+    batch_size: int | None = None,
+    policies: list[db.RetentionPolicy] | None = None,
+    engine: sa.Engine | None = None,
+    echo: bool = False,
+) -> list[db.RetentionReport]:
+    """Apply retention policies to the raw WeatherAPI JSON tables.
+
+    Params:
+        dry_run (bool | None, optional): Only report rows/bytes that would be reclaimed. Defaults to the `RETENTION_DRY_RUN` setting.
+        batch_size (int | None, optional): Rows per delete batch. Defaults to the `RETENTION_BATCH_SIZE` setting.
+        policies (list[RetentionPolicy] | None, optional): Policies to apply. Defaults to `get_retention_policies()`.
+        engine (Engine | None, optional): The database engine to use. If None, the default engine is used. Defaults to None.
+        echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+
+    Returns:
+        list[RetentionReport]: One report per policy.
+
+    Raises:
+        Exception: If a retention policy cannot be applied, an `Exception` is raised.
+
+    """
+    if dry_run is None:
+        dry_run = RETENTION_SETTINGS.get("RETENTION_DRY_RUN", default=True)
+    if batch_size is None:
+        batch_size = RETENTION_SETTINGS.get("RETENTION_BATCH_SIZE", default=500)
+    if policies is None:
+        policies = get_retention_policies()
+
+    if engine is None:
+        engine = db_depends.get_db_engine(echo=echo)
+
+    reports: list[db.RetentionReport] = []
+
+    for policy in policies:
+        try:
+            report = db.apply_retention_policy(policy=policy, engine=engine, dry_run=dry_run, batch_size=batch_size)
+        except Exception as exc:
+            msg = f"({type(exc)}) Error applying retention policy '{policy.name}'. Details: {exc}"
+            log.error(msg)
+
+            raise exc
+
+        reports.append(report)
+
+    return reports
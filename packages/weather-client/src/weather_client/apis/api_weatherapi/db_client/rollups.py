@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+import datetime as dt
+from functools import lru_cache
+import time
+import typing as t
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from core_utils import metrics_utils
+from depends import db_depends
+from domain.weatherapi import location as domain_location
+from domain.weatherapi.weather import (
+    current as domain_current_weather,
+    rollups as domain_rollups,
+)
+from loguru import logger as log
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+__all__ = [
+    "CURRENT_WEATHER_ROLLUP_WATERMARK",
+    "ROLLUP_GRANULARITIES",
+    "ROLLUP_AVERAGED_METRICS",
+    "update_current_weather_rollups",
+    "get_current_weather_rollups",
+]
+
+## Watermark name for the current weather rollup job
+CURRENT_WEATHER_ROLLUP_WATERMARK: str = "weatherapi_current_weather"
+ROLLUP_GRANULARITIES: list[str] = ["hourly", "daily"]
+## Metrics averaged per bucket, as a running `<metric>_sum` & a `<metric>_count` of non-null readings
+ROLLUP_AVERAGED_METRICS: list[str] = ["temp_c", "feelslike_c", "humidity", "pressure_mb", "wind_kph"]
+
+
+@lru_cache(maxsize=256)
+def _get_tz(tz_id: str | None) -> dt.tzinfo:
+    """Return a tzinfo for a location's tz_id, falling back to UTC."""
+    if not tz_id:
+        return dt.timezone.utc
+
+    try:
+        return ZoneInfo(tz_id)
+    except (ZoneInfoNotFoundError, ValueError):
+        log.warning(f"Unknown timezone '{tz_id}', rolling up daily buckets in UTC.")
+
+        return dt.timezone.utc
+
+
+def _hour_bucket(epoch: int) -> int:
+    return epoch - (epoch % 3600)
+
+
+def _day_bucket(epoch: int, tz_id: str | None) -> int:
+    tz = _get_tz(tz_id)
+    local = dt.datetime.fromtimestamp(epoch, tz=tz)
+    midnight = local.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    return int(midnight.timestamp())
+
+
+def _to_float(value: t.Any) -> float | None:
+    return None if value is None else float(value)
+
+
+def _min(current: float | None, value: float | None) -> float | None:
+    if value is None:
+        return current
+    return value if current is None else min(current, value)
+
+
+def _max(current: float | None, value: float | None) -> float | None:
+    if value is None:
+        return current
+    return value if current is None else max(current, value)
+
+
+def _add_to_average(bucket: t.Any, metric: str, value: float | None) -> None:
+    ## Missing values are left out of the average, instead of counting as 0
+    if value is None:
+        return
+
+    setattr(bucket, f"{metric}_sum", (getattr(bucket, f"{metric}_sum") or 0.0) + value)
+    setattr(bucket, f"{metric}_count", (getattr(bucket, f"{metric}_count") or 0) + 1)
+
+
+def _merge_reading(
+    bucket: domain_rollups.CurrentWeatherHourlyRollupModel | domain_rollups.CurrentWeatherDailyRollupModel,
+    reading: sa.Row,
+) -> None:
+    """Fold a single current weather reading into a rollup bucket, in place."""
+    epoch: int = int(reading.last_updated_epoch)
+    temp_c = _to_float(reading.temp_c)
+    wind_kph = _to_float(reading.wind_kph)
+    precip_mm = _to_float(reading.precip_mm)
+
+    bucket.reading_count = (bucket.reading_count or 0) + 1
+    bucket.first_reading_epoch = epoch if bucket.first_reading_epoch is None else min(bucket.first_reading_epoch, epoch)
+    bucket.last_reading_epoch = epoch if bucket.last_reading_epoch is None else max(bucket.last_reading_epoch, epoch)
+
+    for metric in ROLLUP_AVERAGED_METRICS:
+        _add_to_average(bucket, metric, _to_float(getattr(reading, metric)))
+
+    bucket.temp_c_min = _min(bucket.temp_c_min, temp_c)
+    bucket.temp_c_max = _max(bucket.temp_c_max, temp_c)
+    bucket.wind_kph_max = _max(bucket.wind_kph_max, wind_kph)
+    bucket.gust_kph_max = _max(bucket.gust_kph_max, _to_float(reading.gust_kph))
+    bucket.precip_mm_sum = (bucket.precip_mm_sum or 0.0) + (precip_mm or 0.0)
+    bucket.precip_mm_max = _max(bucket.precip_mm_max, precip_mm)
+    bucket.uv_max = _max(bucket.uv_max, _to_float(reading.uv))
+
+
+def _apply_readings(
+    session: so.Session,
+    repo: domain_rollups.CurrentWeatherHourlyRollupRepository | domain_rollups.CurrentWeatherDailyRollupRepository,
+    readings: list[sa.Row],
+    bucket_fn: t.Callable[[sa.Row], int],
+) -> int:
+    """Merge a batch of readings into the buckets managed by repo. Returns the number of buckets touched."""
+    grouped: dict[int, dict[int, list[sa.Row]]] = {}
+
+    for reading in readings:
+        grouped.setdefault(reading.location_id, {}).setdefault(bucket_fn(reading), []).append(reading)
+
+    touched: int = 0
+
+    for location_id, buckets in grouped.items():
+        ## One query per location loads every existing bucket in this batch
+        existing = repo.get_buckets(location_id=location_id, bucket_start_epochs=list(buckets.keys()))
+
+        for bucket_start_epoch, bucket_readings in buckets.items():
+            bucket = existing.get(bucket_start_epoch)
+
+            if bucket is None:
+                bucket = repo.model(location_id=location_id, bucket_start_epoch=bucket_start_epoch, reading_count=0)
+                session.add(bucket)
+
+            for reading in bucket_readings:
+                _merge_reading(bucket, reading)
+
+            touched += 1
+
+    return touched
+
+
+@metrics_utils.timed_stage("db")
+def update_current_weather_rollups(
+    engine: sa.Engine | None = None,
+    echo: bool = False,
+    batch_size: int = 1000,
+    max_batches: int | None = None,
+    settle_s: int = 300,
+) -> dict:
+    """Fold current weather readings added since the last run into the hourly & daily rollup tables.
+
+    Description:
+        Reads `weatherapi_current_weather` rows with an ID above the stored watermark, in batches
+        of `batch_size`. Each batch's bucket updates & the advanced watermark are committed in the
+        same transaction, so an interrupted run resumes where it left off without double counting.
+
+        The watermark row is locked (`SELECT ... FOR UPDATE`) for each batch, so concurrent runs
+        take turns instead of rolling up the same rows twice.
+
+        IDs are assigned when a row is inserted, not when it's committed, so a row can become visible
+        after a higher ID was already rolled up. Rows are only rolled up once they're `settle_s`
+        seconds old, & a batch stops at the first row that isn't, so the watermark never moves past
+        a row written by a transaction that's still open (unless it stays open for longer than
+        `settle_s`). Rows saved before `created_at` was tracked count as settled.
+
+    Params:
+        engine (Engine | None, optional): The database engine to use. If None, the default engine is used. Defaults to None.
+        echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+        batch_size (int, optional): Number of source rows to process per transaction. Defaults to 1000.
+        max_batches (int | None, optional): Stop after this many batches. Defaults to None (process all new rows).
+        settle_s (int, optional): Only roll up rows created at least this many seconds ago. Defaults to 300.
+
+    Returns:
+        dict: A summary with `readings`, `hourly_buckets`, `daily_buckets`, `batches`, `watermark` & `duration_s` keys.
+
+    Raises:
+        Exception: If there is an error updating the rollups, an `Exception` is raised.
+
+    """
+    if engine is None:
+        engine = db_depends.get_db_engine(echo=echo)
+
+    session_pool = db_depends.get_session_pool(engine=engine)
+
+    weather = domain_current_weather.CurrentWeatherModel
+    location = domain_location.WeatherAPILocationModel
+
+    summary: dict = {"readings": 0, "hourly_buckets": 0, "daily_buckets": 0, "batches": 0, "watermark": 0}
+    start = time.perf_counter()
+
+    with session_pool() as session:
+        watermark_repo = domain_rollups.RollupWatermarkRepository(session=session)
+        hourly_repo = domain_rollups.CurrentWeatherHourlyRollupRepository(session=session)
+        daily_repo = domain_rollups.CurrentWeatherDailyRollupRepository(session=session)
+
+        watermark = watermark_repo.get_or_create(name=CURRENT_WEATHER_ROLLUP_WATERMARK)
+        summary["watermark"] = watermark.last_id
+
+        settled = sa.or_(
+            weather.created_at.is_(None),
+            weather.created_at <= dt.datetime.now() - dt.timedelta(seconds=settle_s),
+        )
+
+        while max_batches is None or summary["batches"] < max_batches:
+            ## Committing a batch releases the lock; take it again before reading past the watermark
+            watermark = watermark_repo.get_or_create(name=CURRENT_WEATHER_ROLLUP_WATERMARK, for_update=True)
+
+            stmt = (
+                sa.select(
+                    weather.id,
+                    weather.location_id,
+                    weather.last_updated_epoch,
+                    weather.temp_c,
+                    weather.feelslike_c,
+                    weather.humidity,
+                    weather.pressure_mb,
+                    weather.wind_kph,
+                    weather.gust_kph,
+                    weather.precip_mm,
+                    weather.uv,
+                    location.tz_id,
+                    settled.label("settled"),
+                )
+                .outerjoin(location, location.id == weather.location_id)
+                .where(weather.id > watermark.last_id)
+                .order_by(weather.id)
+                .limit(batch_size)
+            )
+
+            readings: list[sa.Row] = session.execute(stmt).all()
+
+            ## Stop at the first unsettled row; the rows after it are rolled up by a later run
+            settled_count: int = next((i for i, r in enumerate(readings) if not r.settled), len(readings))
+            caught_up: bool = settled_count < len(readings) or len(readings) < batch_size
+            readings = readings[:settled_count]
+
+            if not readings:
+                session.rollback()
+                break
+
+            ## Readings without a location or timestamp can't be bucketed, but still advance the watermark
+            valid = [r for r in readings if r.location_id is not None and r.last_updated_epoch is not None]
+
+            try:
+                summary["hourly_buckets"] += _apply_readings(
+                    session, hourly_repo, valid, lambda r: _hour_bucket(int(r.last_updated_epoch))
+                )
+                summary["daily_buckets"] += _apply_readings(
+                    session, daily_repo, valid, lambda r: _day_bucket(int(r.last_updated_epoch), r.tz_id)
+                )
+
+                watermark.last_id = readings[-1].id
+                session.commit()
+            except Exception as exc:
+                session.rollback()
+
+                msg = f"({type(exc)}) Error updating current weather rollups after watermark [{watermark.last_id}]. Details: {exc}"
+                log.error(msg)
+
+                raise exc
+
+            summary["readings"] += len(valid)
+            summary["batches"] += 1
+            summary["watermark"] = watermark.last_id
+
+            if caught_up:
+                break
+
+    summary["duration_s"] = round(time.perf_counter() - start, 3)
+    log.info(
+        f"Rolled up [{summary['readings']}] current weather reading(s) into [{summary['hourly_buckets']}] hourly & [{summary['daily_buckets']}] daily bucket(s) in {summary['duration_s']}s. Watermark: {summary['watermark']}"
+    )
+
+    return summary
+
+
+def get_current_weather_rollups(
+    location_name: str,
+    granularity: str = "hourly",
+    start_epoch: int | None = None,
+    end_epoch: int | None = None,
+    limit: int | None = None,
+    engine: sa.Engine | None = None,
+    echo: bool = False,
+) -> list[domain_rollups.CurrentWeatherRollupOut]:
+    """Return hourly or daily current weather rollups for a location.
+
+    Params:
+        location_name (str): The name of the location, i.e. "London".
+        granularity (str, optional): One of `ROLLUP_GRANULARITIES`. Defaults to "hourly".
+        start_epoch (int | None, optional): Only return buckets starting at or after this Unix timestamp. Defaults to None.
+        end_epoch (int | None, optional): Only return buckets starting before this Unix timestamp. Defaults to None.
+        limit (int | None, optional): Return at most this many (most recent) buckets. Defaults to None.
+        engine (Engine | None, optional): The database engine to use. If None, the default engine is used. Defaults to None.
+        echo (bool, optional): Whether to echo SQL statements to the console. Defaults to False.
+
+    Returns:
+        list[CurrentWeatherRollupOut]: Rollup buckets, oldest first. Empty if the location is unknown.
+
+    """
+    if granularity not in ROLLUP_GRANULARITIES:
+        raise ValueError(f"Invalid rollup granularity: '{granularity}'. Must be one of {ROLLUP_GRANULARITIES}")
+
+    if engine is None:
+        engine = db_depends.get_db_engine(echo=echo)
+
+    session_pool = db_depends.get_session_pool(engine=engine)
+
+    with session_pool() as session:
+        db_location = (
+            session.query(domain_location.WeatherAPILocationModel)
+            .filter(domain_location.WeatherAPILocationModel.name == location_name)
+            .first()
+        )
+
+        if db_location is None:
+            log.warning(f"No location found in database with name '{location_name}'.")
+            return []
+
+        repo = (
+            domain_rollups.CurrentWeatherHourlyRollupRepository(session=session)
+            if granularity == "hourly"
+            else domain_rollups.CurrentWeatherDailyRollupRepository(session=session)
+        )
+
+        buckets = repo.list_for_location(
+            location_id=db_location.id, start_epoch=start_epoch, end_epoch=end_epoch, limit=limit
+        )
+
+        return [domain_rollups.CurrentWeatherRollupOut.model_validate(b) for b in buckets]
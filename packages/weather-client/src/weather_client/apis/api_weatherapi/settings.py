@@ -3,4 +3,16 @@ from __future__ import annotations
 from settings import WEATHERAPI_SETTINGS
 
 api_key: str = WEATHERAPI_SETTINGS.get("WEATHERAPI_API_KEY", default=None)
-location_name: str = WEATHERAPI_SETTINGS.get("WEATHERAPI_LOCATION_NAME", default=None)
\ No newline at end of file
+location_name: str = WEATHERAPI_SETTINGS.get("WEATHERAPI_LOCATION_NAME", default=None)
+## Registry polling: locations per Celery subtask & concurrent requests within a subtask
+poll_shard_size: int = WEATHERAPI_SETTINGS.get("WEATHERAPI_POLL_SHARD_SIZE", default=50)
+poll_concurrency: int = WEATHERAPI_SETTINGS.get("WEATHERAPI_POLL_CONCURRENCY", default=8)## Registry polling: seconds to spread each poll's locations over (0 = all at once), & random jitter per batch
+poll_spread_current: int = WEATHERAPI_SETTINGS.get("WEATHERAPI_POLL_SPREAD_CURRENT", default=600)
+poll_spread_forecast: int = WEATHERAPI_SETTINGS.get("WEATHERAPI_POLL_SPREAD_FORECAST", default=1200)
+poll_jitter: int = WEATHERAPI_SETTINGS.get("WEATHERAPI_POLL_JITTER", default=10)
+## Conditional polling: skip current weather polls for locations WeatherAPI isn't expected to have updated yet.
+#  Update intervals are learned per location within [min, max] seconds, starting from the default.
+conditional_polling: bool = WEATHERAPI_SETTINGS.get("WEATHERAPI_CONDITIONAL_POLLING", default=True)
+update_interval_default: int = WEATHERAPI_SETTINGS.get("WEATHERAPI_UPDATE_INTERVAL_DEFAULT", default=900)
+update_interval_min: int = WEATHERAPI_SETTINGS.get("WEATHERAPI_UPDATE_INTERVAL_MIN", default=300)
+update_interval_max: int = WEATHERAPI_SETTINGS.get("WEATHERAPI_UPDATE_INTERVAL_MAX", default=3600)
@@ -0,0 +1,132 @@
+"""Measure CLI startup time.
+
+Description:
+    Imports `weather_cli.main` in a fresh interpreter with `python -X importtime`, then reports the
+    total import time, the slowest top-level imports, and the wall-clock time of `python -m weather_cli --help`.
+
+    Any of the `--forbid` modules (heavy dependencies the sub-commands import when they run) imported at
+    startup are listed with the chain of imports that pulled them in.
+
+    The startup checks are enforced by `tests/cli/test_cli_startup.py`: no heavy imports always, & the
+    import time cap when WEATHERDATA_CLI_MAX_IMPORT_MS is set. Use this script to see what to fix when they fail.
+
+Usage:
+    python scripts/benchmarks/bench_cli_startup.py
+    python scripts/benchmarks/bench_cli_startup.py --runs 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+## Only imported by the commands that use them
+DEFAULT_FORBIDDEN: list[str] = ["alembic", "celery", "dramatiq", "fastapi", "hishel", "pandas", "sqlalchemy"]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Measure CLI startup time.")
+    parser.add_argument("--module", type=str, default="weather_cli.main", help="The CLI module to import.")
+    parser.add_argument("--forbid", type=str, nargs="*", default=DEFAULT_FORBIDDEN, help="Show how any of these modules are imported at startup.")
+    parser.add_argument("--runs", type=int, default=5, help="Runs to take the median of.")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest top-level imports to show.")
+
+    return parser.parse_args()
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int, int]]:
+    """Parse `-X importtime` output.
+
+    Returns:
+        (list[tuple[str, int, int, int]]): `(module, self_us, cumulative_us, depth)` for each import.
+
+    """
+    imports: list[tuple[str, int, int, int]] = []
+
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            ## The header line
+            continue
+
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+
+        imports.append((name.strip(), int(fields[0]), int(fields[1]), depth))
+
+    return imports
+
+
+def measure_imports(module: str) -> list[tuple[str, int, int, int]]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        print(proc.stderr[-2000:], file=sys.stderr)
+        raise RuntimeError(f"Importing '{module}' failed with exit code {proc.returncode}")
+
+    return parse_importtime(proc.stderr)
+
+
+def measure_help(module: str) -> float:
+    package = module.split(".", 1)[0]
+
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-m", package, "--help"], capture_output=True, check=True)
+
+    return time.perf_counter() - start
+
+
+def main(args: argparse.Namespace) -> int:
+    runs = [measure_imports(args.module) for _ in range(args.runs)]
+    ## Top-level imports' cumulative times add up to the whole import
+    totals_ms = [sum(cumulative for _, _, cumulative, depth in imports if depth == 0) / 1000 for imports in runs]
+    import_ms = statistics.median(totals_ms)
+
+    help_ms = statistics.median(measure_help(args.module) for _ in range(args.runs)) * 1000
+
+    imports = runs[-1]
+    imported = {name for name, _, _, _ in imports}
+    forbidden = sorted(name for name in args.forbid if name in imported)
+
+    print(f"\n{args.module}: {len(imported)} modules imported")
+    print(f"  import time (median of {args.runs}): {import_ms:.1f} ms")
+    print(f"  `python -m {args.module.split('.', 1)[0]} --help` (median): {help_ms:.1f} ms")
+
+    print(f"\n  {'slowest top-level imports':<40} {'cumulative ms':>14}")
+    top_level = sorted((i for i in imports if i[3] == 0), key=lambda i: i[2], reverse=True)
+    for name, _, cumulative, _ in top_level[: args.top]:
+        print(f"  {name:<40} {cumulative / 1000:>14.1f}")
+
+    if forbidden:
+        print(f"\nImported at startup: {', '.join(forbidden)}")
+        ## Show which top-level import pulled each one in
+        for name in forbidden:
+            print(f"  {name}: {' -> '.join(_import_chain(imports, name))}")
+
+    return 0
+
+
+def _import_chain(imports: list[tuple[str, int, int, int]], target: str) -> list[str]:
+    """Return the chain of imports that led to `target`, outermost first."""
+    index = next(i for i, entry in enumerate(imports) if entry[0] == target)
+    chain: list[str] = [target]
+    depth = imports[index][3]
+
+    ## importtime lists a module after the modules it imported, so its importers come later
+    for name, _, _, entry_depth in imports[index + 1 :]:
+        if entry_depth < depth:
+            chain.append(name)
+            depth = entry_depth
+
+    return list(reversed(chain))
+
+
+if __name__ == "__main__":
+    sys.exit(main(parse_args()))
@@ -0,0 +1,117 @@
+"""Benchmark serial vs. parallel loading with `core_utils.df_utils.load_pqs_to_df`.
+
+Description:
+    Generates a synthetic directory of weather-like export files (Parquet & CSV), then times
+    loading them serially (`max_workers=1`), with a thread pool, and (for CSV) a process pool.
+
+Usage:
+    python scripts/benchmarks/bench_load_pqs_to_df.py --num-files 1000 --rows-per-file 96
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import tempfile
+import time
+
+from core_utils import df_utils
+from loguru import logger as log
+import numpy as np
+import pandas as pd
+import settings
+import setup
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark parallel loading of Parquet/CSV export files.")
+    parser.add_argument("-n", "--num-files", type=int, default=500, help="Number of synthetic files to generate.")
+    parser.add_argument("-r", "--rows-per-file", type=int, default=96, help="Rows in each synthetic file.")
+    parser.add_argument("-w", "--max-workers", type=int, default=None, help="Max workers for the parallel runs.")
+    parser.add_argument("--data-dir", type=str, default=None, help="Write synthetic files here instead of a temp dir.")
+    parser.add_argument("--columns", nargs="*", default=None, help="Only load these columns.")
+
+    return parser.parse_args()
+
+
+def make_synthetic_df(rows: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+
+    return pd.DataFrame(
+        {
+            "last_updated_epoch": np.arange(rows, dtype="int64") * 900 + seed * rows * 900,
+            "location": rng.choice(["London", "Paris", "New York", "Tokyo"], size=rows),
+            "temp_c": rng.normal(12, 8, size=rows).round(1),
+            "humidity": rng.integers(0, 101, size=rows),
+            "wind_kph": rng.gamma(2, 6, size=rows).round(1),
+            "wind_dir": rng.choice(["N", "NE", "E", "SE", "S", "SW", "W", "NW"], size=rows),
+            "pressure_mb": rng.normal(1013, 8, size=rows).round(1),
+        }
+    )
+
+
+def generate_files(data_dir: Path, num_files: int, rows_per_file: int) -> None:
+    for filetype in ["parquet", "csv"]:
+        (data_dir / filetype).mkdir(parents=True, exist_ok=True)
+
+    for i in range(num_files):
+        df = make_synthetic_df(rows=rows_per_file, seed=i)
+
+        df.to_parquet(data_dir / "parquet" / f"export_{i:05d}.parquet", engine="pyarrow")
+        df.to_csv(data_dir / "csv" / f"export_{i:05d}.csv", index=False)
+
+
+def time_load(label: str, **kwargs) -> float:
+    start = time.perf_counter()
+    df = df_utils.load_pqs_to_df(concat=True, **kwargs)
+    elapsed = time.perf_counter() - start
+
+    log.info(f"{label:<28} {elapsed:8.3f}s  rows={len(df)} cols={len(df.columns)}")
+
+    return elapsed
+
+
+def run(data_dir: Path, args: argparse.Namespace) -> None:
+    log.info(f"Generating [{args.num_files}] Parquet & CSV file(s) in: {data_dir}")
+    generate_files(data_dir=data_dir, num_files=args.num_files, rows_per_file=args.rows_per_file)
+
+    pq_dir = str(data_dir / "parquet")
+    csv_dir = str(data_dir / "csv")
+
+    results: dict[str, float] = {
+        "parquet serial": time_load("parquet serial", search_dir=pq_dir, columns=args.columns, max_workers=1),
+        "parquet threads": time_load(
+            "parquet threads", search_dir=pq_dir, columns=args.columns, max_workers=args.max_workers
+        ),
+        "csv serial": time_load(
+            "csv serial", search_dir=csv_dir, filetype=".csv", columns=args.columns, max_workers=1
+        ),
+        "csv threads": time_load(
+            "csv threads", search_dir=csv_dir, filetype=".csv", columns=args.columns, max_workers=args.max_workers
+        ),
+        "csv processes": time_load(
+            "csv processes",
+            search_dir=csv_dir,
+            filetype=".csv",
+            columns=args.columns,
+            max_workers=args.max_workers,
+            use_processes=True,
+        ),
+    }
+
+    print("\nSpeedup vs. serial:")
+    print(f"  parquet threads: {results['parquet serial'] / results['parquet threads']:.2f}x")
+    print(f"  csv threads:     {results['csv serial'] / results['csv threads']:.2f}x")
+    print(f"  csv processes:   {results['csv serial'] / results['csv processes']:.2f}x")
+
+
+if __name__ == "__main__":
+    setup.setup_loguru_logging(log_level=settings.LOGGING_SETTINGS.get("LOG_LEVEL", default="INFO"), colorize=True)
+
+    args = parse_args()
+
+    if args.data_dir:
+        run(data_dir=Path(args.data_dir), args=args)
+    else:
+        with tempfile.TemporaryDirectory(prefix="bench_load_pqs_") as tmp:
+            run(data_dir=Path(tmp), args=args)
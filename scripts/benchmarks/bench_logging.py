@@ -0,0 +1,113 @@
+"""Benchmark ingest throughput under different logging configurations.
+
+Description:
+    Runs the replayed ingest pipelines from `bench_ingest_pipeline.py` with `setup.setup_loguru_logging()`
+    configured for:
+        - WARNING: the baseline, with almost nothing logged.
+        - INFO: every per-reading INFO line is formatted & written by the calling thread.
+        - INFO + enqueue: messages are formatted & written by loguru's background thread.
+        - INFO + enqueue + sampling: per-call-site sampling (`setup.LogSampler`) drops repeated lines first.
+
+    The console sink is redirected to a log file in a temporary directory, so the timings include
+    real writes without flooding the terminal. "drain s" is the time spent flushing queued messages
+    after the run, which enqueued sinks defer instead of paying inline.
+
+Usage:
+    python scripts/benchmarks/bench_logging.py --readings 500
+    python scripts/benchmarks/bench_logging.py --pipeline weatherapi_current --sample-rate 10
+"""
+
+from __future__ import annotations
+
+import argparse
+from contextlib import redirect_stderr
+from pathlib import Path
+import tempfile
+import time
+
+## Sibling script; importable because the script's directory is on sys.path when it's run
+from bench_ingest_pipeline import PIPELINES, ReplayTransport, bench_pipeline, replay_http
+import db
+from loguru import logger as log
+import setup
+import sqlalchemy as sa
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark ingest throughput under different logging configurations.")
+    parser.add_argument("-n", "--readings", type=int, default=200, help="Number of readings to ingest per pipeline & configuration.")
+    parser.add_argument("--db-uri", type=str, default=None, help="SQLAlchemy database URI. Defaults to a temporary SQLite file.")
+    parser.add_argument("--pipeline", type=str, choices=PIPELINES, default="weatherapi_current", help="The pipeline to run.")
+    parser.add_argument("--sample-rate", type=int, default=5, help="Messages kept per call site per interval when sampling.")
+
+    return parser.parse_args()
+
+
+def get_configs(sample_rate: int) -> list[dict]:
+    return [
+        {"name": "WARNING", "log_level": "WARNING", "enqueue": False, "sample_rate": 0},
+        {"name": "INFO", "log_level": "INFO", "enqueue": False, "sample_rate": 0},
+        {"name": "INFO + enqueue", "log_level": "INFO", "enqueue": True, "sample_rate": 0},
+        {"name": "INFO + enqueue + sampling", "log_level": "INFO", "enqueue": True, "sample_rate": sample_rate},
+    ]
+
+
+def bench_config(config: dict, pipeline: str, engine: sa.Engine, readings: int, log_file: Path) -> dict:
+    with open(log_file, "w", encoding="utf-8") as sink, redirect_stderr(sink):
+        setup.setup_loguru_logging(
+            log_level=config["log_level"],
+            log_fmt="detailed",
+            enqueue=config["enqueue"],
+            sample_rate=config["sample_rate"],
+        )
+
+        result = bench_pipeline(pipeline, engine=engine, readings=readings)
+
+        ## Removing the sinks waits for enqueued messages to be written
+        start = time.perf_counter()
+        log.remove()
+        drain = time.perf_counter() - start
+
+    with open(log_file, "r", encoding="utf-8") as f:
+        lines = sum(1 for _ in f)
+
+    return {**result, "config": config["name"], "drain_s": drain, "lines": lines}
+
+
+def run(engine: sa.Engine, args: argparse.Namespace, tmp: Path) -> None:
+    setup.setup_database(sqla_base=db.Base, engine=engine)
+
+    ## One transport for every run, so each reading is new to the database
+    transport = ReplayTransport()
+    results: list[dict] = []
+
+    with replay_http(transport):
+        ## Warm up imports, the connection pool & the database's tables
+        bench_config(get_configs(0)[0], args.pipeline, engine=engine, readings=min(args.readings, 20), log_file=tmp / "warmup.log")
+
+        for config in get_configs(args.sample_rate):
+            results.append(bench_config(config, args.pipeline, engine=engine, readings=args.readings, log_file=tmp / "bench.log"))
+
+    setup.setup_loguru_logging(log_level="INFO", colorize=True)
+
+    baseline = results[0]["readings_s"]
+
+    print(f"\n[{engine.dialect.name}] {args.pipeline}, {args.readings} reading(s) per configuration")
+    print(f"\n  {'logging':<26} {'readings/s':>11} {'vs WARNING':>11} {'total s':>9} {'drain s':>9} {'lines':>8}")
+    for r in results:
+        print(
+            f"  {r['config']:<26} {r['readings_s']:>11.1f} {r['readings_s'] / baseline if baseline else 0.0:>10.2f}x "
+            f"{r['total_s']:>9.2f} {r['drain_s']:>9.3f} {r['lines']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_logging_") as tmp:
+        if args.db_uri:
+            engine = db.get_engine(url=sa.make_url(args.db_uri), echo=False)
+        else:
+            engine = db.get_engine(url=sa.make_url(f"sqlite+pysqlite:///{Path(tmp) / 'bench.sqlite3'}"), echo=False)
+
+        run(engine=engine, args=args, tmp=Path(tmp))
@@ -0,0 +1,140 @@
+"""Compare Celery & Dramatiq throughput for short, I/O-bound tasks.
+
+Description:
+    Runs an in-process worker for each backend on an in-memory broker (Celery `memory://`,
+    Dramatiq `StubBroker`), enqueues `--tasks` messages whose body sleeps `--io-ms` to stand in
+    for a WeatherAPI request, and reports enqueue rate, end-to-end throughput & per-task overhead.
+    Both workers use a thread pool of `--concurrency` threads, matching how the poll tasks are run.
+    Broker network round trips are not included; the results compare each library's dispatch overhead.
+
+Usage:
+    python scripts/benchmarks/bench_task_backends.py --tasks 2000 --concurrency 16 --io-ms 20
+    python scripts/benchmarks/bench_task_backends.py --backend dramatiq --io-ms 0
+"""
+
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+
+from loguru import logger as log
+
+BACKENDS: list[str] = ["celery", "dramatiq"]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark Celery vs Dramatiq task throughput.")
+    parser.add_argument("-n", "--tasks", type=int, default=2000, help="Number of tasks to run per backend.")
+    parser.add_argument("-c", "--concurrency", type=int, default=16, help="Worker threads per backend.")
+    parser.add_argument("--io-ms", type=float, default=20, help="Milliseconds each task sleeps, simulating an HTTP request.")
+    parser.add_argument("--backend", type=str, choices=BACKENDS, default=None, help="Only benchmark one backend.")
+
+    return parser.parse_args()
+
+
+class Counter:
+    """Thread-safe completion counter that signals once `target` tasks have run."""
+
+    def __init__(self, target: int):
+        self.target = target
+        self.count = 0
+        self._lock = threading.Lock()
+        self.done = threading.Event()
+
+    def incr(self):
+        with self._lock:
+            self.count += 1
+            if self.count >= self.target:
+                self.done.set()
+
+
+def bench_celery(tasks: int, concurrency: int, io_ms: float) -> dict:
+    from celery import Celery
+    from celery.contrib.testing.worker import start_worker
+
+    counter = Counter(tasks)
+
+    app = Celery("bench_task_backends", broker="memory://", backend="cache+memory://")
+    app.conf.update(task_ignore_result=True, worker_prefetch_multiplier=1, task_acks_late=True)
+
+    @app.task(name="bench_poll")
+    def bench_poll(location: str):
+        time.sleep(io_ms / 1000)
+        counter.incr()
+
+    with start_worker(app, pool="threads", concurrency=concurrency, perform_ping_check=False, loglevel="WARNING"):
+        start = time.perf_counter()
+        for i in range(tasks):
+            bench_poll.delay(f"location-{i}")
+        enqueued = time.perf_counter() - start
+
+        counter.done.wait(timeout=max(60.0, tasks * io_ms / 1000))
+        elapsed = time.perf_counter() - start
+
+    return {"backend": "celery", "completed": counter.count, "enqueue_s": enqueued, "total_s": elapsed}
+
+
+def bench_dramatiq(tasks: int, concurrency: int, io_ms: float) -> dict:
+    import dramatiq
+    from dramatiq.brokers.stub import StubBroker
+
+    counter = Counter(tasks)
+    broker = StubBroker()
+
+    def bench_poll(location: str):
+        time.sleep(io_ms / 1000)
+        counter.incr()
+
+    actor = dramatiq.actor(bench_poll, broker=broker, actor_name="bench_poll", max_retries=0)
+
+    worker = dramatiq.Worker(broker, worker_threads=concurrency)
+    worker.start()
+    try:
+        start = time.perf_counter()
+        for i in range(tasks):
+            actor.send(f"location-{i}")
+        enqueued = time.perf_counter() - start
+
+        counter.done.wait(timeout=max(60.0, tasks * io_ms / 1000))
+        elapsed = time.perf_counter() - start
+    finally:
+        worker.stop()
+        broker.close()
+
+    return {"backend": "dramatiq", "completed": counter.count, "enqueue_s": enqueued, "total_s": elapsed}
+
+
+def report(result: dict, tasks: int, concurrency: int, io_ms: float):
+    ## Time the run would take with zero per-task overhead
+    ideal_s = tasks * io_ms / 1000 / concurrency
+    overhead_ms = (result["total_s"] - ideal_s) / max(result["completed"], 1) * concurrency * 1000
+
+    log.info(
+        f"[{result['backend']:>8}] completed {result['completed']}/{tasks} | "
+        f"enqueue: {tasks / result['enqueue_s']:,.0f} msg/s | "
+        f"throughput: {result['completed'] / result['total_s']:,.0f} task/s | "
+        f"total: {result['total_s']:.2f}s (ideal {ideal_s:.2f}s) | "
+        f"overhead: {overhead_ms:.2f} ms/task"
+    )
+
+
+def main(tasks: int, concurrency: int, io_ms: float, backend: str | None = None):
+    benchmarks = {"celery": bench_celery, "dramatiq": bench_dramatiq}
+
+    log.info(f"Running [{tasks}] task(s) per backend, {concurrency} worker thread(s), {io_ms}ms simulated I/O per task")
+
+    for name in [backend] if backend else BACKENDS:
+        try:
+            result = benchmarks[name](tasks=tasks, concurrency=concurrency, io_ms=io_ms)
+        except Exception as exc:
+            log.error(f"({type(exc)}) Error benchmarking {name}. Details: {exc}")
+            continue
+
+        report(result, tasks=tasks, concurrency=concurrency, io_ms=io_ms)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    main(tasks=args.tasks, concurrency=args.concurrency, io_ms=args.io_ms, backend=args.backend)
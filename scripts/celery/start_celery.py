@@ -2,6 +2,17 @@ from __future__ import annotations
 
 import argparse
 
+## gevent/eventlet worker pools must patch the standard library before anything else imports it
+from scheduling.celery_patch import patch_celery_worker_pool
+
+## Only read -m/--mode here, so '-m worker', '--mode worker' & '--mode=worker' all patch.
+#  parse_args() validates the full command line later.
+_mode_parser = argparse.ArgumentParser(add_help=False)
+_mode_parser.add_argument("-m", "--mode", type=str)
+
+if (_mode_parser.parse_known_args()[0].mode or "").lower() == "worker":
+    patch_celery_worker_pool()
+
 import db
 from celery import Celery
 from loguru import logger as log
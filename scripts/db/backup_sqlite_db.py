@@ -0,0 +1,135 @@
+"""Back up the app's SQLite database while it's in use.
+
+Description:
+    Copies the database with SQLite's online backup API in batches of `--pages` pages, so the app can keep
+    writing between batches, & logs the progress. The copy is consistent: if the database changes during
+    the backup, SQLite restarts it.
+
+    The backup can be compressed with zstd (`--compress zstd`) and/or uploaded to MinIO (`--minio-bucket`).
+    The backup API needs a database file to write to, so in those cases the copy is made in a temporary
+    directory next to the backup file & streamed from there.
+
+Usage:
+    python scripts/db/backup_sqlite_db.py
+    python scripts/db/backup_sqlite_db.py --source .db/db.sqlite3 --compress zstd --minio-bucket backups --minio-path sqlite/
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import logging
+from pathlib import Path
+import tempfile
+
+## Sibling script; importable because the script's directory is on sys.path when it's run
+from backup_streams import COMPRESSIONS, MinioTarget, get_compressed_filename, stream_file
+from db.utils import DEFAULT_BACKUP_PAGES, DEFAULT_BACKUP_SLEEP, backup_sqlite_db
+from settings import DB_SETTINGS
+
+log = logging.getLogger(__name__)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Back up the app's SQLite database while it's in use.")
+
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    parser.add_argument(
+        "--source",
+        default=DB_SETTINGS.get("DB_DATABASE", default=".db/db.sqlite3"),
+        help="SQLite database to back up. Defaults to the configured database.",
+    )
+    parser.add_argument("--backup-file", default=None, help="File to save backup to. Defaults to a timestamped file in backups/sqlite.")
+    parser.add_argument("--pages", type=int, default=DEFAULT_BACKUP_PAGES, help="Pages to copy per step. -1 copies the whole database in one step.")
+    parser.add_argument("--sleep", type=float, default=DEFAULT_BACKUP_SLEEP, help="Seconds to wait between steps, for writers to commit.")
+    parser.add_argument("--compress", choices=COMPRESSIONS, default="none", help="Compress the backup with zstd")
+    parser.add_argument("--compress-level", type=int, default=3, help="zstd compression level (1-19)")
+    parser.add_argument("--compress-threads", type=int, default=0, help="zstd threads. 0 uses one per CPU core.")
+    parser.add_argument("--minio-config", default="minio_conf.json", help="minio_ctl config file, for --minio-bucket")
+    parser.add_argument("--minio-bucket", default=None, help="Upload the backup to this MinIO bucket instead of keeping it locally")
+    parser.add_argument("--minio-path", default="", help="MinIO path (prefix) to upload the backup to")
+
+    return parser.parse_args()
+
+
+def get_default_backup_filename(source: str) -> str:
+    timestamp = dt.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+
+    return str(Path("backups/sqlite") / f"{timestamp}_sqlite_{Path(source).stem}_backup.sqlite3")
+
+
+class BackupProgress:
+    """Logs backup progress every `step_pct` percent, instead of after every batch of pages."""
+
+    def __init__(self, step_pct: int = 10):
+        self.step_pct: int = step_pct
+        self.next_pct: int = 0
+
+    def __call__(self, status: int, remaining: int, total: int) -> None:
+        if not total:
+            return
+
+        pct = (total - remaining) * 100 // total
+        if pct >= self.next_pct or remaining == 0:
+            log.info(f"Copied [{total - remaining}/{total}] page(s) ({pct}%)")
+            self.next_pct = pct - pct % self.step_pct + self.step_pct
+
+
+def run_backup(args: argparse.Namespace) -> str:
+    if not Path(args.source).exists():
+        raise FileNotFoundError(f"SQLite database not found at path '{args.source}'")
+
+    backup_file: str = get_compressed_filename(args.backup_file or get_default_backup_filename(args.source), args.compress)
+    Path(backup_file).parent.mkdir(parents=True, exist_ok=True)
+
+    minio: MinioTarget | None = None
+    if args.minio_bucket:
+        remote_path = args.minio_path.strip("/")
+        name = Path(backup_file).name
+        minio = MinioTarget(
+            config_file=args.minio_config,
+            bucket=args.minio_bucket,
+            remote_path=f"{remote_path}/{name}" if remote_path else name,
+        )
+
+    log.info(f"Backing up SQLite database '{args.source}' in steps of [{args.pages}] page(s)")
+
+    if args.compress == "none" and minio is None:
+        backup_sqlite_db(args.source, backup_file, pages=args.pages, sleep=args.sleep, progress=BackupProgress())
+
+        return backup_file
+
+    ## Next to the backup file, so a large database isn't copied into a small /tmp
+    with tempfile.TemporaryDirectory(prefix=".sqlite_backup_", dir=Path(backup_file).parent) as tmp:
+        snapshot = str(Path(tmp) / Path(args.source).name)
+        backup_sqlite_db(args.source, snapshot, pages=args.pages, sleep=args.sleep, progress=BackupProgress())
+
+        return stream_file(
+            snapshot,
+            backup_file=backup_file,
+            compress=args.compress,
+            compress_level=args.compress_level,
+            compress_threads=args.compress_threads,
+            minio=minio,
+        )
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    logging.basicConfig(
+        level="DEBUG" if args.debug else "INFO",
+        format=(
+            "%(asctime)s | [%(levelname)s] | %(name)s:%(lineno)s :: %(message)s"
+            if args.debug
+            else "%(asctime)s [%(levelname)s] :: %(message)s"
+        ),
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+    try:
+        destination = run_backup(args)
+        log.info(f"Backup saved to: {destination}")
+    except Exception as exc:
+        log.error(f"Error backing up SQLite database. Details: {exc}")
+        exit(1)
@@ -0,0 +1,326 @@
+"""Stream database dumps through zstd to a file or straight into MinIO.
+
+Description:
+    Shared by `dump_postgres_db.py`, `dump_mysql_db.py` & `backup_sqlite_db.py`. A dump command's output is
+    piped through the `zstd` CLI (multi-threaded) & written to the backup file, or uploaded to MinIO with a
+    multipart upload as it's produced, so a backup never needs an uncompressed copy or a temporary file.
+
+    MinIO uploads use `scripts/minio/minio_ctl.py` & its JSON config file (generate one with
+    `python scripts/minio/minio_ctl.py --generate-configs`).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+import logging
+from pathlib import Path
+import shutil
+import subprocess
+import sys
+import typing as t
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    "COMPRESSIONS",
+    "MinioTarget",
+    "check_zstd_installed",
+    "get_compressed_filename",
+    "build_zstd_command",
+    "get_minio_controller_from_config",
+    "stream_dump",
+    "stream_file",
+    "upload_backup_dir",
+]
+
+COMPRESSIONS: list[str] = ["none", "zstd"]
+
+
+@dataclass
+class MinioTarget:
+    """Where to upload a backup in MinIO.
+
+    Attributes:
+        config_file: Path to a minio_ctl JSON config file, with the endpoint & credentials
+        bucket: Bucket to upload to. Created if it doesn't exist.
+        remote_path: Object name (or prefix, for directory backups) to upload to
+
+    """
+
+    config_file: str = field(default="minio_conf.json")
+    bucket: str = field(default="")
+    remote_path: str = field(default="")
+
+
+def check_zstd_installed() -> bool:
+    """Verify zstd installation."""
+    if path := shutil.which("zstd"):
+        log.debug(f"zstd found at: {path}")
+        return True
+
+    log.error(
+        "zstd not found in PATH.\nInstallation instructions:\n"
+        "  Ubuntu/Debian: sudo apt install zstd\n"
+        "  CentOS/RHEL:   sudo yum install zstd\n"
+        "  macOS:         brew install zstd"
+    )
+
+    return False
+
+
+def get_compressed_filename(filename: str, compress: str) -> str:
+    """Add the compression's extension to a backup filename, i.e. `backup.sql` -> `backup.sql.zst`."""
+    if compress == "zstd" and not filename.endswith(".zst"):
+        return f"{filename}.zst"
+
+    return filename
+
+
+def build_zstd_command(level: int = 3, threads: int = 0) -> list[str]:
+    """Construct a zstd command that compresses stdin to stdout.
+
+    Params:
+        level (int): Compression level, 1 (fastest) to 19.
+        threads (int): Compression threads. 0 uses one per CPU core.
+
+    """
+    return ["zstd", f"-{level}", f"-T{threads}", "-q", "-c"]
+
+
+def _import_minio_ctl():
+    ## minio_ctl is a standalone script in scripts/minio, not a package
+    minio_dir = str(Path(__file__).resolve().parent.parent / "minio")
+    if minio_dir not in sys.path:
+        sys.path.insert(0, minio_dir)
+
+    import minio_ctl
+
+    return minio_ctl
+
+
+def get_minio_controller_from_config(config_file: str):
+    """Initialize a `minio_ctl.MinioController` from a minio_ctl JSON config file."""
+    if not Path(config_file).exists():
+        raise FileNotFoundError(
+            f"MinIO config file not found at path '{config_file}'. Generate one with: python scripts/minio/minio_ctl.py --generate-configs"
+        )
+
+    with open(config_file, "r") as f:
+        minio_config: dict = json.load(f)
+
+    minio_ctl = _import_minio_ctl()
+
+    return minio_ctl.get_minio_controller(
+        endpoint=minio_config.get("endpoint"),
+        access_key=minio_config.get("access_key"),
+        secret_key=minio_config.get("secret_key"),
+        secure=minio_config.get("secure", True),
+        cert_check=minio_config.get("cert_check", True),
+    )
+
+
+def _check_returncodes(procs: list[subprocess.Popen]) -> None:
+    for proc in procs:
+        returncode = proc.wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, proc.args)
+
+
+class _PipelineReader:
+    """Reads a pipeline's output & checks its exit codes at EOF, before the reader sees the end of the stream.
+
+    Description:
+        `put_object()` completes a multipart upload when `read()` returns EOF, & aborts it if `read()`
+        raises. Raising on a failed dump before returning EOF means a truncated backup is never
+        completed in MinIO.
+    """
+
+    def __init__(self, stream: t.IO[bytes], procs: list[subprocess.Popen]):
+        self.stream = stream
+        self.procs = procs
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.stream.read(size)
+        if not data:
+            _check_returncodes(self.procs)
+
+        return data
+
+
+def _kill(procs: list[subprocess.Popen]) -> None:
+    for proc in procs:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+
+def stream_dump(
+    dump_cmd: list[str],
+    env: dict[str, str] | None = None,
+    backup_file: str | None = None,
+    compress: str = "zstd",
+    compress_level: int = 3,
+    compress_threads: int = 0,
+    minio: MinioTarget | None = None,
+    stdin: t.IO[bytes] | None = None,
+) -> str:
+    """Run a dump command & stream its output, optionally through zstd, to a file or MinIO.
+
+    Description:
+        The dump & compressor run as a pipeline, like `pg_dump ... | zstd -T0 > backup.sql.zst`, so they
+        work in parallel & nothing is buffered on disk. When uploading to MinIO, the compressed stream
+        is sent in parts as it's read, & the pipeline's exit codes are checked before the upload is
+        completed. A partial backup file is deleted, & an incomplete upload aborted, if any step fails.
+
+    Params:
+        dump_cmd (list[str]): The dump command, writing the backup to stdout.
+        env (dict[str, str] | None): Environment for the dump command, i.e. with `PGPASSWORD`.
+        backup_file (str | None): File to write to, when not uploading to MinIO.
+        compress (str): One of `COMPRESSIONS`.
+        compress_level (int): zstd compression level.
+        compress_threads (int): zstd threads. 0 uses one per CPU core.
+        minio (MinioTarget | None): Upload to MinIO instead of writing `backup_file`.
+        stdin (IO[bytes] | None): Input for the dump command, i.e. an open file for `stream_file()`.
+
+    Returns:
+        (str): The backup file, or `<bucket>/<object>` for MinIO uploads.
+
+    Raises:
+        ValueError: If `compress` is not one of `COMPRESSIONS`, or there's no destination.
+        subprocess.CalledProcessError: If the dump or compressor exits with an error.
+
+    """
+    if compress not in COMPRESSIONS:
+        raise ValueError(f"Invalid compression: '{compress}'. Must be one of {COMPRESSIONS}")
+    if minio is None and not backup_file:
+        raise ValueError("A backup file or MinIO target is required")
+    if compress == "zstd" and not check_zstd_installed():
+        raise RuntimeError("zstd dependency not met")
+
+    ## Connect to MinIO before starting the dump, so bad credentials fail fast
+    controller = get_minio_controller_from_config(minio.config_file) if minio else None
+
+    out_file = None
+    if controller is None:
+        Path(backup_file).parent.mkdir(parents=True, exist_ok=True)
+        out_file = open(backup_file, "wb")
+
+    procs: list[subprocess.Popen] = []
+    uploaded: bool = False
+    try:
+        if compress == "zstd":
+            dump = subprocess.Popen(dump_cmd, stdin=stdin, stdout=subprocess.PIPE, env=env)
+            procs.append(dump)
+
+            zstd = subprocess.Popen(
+                build_zstd_command(level=compress_level, threads=compress_threads),
+                stdin=dump.stdout,
+                stdout=out_file or subprocess.PIPE,
+            )
+            procs.append(zstd)
+            ## Only zstd reads the dump's output; closing our copy lets the dump see a broken pipe if zstd dies
+            dump.stdout.close()
+        else:
+            procs.append(subprocess.Popen(dump_cmd, stdin=stdin, stdout=out_file or subprocess.PIPE, env=env))
+
+        if controller is not None:
+            log.info(f"Streaming backup to MinIO: {minio.bucket}/{minio.remote_path}")
+            controller.upload_stream(minio.bucket, minio.remote_path, _PipelineReader(procs[-1].stdout, procs))
+            uploaded = True
+            procs[-1].stdout.close()
+
+        _check_returncodes(procs)
+    except BaseException:
+        _kill(procs)
+
+        if uploaded:
+            ## Only reachable if interrupted after the upload completed; don't leave a backup that wasn't verified
+            controller.delete(minio.bucket, minio.remote_path)
+
+        if out_file is not None:
+            out_file.close()
+            Path(backup_file).unlink(missing_ok=True)
+
+        raise
+    finally:
+        if out_file is not None and not out_file.closed:
+            out_file.close()
+
+    return f"{minio.bucket}/{minio.remote_path}" if controller is not None else backup_file
+
+
+def stream_file(
+    source: str,
+    backup_file: str | None = None,
+    compress: str = "zstd",
+    compress_level: int = 3,
+    compress_threads: int = 0,
+    minio: MinioTarget | None = None,
+) -> str:
+    """Compress an existing file to another file or MinIO, without an intermediate copy.
+
+    Params:
+        source (str): The file to compress or upload.
+        backup_file (str | None): File to write to, when not uploading to MinIO.
+        compress (str): One of `COMPRESSIONS`.
+        compress_level (int): zstd compression level.
+        compress_threads (int): zstd threads. 0 uses one per CPU core.
+        minio (MinioTarget | None): Upload to MinIO instead of writing `backup_file`.
+
+    Returns:
+        (str): The backup file, or `<bucket>/<object>` for MinIO uploads.
+
+    """
+    if compress not in COMPRESSIONS:
+        raise ValueError(f"Invalid compression: '{compress}'. Must be one of {COMPRESSIONS}")
+
+    if compress == "none":
+        if minio is None:
+            Path(backup_file).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(source, backup_file)
+
+            return backup_file
+
+        controller = get_minio_controller_from_config(minio.config_file)
+        with open(source, "rb") as f:
+            controller.upload_stream(minio.bucket, minio.remote_path, f)
+
+        return f"{minio.bucket}/{minio.remote_path}"
+
+    if not check_zstd_installed():
+        raise RuntimeError("zstd dependency not met")
+
+    ## zstd is the whole pipeline, reading the file from stdin
+    with open(source, "rb") as f:
+        return stream_dump(
+            build_zstd_command(level=compress_level, threads=compress_threads),
+            backup_file=backup_file,
+            compress="none",
+            minio=minio,
+            stdin=f,
+        )
+
+
+def upload_backup_dir(backup_dir: str, minio: MinioTarget) -> str:
+    """Upload a directory-format backup to MinIO, under `<remote_path>/<directory name>`.
+
+    Returns:
+        (str): The uploaded prefix, `<bucket>/<remote_path>/<directory name>`.
+
+    """
+    controller = get_minio_controller_from_config(minio.config_file)
+
+    name = Path(backup_dir).name
+    prefix = f"{minio.remote_path}/{name}" if minio.remote_path else name
+
+    ## Upload the directory's entries under the prefix ourselves, so the layout
+    #  doesn't depend on how the controller names a directory it's given
+    entries = sorted(str(entry) for entry in Path(backup_dir).iterdir())
+    if not entries:
+        raise FileNotFoundError(f"Backup directory '{backup_dir}' is empty")
+
+    log.info(f"Uploading backup directory '{backup_dir}' to MinIO: {minio.bucket}/{prefix}")
+    controller.upload(minio.bucket, entries, prefix)
+
+    return f"{minio.bucket}/{prefix}"
@@ -4,6 +4,7 @@ from __future__ import annotations
 # requires-python = ">=3.12"
 # dependencies = [
 #     "pymysql",
+#     "minio",
 # ]
 # ///
 
@@ -12,11 +13,16 @@ from __future__ import annotations
 Description:
     Wraps the `mysqldump` command to dump a MySQL database to a SQL file. Includes a CLI, run with `--help` to see usage.
 
+    InnoDB tables are dumped from a consistent snapshot (`--single-transaction`), without locking out writers.
+    The dump can be streamed through zstd (`--compress zstd`) & uploaded straight to MinIO (`--minio-bucket`)
+    without a temporary file.
+
 Usage:
     python dump_mysql_db.py --db-host <host> --db-port <port> --db-username <username> --db-password <password> --db-database <database> --backup-file <file>
 
 Example:
     python dump_mysql_db.py --db-host localhost --db-port 3306 --db-username root --db-password password --db-database my_database --backup-file backup.sql
+    python dump_mysql_db.py --db-database my_database --compress zstd --minio-bucket backups --minio-path mysql/
 
 """
 
@@ -33,6 +39,9 @@ import typing as t
 
 import pymysql
 
+## Sibling script; importable because the script's directory is on sys.path when it's run
+from backup_streams import COMPRESSIONS, MinioTarget, get_compressed_filename, stream_dump
+
 log = logging.getLogger(__name__)
 
 
@@ -41,6 +50,7 @@ __all__ = [
     "check_mysqldump_installed",
     "get_default_backup_filename",
     "DbSettings",
+    "BackupSettings",
     "DatabaseBackupController",
 ]
 
@@ -52,6 +62,7 @@ DB_SETTINGS = {
     "password": os.environ.get("DB_PASSWORD", None),
     "database": os.environ.get("DB_DATABASE", None),
     "backup_file": os.environ.get("BACKUP_FILE", "backup.sql"),
+    "backup_compress": os.environ.get("BACKUP_COMPRESS", "none"),
 }
 
 
@@ -75,6 +86,21 @@ def parse_args():
     parser.add_argument("--db-password", default=None, help="Database password")
     parser.add_argument("--db-database", default=None, help="Database name")
     parser.add_argument("--backup-file", default=None, help="File to save backup to")
+    parser.add_argument(
+        "--compress",
+        choices=COMPRESSIONS,
+        default=DB_SETTINGS["backup_compress"],
+        help="Stream the dump through zstd",
+    )
+    parser.add_argument("--compress-level", type=int, default=3, help="zstd compression level (1-19)")
+    parser.add_argument("--compress-threads", type=int, default=0, help="zstd threads. 0 uses one per CPU core.")
+    parser.add_argument(
+        "--minio-config",
+        default="minio_conf.json",
+        help="minio_ctl config file, for --minio-bucket",
+    )
+    parser.add_argument("--minio-bucket", default=None, help="Upload the backup to this MinIO bucket instead of keeping it locally")
+    parser.add_argument("--minio-path", default="", help="MinIO path (prefix) to upload the backup to")
 
     args = parser.parse_args()
 
@@ -154,6 +180,28 @@ class DbSettings:
     backup_file: str = field(default="backup.sql")
 
 
+@dataclass
+class BackupSettings:
+    """Compression & upload settings.
+
+    Attributes:
+        compress: One of COMPRESSIONS
+        compress_level: zstd compression level
+        compress_threads: zstd threads. 0 uses one per CPU core.
+        minio_config: minio_ctl config file
+        minio_bucket: MinIO bucket to upload to. The backup is kept locally if empty.
+        minio_path: MinIO path (prefix) to upload to
+
+    """
+
+    compress: str = field(default="none")
+    compress_level: int = field(default=3)
+    compress_threads: int = field(default=0)
+    minio_config: str = field(default="minio_conf.json")
+    minio_bucket: str = field(default="")
+    minio_path: str = field(default="")
+
+
 class DatabaseBackupController:
     """Controller class for MySQL database backup operations.
 
@@ -161,6 +209,7 @@ class DatabaseBackupController:
         args: argparse.Namespace
         logger: logging.Logger
         db_settings: DbSettings
+        backup_settings: BackupSettings
         _connection: pymysql.Connection
 
     """
@@ -169,11 +218,13 @@ class DatabaseBackupController:
         self,
         args: t.Optional[argparse.Namespace] = None,
         db_settings: t.Optional[t.Union[dict, DbSettings]] = None,
+        backup_settings: t.Optional[BackupSettings] = None,
     ):
         self.args = args
         self.logger = logging.getLogger(self.__class__.__name__)
 
         self.db_settings = self._init_db_settings(db_settings)
+        self.backup_settings = backup_settings or BackupSettings()
         self._validate_settings()
 
         self._connection = None
@@ -282,14 +333,39 @@ class DatabaseBackupController:
             self.logger.error(f"Connection failed: {e}")
             raise
 
-    def _build_mysqldump_command(self) -> str:
-        """Construct the mysqldump command."""
-        return (
-            f"mysqldump -h {self.db_settings.host} "
-            f"-P {self.db_settings.port} "
-            f"-u {self.db_settings.username} "
-            f"-p'{self.db_settings.password}' "
-            f"{self.db_settings.database} > {self.db_settings.backup_file}"
+    def _build_mysqldump_command(self) -> list[str]:
+        """Construct the mysqldump command.
+
+        Description:
+            The dump is written to stdout, to be streamed to the backup file or MinIO. The password is
+            passed in the `MYSQL_PWD` environment variable, so it isn't visible in the process list.
+        """
+        return [
+            "mysqldump",
+            "-h",
+            str(self.db_settings.host),
+            "-P",
+            str(self.db_settings.port),
+            "-u",
+            self.db_settings.username,
+            ## Dump InnoDB tables from a snapshot instead of locking them, & stream rows instead of buffering tables
+            "--single-transaction",
+            "--quick",
+            self.db_settings.database,
+        ]
+
+    def _get_minio_target(self, backup_file: str) -> MinioTarget | None:
+        """Return where to upload the backup in MinIO, or None to keep it locally."""
+        if not self.backup_settings.minio_bucket:
+            return None
+
+        name = Path(backup_file).name
+        remote_path = self.backup_settings.minio_path.strip("/")
+
+        return MinioTarget(
+            config_file=self.backup_settings.minio_config,
+            bucket=self.backup_settings.minio_bucket,
+            remote_path=f"{remote_path}/{name}" if remote_path else name,
         )
 
     def _ensure_backup_dir(self) -> None:
@@ -326,9 +402,23 @@ class DatabaseBackupController:
             raise
 
         ## Do backup
-        self.logger.info(f"Starting backup to {self.db_settings.backup_file}")
+        backup = self.backup_settings
+        backup_file = get_compressed_filename(self.db_settings.backup_file, backup.compress)
+        self.logger.info(f"Starting backup to {backup_file}")
         try:
-            subprocess.run(cmd, shell=True, check=True)
+            env = os.environ.copy()
+            env["MYSQL_PWD"] = self.db_settings.password
+
+            destination = stream_dump(
+                cmd,
+                env=env,
+                backup_file=backup_file,
+                compress=backup.compress,
+                compress_level=backup.compress_level,
+                compress_threads=backup.compress_threads,
+                minio=self._get_minio_target(backup_file),
+            )
+            self.logger.info(f"Backup saved to: {destination}")
         except subprocess.CalledProcessError as e:
             self.logger.error(f"Backup failed with exit code {e.returncode}: {e}")
             raise
@@ -347,6 +437,7 @@ def main(
     db_password: str,
     db_database: str,
     backup_file: str,
+    backup_settings: BackupSettings | None = None,
 ):
     db_settings: dict = {
         "host": db_host,
@@ -357,7 +448,9 @@ def main(
         "backup_file": backup_file,
     }
 
-    controller = DatabaseBackupController(db_settings=db_settings)
+    controller = DatabaseBackupController(
+        db_settings=db_settings, backup_settings=backup_settings
+    )
     try:
         controller.run_backup()
         log.info("Backup completed successfully")
@@ -435,7 +528,7 @@ def start_cli():
     if host is None:
         host = args.db_host
     if port is None:
-        host = args.db_port
+        port = args.db_port
     if username is None:
         username = args.db_username
     if password is None:
@@ -448,6 +541,15 @@ def start_cli():
     else:
         backup_file = get_default_backup_filename(db_name=database)
 
+    backup_settings = BackupSettings(
+        compress=args.compress,
+        compress_level=args.compress_level,
+        compress_threads=args.compress_threads,
+        minio_config=args.minio_config,
+        minio_bucket=args.minio_bucket or "",
+        minio_path=args.minio_path,
+    )
+
     main(
         db_host=host,
         db_port=port,
@@ -455,6 +557,7 @@ def start_cli():
         db_password=password,
         db_database=database,
         backup_file=backup_file,
+        backup_settings=backup_settings,
     )
 
 
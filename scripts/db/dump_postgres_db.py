@@ -2,11 +2,34 @@
 # requires-python = ">=3.12"
 # dependencies = [
 #     "psycopg2-binary",
+#     "minio",
 # ]
 # ///
 
 from __future__ import annotations
 
+"""Dump a PostgreSQL database.
+
+Description:
+    Wraps the `pg_dump` command. Includes a CLI, run with `--help` to see usage.
+
+    Formats:
+        - plain: A SQL file. Restore with `psql`.
+        - custom: A compressed archive. Restore with `pg_restore`, optionally in parallel (`pg_restore -j`).
+        - directory: One file per table, dumped in parallel with `--jobs`. Restore with `pg_restore -j`.
+
+    Plain & custom dumps can be streamed through zstd (`--compress zstd`) & uploaded straight to MinIO
+    (`--minio-bucket`) without a temporary file. Directory dumps are compressed by pg_dump (zstd needs
+    pg_dump 16+) & uploaded once the dump finishes.
+
+Usage:
+    python dump_postgres_db.py --db-host <host> --db-username <username> --db-password <password> --db-database <database>
+
+Example:
+    python dump_postgres_db.py --db-database weatherdata --format directory --jobs 4 --compress zstd
+    python dump_postgres_db.py --db-database weatherdata --format custom --compress zstd --minio-bucket backups --minio-path postgres/
+"""
+
 import argparse
 import datetime as dt
 import json
@@ -19,6 +42,15 @@ from pathlib import Path
 import psycopg2
 import shutil
 
+## Sibling script; importable because the script's directory is on sys.path when it's run
+from backup_streams import (
+    COMPRESSIONS,
+    MinioTarget,
+    get_compressed_filename,
+    stream_dump,
+    upload_backup_dir,
+)
+
 
 log = logging.getLogger(__name__)
 
@@ -27,9 +59,14 @@ __all__ = [
     "check_pg_dump_installed",
     "get_default_backup_filename",
     "DbSettings",
+    "BackupSettings",
     "DatabaseBackupController",
 ]
 
+BACKUP_FORMATS: list[str] = ["plain", "custom", "directory"]
+## pg_dump opens one connection per job, plus one
+DEFAULT_JOBS: int = min(4, os.cpu_count() or 1)
+
 ## Load database settings from environment variables.
 DB_SETTINGS = {
     "host": os.environ.get("DB_HOST", "localhost"),
@@ -38,6 +75,8 @@ DB_SETTINGS = {
     "password": os.environ.get("DB_PASSWORD", None),
     "database": os.environ.get("DB_DATABASE", None),
     "backup_file": os.environ.get("BACKUP_FILE", "backup.sql"),
+    "backup_format": os.environ.get("BACKUP_FORMAT", "plain"),
+    "backup_compress": os.environ.get("BACKUP_COMPRESS", "none"),
 }
 
 
@@ -62,7 +101,41 @@ def parse_args():
     parser.add_argument("--db-username", default="postgres", help="Database username")
     parser.add_argument("--db-password", default=None, help="Database password")
     parser.add_argument("--db-database", default=None, help="Database name")
-    parser.add_argument("--backup-file", default=None, help="File to save backup to")
+    parser.add_argument("--backup-file", default=None, help="File (or directory, for --format directory) to save backup to")
+    parser.add_argument(
+        "-F",
+        "--format",
+        choices=BACKUP_FORMATS,
+        default=DB_SETTINGS["backup_format"],
+        help="Dump format. 'directory' dumps tables in parallel with --jobs.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help="Tables to dump in parallel, for --format directory",
+    )
+    parser.add_argument(
+        "--compress",
+        choices=COMPRESSIONS,
+        default=DB_SETTINGS["backup_compress"],
+        help="Compress with zstd. 'none' leaves custom & directory dumps to pg_dump's gzip compression.",
+    )
+    parser.add_argument("--compress-level", type=int, default=3, help="zstd compression level (1-19)")
+    parser.add_argument(
+        "--compress-threads",
+        type=int,
+        default=0,
+        help="zstd threads for plain & custom dumps. 0 uses one per CPU core.",
+    )
+    parser.add_argument(
+        "--minio-config",
+        default="minio_conf.json",
+        help="minio_ctl config file, for --minio-bucket",
+    )
+    parser.add_argument("--minio-bucket", default=None, help="Upload the backup to this MinIO bucket instead of keeping it locally")
+    parser.add_argument("--minio-path", default="", help="MinIO path (prefix) to upload the backup to")
 
     args = parser.parse_args()
 
@@ -98,22 +171,36 @@ sudo apt install -y postgresql-client-16
     return False
 
 
-def get_default_backup_filename(db_name: str | None = None):
+def get_default_backup_filename(db_name: str | None = None, backup_format: str = "plain"):
     """Generate a default backup filename based on the current date and time.
 
     Params:
         db_name (str): The optional name of the database to include in the filename.
+        backup_format (str): The pg_dump format. Directory dumps have no extension.
 
     Returns:
         str: The default backup filename
 
     """
     timestamp = dt.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    extension = {"plain": ".sql", "custom": ".dump", "directory": ""}.get(backup_format, ".sql")
 
     if db_name:
-        return f"{timestamp}_postgres_{db_name}_backup.sql"
+        return f"{timestamp}_postgres_{db_name}_backup{extension}"
+
+    return f"{timestamp}_backup{extension}"
+
+
+def get_pg_dump_major_version() -> int:
+    """Return the major version of the installed pg_dump, i.e. 16."""
+    output = subprocess.run(
+        ["pg_dump", "--version"], capture_output=True, text=True, check=True
+    ).stdout
 
-    return f"{timestamp}_backup.sql"
+    ## i.e. "pg_dump (PostgreSQL) 16.2 (Debian 16.2-1.pgdg120+2)"
+    version = output.split(")", 1)[-1].strip().split()[0]
+
+    return int(version.split(".")[0])
 
 
 def save_default_config_json():
@@ -152,6 +239,32 @@ class DbSettings:
     backup_file: str = field(default="backup.sql")
 
 
+@dataclass
+class BackupSettings:
+    """Dump format, compression & upload settings.
+
+    Attributes:
+        format: pg_dump format, one of BACKUP_FORMATS
+        jobs: Tables to dump in parallel, for the directory format
+        compress: One of COMPRESSIONS
+        compress_level: zstd compression level
+        compress_threads: zstd threads for streamed dumps. 0 uses one per CPU core.
+        minio_config: minio_ctl config file
+        minio_bucket: MinIO bucket to upload to. The backup is kept locally if empty.
+        minio_path: MinIO path (prefix) to upload to
+
+    """
+
+    format: str = field(default="plain")
+    jobs: int = field(default=DEFAULT_JOBS)
+    compress: str = field(default="none")
+    compress_level: int = field(default=3)
+    compress_threads: int = field(default=0)
+    minio_config: str = field(default="minio_conf.json")
+    minio_bucket: str = field(default="")
+    minio_path: str = field(default="")
+
+
 class DatabaseBackupController:
     """Controller class for PostgreSQL database backup operations.
 
@@ -159,6 +272,7 @@ class DatabaseBackupController:
         args: argparse.Namespace
         logger: logging.Logger
         db_settings: DbSettings
+        backup_settings: BackupSettings
         _connection: psycopg2.extensions.connection
 
     """
@@ -167,11 +281,13 @@ class DatabaseBackupController:
         self,
         args: t.Optional[argparse.Namespace] = None,
         db_settings: t.Optional[t.Union[dict, DbSettings]] = None,
+        backup_settings: t.Optional[BackupSettings] = None,
     ):
         self.args = args
         self.logger = logging.getLogger(self.__class__.__name__)
 
         self.db_settings = self._init_db_settings(db_settings)
+        self.backup_settings = backup_settings or BackupSettings()
         self._validate_settings()
 
         self._connection = None
@@ -261,6 +377,15 @@ class DatabaseBackupController:
             if not getattr(self.db_settings, field, None):
                 raise ValueError(f"Missing required database setting: {field}")
 
+        if self.backup_settings.format not in BACKUP_FORMATS:
+            raise ValueError(
+                f"Invalid backup format: '{self.backup_settings.format}'. Must be one of {BACKUP_FORMATS}"
+            )
+        if self.backup_settings.compress not in COMPRESSIONS:
+            raise ValueError(
+                f"Invalid compression: '{self.backup_settings.compress}'. Must be one of {COMPRESSIONS}"
+            )
+
     def _test_connection(self) -> None:
         """Test database connection."""
         self.logger.info(
@@ -280,14 +405,59 @@ class DatabaseBackupController:
             self.logger.error(f"Connection failed: {e}")
             raise
 
-    def _build_pg_dump_command(self) -> str:
-        """Construct the pg_dump command."""
-        return (
-            f"pg_dump -h {self.db_settings.host} "
-            f"-p {self.db_settings.port} "
-            f"-U {self.db_settings.username} "
-            f"-d {self.db_settings.database} "
-            f"-f {self.db_settings.backup_file}"
+    def _build_pg_dump_command(self) -> list[str]:
+        """Construct the pg_dump command.
+
+        Description:
+            Plain & custom dumps are written to stdout, to be streamed to the backup file or MinIO.
+            Directory dumps are written to the backup file (a directory) by pg_dump's parallel workers.
+        """
+        backup = self.backup_settings
+        cmd = [
+            "pg_dump",
+            "-h",
+            str(self.db_settings.host),
+            "-p",
+            str(self.db_settings.port),
+            "-U",
+            self.db_settings.username,
+            "-d",
+            self.db_settings.database,
+            f"--format={backup.format}",
+        ]
+
+        match backup.format:
+            case "directory":
+                cmd += [f"--jobs={backup.jobs}", f"--file={self.db_settings.backup_file}"]
+
+                if backup.compress == "zstd":
+                    if get_pg_dump_major_version() < 16:
+                        raise RuntimeError(
+                            "zstd compression of directory dumps requires pg_dump 16 or newer. Use '--compress none' for gzip."
+                        )
+                    cmd.append(f"--compress=zstd:{backup.compress_level}")
+            case "custom":
+                if backup.compress == "zstd":
+                    ## zstd compresses the stream instead of pg_dump's single-threaded gzip
+                    cmd.append("--compress=0")
+
+        return cmd
+
+    def _get_minio_target(self, backup_path: str) -> MinioTarget | None:
+        """Return where to upload the backup in MinIO, or None to keep it locally."""
+        if not self.backup_settings.minio_bucket:
+            return None
+
+        name = Path(backup_path).name
+        remote_path = self.backup_settings.minio_path.strip("/")
+
+        return MinioTarget(
+            config_file=self.backup_settings.minio_config,
+            bucket=self.backup_settings.minio_bucket,
+            ## Directories are uploaded under `<prefix>/<directory name>`; streams need the full object name
+            remote_path=remote_path
+            if self.backup_settings.format == "directory"
+            else (f"{remote_path}/{name}" if remote_path else name),
         )
 
     def _ensure_backup_dir(self) -> None:
@@ -324,12 +494,38 @@ class DatabaseBackupController:
             raise
 
         ## Do backup
-        self.logger.info(f"Starting backup to {self.db_settings.backup_file}")
+        backup = self.backup_settings
+        self.logger.info(
+            f"Starting {backup.format} backup to {self.db_settings.backup_file}"
+            + (f" with [{backup.jobs}] job(s)" if backup.format == "directory" else "")
+        )
         try:
             # Need to set PGPASSWORD environment variable for password authentication
             env = os.environ.copy()
             env["PGPASSWORD"] = self.db_settings.password
-            subprocess.run(cmd, shell=True, check=True, env=env)
+
+            if backup.format == "directory":
+                subprocess.run(cmd, check=True, env=env)
+
+                minio = self._get_minio_target(self.db_settings.backup_file)
+                if minio:
+                    destination = upload_backup_dir(self.db_settings.backup_file, minio)
+                else:
+                    destination = self.db_settings.backup_file
+            else:
+                backup_file = get_compressed_filename(self.db_settings.backup_file, backup.compress)
+
+                destination = stream_dump(
+                    cmd,
+                    env=env,
+                    backup_file=backup_file,
+                    compress=backup.compress,
+                    compress_level=backup.compress_level,
+                    compress_threads=backup.compress_threads,
+                    minio=self._get_minio_target(backup_file),
+                )
+
+            self.logger.info(f"Backup saved to: {destination}")
         except subprocess.CalledProcessError as e:
             self.logger.error(f"Backup failed with exit code {e.returncode}: {e}")
             raise
@@ -348,6 +544,7 @@ def main(
     db_password: str,
     db_database: str,
     backup_file: str,
+    backup_settings: BackupSettings | None = None,
 ):
     db_settings: dict = {
         "host": db_host,
@@ -358,7 +555,9 @@ def main(
         "backup_file": backup_file,
     }
 
-    controller = DatabaseBackupController(db_settings=db_settings)
+    controller = DatabaseBackupController(
+        db_settings=db_settings, backup_settings=backup_settings
+    )
     try:
         controller.run_backup()
         log.info("Backup completed successfully")
@@ -436,7 +635,7 @@ def start_cli():
     if host is None:
         host = args.db_host
     if port is None:
-        host = args.db_port
+        port = args.db_port
     if username is None:
         username = args.db_username
     if password is None:
@@ -447,7 +646,20 @@ def start_cli():
     if args.backup_file is not None:
         backup_file = args.backup_file
     else:
-        backup_file = get_default_backup_filename(db_name=database)
+        backup_file = get_default_backup_filename(
+            db_name=database, backup_format=args.format
+        )
+
+    backup_settings = BackupSettings(
+        format=args.format,
+        jobs=args.jobs,
+        compress=args.compress,
+        compress_level=args.compress_level,
+        compress_threads=args.compress_threads,
+        minio_config=args.minio_config,
+        minio_bucket=args.minio_bucket or "",
+        minio_path=args.minio_path,
+    )
 
     main(
         db_host=host,
@@ -456,6 +668,7 @@ def start_cli():
         db_password=password,
         db_database=database,
         backup_file=backup_file,
+        backup_settings=backup_settings,
     )
 
 
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import argparse
+
+import depends
+from loguru import logger as log
+import settings
+import setup
+from weather_client.apis import api_weatherapi
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Report (or apply) retention policies for the raw WeatherAPI JSON tables."
+    )
+    parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="Delete rows. Without this flag, only report rows/bytes that would be reclaimed."
+    )
+    parser.add_argument(
+        "-b", "--batch-size",
+        type=int,
+        default=None,
+        help="Rows per delete batch. Defaults to the RETENTION_BATCH_SIZE setting."
+    )
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    setup.setup_loguru_logging(log_level=settings.LOGGING_SETTINGS.get("LOG_LEVEL", default="INFO"), colorize=True)
+    setup.setup_database()
+
+    args = parse_args()
+
+    try:
+        reports = api_weatherapi.db_client.apply_retention_policies(
+            dry_run=not args.apply, batch_size=args.batch_size, engine=depends.get_db_engine()
+        )
+    except Exception as exc:
+        msg = f"({type(exc)}) Error applying retention policies. Details: {exc}"
+        log.error(msg)
+
+        raise exc
+
+    print(f"\nRetention report{' (dry run)' if not args.apply else ''}:")
+    print(f"  {'table':<28} {'rows':>10} {'downsampled':>12} {'deleted':>10} {'reclaimed':>12}")
+    for report in reports:
+        print(
+            f"  {report.table:<28} {report.rows_total:>10} {report.downsampled_rows:>12} {report.deleted_rows:>10} {report.bytes_reclaimed / 1024 / 1024:>9.2f} MiB"
+        )
@@ -1,12 +1,13 @@
 #!/bin/bash
 set -euo pipefail
 
-## Defaults: all overlays ON except db_init
+## Defaults: all overlays ON except db_init & minio
 INCLUDE_CELERY=true
 INCLUDE_ALEMBIC=true
 INCLUDE_DB=true
 INCLUDE_MESSAGING=true
 INCLUDE_DB_INIT=false
+INCLUDE_MINIO=false
 DEBUG=false
 
 if ! command -v docker &>/dev/null; then
@@ -20,7 +21,7 @@ if ! command -v docker compose &>/dev/null; then
 fi
 
 function print_help {
-    echo "Usage: $0 [--no-celery] [--no-alembic] [--no-db] [--no-messaging] [--db-init]"
+    echo "Usage: $0 [--no-celery] [--no-alembic] [--no-db] [--no-messaging] [--db-init] [--minio]"
     echo ""
     echo "Options:"
     echo "  --no-celery       Disable Celery"
@@ -28,6 +29,7 @@ function print_help {
     echo "  --no-db           Disable Postgres"
     echo "  --no-messaging    Disable RabbitMQ"
     echo "  --db-init         Include DB init script"
+    echo "  --minio           Include MinIO (for testing minio_ctl & backup uploads)"
     echo ""
 }
 
@@ -48,12 +50,16 @@ while [[ $# -gt 0 ]]; do
         --db-init)
             INCLUDE_DB_INIT=true
             ;;
+        --minio)
+            INCLUDE_MINIO=true
+            ;;
         --debug)
             DEBUG=true
             ;;
         -h|--help)
             print_help
             exit 0
+            ;;
         *)
             echo "Unknown option: $1"
             print_help
@@ -82,6 +88,9 @@ fi
 if $INCLUDE_DB_INIT; then
     COMPOSE_ARGS+=" -f containers/overlays/db_init.yml"
 fi
+if $INCLUDE_MINIO; then
+    COMPOSE_ARGS+=" -f containers/overlays/minio.yml"
+fi
 
 export COMPOSE_PROJECT_NAME="${COMPOSE_PROJECT_NAME:-devstack}"
 
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import argparse
+
+from loguru import logger as log
+from scheduling.dramatiq_scheduler import start_dramatiq
+from settings import DRAMATIQ_SETTINGS, LOGGING_SETTINGS
+import setup
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Start the Dramatiq task backend in worker or scheduler mode."
+    )
+    parser.add_argument(
+        "-m", "--mode",
+        type=str,
+        choices=start_dramatiq.DRAMATIQ_MODES,
+        required=True,
+        help="Mode to run the application: 'worker' or 'scheduler'."
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    setup.setup_loguru_logging(log_level=LOGGING_SETTINGS.get("LOG_LEVEL", default="INFO"), log_fmt="basic", colorize=True)
+    try:
+        setup.setup_database()
+    except Exception as exc:
+        msg = f"({type(exc)}) Error setting up database. Details: {exc}"
+        log.error(msg)
+
+        raise
+
+    args = parse_args()
+
+    log.debug(f"Dramatiq settings: {DRAMATIQ_SETTINGS.as_dict()}")
+
+    try:
+        exit(start_dramatiq.start(mode=args.mode.lower()) or 0)
+    except Exception as exc:
+        msg = f"({type(exc)}) Error running Dramatiq in '{args.mode}' mode. Details: {exc}"
+        log.error(msg)
+
+        raise exc
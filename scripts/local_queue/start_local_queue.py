@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import argparse
+
+from loguru import logger as log
+from scheduling.local_queue import start_local_queue
+from settings import LOGGING_SETTINGS
+import setup
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Start the SQLite task queue worker, beat, or both (no broker needed)."
+    )
+    parser.add_argument(
+        "-m", "--mode",
+        type=str,
+        choices=start_local_queue.LOCAL_QUEUE_MODES,
+        default="all",
+        help="Mode to run: 'worker', 'beat' or 'all' (both in one process)."
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    setup.setup_loguru_logging(log_level=LOGGING_SETTINGS.get("LOG_LEVEL", default="INFO"), log_fmt="basic", colorize=True)
+    try:
+        setup.setup_database()
+    except Exception as exc:
+        msg = f"({type(exc)}) Error setting up database. Details: {exc}"
+        log.error(msg)
+
+        raise
+
+    args = parse_args()
+
+    try:
+        start_local_queue.start(mode=args.mode.lower())
+    except Exception as exc:
+        msg = f"({type(exc)}) Error running local queue in '{args.mode}' mode. Details: {exc}"
+        log.error(msg)
+
+        raise exc
@@ -7,23 +7,47 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 import glob
+import hashlib
+import json
 import logging
 import os
 from pathlib import Path
+import threading
+import time
 import typing as t
 
+import certifi
 from minio import Minio
+import urllib3
 from minio.commonconfig import CopySource
 from minio.deleteobjects import DeleteObject
 from minio.error import S3Error
 
 log = logging.getLogger(__name__)
 
+## Parts of a streamed upload are buffered in memory before they're sent; MinIO's minimum is 5 MiB
+DEFAULT_STREAM_PART_SIZE: int = 16 * 1024 * 1024
+## Files transferred at once by upload() & download()
+DEFAULT_WORKERS: int = 8
+## Files larger than the part size are uploaded in parts, `DEFAULT_PART_WORKERS` at a time
+DEFAULT_PART_SIZE: int = 16 * 1024 * 1024
+DEFAULT_PART_WORKERS: int = 3
+## How to decide a file is already transferred: "etag" compares sizes, then content hashes,
+#  "size" only compares sizes, "none" always transfers
+SKIP_MODES: list[str] = ["etag", "size", "none"]
+## Seconds between progress log messages
+PROGRESS_INTERVAL: float = 5.0
+
 __all__ = [
     "MinioController",
     "get_minio_controller",
+    "compute_etag",
+    "TransferJournal",
+    "TransferReport",
+    "TransferError",
     "MinioSettings",
     "MinioJob",
     "MinioUploadJob",
@@ -242,6 +266,37 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("-t", "--minio-path", type=str, help="Minio path to upload to")
     parser.add_argument("--secure", action="store_true", help="Use secure connection")
     parser.add_argument("--check-cert", action="store_true", help="Check certificate")
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Files to upload/download at once. Default: {DEFAULT_WORKERS}",
+    )
+    parser.add_argument(
+        "--part-size",
+        type=int,
+        default=DEFAULT_PART_SIZE // 1024 // 1024,
+        help=f"Multipart upload part size in MiB (min 5). Default: {DEFAULT_PART_SIZE // 1024 // 1024}",
+    )
+    parser.add_argument(
+        "--part-workers",
+        type=int,
+        default=DEFAULT_PART_WORKERS,
+        help=f"Parts of one file to upload at once. Default: {DEFAULT_PART_WORKERS}",
+    )
+    parser.add_argument(
+        "--skip-unchanged",
+        choices=SKIP_MODES,
+        default="etag",
+        help="Skip files that are already transferred, comparing size & ETag ('etag'), size only ('size'), or never ('none')",
+    )
+    parser.add_argument(
+        "--state-file",
+        type=str,
+        default=None,
+        help="Journal of finished transfers. Run an interrupted job again with the same file to resume it without re-hashing finished files.",
+    )
 
     args = parser.parse_args()
 
@@ -305,6 +360,11 @@ def get_minio_controller(
     secret_key: str,
     secure: bool = True,
     cert_check: bool = True,
+    workers: int = DEFAULT_WORKERS,
+    part_size: int = DEFAULT_PART_SIZE,
+    part_workers: int = DEFAULT_PART_WORKERS,
+    skip_unchanged: str = "etag",
+    state_file: str | None = None,
 ) -> "MinioController":
     """Initializes a MinioController instance.
 
@@ -314,6 +374,11 @@ def get_minio_controller(
         secret_key (str): Minio secret key.
         secure (bool): Whether to use SSL.
         cert_check (bool): Whether to verify SSL certificates.
+        workers (int): Files to upload/download at once.
+        part_size (int): Multipart upload part size in bytes.
+        part_workers (int): Parts of one file to upload at once.
+        skip_unchanged (str): One of SKIP_MODES.
+        state_file (str | None): Journal of finished transfers, to resume interrupted jobs.
 
     Returns:
         (MinioController): A controller class to handle minio operations.
@@ -327,6 +392,11 @@ def get_minio_controller(
             secret_key=secret_key,
             secure=secure,
             cert_check=cert_check,
+            workers=workers,
+            part_size=part_size,
+            part_workers=part_workers,
+            skip_unchanged=skip_unchanged,
+            state_file=state_file,
         )
 
         return controller
@@ -352,18 +422,225 @@ def normalize_path(path: t.Union[str, Path]) -> str:
     return str(Path(path).as_posix()).replace("\\", "/")
 
 
+def compute_etag(path: t.Union[str, Path], part_size: int) -> str:
+    """Computes the S3 ETag a file would have if it was uploaded in parts of `part_size` bytes.
+
+    Description:
+        Objects uploaded in one request have the MD5 of their content as their ETag. Multipart uploads
+        have the MD5 of their parts' MD5s, followed by "-<number of parts>".
+
+    Params:
+        path (str | Path): Local file.
+        part_size (int): Part size used for the upload.
+
+    Returns:
+        (str): The ETag, without quotes.
+
+    """
+    size = os.path.getsize(path)
+    chunk_size = 1024 * 1024
+
+    with open(path, "rb") as f:
+        if size <= part_size:
+            md5 = hashlib.md5()
+            while chunk := f.read(chunk_size):
+                md5.update(chunk)
+
+            return md5.hexdigest()
+
+        part_digests: list[bytes] = []
+        for _ in range(-(-size // part_size)):
+            md5 = hashlib.md5()
+            remaining = part_size
+            while remaining and (chunk := f.read(min(chunk_size, remaining))):
+                md5.update(chunk)
+                remaining -= len(chunk)
+            part_digests.append(md5.digest())
+
+    return f"{hashlib.md5(b''.join(part_digests)).hexdigest()}-{len(part_digests)}"
+
+
+class TransferJournal:
+    """Records finished transfers in a JSON lines file, so an interrupted upload/download can be resumed.
+
+    Description:
+        Run the same job with the same state file again, and files that were transferred & haven't changed
+        since are skipped without hashing them. Entries are appended as each file finishes, so the journal
+        survives the process being killed.
+
+    Attributes:
+        path (Path): The journal file.
+
+    """
+
+    def __init__(self, path: t.Union[str, Path]):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] = {}
+
+        if self.path.exists():
+            with open(self.path, "r") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        ## A line cut off when the process was killed
+                        continue
+                    self._entries[entry["key"]] = entry
+
+    @staticmethod
+    def key(direction: str, bucket: str, remote_path: str, local_path: str) -> str:
+        return f"{direction}:{bucket}/{remote_path}:{Path(local_path).absolute().as_posix()}"
+
+    def get(self, key: str) -> dict | None:
+        return self._entries.get(key)
+
+    def record(self, key: str, size: int, mtime_ns: int, etag: str) -> None:
+        entry = {"key": key, "size": size, "mtime_ns": mtime_ns, "etag": etag}
+
+        with self._lock:
+            self._entries[key] = entry
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+
+
+@dataclass
+class TransferReport:
+    """Results of an upload or download.
+
+    Attributes:
+        direction: "upload" or "download"
+        files: Files in the transfer
+        transferred: Files uploaded/downloaded
+        skipped: Files skipped because they were unchanged
+        failed: Files that failed
+        bytes_transferred: Bytes uploaded/downloaded
+        bytes_skipped: Size of the skipped files
+        elapsed: Seconds the transfer took
+        errors: An error message for each failed file
+
+    """
+
+    direction: str
+    files: int = 0
+    transferred: int = 0
+    skipped: int = 0
+    failed: int = 0
+    bytes_transferred: int = 0
+    bytes_skipped: int = 0
+    elapsed: float = 0.0
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def throughput(self) -> float:
+        """MiB transferred per second."""
+        return self.bytes_transferred / 1024 / 1024 / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.direction.capitalize()}: [{self.transferred}] transferred, [{self.skipped}] unchanged, "
+            f"[{self.failed}] failed of [{self.files}] file(s). "
+            f"{self.bytes_transferred / 1024 / 1024:.1f} MiB in {self.elapsed:.1f}s ({self.throughput:.1f} MiB/s)"
+        )
+
+
+class TransferError(Exception):
+    """Raised when files failed to upload/download. The other files were still transferred.
+
+    Attributes:
+        report (TransferReport): The transfer's results.
+
+    """
+
+    def __init__(self, report: TransferReport):
+        self.report = report
+        super().__init__(f"[{report.failed}] of [{report.files}] file(s) failed to {report.direction}")
+
+
+class _TransferProgress:
+    """Thread-safe counters for a TransferReport, logging progress every `PROGRESS_INTERVAL` seconds."""
+
+    def __init__(self, report: TransferReport, logger: logging.Logger):
+        self.report = report
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self._last_log = self._start
+
+    def done(self, transferred: bool, size: int) -> None:
+        with self._lock:
+            if transferred:
+                self.report.transferred += 1
+                self.report.bytes_transferred += size
+            else:
+                self.report.skipped += 1
+                self.report.bytes_skipped += size
+            self._maybe_log()
+
+    def failed(self, message: str) -> None:
+        with self._lock:
+            self.report.failed += 1
+            self.report.errors.append(message)
+            self._maybe_log()
+
+    def finish(self) -> TransferReport:
+        self.report.elapsed = time.perf_counter() - self._start
+
+        return self.report
+
+    def _maybe_log(self) -> None:
+        now = time.perf_counter()
+        if now - self._last_log < PROGRESS_INTERVAL:
+            return
+
+        self._last_log = now
+        r = self.report
+        elapsed = now - self._start
+        self.logger.info(
+            f"{r.direction.capitalize()} progress: [{r.transferred + r.skipped + r.failed}/{r.files}] file(s), "
+            f"{r.bytes_transferred / 1024 / 1024:.1f} MiB ({r.bytes_transferred / 1024 / 1024 / elapsed:.1f} MiB/s)"
+        )
+
+
+def _get_http_client(pool_size: int, cert_check: bool) -> urllib3.PoolManager:
+    """Returns a urllib3 pool with a connection for every transfer thread.
+
+    Description:
+        Same settings as the minio client's default pool, which only keeps 10 connections & discards the
+        rest when more threads use it.
+    """
+    timeout = 5 * 60
+
+    return urllib3.PoolManager(
+        timeout=urllib3.util.Timeout(connect=timeout, read=timeout),
+        maxsize=pool_size,
+        cert_reqs="CERT_REQUIRED" if cert_check else "CERT_NONE",
+        ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+        retries=urllib3.Retry(total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+    )
+
+
 class MinioController:
     """Handler class for Minio operations.
 
     Attributes:
         logger (logging.Logger): Logger for this class.
         client (minio.Minio): Minio client.
+        workers (int): Files uploaded/downloaded at once.
+        part_size (int): Files larger than this are uploaded in parts of this size.
+        part_workers (int): Parts of one file uploaded at once.
+        skip_unchanged (str): One of SKIP_MODES. How to decide a file is already transferred.
+        journal (TransferJournal | None): Finished transfers, to resume an interrupted job.
 
     Methods:
         _upload (self, bucket: str, local_path: str, remote_path: str): Handles uploading a single file or directory recursively.
         _download (self, bucket: str, remote_path: str, local_path: str): Handles downloading a single file or directory recursively.
+        _transfer (self, direction: str, transfers: list, transfer_file: t.Callable): Runs file transfers on a thread pool.
         _delete (self, bucket: str, remote_path: str): Deletes a single file or all files in a directory (prefix).
         upload (self, bucket: str, local_path: str, remote_path: str): Uploads a single file or directory recursively.
+        upload_stream (self, bucket: str, remote_path: str, stream: t.BinaryIO): Uploads a stream of unknown length as a multipart upload.
         download (self, bucket: str, remote_paths: t.Union[str, t.List[str]], local_path: str): Downloads one or more files/directories from MinIO.
         delete (self, bucket: str, remote_path: str): Deletes a single file or all files in a directory (prefix).
         exists (self, bucket: str, remote_path: str): Checks if a file or directory exists in MinIO.
@@ -384,10 +661,26 @@ class MinioController:
         secret_key: str,
         secure: bool,
         cert_check: bool,
+        workers: int = DEFAULT_WORKERS,
+        part_size: int = DEFAULT_PART_SIZE,
+        part_workers: int = DEFAULT_PART_WORKERS,
+        skip_unchanged: str = "etag",
+        state_file: str | None = None,
     ) -> None:
         ## Initialize class logger
         self.logger = log.getChild("MinioController")
 
+        if skip_unchanged not in SKIP_MODES:
+            raise ValueError(f"Invalid skip mode: '{skip_unchanged}'. Must be one of {SKIP_MODES}")
+        if part_size < 5 * 1024 * 1024:
+            raise ValueError("Part size must be at least 5 MiB")
+
+        self.workers = max(1, workers)
+        self.part_size = part_size
+        self.part_workers = max(1, part_workers)
+        self.skip_unchanged = skip_unchanged
+        self.journal = TransferJournal(state_file) if state_file else None
+
         try:
             self.client = Minio(
                 endpoint,
@@ -395,77 +688,228 @@ class MinioController:
                 secret_key=secret_key,
                 secure=secure,
                 cert_check=cert_check,
+                ## Each transfer thread, and each thread uploading one of its parts, needs a connection
+                http_client=_get_http_client(
+                    pool_size=max(10, self.workers * self.part_workers),
+                    cert_check=cert_check,
+                ),
             )
         except Exception as exc:
             self.logger.error(f"Error connecting to minio: {exc}")
             raise
 
-    def _upload(self, bucket: str, local_path: str, remote_path: str) -> None:
-        """Handles uploading a single file or directory recursively.
+    def _is_unchanged(
+        self,
+        direction: str,
+        bucket: str,
+        remote_path: str,
+        local_path: str,
+        remote_size: int,
+        remote_etag: str,
+    ) -> bool:
+        """Checks if a local file & remote object have the same content, using `skip_unchanged`.
+
+        Description:
+            Sizes are compared first. With "etag", a file recorded in the journal with the same size, mtime
+            & ETag is unchanged; otherwise the file's ETag is computed & compared.
+
+        """
+        if self.skip_unchanged == "none":
+            return False
+
+        try:
+            stat = os.stat(local_path)
+        except FileNotFoundError:
+            return False
+
+        if stat.st_size != remote_size:
+            return False
+        if self.skip_unchanged == "size":
+            return True
+
+        remote_etag = remote_etag.strip('"')
+        key = TransferJournal.key(direction, bucket, remote_path, local_path)
+
+        if self.journal is not None:
+            entry = self.journal.get(key)
+            if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns and entry["etag"] == remote_etag:
+                return True
+
+        if "-" in remote_etag:
+            ## Multipart ETags depend on the part size; try ours, then the smallest whole MiB that gives the same number of parts
+            parts = int(remote_etag.rsplit("-", 1)[1])
+            mib = 1024 * 1024
+            per_part = -(-stat.st_size // parts)
+            part_sizes = {self.part_size, -(-per_part // mib) * mib}
+            candidates = [size for size in part_sizes if -(-stat.st_size // size) == parts]
+        else:
+            candidates = [max(stat.st_size, 1)]
+
+        unchanged = any(compute_etag(local_path, size) == remote_etag for size in candidates)
+        if unchanged and self.journal is not None:
+            self.journal.record(key, stat.st_size, stat.st_mtime_ns, remote_etag)
+
+        return unchanged
+
+    def _upload_file(self, bucket: str, local_file: str, remote_file: str) -> tuple[bool, int]:
+        """Uploads one file, unless it's unchanged. Returns (uploaded, size)."""
+        size = os.path.getsize(local_file)
+
+        if self.skip_unchanged != "none":
+            try:
+                stat = self.client.stat_object(bucket, remote_file)
+            except S3Error as e:
+                if e.code not in ("NoSuchKey", "NoSuchObject"):
+                    raise
+            else:
+                if self._is_unchanged("upload", bucket, remote_file, local_file, stat.size, stat.etag):
+                    self.logger.debug(f"Skipping unchanged file '{local_file}'")
+                    return False, size
+
+        mtime_ns = os.stat(local_file).st_mtime_ns
+
+        self.logger.debug(
+            f"Uploading file '{local_file}' to '{remote_file}' in bucket '{bucket}'"
+        )
+        result = self.client.fput_object(
+            bucket,
+            remote_file,
+            local_file,
+            part_size=self.part_size,
+            num_parallel_uploads=self.part_workers,
+        )
+
+        if self.journal is not None:
+            self.journal.record(
+                TransferJournal.key("upload", bucket, remote_file, local_file),
+                size,
+                mtime_ns,
+                result.etag.strip('"'),
+            )
+
+        return True, size
+
+    def _download_file(
+        self, bucket: str, remote_file: str, local_file: str, size: int, etag: str
+    ) -> tuple[bool, int]:
+        """Downloads one object, unless the local file is unchanged. Returns (downloaded, size)."""
+        if self._is_unchanged("download", bucket, remote_file, local_file, size, etag):
+            self.logger.debug(f"Skipping unchanged file '{local_file}'")
+            return False, size
+
+        Path(local_file).parent.mkdir(parents=True, exist_ok=True)
+
+        self.logger.debug(f"Downloading '{remote_file}' to '{local_file}'")
+        ## fget_object() writes to '<file>.<etag>.part.minio' & resumes from it if a previous download was interrupted
+        self.client.fget_object(bucket, remote_file, local_file)
+
+        if self.journal is not None:
+            stat = os.stat(local_file)
+            self.journal.record(
+                TransferJournal.key("download", bucket, remote_file, local_file),
+                stat.st_size,
+                stat.st_mtime_ns,
+                etag.strip('"'),
+            )
+
+        return True, size
+
+    def _transfer(
+        self,
+        direction: str,
+        transfers: list[tuple],
+        transfer_file: t.Callable[..., tuple[bool, int]],
+    ) -> TransferReport:
+        """Runs file transfers on a thread pool of `workers` threads.
 
         Params:
-            bucket (str): Bucket name.
-            local_path (str): Local path to file or directory.
-            remote_path (str): Remote path to file or directory.
+            direction (str): "upload" or "download".
+            transfers (list[tuple]): Arguments for each `transfer_file()` call.
+            transfer_file (Callable): Transfers one file, returning (transferred, size).
 
         Raises:
-            FileNotFoundError: If local_path does not exist or is not a file/directory.
+            TransferError: If any file failed. The other files are still transferred.
 
         Returns:
-            None
+            (TransferReport): The transfer's results.
 
         """
-        if not self.client.bucket_exists(bucket):
-            self.client.make_bucket(bucket)
+        progress = _TransferProgress(TransferReport(direction=direction, files=len(transfers)), self.logger)
+
+        self.logger.info(f"Starting {direction} of [{len(transfers)}] file(s) with [{self.workers}] worker(s)")
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=f"minio-{direction}") as pool:
+            futures = {pool.submit(transfer_file, *transfer): transfer for transfer in transfers}
+
+            for future in as_completed(futures):
+                try:
+                    transferred, size = future.result()
+                except Exception as exc:
+                    msg = f"Error during {direction} of {futures[future]}: {exc}"
+                    self.logger.error(msg)
+                    progress.failed(msg)
+                else:
+                    progress.done(transferred, size)
+
+        report = progress.finish()
+        self.logger.info(report.summary())
+
+        if report.failed:
+            raise TransferError(report)
+
+        return report
+
+    def _collect_uploads(self, local_path: str, remote_path: str) -> list[tuple[str, str]]:
+        """Returns (local file, remote path) for a file, or every file in a directory.
+
+        Raises:
+            FileNotFoundError: If local_path does not exist or is not a file/directory.
 
+        """
         ## Replace any \ or \\ with /
         remote_path = normalize_path(remote_path)
 
         if Path(local_path).is_file():
-            ## Path is file, upload single object
-            self.logger.debug(
-                f"Uploading file '{local_path}' to '{remote_path}' in bucket '{bucket}'"
-            )
-            try:
-                self.client.fput_object(bucket, remote_path, local_path)
-                self.logger.debug(
-                    f"Uploaded '{local_path}' to '{remote_path}' in bucket '{bucket}'"
-                )
-            except Exception as exc:
-                self.logger.error(
-                    f"Error uploading '{local_path}' to '{remote_path}' in bucket '{bucket}': {exc}"
-                )
-                raise
+            return [(local_path, remote_path)]
 
         elif Path(local_path).is_dir():
-            ## Path is a directory, create path & upload all objects
-            for local_file in glob.glob(local_path + "/**", recursive=True):
+            uploads: list[tuple[str, str]] = []
 
+            for local_file in glob.glob(local_path + "/**", recursive=True):
                 if Path(local_file).is_file():
                     rel_path = Path(local_file).relative_to(local_path)
-                    remote_file_path = (Path(remote_path) / rel_path).as_posix()
+                    uploads.append((local_file, (Path(remote_path) / rel_path).as_posix()))
 
-                    self.logger.debug(
-                        f"Uploading file '{local_file}' to '{remote_file_path}' in bucket '{bucket}'"
-                    )
-                    try:
-                        self.client.fput_object(bucket, remote_file_path, local_file)
-                        self.logger.debug(
-                            f"Uploaded '{local_file}' to '{remote_file_path}' in bucket '{bucket}'"
-                        )
-                    except Exception as exc:
-                        self.logger.error(
-                            f"Error uploading '{local_file}' to '{remote_file_path}' in bucket '{bucket}': {exc}"
-                        )
-                        raise
+            return uploads
 
-        else:
-            ## Path is not a file or directory
-            raise FileNotFoundError(
-                f"Local path '{local_path}' does not exist or is not a file/directory."
-            )
+        ## Path is not a file or directory
+        raise FileNotFoundError(
+            f"Local path '{local_path}' does not exist or is not a file/directory."
+        )
+
+    def _upload(self, bucket: str, local_path: str, remote_path: str) -> TransferReport:
+        """Handles uploading a single file or directory recursively.
+
+        Params:
+            bucket (str): Bucket name.
+            local_path (str): Local path to file or directory.
+            remote_path (str): Remote path to file or directory.
+
+        Raises:
+            FileNotFoundError: If local_path does not exist or is not a file/directory.
+            TransferError: If any file failed to upload.
+
+        Returns:
+            (TransferReport): The upload's results.
 
-    def _download(self, bucket: str, remote_path: str, local_path: str):
+        """
+        if not self.client.bucket_exists(bucket):
+            self.client.make_bucket(bucket)
+
+        uploads = self._collect_uploads(local_path, remote_path)
+
+        return self._transfer("upload", [(bucket, *upload) for upload in uploads], self._upload_file)
+
+    def _download(self, bucket: str, remote_path: str, local_path: str) -> TransferReport:
         """Handles downloading a single file or directory recursively.
 
         Params:
@@ -475,31 +919,37 @@ class MinioController:
 
         Raises:
             FileNotFoundError: If remote_path does not exist or is not a file/directory.
+            TransferError: If any file failed to download.
 
         Returns:
-            None
+            (TransferReport): The download's results.
 
         """
+        ## A trailing slash means a directory (prefix); check before normalize_path() removes it
+        is_prefix = str(remote_path).endswith(("/", "\\"))
+
         ## Replace any \ or \\ with /
         remote_path = normalize_path(remote_path)
         local_path = Path(local_path)
 
         ## Check if remote_path is a directory (prefix) or file
-        if remote_path.endswith("/"):
-            prefix = remote_path
-            objects = self.client.list_objects(bucket, prefix=prefix, recursive=True)
-
-            for obj in objects:
-                rel_path = Path(obj.object_name).relative_to(prefix)
-                local_file = local_path / rel_path
-                local_file.parent.mkdir(parents=True, exist_ok=True)
-
-                self.logger.debug(f"Downloading '{obj.object_name}' to '{local_file}'")
-                self.client.fget_object(bucket, obj.object_name, str(local_file))
+        if is_prefix:
+            prefix = remote_path.rstrip("/") + "/"
+            downloads = [
+                (
+                    bucket,
+                    obj.object_name,
+                    str(local_path / Path(obj.object_name).relative_to(prefix)),
+                    obj.size,
+                    obj.etag,
+                )
+                for obj in self.client.list_objects(bucket, prefix=prefix, recursive=True)
+                if not obj.is_dir
+            ]
         else:
             ## Try to stat object to ensure it exists and is a file
             try:
-                self.client.stat_object(bucket, remote_path)
+                stat = self.client.stat_object(bucket, remote_path)
             except S3Error as e:
                 if e.code == "NoSuchKey":
                     raise FileNotFoundError(
@@ -507,10 +957,9 @@ class MinioController:
                     )
                 raise
 
-            local_path.parent.mkdir(parents=True, exist_ok=True)
+            downloads = [(bucket, remote_path, str(local_path), stat.size, stat.etag)]
 
-            self.logger.debug(f"Downloading '{remote_path}' to '{local_path}'")
-            self.client.fget_object(bucket, remote_path, str(local_path))
+        return self._transfer("download", downloads, self._download_file)
 
     def _copy(
         self, bucket: str, src_path: str, dest_path: str, dest_bucket: str | None = None
@@ -646,8 +1095,20 @@ class MinioController:
 
     def upload(
         self, bucket: str, local_paths: t.Union[str, t.List[str]], remote_path: str = ""
-    ):
-        """Uploads one or more files/directories to MinIO."""
+    ) -> TransferReport:
+        """Uploads one or more files/directories to MinIO, `workers` files at a time.
+
+        Description:
+            Files that are already in MinIO with the same content (see `skip_unchanged`) are skipped, so
+            running an interrupted upload again resumes it.
+
+        Raises:
+            TransferError: If any file failed to upload. The other files are still uploaded.
+
+        Returns:
+            (TransferReport): The upload's results.
+
+        """
         if isinstance(local_paths, str):
             ## Replace any \ or \\ with /
             local_paths = [normalize_path(local_paths)]
@@ -655,6 +1116,10 @@ class MinioController:
         ## Replace any \ or \\ with /
         remote_path = normalize_path(remote_path)
 
+        if not self.client.bucket_exists(bucket):
+            self.client.make_bucket(bucket)
+
+        uploads: list[tuple[str, str, str]] = []
         for path in local_paths:
             base_name = Path(path).name
             if remote_path:
@@ -662,20 +1127,86 @@ class MinioController:
             else:
                 dest_path = base_name
 
-            self._upload(bucket, path, dest_path)
+            uploads += [(bucket, *upload) for upload in self._collect_uploads(path, dest_path)]
+
+        ## One pool for every path, so small directories don't leave workers idle
+        return self._transfer("upload", uploads, self._upload_file)
+
+    def upload_stream(
+        self,
+        bucket: str,
+        remote_path: str,
+        stream: t.BinaryIO,
+        content_type: str = "application/octet-stream",
+        part_size: int = DEFAULT_STREAM_PART_SIZE,
+    ) -> None:
+        """Uploads a stream of unknown length, i.e. a pipe from a database dump, as a multipart upload.
+
+        Params:
+            bucket (str): Bucket name. Created if it doesn't exist.
+            remote_path (str): Remote path to the object.
+            stream (BinaryIO): A readable binary stream. Read until EOF.
+            content_type (str): The object's content type.
+            part_size (int): Bytes buffered & sent per part. At least 5 MiB.
+
+        Returns:
+            None
+
+        """
+        if not self.client.bucket_exists(bucket):
+            self.client.make_bucket(bucket)
+
+        ## Replace any \ or \\ with /
+        remote_path = normalize_path(remote_path)
+
+        self.logger.debug(f"Streaming upload to '{remote_path}' in bucket '{bucket}'")
+        try:
+            ## length=-1 makes put_object() read & send one part at a time until EOF
+            result = self.client.put_object(
+                bucket,
+                remote_path,
+                stream,
+                length=-1,
+                part_size=part_size,
+                content_type=content_type,
+            )
+            self.logger.debug(
+                f"Uploaded stream to '{remote_path}' in bucket '{bucket}' (etag: {result.etag})"
+            )
+        except Exception as exc:
+            self.logger.error(
+                f"Error streaming upload to '{remote_path}' in bucket '{bucket}': {exc}"
+            )
+            raise
 
     def download(
         self, bucket: str, remote_paths: t.Union[str, t.List[str]], local_path: str
-    ):
-        """Downloads one or more files/directories from MinIO."""
+    ) -> TransferReport:
+        """Downloads one or more files/directories from MinIO, `workers` files at a time.
+
+        Description:
+            Local files with the same content (see `skip_unchanged`) are skipped, and partially downloaded
+            files are resumed, so running an interrupted download again resumes it.
+
+        Raises:
+            TransferError: If any file failed to download.
+
+        Returns:
+            (TransferReport): The combined results of every path.
+
+        """
         if isinstance(remote_paths, str):
-            ## Replace any \ or \\ with /
-            remote_paths = [normalize_path(remote_paths)]
+            remote_paths = [remote_paths]
 
+        report = TransferReport(direction="download")
         for remote_path in remote_paths:
-            ## Replace any \ or \\ with /
-            remote_path = normalize_path(remote_path)
-            self._download(bucket, remote_path, local_path)
+            ## _download() normalizes the path, after checking for a trailing slash
+            path_report = self._download(bucket, remote_path, local_path)
+
+            for attr in ("files", "transferred", "skipped", "failed", "bytes_transferred", "bytes_skipped", "elapsed"):
+                setattr(report, attr, getattr(report, attr) + getattr(path_report, attr))
+
+        return report
 
     def object_exists(self, bucket: str, remote_path: str) -> bool:
         """Checks if a file or directory exists in MinIO.
@@ -907,7 +1438,16 @@ if __name__ == "__main__":
 
     ## Initialize MinIO Controller
     controller = get_minio_controller(
-        endpoint, access_key, secret_key, secure=secure, cert_check=cert_check
+        endpoint,
+        access_key,
+        secret_key,
+        secure=secure,
+        cert_check=cert_check,
+        workers=args.workers,
+        part_size=args.part_size * 1024 * 1024,
+        part_workers=args.part_workers,
+        skip_unchanged=args.skip_unchanged,
+        state_file=args.state_file,
     )
 
     ## Handle job file
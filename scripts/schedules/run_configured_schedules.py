@@ -0,0 +1,15 @@
+import logging
+
+from scheduling import lib_scheduler
+import setup
+from settings import LOGGING_SETTINGS
+
+log = logging.getLogger(__name__)
+
+if __name__ == "__main__":
+    setup.setup_loguru_logging(
+        log_level=LOGGING_SETTINGS.get("LOG_LEVEL", "INFO").upper(), colorize=True
+    )
+
+    ## Runs the jobs in the [scheduler] section of settings.toml
+    lib_scheduler.run_configured_schedules()
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import os
+import statistics
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("weather_cli")
+
+CLI_MODULE: str = "weather_cli.main"
+## Only imported by the sub-commands that use them; see scripts/benchmarks/bench_cli_startup.py for the import chain
+FORBIDDEN_AT_STARTUP: list[str] = ["alembic", "celery", "dramatiq", "fastapi", "hishel", "pandas", "sqlalchemy"]
+## Wall-clock timings vary between machines & with load, so the cap is opt-in: set it with some
+#  headroom over a local run, i.e. WEATHERDATA_CLI_MAX_IMPORT_MS=500
+MAX_IMPORT_MS: str | None = os.environ.get("WEATHERDATA_CLI_MAX_IMPORT_MS")
+RUNS: int = 3
+
+
+def _import_time_ms(module: str) -> float:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True
+    )
+
+    total_us: int = 0
+    for line in proc.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        ## Top-level imports (not indented) add up to the whole import
+        if len(fields) == 3 and fields[1].strip().isdigit() and not fields[2][1:].startswith(" "):
+            total_us += int(fields[1])
+
+    return total_us / 1000
+
+
+def test_cli_startup_does_not_import_heavy_dependencies():
+    proc = subprocess.run(
+        [sys.executable, "-c", f"import sys, {CLI_MODULE}; print('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported = set(proc.stdout.split())
+
+    assert sorted(name for name in FORBIDDEN_AT_STARTUP if name in imported) == []
+
+
+@pytest.mark.skipif(not MAX_IMPORT_MS, reason="Set WEATHERDATA_CLI_MAX_IMPORT_MS to check the CLI's import time")
+def test_cli_import_time_is_under_the_cap():
+    max_ms = float(MAX_IMPORT_MS)
+    import_ms = statistics.median(_import_time_ms(CLI_MODULE) for _ in range(RUNS))
+
+    assert import_ms <= max_ms, f"Importing {CLI_MODULE} took {import_ms:.1f} ms (max {max_ms:.0f} ms)"
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from core_utils.df_utils.optimize import load_sql_to_df
+import sqlalchemy as sa
+
+
+@pytest.fixture()
+def engine(tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'weather.sqlite3'}")
+
+    ## The first chunk only has 4 wind directions; later chunks add new ones, & `country` has one
+    #  value per row at first (too many to categorize) but repeats later
+    rows = [
+        {
+            "wind_dir": ["N", "S", "E", "W"][i % 4] if i < 100 else ["NE", "SW"][i % 2],
+            "country": f"country {i}" if i < 50 else "United Kingdom",
+            "last_updated": f"2026-10-19 {i // 60:02d}:{i % 60:02d}",
+            "humidity": i % 100,
+            "temp_c": i / 10,
+        }
+        for i in range(250)
+    ]
+    pd.DataFrame(rows).to_sql("current_weather", engine, index=False)
+
+    yield engine
+
+    engine.dispose()
+
+
+def test_chunked_load_casts_every_chunk_the_same_way(engine):
+    full = load_sql_to_df("SELECT * FROM current_weather", engine, report=False)
+    chunked = load_sql_to_df("SELECT * FROM current_weather", engine, chunksize=50, report=False)
+
+    assert isinstance(chunked["wind_dir"].dtype, pd.CategoricalDtype)
+    assert set(chunked["wind_dir"].cat.categories) == {"N", "S", "E", "W", "NE", "SW"}
+    ## Decided from the first chunk, where every country is unique
+    assert isinstance(chunked["country"].dtype, pd.StringDtype)
+    assert chunked["humidity"].dtype == "uint8"
+
+    pd.testing.assert_frame_equal(
+        chunked.astype({"wind_dir": str, "country": str}), full.astype({"wind_dir": str, "country": str})
+    )
+
+
+def test_chunked_load_without_optimize_keeps_raw_dtypes(engine):
+    df = load_sql_to_df("SELECT * FROM current_weather", engine, chunksize=100, optimize=False, report=False)
+
+    assert len(df.index) == 250
+    assert df["wind_dir"].dtype == object
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import pytest
+
+from core_utils.metrics_utils.metrics import Counter, _Metric
+
+
+def test_metric_subclasses_must_implement_samples():
+    class Incomplete(_Metric):
+        type_name = "gauge"
+
+    with pytest.raises(TypeError, match="samples"):
+        Incomplete("weatherdata_test_incomplete", "Never registered.", register=False)
+
+
+def test_counter_renders_samples():
+    counter = Counter("weatherdata_test_total", "Test counter.", ["route"], register=False)
+    counter.inc("/health")
+    counter.inc("/health", amount=2)
+
+    assert counter.render() == [
+        "# HELP weatherdata_test_total Test counter.",
+        "# TYPE weatherdata_test_total counter",
+        'weatherdata_test_total{route="/health"} 3',
+    ]
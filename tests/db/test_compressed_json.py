@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import pytest
+
+from db import types as db_types
+from db.types import CompressedJSON
+
+PAYLOAD: dict = {"location": {"name": "London"}, "current": {"temp_c": 11.5, "condition": {"text": "Cloudy"}}}
+
+
+def test_defaults_to_zlib():
+    column = CompressedJSON()
+
+    assert (column.algorithm, column.level) == ("zlib", 6)
+    assert column.compress(PAYLOAD)[:1] == db_types._CODEC_ZLIB
+    assert column.decompress(column.compress(PAYLOAD)) == PAYLOAD
+
+
+def test_zstd_opt_in_without_zstandard_raises(monkeypatch):
+    monkeypatch.setattr(db_types, "zstandard", None)
+
+    ## The zlib default never needs the package
+    assert CompressedJSON().decompress(CompressedJSON().compress(PAYLOAD)) == PAYLOAD
+
+    with pytest.raises(ImportError, match="database\\[zstd\\]"):
+        CompressedJSON(algorithm="zstd")
+
+
+def test_zstd_dict_requires_zstd():
+    with pytest.raises(ValueError, match="zstd_dict requires"):
+        CompressedJSON(zstd_dict="weatherapi_current")
+
+
+def test_zstd_round_trip_and_mixed_rows():
+    pytest.importorskip("zstandard")
+
+    zstd_column = CompressedJSON(algorithm="zstd")
+    data = zstd_column.compress(PAYLOAD)
+
+    assert data[:1] == db_types._CODEC_ZSTD
+    ## Rows are self-describing, so a zlib column still reads rows written with zstd
+    assert CompressedJSON().decompress(data) == PAYLOAD
+    assert zstd_column.decompress(CompressedJSON().compress(PAYLOAD)) == PAYLOAD
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import datetime as dt
+
+import pytest
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+import db
+from domain.weatherapi.location import WeatherAPILocationModel
+from domain.weatherapi.weather.current import CurrentWeatherModel
+from domain.weatherapi.weather.rollups import (
+    CurrentWeatherDailyRollupModel,
+    CurrentWeatherHourlyRollupModel,
+    RollupWatermarkModel,
+)
+from weather_client.apis.api_weatherapi.db_client.rollups import (
+    CURRENT_WEATHER_ROLLUP_WATERMARK,
+    update_current_weather_rollups,
+)
+
+UTC = dt.timezone.utc
+SETTLED_AT = dt.datetime.now() - dt.timedelta(hours=1)
+
+
+def _epoch(*args: int) -> int:
+    return int(dt.datetime(*args, tzinfo=UTC).timestamp())
+
+
+@pytest.fixture()
+def engine(tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'rollups.sqlite3'}")
+    db.Base.metadata.create_all(engine)
+
+    yield engine
+
+    engine.dispose()
+
+
+def _add_location(session: so.Session, name: str, tz_id: str) -> int:
+    location = WeatherAPILocationModel(
+        name=name, region="", country="", lat=0, lon=0, tz_id=tz_id, localtime_epoch=0, localtime=""
+    )
+    session.add(location)
+    session.flush()
+
+    return location.id
+
+
+def _add_reading(
+    session: so.Session,
+    location_id: int,
+    epoch: int,
+    temp_c: float,
+    precip_mm: float = 0.0,
+    created_at: dt.datetime | None = SETTLED_AT,
+) -> int:
+    ## Columns the rollups don't read are filled with zeros
+    values: dict = {
+        column.name: "" if isinstance(column.type, sa.TEXT) else 0
+        for column in CurrentWeatherModel.__table__.columns
+        if not column.nullable and not column.primary_key
+    }
+    values.update(
+        location_id=location_id,
+        last_updated_epoch=epoch,
+        created_at=created_at,
+        temp_c=temp_c,
+        feelslike_c=temp_c - 1,
+        humidity=80,
+        wind_kph=temp_c * 2,
+        gust_kph=temp_c * 3,
+        precip_mm=precip_mm,
+        uv=1,
+    )
+
+    return session.execute(sa.insert(CurrentWeatherModel).values(**values)).inserted_primary_key[0]
+
+
+def _buckets(engine: sa.Engine, model: type) -> list[tuple]:
+    with so.Session(engine) as session:
+        buckets = session.scalars(sa.select(model).order_by(model.location_id, model.bucket_start_epoch))
+
+        return [
+            (b.location_id, b.bucket_start_epoch, b.reading_count, b.temp_c_min, b.temp_c_max)
+            + (b.temp_c_sum, b.temp_c_count, b.precip_mm_sum)
+            for b in buckets
+        ]
+
+
+def _watermark(engine: sa.Engine) -> int:
+    with so.Session(engine) as session:
+        return session.scalar(
+            sa.select(RollupWatermarkModel.last_id).where(RollupWatermarkModel.name == CURRENT_WEATHER_ROLLUP_WATERMARK)
+        )
+
+
+def test_rollups_cross_hour_and_day_boundaries_and_stop_at_unsettled_rows(engine):
+    with so.Session(engine) as session:
+        london = _add_location(session, "London", "UTC")
+        paris = _add_location(session, "Paris", "Europe/Paris")
+
+        _add_reading(session, london, _epoch(2026, 10, 18, 22, 50), temp_c=10, precip_mm=0.5)
+        _add_reading(session, london, _epoch(2026, 10, 18, 23, 10), temp_c=12, precip_mm=1.0)
+        ## Saved before created_at was tracked; counts as settled
+        _add_reading(session, london, _epoch(2026, 10, 18, 23, 40), temp_c=14, created_at=None)
+        ## Next hour & next day
+        _add_reading(session, london, _epoch(2026, 10, 19, 0, 5), temp_c=16)
+        ## 00:30 on the 19th in Paris (UTC+2), so it's in Paris's Oct 19 daily bucket
+        last_settled = _add_reading(session, paris, _epoch(2026, 10, 18, 22, 30), temp_c=20)
+        ## Still inside the settle window, so it & every row after it wait for a later run
+        unsettled = _add_reading(session, london, _epoch(2026, 10, 19, 0, 20), temp_c=18, created_at=dt.datetime.now())
+        _add_reading(session, london, _epoch(2026, 10, 19, 0, 25), temp_c=19)
+
+        session.commit()
+
+    summary = update_current_weather_rollups(engine=engine, batch_size=3)
+
+    assert (summary["readings"], summary["batches"], summary["watermark"]) == (5, 2, last_settled)
+    assert _watermark(engine) == last_settled
+
+    assert _buckets(engine, CurrentWeatherHourlyRollupModel) == [
+        (london, _epoch(2026, 10, 18, 22), 1, 10.0, 10.0, 10.0, 1, 0.5),
+        (london, _epoch(2026, 10, 18, 23), 2, 12.0, 14.0, 26.0, 2, 1.0),
+        (london, _epoch(2026, 10, 19, 0), 1, 16.0, 16.0, 16.0, 1, 0.0),
+        (paris, _epoch(2026, 10, 18, 22), 1, 20.0, 20.0, 20.0, 1, 0.0),
+    ]
+    assert _buckets(engine, CurrentWeatherDailyRollupModel) == [
+        (london, _epoch(2026, 10, 18), 3, 10.0, 14.0, 36.0, 3, 1.5),
+        (london, _epoch(2026, 10, 19), 1, 16.0, 16.0, 16.0, 1, 0.0),
+        ## Midnight in Paris
+        (paris, _epoch(2026, 10, 18, 22), 1, 20.0, 20.0, 20.0, 1, 0.0),
+    ]
+
+    ## Nothing new is settled, so a second run changes nothing
+    assert update_current_weather_rollups(engine=engine)["readings"] == 0
+
+    ## Once the row settles, it & the rows after it are added to the existing buckets
+    with so.Session(engine) as session:
+        session.execute(
+            sa.update(CurrentWeatherModel).where(CurrentWeatherModel.id == unsettled).values(created_at=SETTLED_AT)
+        )
+        session.commit()
+
+    summary = update_current_weather_rollups(engine=engine)
+
+    assert summary["readings"] == 2
+    assert _watermark(engine) == unsettled + 1
+    assert _buckets(engine, CurrentWeatherHourlyRollupModel)[2] == (london, _epoch(2026, 10, 19, 0), 3, 16.0, 19.0, 53.0, 3, 0.0)
+    assert _buckets(engine, CurrentWeatherDailyRollupModel)[1] == (london, _epoch(2026, 10, 19), 3, 16.0, 19.0, 53.0, 3, 0.0)
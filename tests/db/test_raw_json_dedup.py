@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import datetime as dt
+
+import pytest
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+from core_utils import hash_utils
+import db
+from domain.weatherapi.weather.current import CurrentWeatherJSONModel, CurrentWeatherJSONRepository
+from weather_client.apis.api_weatherapi.db_client import current_weather as current_db
+from weather_client.apis.api_weatherapi.db_client.raw_json import bulk_save_raw_json
+
+LONDON: dict = {
+    "location": {"name": "London", "region": "City of London", "country": "UK", "localtime_epoch": 1700000000},
+    "current": {"last_updated_epoch": 1699999200, "temp_c": 11.5},
+}
+PARIS: dict = {
+    "location": {"name": "Paris", "region": "Ile-de-France", "country": "France", "localtime_epoch": 1700000000},
+    "current": {"last_updated_epoch": 1699999200, "temp_c": 13.0},
+}
+
+
+def _requested_again(payload: dict, localtime_epoch: int = 1700000900) -> dict:
+    """The same response, requested later; only the volatile local time changed."""
+    return {**payload, "location": {**payload["location"], "localtime_epoch": localtime_epoch}}
+
+
+def _content_hash(payload: dict) -> str:
+    return hash_utils.get_content_hash(payload, exclude_keys=current_db.CURRENT_WEATHER_VOLATILE_KEYS)
+
+
+@pytest.fixture()
+def engine(tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'raw_json.sqlite3'}")
+    db.Base.metadata.create_all(engine)
+
+    yield engine
+
+    engine.dispose()
+
+
+def _rows(engine: sa.Engine) -> list[CurrentWeatherJSONModel]:
+    with so.Session(engine, expire_on_commit=False) as session:
+        return session.scalars(sa.select(CurrentWeatherJSONModel).order_by(CurrentWeatherJSONModel.id)).all()
+
+
+def test_duplicate_response_bumps_seen_count(engine):
+    first = current_db.save_current_weather_response(LONDON, engine=engine)
+    second = current_db.save_current_weather_response(_requested_again(LONDON), engine=engine)
+
+    assert second.id == first.id
+
+    [row] = _rows(engine)
+    assert row.seen_count == 2
+    assert row.last_seen_at is not None
+    assert row.location_key == "london|city of london|uk"
+    ## The first response is kept as saved
+    assert row.current_weather_json == LONDON
+
+
+def test_dedupe_false_always_inserts(engine):
+    current_db.save_current_weather_response(LONDON, engine=engine, dedupe=False)
+    current_db.save_current_weather_response(LONDON, engine=engine, dedupe=False)
+
+    assert [(row.content_hash, row.seen_count) for row in _rows(engine)] == [(None, 1), (None, 1)]
+
+
+def test_insert_race_falls_back_to_bumping_the_existing_row(engine, monkeypatch):
+    saved = current_db.save_current_weather_response(LONDON, engine=engine)
+
+    ## Another worker saved the response between this worker's lookup & insert
+    lookup = CurrentWeatherJSONRepository.get_by_content_hash
+    calls: list[str] = []
+
+    def racing_lookup(self, content_hash):
+        calls.append(content_hash)
+        return None if len(calls) == 1 else lookup(self, content_hash)
+
+    monkeypatch.setattr(CurrentWeatherJSONRepository, "get_by_content_hash", racing_lookup)
+
+    out = current_db.save_current_weather_response(_requested_again(LONDON), engine=engine)
+
+    assert len(calls) == 2
+    assert out.id == saved.id
+    assert [(row.id, row.seen_count) for row in _rows(engine)] == [(saved.id, 2)]
+
+
+def test_bulk_save_dedupes_within_the_batch_and_against_stored_rows(engine):
+    current_db.save_current_weather_response(LONDON, engine=engine)
+
+    summary = bulk_save_raw_json(
+        model=CurrentWeatherJSONModel,
+        json_col="current_weather_json",
+        payloads=[_requested_again(LONDON), PARIS, _requested_again(PARIS), _requested_again(PARIS, 1700001800)],
+        volatile_keys=current_db.CURRENT_WEATHER_VOLATILE_KEYS,
+        engine=engine,
+    )
+
+    assert summary == {"received": 4, "inserted": 1, "duplicates": 3}
+
+    london, paris = _rows(engine)
+    assert (london.location_key, london.seen_count) == ("london|city of london|uk", 2)
+    assert isinstance(london.last_seen_at, dt.datetime)
+    ## Repeats within the batch are counted on the new row
+    assert (paris.location_key, paris.seen_count, paris.last_seen_at) == ("paris|ile-de-france|france", 3, None)
+    assert paris.current_weather_json == PARIS
+
+
+def test_bulk_save_hashes_match_the_single_row_save(engine):
+    bulk_save_raw_json(
+        model=CurrentWeatherJSONModel,
+        json_col="current_weather_json",
+        payloads=[LONDON],
+        volatile_keys=current_db.CURRENT_WEATHER_VOLATILE_KEYS,
+        engine=engine,
+    )
+    current_db.save_current_weather_response(_requested_again(LONDON), engine=engine)
+
+    [row] = _rows(engine)
+    assert row.seen_count == 2
+
+
+def test_bulk_save_retries_after_a_content_hash_conflict(engine):
+    ## Another worker inserts the same response after the batch looked up the existing hashes
+    conflicts: list[int] = []
+
+    def insert_conflict(session, flush_context, instances):
+        if conflicts:
+            return
+
+        conflicts.append(1)
+        with engine.begin() as conn:
+            conn.execute(
+                sa.insert(CurrentWeatherJSONModel).values(
+                    current_weather_json=LONDON,
+                    content_hash=_content_hash(LONDON),
+                    location_key="london|city of london|uk",
+                    created_at=dt.datetime.now(),
+                )
+            )
+
+    sa.event.listen(so.Session, "before_flush", insert_conflict)
+    try:
+        summary = bulk_save_raw_json(
+            model=CurrentWeatherJSONModel,
+            json_col="current_weather_json",
+            payloads=[_requested_again(LONDON), PARIS],
+            volatile_keys=current_db.CURRENT_WEATHER_VOLATILE_KEYS,
+            engine=engine,
+        )
+    finally:
+        sa.event.remove(so.Session, "before_flush", insert_conflict)
+
+    assert conflicts == [1]
+    assert summary == {"received": 2, "inserted": 1, "duplicates": 1}
+    assert [(row.location_key, row.seen_count) for row in _rows(engine)] == [
+        ("london|city of london|uk", 2),
+        ("paris|ile-de-france|france", 1),
+    ]
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import datetime as dt
+
+import pytest
+
+from db.retention import RetentionPolicy, apply_retention_policy
+from db.types import CompressedJSON
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+NOW = dt.datetime(2026, 10, 19, 12, 0, 0)
+
+
+class Base(so.DeclarativeBase):
+    pass
+
+
+class Reading(Base):
+    __tablename__ = "readings"
+
+    id: so.Mapped[int] = so.mapped_column(primary_key=True)
+    created_at: so.Mapped[dt.datetime] = so.mapped_column(sa.DateTime())
+    location_key: so.Mapped[str | None] = so.mapped_column(sa.String(255), nullable=True)
+    payload: so.Mapped[dict] = so.mapped_column(CompressedJSON())
+
+
+@pytest.fixture()
+def engine(tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'retention.sqlite3'}")
+    Base.metadata.create_all(engine)
+
+    yield engine
+
+    engine.dispose()
+
+
+def _add_readings(engine: sa.Engine, readings: list[tuple[dt.datetime, str | None]]) -> None:
+    with so.Session(engine) as session:
+        session.add_all(
+            Reading(created_at=created_at, location_key=key, payload={"location": {"name": key}, "n": i})
+            for i, (created_at, key) in enumerate(readings)
+        )
+        session.commit()
+
+
+def _remaining(engine: sa.Engine) -> list[tuple[dt.datetime, str | None]]:
+    with so.Session(engine) as session:
+        return [tuple(row) for row in session.execute(sa.select(Reading.created_at, Reading.location_key).order_by(Reading.id))]
+
+
+def _policy(**kwargs) -> RetentionPolicy:
+    return RetentionPolicy(
+        name="readings",
+        model=Reading,
+        raw_days=30,
+        downsample="hourly",
+        delete_days=365,
+        payload_col="payload",
+        partition_col="location_key",
+        **kwargs,
+    )
+
+
+def _payload_bytes(engine: sa.Engine, ids: list[int]) -> int:
+    with so.Session(engine) as session:
+        return session.execute(
+            sa.select(sa.func.sum(sa.func.length(Reading.__table__.c.payload))).where(Reading.id.in_(ids))
+        ).scalar_one()
+
+
+def test_downsample_keeps_first_row_per_location_per_hour(engine, monkeypatch):
+    old = NOW - dt.timedelta(days=60)
+    _add_readings(
+        engine,
+        [
+            (old, "london"),
+            (old + dt.timedelta(minutes=15), "london"),
+            (old + dt.timedelta(minutes=30), "paris"),
+            (old + dt.timedelta(minutes=45), "london"),
+            (old + dt.timedelta(hours=1), "london"),
+            (old + dt.timedelta(minutes=5), None),
+            (old + dt.timedelta(minutes=10), None),
+            ## Newer than raw_days, older than delete_days
+            (NOW - dt.timedelta(days=1), "london"),
+            (NOW - dt.timedelta(days=1, minutes=-15), "london"),
+            (NOW - dt.timedelta(days=400), "london"),
+        ],
+    )
+    expected_bytes = _payload_bytes(engine, [2, 4])
+
+    ## Payloads are never loaded, only their stored size
+    monkeypatch.setattr(CompressedJSON, "process_result_value", lambda *args: pytest.fail("payload was decoded"))
+
+    dry_run = apply_retention_policy(_policy(), engine, dry_run=True, now=NOW)
+    assert (dry_run.downsampled_rows, dry_run.downsampled_bytes, dry_run.deleted_rows) == (2, expected_bytes, 1)
+    assert len(_remaining(engine)) == 10
+
+    report = apply_retention_policy(_policy(), engine, dry_run=False, batch_size=2, now=NOW)
+    assert (report.downsampled_rows, report.downsampled_bytes, report.deleted_rows) == (2, expected_bytes, 1)
+
+    assert _remaining(engine) == [
+        (old, "london"),
+        (old + dt.timedelta(minutes=30), "paris"),
+        (old + dt.timedelta(hours=1), "london"),
+        ## Rows without a location key are kept
+        (old + dt.timedelta(minutes=5), None),
+        (old + dt.timedelta(minutes=10), None),
+        (NOW - dt.timedelta(days=1), "london"),
+        (NOW - dt.timedelta(days=1, minutes=-15), "london"),
+    ]
+
+
+def test_downsample_without_partition_col_uses_one_partition(engine):
+    old = NOW - dt.timedelta(days=60)
+    _add_readings(engine, [(old, "london"), (old + dt.timedelta(minutes=30), "paris")])
+
+    report = apply_retention_policy(
+        RetentionPolicy(name="readings", model=Reading, raw_days=30, downsample="daily"), engine, dry_run=False, now=NOW
+    )
+
+    assert (report.downsampled_rows, report.downsampled_bytes) == (1, 0)
+    assert _remaining(engine) == [(old, "london")]
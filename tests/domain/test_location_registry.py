@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import pytest
+
+from domain.weatherapi.location import LocationRegistryModel, LocationRegistryRepository, WeatherAPILocationModel
+
+## Imported for its side effect: WeatherAPILocationModel's relationships resolve to these models
+from domain.weatherapi.weather import current  # noqa: F401
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+
+@pytest.fixture()
+def repo(tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'registry.sqlite3'}")
+    WeatherAPILocationModel.metadata.create_all(
+        engine, tables=[WeatherAPILocationModel.__table__, LocationRegistryModel.__table__]
+    )
+
+    with so.Session(engine) as session:
+        session.add_all(LocationRegistryModel(query=query) for query in ["London", "Paris", "Berlin"])
+        session.commit()
+
+        yield LocationRegistryRepository(session)
+
+    engine.dispose()
+
+
+def _entry(repo: LocationRegistryRepository, query: str) -> LocationRegistryModel:
+    entry = repo.get_by_query(query)
+    repo.session.refresh(entry)
+
+    return entry
+
+
+def test_first_update_uses_the_default_interval(repo):
+    repo.record_update_epochs({"London": 10_000}, default_interval=900)
+
+    entry = _entry(repo, "London")
+    assert (entry.last_updated_epoch, entry.update_interval_s, entry.next_update_epoch) == (10_000, 900, 10_900)
+    assert _entry(repo, "Paris").next_update_epoch is None
+
+
+def test_shorter_gap_lowers_the_interval(repo):
+    repo.record_update_epochs({"London": 10_000}, default_interval=900)
+    repo.record_update_epochs({"London": 10_600}, default_interval=900)
+
+    entry = _entry(repo, "London")
+    assert (entry.update_interval_s, entry.next_update_epoch) == (750, 11_350)
+
+
+def test_longer_gap_without_unchanged_polls_keeps_the_interval(repo):
+    ## i.e. polls in between were skipped or failed; the gap says nothing about WeatherAPI
+    repo.record_update_epochs({"London": 10_000}, default_interval=900)
+    repo.record_update_epochs({"London": 12_700}, default_interval=900)
+
+    assert _entry(repo, "London").update_interval_s == 900
+
+
+def test_longer_gap_after_unchanged_polls_raises_the_interval(repo):
+    repo.record_update_epochs({"London": 10_000}, default_interval=900)
+    repo.record_update_epochs({"London": 10_000}, default_interval=900)
+
+    entry = _entry(repo, "London")
+    assert (entry.unchanged_polls, entry.next_update_epoch) == (1, 10_900)
+
+    repo.record_update_epochs({"London": 11_800}, default_interval=900)
+
+    entry = _entry(repo, "London")
+    assert (entry.update_interval_s, entry.next_update_epoch, entry.unchanged_polls) == (1350, 13_150, 0)
+
+
+def test_learned_interval_is_clamped(repo):
+    repo.record_update_epochs({"London": 10_000, "Paris": 10_000}, default_interval=900)
+    repo.record_update_epochs({"London": 10_010, "Paris": 10_000}, default_interval=900, min_interval=300)
+    repo.record_update_epochs({"Paris": 90_000}, default_interval=900, max_interval=3600)
+
+    assert _entry(repo, "London").update_interval_s == (900 + 300) // 2
+    assert _entry(repo, "Paris").update_interval_s == (900 + 3600) // 2
+
+
+def test_list_active_queries_skips_locations_not_due(repo):
+    repo.record_update_epochs({"London": 10_000, "Paris": 20_000}, default_interval=900)
+
+    assert repo.list_active_queries(poll="current") == ["London", "Paris", "Berlin"]
+    ## Berlin has never been polled, so it's always due
+    assert repo.list_active_queries(poll="current", due_before=15_000) == ["London", "Berlin"]
+    assert repo.list_active_queries(poll="current", due_before=10_899) == ["Berlin"]
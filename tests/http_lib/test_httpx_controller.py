@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from http_lib import controllers
+from http_lib.controllers import HttpxController, _InstrumentedTransport
+
+
+@pytest.fixture
+def instrumented(monkeypatch):
+    monkeypatch.setattr(controllers.metrics_utils, "stage_timing_enabled", lambda: True)
+
+
+def test_instrumented_client_keeps_environment_proxies(instrumented, monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+    monkeypatch.delenv("NO_PROXY", raising=False)
+
+    with HttpxController(use_cache=False) as http_ctl:
+        client = http_ctl.client
+
+        assert isinstance(client._transport, _InstrumentedTransport)
+
+        proxied = [mounted for mounted in client._mounts.values() if mounted is not None]
+        assert proxied
+        assert all(isinstance(mounted, _InstrumentedTransport) for mounted in proxied)
+        ## Requests to https:// URLs go through the (instrumented) proxy transport
+        assert client._transport_for_url(httpx.URL("https://api.weatherapi.com")) in proxied
+
+
+def test_instrumented_client_wraps_an_explicit_transport(instrumented):
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"ok": True}))
+
+    with HttpxController(use_cache=False, transport=transport) as http_ctl:
+        assert isinstance(http_ctl.client._transport, _InstrumentedTransport)
+        assert http_ctl.client._transport.transport is transport
+        assert http_ctl.client.get("https://api.weatherapi.com/v1/current.json").json() == {"ok": True}
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import ast
+from pathlib import Path
+
+from scheduling.celery_scheduler import tuning
+
+TASKS_FILE: Path = Path(tuning.__file__).parent / "celery_tasks" / "weatherapi_tasks" / "tasks.py"
+
+
+def _scheduled_task_names() -> set[str]:
+    """Read the task names registered in the scheduled tasks module, without importing Celery tasks."""
+    names: set[str] = set()
+
+    for node in ast.walk(ast.parse(TASKS_FILE.read_text())):
+        if isinstance(node, ast.keyword) and node.arg == "name" and isinstance(node.value, ast.Constant):
+            names.add(node.value.value)
+
+    return names
+
+
+def test_every_scheduled_task_is_routed_to_a_named_queue():
+    names = _scheduled_task_names()
+
+    assert names
+    assert names <= set(tuning.TASK_ROUTES)
+
+
+def test_dispatch_and_summarize_run_on_the_maintenance_queue():
+    assert tuning.TASK_ROUTES["dispatch_location_polls"]["queue"] == tuning.QUEUE_MAINTENANCE
+    assert tuning.TASK_ROUTES["summarize_location_polls"]["queue"] == tuning.QUEUE_MAINTENANCE
+
+
+def test_every_routed_queue_is_declared():
+    declared = {queue.name for queue in tuning.get_task_queues()}
+
+    assert tuning.QUEUE_DEFAULT in declared
+    assert {route["queue"] for route in tuning.TASK_ROUTES.values()} <= declared
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+import sqlalchemy as sa
+
+import db
+from depends import db_depends
+from scheduling.celery_scheduler import claim_check
+from weather_client.apis.api_weatherapi.db_client.current_weather import save_current_weather_response
+from weather_client.apis.api_weatherapi.db_client.forecast import save_forecast
+
+CURRENT: dict = {
+    "location": {"name": "London", "region": "City of London", "country": "UK", "localtime_epoch": 1700000000},
+    "current": {"last_updated_epoch": 1699999200, "temp_c": 11.5, "condition": {"text": "Cloudy"}},
+}
+FORECAST: dict = {
+    "location": CURRENT["location"],
+    "current": CURRENT["current"],
+    "forecast": {"forecastday": [{"date": "2023-11-14"}, {"date": "2023-11-15"}]},
+}
+
+
+class FakeObject(io.BytesIO):
+    def release_conn(self) -> None:
+        pass
+
+
+class FakeMinio:
+    def __init__(self) -> None:
+        self.buckets: set[str] = set()
+        self.objects: dict[tuple[str, str], bytes] = {}
+
+    def bucket_exists(self, bucket: str) -> bool:
+        return bucket in self.buckets
+
+    def make_bucket(self, bucket: str) -> None:
+        self.buckets.add(bucket)
+
+    def put_object(self, bucket: str, key: str, data: io.BytesIO, length: int, **kwargs) -> None:
+        assert bucket in self.buckets
+        self.objects[(bucket, key)] = data.read(length)
+
+    def get_object(self, bucket: str, key: str) -> FakeObject:
+        return FakeObject(self.objects[(bucket, key)])
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    engine = sa.create_engine("sqlite://", poolclass=sa.pool.StaticPool)
+    db.Base.metadata.create_all(engine)
+    monkeypatch.setattr(db_depends, "get_db_engine", lambda *args, **kwargs: engine)
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture
+def minio(monkeypatch) -> FakeMinio:
+    client = FakeMinio()
+    monkeypatch.setattr(claim_check, "_get_minio_client", lambda: client)
+
+    return client
+
+
+def test_summarize_payload():
+    summary = claim_check.summarize_payload(FORECAST, kind="forecast", location="London", duration_s=0.25)
+
+    assert summary["ok"] is True
+    assert (summary["name"], summary["country"]) == ("London", "UK")
+    assert summary["last_updated_epoch"] == 1699999200
+    assert summary["forecast_days"] == 2
+    assert summary["payload_bytes"] > 0
+
+    assert claim_check.summarize_payload(None, kind="current", location="London") == {
+        "kind": "current",
+        "location": "London",
+        "ok": False,
+        "duration_s": None,
+    }
+
+
+def test_store_payload_validates_mode_and_kind():
+    assert claim_check.store_payload(CURRENT, kind="current", mode="none") is None
+
+    with pytest.raises(ValueError, match="claim check mode"):
+        claim_check.store_payload(CURRENT, kind="current", mode="s3")
+    with pytest.raises(ValueError, match="payload kind"):
+        claim_check.store_payload(CURRENT, kind="hourly", mode="db")
+
+
+@pytest.mark.parametrize(
+    ("kind", "payload", "save"),
+    [
+        ("current", CURRENT, lambda payload, engine: save_current_weather_response(payload, engine=engine)),
+        ("forecast", FORECAST, lambda payload, engine: save_forecast({"forecast_json": payload}, engine=engine)),
+    ],
+)
+def test_db_mode_references_the_saved_row(engine, kind, payload, save):
+    saved = save(payload, engine)
+
+    ref = claim_check.store_payload(payload, kind=kind, mode="db")
+
+    assert ref == {"backend": "db", "table": claim_check.PAYLOAD_KINDS[kind][0].__tablename__, "id": saved.id}
+    assert claim_check.load_payload(ref) == payload
+
+
+def test_db_mode_without_a_saved_row_returns_no_reference(engine):
+    ## i.e. the client logged & swallowed an error while saving the response
+    assert claim_check.store_payload(CURRENT, kind="current", mode="db") is None
+
+
+def test_db_mode_load_missing_row_raises(engine):
+    with pytest.raises(LookupError):
+        claim_check.load_payload({"backend": "db", "table": "weatherapi_current_json", "id": 404})
+
+
+def test_minio_mode_round_trip(minio):
+    ref = claim_check.store_payload(CURRENT, kind="current", mode="minio")
+
+    assert ref["backend"] == "minio"
+    assert ref["key"].startswith("current/") and ref["key"].endswith(".json.gz")
+    assert (ref["bucket"], ref["key"]) in minio.objects
+    assert claim_check.load_payload(ref) == CURRENT
+
+
+def test_minio_mode_same_response_reuses_the_key(minio):
+    first = claim_check.store_payload(CURRENT, kind="current", mode="minio")
+
+    ## Only volatile keys changed, so the content hash (& object key) is the same
+    changed = {**CURRENT, "location": {**CURRENT["location"], "localtime_epoch": 1700000900}}
+    second = claim_check.store_payload(changed, kind="current", mode="minio")
+
+    assert first == second
+    assert len(minio.objects) == 1
+
+
+def test_load_payload_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown claim check backend"):
+        claim_check.load_payload({"backend": "s3"})
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import importlib
+
+import pytest
+
+dramatiq = pytest.importorskip("dramatiq")
+
+from dramatiq.brokers.stub import StubBroker
+from scheduling.dramatiq_scheduler import broker as dramatiq_broker
+
+
+@pytest.fixture(scope="module")
+def stub_broker() -> StubBroker:
+    ## Must be set up before the actors are declared
+    broker = dramatiq_broker.setup_broker("stub")
+    if not isinstance(broker, StubBroker):
+        pytest.skip(f"Global Dramatiq broker is already a {type(broker).__name__}")
+
+    broker.emit_after("process_boot")
+    yield broker
+    broker.close()
+
+
+@pytest.fixture(scope="module")
+def actors(stub_broker):
+    return importlib.import_module("scheduling.dramatiq_scheduler.actors")
+
+
+@pytest.fixture()
+def worker(stub_broker):
+    stub_broker.flush_all()
+
+    worker = dramatiq.Worker(stub_broker, worker_timeout=100)
+    worker.start()
+    yield worker
+    worker.stop()
+
+
+def test_importing_the_package_does_not_set_up_a_broker():
+    package = importlib.import_module("scheduling.dramatiq_scheduler")
+
+    assert not hasattr(package, "request_current_weather")
+    assert dramatiq_broker.BROKER_SETUP in package.get_worker_argv()
+
+
+def test_actors_bind_to_the_stub_broker(stub_broker, actors):
+    assert actors.request_current_weather.broker is stub_broker
+    assert actors.QUEUE_CURRENT_WEATHER in stub_broker.get_declared_queues()
+
+
+def test_request_current_weather(stub_broker, actors, worker, monkeypatch):
+    calls: list[dict] = []
+    monkeypatch.setattr(
+        actors.api_weatherapi.client, "get_current_weather", lambda **kwargs: calls.append(kwargs) or {}
+    )
+
+    actors.request_current_weather.send("London")
+    stub_broker.join(actors.QUEUE_CURRENT_WEATHER, fail_fast=True)
+    worker.join()
+
+    assert calls == [{"location": "London", "save_to_db": True, "use_cache": True}]
+
+
+def test_dispatch_location_polls_sends_a_message_per_shard(stub_broker, actors, worker, monkeypatch):
+    shards: list[tuple] = []
+    monkeypatch.setattr(actors.polling, "plan_location_polls", lambda **kwargs: [(0, ["a", "b"]), (0.05, ["c"])])
+    monkeypatch.setattr(
+        actors.polling, "poll_location_shard", lambda poll, locations, max_concurrency=None: shards.append((poll, locations))
+    )
+
+    actors.dispatch_location_polls.send(poll="forecast")
+    stub_broker.join(actors.QUEUE_MAINTENANCE, fail_fast=True)
+    stub_broker.join(actors.QUEUE_FORECAST, fail_fast=True)
+    worker.join()
+
+    assert sorted(shards) == [("forecast", ["a", "b"]), ("forecast", ["c"])]
+
+
+def test_dispatch_location_polls_rejects_unknown_poll_types(stub_broker, actors, worker):
+    actors.dispatch_location_polls.send(poll="hourly")
+
+    ## max_retries=0, so the message is dead-lettered & fail_fast re-raises its error
+    with pytest.raises(ValueError, match="Invalid poll type"):
+        stub_broker.join(actors.QUEUE_MAINTENANCE, fail_fast=True)
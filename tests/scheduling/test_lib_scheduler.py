@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+
+import pytest
+
+from scheduling.lib_scheduler.scheduler import IntervalJob, Scheduler
+
+
+def _noop() -> None:
+    pass
+
+
+def test_next_run_after_is_aligned_to_the_wall_clock():
+    job = IntervalJob(name="job", func=_noop, interval=900, offset=300)
+
+    assert job.next_run_after(0) == 300
+    assert job.next_run_after(1000) == 1200
+    ## Strictly after `now`, so a job that's due now isn't scheduled again for the same slot
+    assert job.next_run_after(1200) == 2100
+
+
+def test_schedule_does_not_drift_with_late_wakeups():
+    job = IntervalJob(name="job", func=_noop, interval=900, offset=300)
+    rng = random.Random(0)
+
+    now = job.schedule_next(1_700_000_000.0)
+    runs: list[float] = []
+    for _ in range(1000):
+        ## Wake up late & take a while to run, like a busy scheduler thread
+        now = job.next_run + rng.uniform(0, 60) + rng.uniform(0, 120)
+        runs.append(job.next_run)
+        job.schedule_next(now)
+
+    assert all(run % 900 == 300 for run in runs)
+    assert all(later - earlier == 900 for earlier, later in zip(runs, runs[1:]))
+
+
+def test_schedule_skips_missed_slots():
+    job = IntervalJob(name="job", func=_noop, interval=60)
+
+    ## i.e. resumed from suspend an hour later: the next run is the next slot, not 60 missed ones
+    assert job.schedule_next(3600 * 10 + 30) == 3600 * 10 + 60
+
+
+def test_offset_is_normalized_to_the_interval():
+    assert IntervalJob(name="job", func=_noop, interval=900, offset=1000).offset == 100
+    assert IntervalJob(name="job", func=_noop, interval=900, offset=-300).offset == 600
+
+
+@pytest.mark.parametrize("interval", [0, -60])
+def test_interval_must_be_positive(interval):
+    with pytest.raises(ValueError, match="interval must be greater than 0"):
+        IntervalJob(name="job", func=_noop, interval=interval)
+
+
+def test_jitter_is_added_after_the_aligned_time_and_bounded():
+    job = IntervalJob(name="job", func=_noop, interval=60, jitter=10)
+
+    for now in range(0, 6000, 7):
+        aligned = job.next_run_after(now)
+        assert aligned <= job.schedule_next(now) <= aligned + 10
+
+    ## Never more than one interval, so jitter can't push a run into the next slot
+    job = IntervalJob(name="job", func=_noop, interval=60, jitter=600)
+    for now in range(0, 6000, 7):
+        aligned = job.next_run_after(now)
+        assert aligned <= job.schedule_next(now) <= aligned + 60
+
+
+def test_add_job_rejects_duplicate_names():
+    scheduler = Scheduler(jobs=[IntervalJob(name="job", func=_noop, interval=60)])
+
+    with pytest.raises(ValueError, match="already scheduled"):
+        scheduler.add_job(IntervalJob(name="job", func=_noop, interval=120))
+
+
+def test_run_without_jobs_raises():
+    with pytest.raises(ValueError, match="No jobs to schedule"):
+        Scheduler().run(install_signal_handlers=False)
+
+
+def test_slow_job_is_skipped_instead_of_overlapping():
+    lock = threading.Lock()
+    state = {"running": 0, "overlapped": False, "runs": 0}
+    release = threading.Event()
+
+    def slow() -> None:
+        with lock:
+            state["running"] += 1
+            state["runs"] += 1
+            state["overlapped"] |= state["running"] > 1
+        release.wait(timeout=10)
+        with lock:
+            state["running"] -= 1
+
+    scheduler = Scheduler(jobs=[IntervalJob(name="slow", func=slow, interval=0.05, run_on_start=True)], max_workers=4)
+    thread = threading.Thread(target=scheduler.run, kwargs={"install_signal_handlers": False})
+    thread.start()
+    try:
+        ## Several intervals pass while the first run is still going
+        time.sleep(0.5)
+        with lock:
+            assert state["runs"] == 1
+    finally:
+        release.set()
+        scheduler.stop()
+        thread.join(timeout=10)
+
+    assert not thread.is_alive()
+    assert not state["overlapped"]
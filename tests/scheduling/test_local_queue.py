@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("weather_client")
+
+from scheduling.local_queue import queue as local_queue
+from scheduling.local_queue.queue import SQLiteTaskQueue
+from scheduling.local_queue.tasks import TASKS
+from scheduling.local_queue.worker import LocalQueueWorker
+
+
+class FakeClock:
+    """Stands in for the `time` module in `scheduling.local_queue.queue`."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def queue(tmp_path) -> SQLiteTaskQueue:
+    return SQLiteTaskQueue(tmp_path / "queue.sqlite3", busy_timeout=10)
+
+
+@pytest.fixture()
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(local_queue, "time", clock)
+
+    return clock
+
+
+def _row(queue: SQLiteTaskQueue, task_id: int):
+    return queue._connect().execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
+
+
+def test_claim_returns_due_tasks_in_order(queue):
+    later = queue.enqueue("task", args=[2], countdown=3600)
+    first = queue.enqueue("task", args=[1], kwargs={"a": "b"})
+
+    task = queue.claim(worker="w1")
+
+    assert (task.id, task.args, task.kwargs, task.attempts) == (first, [1], {"a": "b"}, 1)
+    assert queue.claim(worker="w1") is None
+    assert _row(queue, later)["status"] == "queued"
+
+
+def test_claim_filters_by_name(queue):
+    queue.enqueue("other")
+    wanted = queue.enqueue("wanted")
+
+    assert queue.claim(worker="w1", names=["wanted"]).id == wanted
+    assert queue.claim(worker="w1", names=["wanted"]) is None
+
+
+def test_concurrent_claims_never_double_claim(queue):
+    task_ids = {queue.enqueue("task", args=[i]) for i in range(200)}
+    claimed: list[int] = []
+    lock = threading.Lock()
+
+    def drain(worker: str) -> None:
+        ## Each thread gets its own connection, like separate workers
+        while (task := queue.claim(worker=worker)) is not None:
+            with lock:
+                claimed.append(task.id)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(drain, [f"w{i}" for i in range(8)]))
+
+    assert len(claimed) == len(set(claimed))
+    assert set(claimed) == task_ids
+    assert queue.counts()["running"] == 200
+
+
+def test_fail_retries_with_exponential_backoff(queue, clock):
+    task_id = queue.enqueue("task", max_retries=2)
+
+    for attempt, backoff in [(1, 10), (2, 20)]:
+        task = queue.claim(worker="w1")
+        assert task.attempts == attempt
+
+        assert queue.fail(task, error="boom", retry_backoff=10) is True
+        row = _row(queue, task_id)
+        assert (row["status"], row["eta"], row["last_error"]) == ("queued", clock.now + backoff, "boom")
+
+        ## Not due until the backoff has passed
+        assert queue.claim(worker="w1") is None
+        clock.now += backoff
+
+
+def test_fail_marks_task_failed_after_max_retries(queue, clock):
+    task_id = queue.enqueue("task", max_retries=1)
+
+    assert queue.fail(queue.claim(worker="w1"), error="first", retry_backoff=1) is True
+    clock.now += 1
+    assert queue.fail(queue.claim(worker="w1"), error="second", retry_backoff=1) is False
+
+    row = _row(queue, task_id)
+    assert (row["status"], row["attempts"], row["last_error"], row["finished_at"]) == ("failed", 2, "second", clock.now)
+    assert queue.claim(worker="w1") is None
+
+
+def test_requeue_stale_only_requeues_old_running_tasks(queue, clock):
+    stale = queue.enqueue("task")
+    queue.claim(worker="crashed")
+
+    clock.now += 100
+    fresh = queue.enqueue("task")
+    queue.claim(worker="alive")
+
+    assert queue.requeue_stale(timeout=50) == 1
+    assert _row(queue, stale)["status"] == "queued"
+    assert _row(queue, fresh)["status"] == "running"
+
+    ## The re-queued task can be claimed again, counting another attempt
+    task = queue.claim(worker="alive")
+    assert (task.id, task.attempts) == (stale, 2)
+
+
+def test_complete_and_fail_ignore_a_lost_claim(queue, clock):
+    task_id = queue.enqueue("task")
+    slow = queue.claim(worker="slow")
+
+    ## The slow worker's claim went stale & another worker took the task over
+    clock.now += 100
+    queue.requeue_stale(timeout=50)
+    current = queue.claim(worker="alive")
+
+    assert queue.complete(slow) is False
+    assert queue.fail(slow, error="late") is False
+    row = _row(queue, task_id)
+    assert (row["status"], row["worker"], row["attempts"], row["last_error"]) == (
+        "running",
+        "alive",
+        2,
+        "Worker stopped before the task finished",
+    )
+
+    assert queue.complete(current) is True
+    assert _row(queue, task_id)["status"] == "done"
+
+
+def test_purge_deletes_old_finished_tasks(queue, clock):
+    old_done = queue.enqueue("task")
+    queue.complete(queue.claim(worker="w1"))
+    old_failed = queue.enqueue("task", max_retries=0)
+    queue.fail(queue.claim(worker="w1"), error="boom")
+
+    clock.now += 100
+    recent_done = queue.enqueue("task")
+    queue.complete(queue.claim(worker="w1"))
+    queued = queue.enqueue("task")
+
+    assert queue.purge(older_than=50) == 2
+    assert _row(queue, old_done) is None
+    assert _row(queue, old_failed) is None
+    assert _row(queue, recent_done)["status"] == "done"
+    assert _row(queue, queued)["status"] == "queued"
+
+
+def _wait_for(condition, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise TimeoutError("Condition not met in time")
+        time.sleep(0.02)
+
+
+def test_worker_runs_retries_and_fails_tasks(queue, monkeypatch):
+    results: list[tuple] = []
+    attempts: dict[str, int] = {"flaky": 0}
+
+    def flaky() -> None:
+        attempts["flaky"] += 1
+        if attempts["flaky"] == 1:
+            raise RuntimeError("first attempt fails")
+        results.append(("flaky", attempts["flaky"]))
+
+    def broken() -> None:
+        raise RuntimeError("always fails")
+
+    monkeypatch.setitem(TASKS, "test_add", lambda a, b: results.append(("add", a + b)))
+    monkeypatch.setitem(TASKS, "test_flaky", flaky)
+    monkeypatch.setitem(TASKS, "test_broken", broken)
+
+    queue.enqueue("test_add", args=[1, 2])
+    queue.enqueue("test_flaky", max_retries=1)
+    broken_id = queue.enqueue("test_broken", max_retries=0)
+    unknown_id = queue.enqueue("test_unregistered", max_retries=0)
+
+    worker = LocalQueueWorker(queue, concurrency=2, poll_interval=0.02, retry_backoff=0)
+    thread = threading.Thread(target=worker.run, kwargs={"install_signal_handlers": False})
+    thread.start()
+    try:
+        _wait_for(lambda: queue.counts()["done"] == 2 and queue.counts()["failed"] == 2)
+    finally:
+        worker.stop()
+        thread.join(timeout=10)
+
+    assert not thread.is_alive()
+    assert sorted(results) == [("add", 3), ("flaky", 2)]
+    assert "always fails" in _row(queue, broken_id)["last_error"]
+    assert "LookupError" in _row(queue, unknown_id)["last_error"]
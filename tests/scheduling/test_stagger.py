@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from scheduling.stagger import apply_jitter, format_load_report, load_distribution, stagger_batches, stagger_offset
+
+KEYS: list[str] = [f"{lat:.2f},{lon:.2f}" for lat in range(-60, 60, 2) for lon in range(-180, 180, 6)]
+
+
+def test_stagger_offset_is_stable_and_within_the_window():
+    for key in KEYS:
+        offset = stagger_offset(key, window=900)
+
+        assert 0 <= offset < 900
+        assert stagger_offset(key, window=900) == offset
+
+
+def test_stagger_offset_salt_changes_the_offset():
+    changed = [stagger_offset(key, 900) != stagger_offset(key, 900, salt="forecast") for key in KEYS]
+
+    assert sum(changed) > len(KEYS) * 0.95
+
+
+@pytest.mark.parametrize("window", [0, -10])
+def test_stagger_offset_without_a_window_is_zero(window):
+    assert stagger_offset("London", window=window) == 0.0
+
+
+def test_apply_jitter_is_clamped_to_the_window():
+    rng = random.Random(0)
+
+    for _ in range(1000):
+        assert 0 <= apply_jitter(5, jitter=30, window=60, rng=rng) < 60
+        assert 0 <= apply_jitter(55, jitter=30, window=60, rng=rng) < 60
+        assert apply_jitter(5, jitter=30, rng=rng) >= 0
+
+    assert apply_jitter(42.0, jitter=0, window=60) == 42.0
+
+
+def test_stagger_batches_cover_every_key_once_in_offset_order():
+    batches = stagger_batches(KEYS, window=900, slot=60)
+
+    offsets = [offset for offset, _ in batches]
+    assert offsets == sorted(offsets)
+    assert all(offset % 60 == 0 and 0 <= offset < 900 for offset in offsets)
+    assert sorted(key for _, keys in batches for key in keys) == sorted(KEYS)
+
+    for offset, keys in batches:
+        assert all(stagger_offset(key, 900) // 60 * 60 == offset for key in keys)
+
+
+def test_stagger_batches_respects_max_batch_size():
+    batches = stagger_batches(KEYS, window=300, slot=60, max_batch_size=25)
+
+    assert all(len(keys) <= 25 for _, keys in batches)
+    assert sorted(key for _, keys in batches for key in keys) == sorted(KEYS)
+
+
+def test_stagger_batches_without_a_window_is_one_batch():
+    assert stagger_batches(["a", "b", "c"], window=0) == [(0, ["a", "b", "c"])]
+
+
+def test_stagger_batches_jitter_stays_in_the_window():
+    batches = stagger_batches(KEYS, window=600, slot=60, jitter=45)
+
+    assert all(0 <= offset < 600 for offset, _ in batches)
+
+
+def test_load_distribution_spreads_keys_evenly():
+    counts = load_distribution(KEYS, window=900, slot=60)
+
+    assert len(counts) == 15
+    assert sum(counts) == len(KEYS)
+    mean = len(KEYS) / len(counts)
+    assert max(counts) < mean * 1.5
+    assert min(counts) > mean * 0.5
+
+
+def test_load_distribution_counts_a_partial_last_slot():
+    counts = load_distribution(KEYS, window=90, slot=60)
+
+    assert len(counts) == 2
+    assert sum(counts) == len(KEYS)
+
+
+def test_format_load_report():
+    report = format_load_report([1, 3, 0], slot=60, width=6).splitlines()
+
+    assert report == [
+        "+00:00 |     1 ##",
+        "+01:00 |     3 ######",
+        "+02:00 |     0 ",
+        "total: 4 | slots: 3 | mean/slot: 1.3 | peak/slot: 3",
+    ]
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pydantic
+import pytest
+
+from settings.celery_settings import CelerySettings
+from settings.db_settings import DatabaseSettings
+from settings.logging_settings import LoggingSettings
+from settings.namespace import SettingsNamespace
+
+
+def test_namespace_values_are_read_only():
+    values = {"CELERY_QUEUES": {"default": ["celery"]}}
+    namespace = SettingsNamespace(namespace="celery", values=values)
+
+    ## Changing the source dict, a returned value or the mapping doesn't change the settings
+    values["CELERY_QUEUES"]["default"].append("changed")
+    namespace.get("CELERY_QUEUES")["default"].append("changed")
+    with pytest.raises(TypeError):
+        namespace._values["CELERY_QUEUES"] = {}
+
+    assert namespace.get("celery_queues.default") == ["celery"]
+    assert not hasattr(namespace, "values")
+
+
+def test_to_model_converts_and_ignores_unknown_settings():
+    namespace = SettingsNamespace(
+        namespace="celery",
+        values={"CELERY_WORKER_CONCURRENCY": "50", "CELERY_TASK_ACKS_LATE": "false", "CELERY_OTHER": 1},
+    )
+
+    celery = namespace.to_model(CelerySettings)
+
+    assert (celery.celery_worker_concurrency, celery.celery_task_acks_late) == (50, False)
+    assert celery.celery_worker_pool == "prefork"
+    assert namespace.to_model(CelerySettings) is celery
+
+
+def test_to_model_treats_empty_optional_values_as_unset():
+    namespace = SettingsNamespace(
+        namespace="database",
+        values={"DB_HOST": "", "DB_PORT": "", "DB_PASSWORD": "secret", "DB_DATABASE": "app.sqlite3"},
+    )
+
+    database = namespace.to_model(DatabaseSettings)
+
+    assert (database.db_host, database.db_port, database.db_database) == (None, None, "app.sqlite3")
+    assert "secret" not in repr(database)
+
+
+def test_to_model_rejects_invalid_values():
+    namespace = SettingsNamespace(namespace="logging", values={"LOG_JSON_ROTATION": "weekly"})
+
+    with pytest.raises(pydantic.ValidationError):
+        namespace.to_model(LoggingSettings)